@@ -0,0 +1,48 @@
+"""Store batch performance scores
+
+Revision ID: 0001_performance_scoring_columns
+Revises: 
+Create Date: 2026-10-19 00:00:00
+
+The tables themselves are created by Base.metadata.create_all, so this and
+later revisions only touch tables that already exist and skip anything a
+fresh create_all has already put in place.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0001_performance_scoring_columns'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def _existing_columns(table):
+    inspector = sa.inspect(op.get_bind())
+    if not inspector.has_table(table):
+        return None
+    return {column["name"] for column in inspector.get_columns(table)}
+
+
+def _existing_indexes(table):
+    return {index["name"] for index in sa.inspect(op.get_bind()).get_indexes(table)}
+
+
+def upgrade() -> None:
+    columns = _existing_columns("employee_performance")
+    if columns is None:
+        return
+    if "department_percentile" not in columns:
+        op.add_column("employee_performance", sa.Column("department_percentile", sa.Float(), nullable=True))
+    if "performance_rating" not in columns:
+        op.add_column("employee_performance", sa.Column("performance_rating", sa.String(), nullable=True))
+    if "ix_employee_performance_evaluation_date" not in _existing_indexes("employee_performance"):
+        op.create_index("ix_employee_performance_evaluation_date", "employee_performance", ["evaluation_date"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_employee_performance_evaluation_date", table_name="employee_performance")
+    op.drop_column("employee_performance", "performance_rating")
+    op.drop_column("employee_performance", "department_percentile")
\ No newline at end of file
@@ -0,0 +1,36 @@
+"""Link goals into a hierarchy
+
+Revision ID: 0002_goal_hierarchy
+Revises: 0001_performance_scoring_columns
+Create Date: 2026-10-19 00:00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0002_goal_hierarchy'
+down_revision = '0001_performance_scoring_columns'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+    if not inspector.has_table("goals"):
+        return
+    if "parent_id" in {column["name"] for column in inspector.get_columns("goals")}:
+        return
+    # Batch mode so SQLite, which cannot add a foreign key in place, rebuilds the table
+    with op.batch_alter_table("goals") as batch_op:
+        batch_op.add_column(sa.Column("parent_id", sa.Integer(), nullable=True))
+        batch_op.create_foreign_key("fk_goals_parent_id_goals", "goals", ["parent_id"], ["id"])
+        batch_op.create_index("ix_goals_parent_id", ["parent_id"])
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("goals") as batch_op:
+        batch_op.drop_index("ix_goals_parent_id")
+        batch_op.drop_constraint("fk_goals_parent_id_goals", type_="foreignkey")
+        batch_op.drop_column("parent_id")
\ No newline at end of file
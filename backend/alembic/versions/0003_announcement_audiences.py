@@ -0,0 +1,72 @@
+"""Normalize announcement targeting into audience rows
+
+Revision ID: 0003_announcement_audiences
+Revises: 0002_goal_hierarchy
+Create Date: 2026-10-19 00:00:00
+
+Feeds only show announcements that have audience rows, so every existing
+announcement without any gets them from its JSON target columns.
+"""
+import json
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0003_announcement_audiences'
+down_revision = '0002_goal_hierarchy'
+branch_labels = None
+depends_on = None
+
+EVERYONE = "*"
+
+
+def _targets(raw):
+    """Targets from a JSON column; anything unreadable falls back to everyone"""
+    try:
+        values = json.loads(raw) if raw else []
+    except ValueError:
+        return [EVERYONE]
+    if not isinstance(values, list) or not all(isinstance(value, str) for value in values):
+        return [EVERYONE]
+    return values or [EVERYONE]
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    if not inspector.has_table("announcements"):
+        return
+    if not inspector.has_table("announcement_audiences"):
+        op.create_table(
+            "announcement_audiences",
+            sa.Column("announcement_id", sa.Integer(), sa.ForeignKey("announcements.id", ondelete="CASCADE"), nullable=False),
+            sa.Column("dimension", sa.String(), nullable=False),
+            sa.Column("value", sa.String(), nullable=False),
+            sa.PrimaryKeyConstraint("announcement_id", "dimension", "value"),
+        )
+        op.create_index(
+            "ix_announcement_audiences_lookup", "announcement_audiences", ["dimension", "value", "announcement_id"]
+        )
+
+    announcements = sa.table(
+        "announcements", sa.column("id"), sa.column("target_departments"), sa.column("target_roles")
+    )
+    audiences = sa.table("announcement_audiences", sa.column("announcement_id"), sa.column("dimension"), sa.column("value"))
+    missing = bind.execute(
+        sa.select(announcements.c.id, announcements.c.target_departments, announcements.c.target_roles)
+        .where(~sa.exists().where(audiences.c.announcement_id == announcements.c.id))
+    ).all()
+    rows = [
+        {"announcement_id": announcement_id, "dimension": dimension, "value": value}
+        for announcement_id, departments, roles in missing
+        for dimension, raw in (("department", departments), ("role", roles))
+        for value in _targets(raw)
+    ]
+    if rows:
+        op.bulk_insert(audiences, rows)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_announcement_audiences_lookup", table_name="announcement_audiences")
+    op.drop_table("announcement_audiences")
\ No newline at end of file
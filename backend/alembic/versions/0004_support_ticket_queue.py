@@ -0,0 +1,75 @@
+"""Rank support tickets for the claim queue
+
+Revision ID: 0004_support_ticket_queue
+Revises: 0003_announcement_audiences
+Create Date: 2026-10-19 00:00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0004_support_ticket_queue'
+down_revision = '0003_announcement_audiences'
+branch_labels = None
+depends_on = None
+
+# Enum columns store member names; must match PRIORITY_RANKS on the model
+PRIORITY_RANKS = {"LOW": 0, "MEDIUM": 1, "HIGH": 2, "URGENT": 3}
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    if not inspector.has_table("support_tickets"):
+        return
+
+    if "priority_rank" not in {column["name"] for column in inspector.get_columns("support_tickets")}:
+        op.add_column("support_tickets", sa.Column("priority_rank", sa.Integer(), nullable=True))
+    tickets = sa.table("support_tickets", sa.column("priority"), sa.column("priority_rank"))
+    op.execute(
+        tickets.update()
+        .where(tickets.c.priority_rank.is_(None))
+        .values(priority_rank=sa.case(PRIORITY_RANKS, value=tickets.c.priority, else_=PRIORITY_RANKS["MEDIUM"]))
+    )
+
+    if "ix_support_tickets_open_queue" not in {index["name"] for index in inspector.get_indexes("support_tickets")}:
+        open_unassigned = sa.text("status IN ('OPEN', 'REOPENED') AND assigned_to IS NULL")
+        op.create_index(
+            "ix_support_tickets_open_queue", "support_tickets",
+            ["category", sa.text("priority_rank DESC"), "created_at"],
+            postgresql_where=open_unassigned, sqlite_where=open_unassigned
+        )
+
+    # Ticket numbers come from a sequence, or a counter table on SQLite. Deleted
+    # tickets leave gaps, so both start after the highest number handed out,
+    # not after the row count
+    if bind.dialect.name == "postgresql":
+        op.execute("CREATE SEQUENCE IF NOT EXISTS support_ticket_number_seq")
+        op.execute(
+            "SELECT setval('support_ticket_number_seq', COALESCE(MAX(number), 1), MAX(number) IS NOT NULL) "
+            "FROM (SELECT CAST(SUBSTRING(ticket_number FROM 4) AS BIGINT) AS number "
+            "FROM support_tickets WHERE ticket_number ~ '^TKT[0-9]+$') AS numbers"
+        )
+    elif not inspector.has_table("ticket_number_sequence"):
+        op.create_table(
+            "ticket_number_sequence",
+            sa.Column("id", sa.Integer(), primary_key=True),
+            sqlite_autoincrement=True
+        )
+        # AUTOINCREMENT never hands out an id below the highest ever inserted
+        op.execute(
+            "INSERT INTO ticket_number_sequence (id) "
+            "SELECT MAX(CAST(SUBSTR(ticket_number, 4) AS INTEGER)) FROM support_tickets "
+            "WHERE ticket_number GLOB 'TKT[0-9]*' AND SUBSTR(ticket_number, 4) NOT GLOB '*[^0-9]*' "
+            "HAVING MAX(CAST(SUBSTR(ticket_number, 4) AS INTEGER)) > 0"
+        )
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == "postgresql":
+        op.execute("DROP SEQUENCE IF EXISTS support_ticket_number_seq")
+    else:
+        op.drop_table("ticket_number_sequence")
+    op.drop_index("ix_support_tickets_open_queue", table_name="support_tickets")
+    op.drop_column("support_tickets", "priority_rank")
\ No newline at end of file
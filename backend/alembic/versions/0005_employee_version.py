@@ -0,0 +1,33 @@
+"""Version employees for conditional writes
+
+Revision ID: 0005_employee_version
+Revises: 0004_support_ticket_queue
+Create Date: 2026-10-19 00:00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0005_employee_version'
+down_revision = '0004_support_ticket_queue'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+    if not inspector.has_table("employees"):
+        return
+
+    # The server default fills existing rows, so every employee starts at version 1
+    if "version" not in {column["name"] for column in inspector.get_columns("employees")}:
+        op.add_column(
+            "employees",
+            sa.Column("version", sa.Integer(), nullable=False, server_default="1")
+        )
+
+
+def downgrade() -> None:
+    op.drop_column("employees", "version")
\ No newline at end of file
@@ -0,0 +1,75 @@
+"""Partial indexes over active employees and archive tables for inactive ones
+
+Revision ID: 0006_employee_archive
+Revises: 0005_employee_version
+Create Date: 2026-10-19 00:00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = '0006_employee_archive'
+down_revision = '0005_employee_version'
+branch_labels = None
+depends_on = None
+
+# Archive table, hot table, extra indexed column
+ARCHIVES = (
+    ("employees_archive", "employees", "employee_id"),
+    ("tasks_archive", "tasks", "assigned_to"),
+    ("support_tickets_archive", "support_tickets", "created_by"),
+)
+
+# Enum columns store member names
+ACTIVE = sa.text("status = 'ACTIVE'")
+
+
+def _cold_columns(inspector, hot: str):
+    """The hot table's columns as they are now, without constraints, plus archived_at"""
+    primary_key = set(inspector.get_pk_constraint(hot)["constrained_columns"])
+    columns = []
+    for column in inspector.get_columns(hot):
+        type_ = column["type"]
+        # The enum types already exist for the hot table
+        if isinstance(type_, postgresql.ENUM):
+            type_.create_type = False
+        columns.append(sa.Column(
+            column["name"], type_,
+            primary_key=column["name"] in primary_key, autoincrement=False, nullable=column["nullable"]
+        ))
+    return columns + [sa.Column("archived_at", sa.DateTime(), nullable=False)]
+
+
+def upgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+    if not inspector.has_table("employees"):
+        return
+
+    existing = {index["name"] for index in inspector.get_indexes("employees")}
+    if "ix_employees_active_department_role" not in existing:
+        op.create_index(
+            "ix_employees_active_department_role", "employees", ["department", "role"],
+            postgresql_where=ACTIVE, sqlite_where=ACTIVE
+        )
+    if "ix_employees_active_manager" not in existing:
+        op.create_index(
+            "ix_employees_active_manager", "employees", ["manager_id"],
+            postgresql_where=ACTIVE, sqlite_where=ACTIVE
+        )
+
+    for archive, hot, column in ARCHIVES:
+        if inspector.has_table(archive) or not inspector.has_table(hot):
+            continue
+        op.create_table(archive, *_cold_columns(inspector, hot))
+        op.create_index(f"ix_{archive}_{column}", archive, [column])
+
+
+def downgrade() -> None:
+    for archive, hot, column in ARCHIVES:
+        op.drop_index(f"ix_{archive}_{column}", table_name=archive)
+        op.drop_table(archive)
+    op.drop_index("ix_employees_active_manager", table_name="employees")
+    op.drop_index("ix_employees_active_department_role", table_name="employees")
\ No newline at end of file
@@ -0,0 +1,36 @@
+"""Index analytics metrics by date for time-series reads
+
+Revision ID: 0007_analytics_metric_indexes
+Revises: 0006_employee_archive
+Create Date: 2026-10-19 00:00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0007_analytics_metric_indexes'
+down_revision = '0006_employee_archive'
+branch_labels = None
+depends_on = None
+
+# Index name, table, columns; must match the models
+INDEXES = (
+    ("ix_company_metrics_date", "company_metrics", ["date"]),
+    ("ix_department_metrics_department_date", "department_metrics", ["department", "date"]),
+)
+
+
+def upgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+    for name, table, columns in INDEXES:
+        if not inspector.has_table(table):
+            continue
+        if name not in {index["name"] for index in inspector.get_indexes(table)}:
+            op.create_index(name, table, columns)
+
+
+def downgrade() -> None:
+    for name, table, columns in reversed(INDEXES):
+        op.drop_index(name, table_name=table)
\ No newline at end of file
@@ -0,0 +1,38 @@
+"""Partial indexes over open tasks and goals for the background sweeps
+
+Revision ID: 0008_open_work_partial_indexes
+Revises: 0007_analytics_metric_indexes
+Create Date: 2026-10-19 00:00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0008_open_work_partial_indexes'
+down_revision = '0007_analytics_metric_indexes'
+branch_labels = None
+depends_on = None
+
+# Index name, table, column, condition; enum columns store member names
+INDEXES = (
+    ("ix_tasks_open_due_date", "tasks", "due_date", sa.text("status IN ('ASSIGNED', 'IN_PROGRESS')")),
+    ("ix_tasks_unnotified_assignee", "tasks", "assigned_to", sa.column("notification_sent", sa.Boolean) == sa.false()),
+    ("ix_goals_open_target_date", "goals", "target_date", sa.text("status IN ('PENDING', 'IN_PROGRESS')")),
+)
+
+
+def upgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+    for name, table, column, condition in INDEXES:
+        if not inspector.has_table(table):
+            continue
+        if name in {index["name"] for index in inspector.get_indexes(table)}:
+            continue
+        op.create_index(name, table, [column], postgresql_where=condition, sqlite_where=condition)
+
+
+def downgrade() -> None:
+    for name, table, column, condition in reversed(INDEXES):
+        op.drop_index(name, table_name=table)
\ No newline at end of file
@@ -0,0 +1,45 @@
+from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import FileResponse
+from app.models.employee import Employee
+from app.api.deps import require_admin, require_super_admin
+from app.services.request_profiler import list_profiles, profile_path
+from app.services.worker_stats import worker_stats
+
+router = APIRouter()
+
+@router.get("/workers")
+def get_worker_stats(current_employee: Employee = Depends(require_admin)):
+    """Per-worker request counts, memory, DB pool, cache and typeahead index stats, with totals across workers"""
+    workers = [
+        {key: value for key, value in worker.items() if key != "metrics"}
+        for worker in worker_stats.collect()
+    ]
+    return {
+        "workers": workers,
+        "totals": {
+            "workers": len(workers),
+            "requests": sum(worker["requests"] for worker in workers),
+            "db_connections_checked_out": sum(worker["db_pool"].get("checked_out", 0) for worker in workers),
+            "push_connections": sum(worker["push"]["connections"] for worker in workers),
+            "response_cache_hits": sum(worker["response_cache"]["hits"] for worker in workers),
+            "response_cache_misses": sum(worker["response_cache"]["misses"] for worker in workers),
+            "max_rss_kb": sum(worker["max_rss_kb"] for worker in workers),
+            "typeahead_approx_bytes": sum(worker["typeahead"]["approx_bytes"] for worker in workers),
+        }
+    }
+
+@router.get("/profiles")
+def get_profiles(current_employee: Employee = Depends(require_super_admin)):
+    """Stored request profiles from every worker, newest first"""
+    return {"profiles": list_profiles()}
+
+@router.get("/profiles/{name}")
+def download_profile(name: str, current_employee: Employee = Depends(require_super_admin)):
+    """One profile as collapsed stacks, for flamegraph.pl or speedscope"""
+    path = profile_path(name)
+    if path is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Profile not found"
+        )
+    return FileResponse(path, media_type="text/plain", filename=name)
\ No newline at end of file
@@ -0,0 +1,109 @@
+from fastapi import APIRouter, Depends, HTTPException, status, Query
+from sqlalchemy.orm import Session
+from typing import List, Optional
+from datetime import date, timedelta
+from app.database.database import get_db
+from app.schemas.analytics import (
+    TimeSeriesResponse, TimeSeriesPoint, PerformanceScoringRequest,
+    PerformanceScoringResponse, PerformanceRanking
+)
+from app.models.analytics import EmployeePerformance
+from app.models.employee import Employee, RoleEnum
+from app.api.deps import require_roles, require_hr_or_admin
+from app.services.timeseries import BUCKETS, query_timeseries, lttb
+from app.services.performance_scoring import score_period
+
+router = APIRouter()
+
+require_analytics_access = require_roles([RoleEnum.HR, RoleEnum.FINANCE, RoleEnum.ADMIN, RoleEnum.SUPER_ADMIN])
+
+@router.get("/timeseries", response_model=TimeSeriesResponse)
+def get_timeseries(
+    metrics: List[str] = Query(["revenue"]),
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    bucket: str = Query("day", pattern=f"^({'|'.join(BUCKETS)})$"),
+    department: Optional[str] = None,
+    points: Optional[int] = Query(None, ge=3, le=10000),
+    db: Session = Depends(get_db),
+    current_employee: Employee = Depends(require_analytics_access)
+):
+    end_date = end_date or date.today()
+    start_date = start_date or end_date - timedelta(days=365)
+    if start_date > end_date:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="start_date must not be after end_date"
+        )
+    
+    try:
+        series = query_timeseries(db, metrics, start_date, end_date, bucket, department)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    
+    # Downsample what the chart can't draw anyway
+    if points:
+        series = {metric: lttb(values, points) for metric, values in series.items()}
+    
+    return TimeSeriesResponse(
+        bucket=bucket,
+        department=department,
+        start_date=start_date,
+        end_date=end_date,
+        series={
+            metric: [TimeSeriesPoint(date=day, value=value) for day, value in values]
+            for metric, values in series.items()
+        }
+    )
+
+@router.post("/performance/score", response_model=PerformanceScoringResponse)
+def score_performance(
+    scoring_request: PerformanceScoringRequest,
+    db: Session = Depends(get_db),
+    current_employee: Employee = Depends(require_hr_or_admin)
+):
+    try:
+        scored = score_period(
+            db,
+            scoring_request.start_date,
+            scoring_request.end_date,
+            scoring_request.weights
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    
+    return PerformanceScoringResponse(evaluations_scored=scored)
+
+@router.get("/performance/leaderboard", response_model=List[PerformanceRanking])
+def get_performance_leaderboard(
+    start_date: date,
+    end_date: date,
+    department: Optional[str] = None,
+    limit: int = Query(20, ge=1, le=500),
+    db: Session = Depends(get_db),
+    current_employee: Employee = Depends(require_analytics_access)
+):
+    # Reads the values stored by the scoring pipeline, nothing is computed here
+    query = db.query(
+        Employee.id.label("employee_id"),
+        Employee.full_name,
+        Employee.department,
+        EmployeePerformance.evaluation_date,
+        EmployeePerformance.overall_score,
+        EmployeePerformance.department_percentile,
+        EmployeePerformance.performance_rating
+    ).join(Employee, Employee.id == EmployeePerformance.employee_id).filter(
+        EmployeePerformance.evaluation_date.between(start_date, end_date)
+    )
+    
+    if department:
+        query = query.filter(Employee.department == department)
+    
+    rows = query.order_by(EmployeePerformance.overall_score.desc()).limit(limit).all()
+    return [PerformanceRanking(**row._mapping) for row in rows]
\ No newline at end of file
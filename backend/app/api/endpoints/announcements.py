@@ -0,0 +1,100 @@
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.orm import Session, joinedload
+from typing import List
+from app.database.database import get_db
+from app.schemas.announcement import AnnouncementCreate, AnnouncementUpdate, AnnouncementResponse
+from app.models.announcement import Announcement
+from app.models.employee import Employee
+from app.api.deps import get_current_employee, require_hr_or_admin
+from app.services.announcement_feed import feed_cache, get_feed, audience_of
+from app.services.push_hub import push_hub
+
+router = APIRouter()
+
+def load_announcement(db: Session, announcement_id: int) -> Announcement:
+    announcement = db.query(Announcement).options(
+        joinedload(Announcement.author).load_only(Employee.full_name)
+    ).filter(Announcement.id == announcement_id).first()
+    if not announcement:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Announcement not found"
+        )
+    return announcement
+
+def checked_audience(announcement: Announcement):
+    try:
+        return audience_of(announcement)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+
+@router.get("/feed", response_model=List[AnnouncementResponse])
+def get_announcement_feed(
+    db: Session = Depends(get_db),
+    current_employee: Employee = Depends(get_current_employee)
+):
+    return get_feed(db, current_employee.department, current_employee.role.value)
+
+@router.post("/", response_model=AnnouncementResponse)
+def create_announcement(
+    announcement_data: AnnouncementCreate,
+    db: Session = Depends(get_db),
+    current_employee: Employee = Depends(require_hr_or_admin)
+):
+    db_announcement = Announcement(**announcement_data.dict(), created_by=current_employee.id)
+    departments, roles = checked_audience(db_announcement)
+    
+    db.add(db_announcement)
+    db.commit()
+    announcement_id = db_announcement.id
+    
+    feed_cache.invalidate(departments, roles)
+    announcement = load_announcement(db, announcement_id)
+    push_hub.publish(
+        "announcement.created",
+        {"id": announcement.id, "title": announcement.title, "priority": announcement.priority.value},
+        departments, roles
+    )
+    return announcement
+
+@router.put("/{announcement_id}", response_model=AnnouncementResponse)
+def update_announcement(
+    announcement_id: int,
+    announcement_update: AnnouncementUpdate,
+    db: Session = Depends(get_db),
+    current_employee: Employee = Depends(require_hr_or_admin)
+):
+    announcement = load_announcement(db, announcement_id)
+    old_departments, old_roles = checked_audience(announcement)
+    
+    # Update fields
+    update_data = announcement_update.dict(exclude_unset=True)
+    for field, value in update_data.items():
+        setattr(announcement, field, value)
+    new_departments, new_roles = checked_audience(announcement)
+    db.commit()
+    
+    # Segments that could see the old or the new version are stale
+    feed_cache.invalidate(old_departments + new_departments, old_roles + new_roles)
+    push_hub.publish("announcement.updated", {"id": announcement_id}, old_departments + new_departments, old_roles + new_roles)
+    return load_announcement(db, announcement_id)
+
+@router.delete("/{announcement_id}")
+def delete_announcement(
+    announcement_id: int,
+    db: Session = Depends(get_db),
+    current_employee: Employee = Depends(require_hr_or_admin)
+):
+    announcement = load_announcement(db, announcement_id)
+    departments, roles = checked_audience(announcement)
+    
+    # Soft delete, the feed only reads active announcements
+    announcement.is_active = False
+    db.commit()
+    
+    feed_cache.invalidate(departments, roles)
+    push_hub.publish("announcement.deactivated", {"id": announcement_id}, departments, roles)
+    return {"message": "Announcement deactivated successfully"}
\ No newline at end of file
@@ -0,0 +1,20 @@
+from fastapi import APIRouter, Depends, Response
+from sqlalchemy.orm import Session
+from app.core.config import settings
+from app.database.database import get_db
+from app.schemas.dashboard import DashboardSummary
+from app.models.employee import Employee
+from app.api.deps import get_current_employee
+from app.services.dashboard import get_summary
+
+router = APIRouter()
+
+@router.get("/summary", response_model=DashboardSummary)
+def get_dashboard_summary(
+    response: Response,
+    db: Session = Depends(get_db),
+    current_employee: Employee = Depends(get_current_employee)
+):
+    # Everything the dashboard shows in one request; the answer is per user
+    response.headers["Cache-Control"] = f"private, max-age={settings.DASHBOARD_CACHE_TTL_SECONDS}"
+    return get_summary(db, current_employee)
\ No newline at end of file
@@ -1,217 +1,322 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session
-from typing import List, Optional
-from app.database.database import get_db
-from app.schemas.employee import EmployeeCreate, EmployeeUpdate, EmployeeResponse
-from app.models.employee import Employee, RoleEnum, StatusEnum
-from app.api.deps import get_current_employee, require_hr_or_admin, require_super_admin
-from app.core.security import get_password_hash, generate_password, generate_employee_id
-from app.services.notification_service import send_welcome_email
-
-router = APIRouter()
-
-@router.post("/", response_model=EmployeeResponse)
-async def create_employee(
-    employee_data: EmployeeCreate,
-    db: Session = Depends(get_db),
-    current_employee: Employee = Depends(require_hr_or_admin)
-):
-    # Check if email already exists
-    if db.query(Employee).filter(Employee.email == employee_data.email).first():
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Email already registered"
-        )
-    
-    # Generate employee ID and password
-    employee_id = generate_employee_id(employee_data.department)
-    password = employee_data.password or generate_password()
-    
-    # Ensure unique employee ID
-    while db.query(Employee).filter(Employee.employee_id == employee_id).first():
-        employee_id = generate_employee_id(employee_data.department)
-    
-    # Create employee
-    db_employee = Employee(
-        employee_id=employee_id,
-        email=employee_data.email,
-        full_name=employee_data.full_name,
-        hashed_password=get_password_hash(password),
-        phone_number=employee_data.phone_number,
-        role=employee_data.role,
-        department=employee_data.department,
-        designation=employee_data.designation,
-        manager_id=employee_data.manager_id,
-        team_leader_id=employee_data.team_leader_id,
-        status=StatusEnum.ACTIVE
-    )
-    
-    db.add(db_employee)
-    db.commit()
-    db.refresh(db_employee)
-    
-    # Send welcome email with credentials
-    try:
-        await send_welcome_email(
-            email=employee_data.email,
-            full_name=employee_data.full_name,
-            employee_id=employee_id,
-            password=password
-        )
-    except Exception as e:
-        # Log error but don't fail the creation
-        print(f"Failed to send welcome email: {e}")
-    
-    return db_employee
-
-@router.get("/", response_model=List[EmployeeResponse])
-def get_employees(
-    skip: int = Query(0, ge=0),
-    limit: int = Query(100, ge=1, le=1000),
-    department: Optional[str] = None,
-    role: Optional[RoleEnum] = None,
-    status: Optional[StatusEnum] = None,
-    db: Session = Depends(get_db),
-    current_employee: Employee = Depends(get_current_employee)
-):
-    query = db.query(Employee)
-    
-    # Apply filters
-    if department:
-        query = query.filter(Employee.department == department)
-    if role:
-        query = query.filter(Employee.role == role)
-    if status:
-        query = query.filter(Employee.status == status)
-    
-    # Role-based access control
-    if current_employee.role not in [RoleEnum.HR, RoleEnum.ADMIN, RoleEnum.SUPER_ADMIN]:
-        # Regular employees can only see their department colleagues
-        query = query.filter(Employee.department == current_employee.department)
-    
-    employees = query.offset(skip).limit(limit).all()
-    return employees
-
-@router.get("/me", response_model=EmployeeResponse)
-def get_current_employee_info(
-    current_employee: Employee = Depends(get_current_employee)
-):
-    return current_employee
-
-@router.get("/{employee_id}", response_model=EmployeeResponse)
-def get_employee(
-    employee_id: int,
-    db: Session = Depends(get_db),
-    current_employee: Employee = Depends(get_current_employee)
-):
-    employee = db.query(Employee).filter(Employee.id == employee_id).first()
-    if not employee:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Employee not found"
-        )
-    
-    # Check permissions
-    if (current_employee.id != employee_id and 
-        current_employee.role not in [RoleEnum.HR, RoleEnum.ADMIN, RoleEnum.SUPER_ADMIN] and
-        current_employee.department != employee.department):
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not authorized to view this employee"
-        )
-    
-    return employee
-
-@router.put("/{employee_id}", response_model=EmployeeResponse)
-def update_employee(
-    employee_id: int,
-    employee_update: EmployeeUpdate,
-    db: Session = Depends(get_db),
-    current_employee: Employee = Depends(require_hr_or_admin)
-):
-    employee = db.query(Employee).filter(Employee.id == employee_id).first()
-    if not employee:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Employee not found"
-        )
-    
-    # Update fields
-    update_data = employee_update.dict(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(employee, field, value)
-    
-    db.commit()
-    db.refresh(employee)
-    return employee
-
-@router.patch("/{employee_id}/status")
-def update_employee_status(
-    employee_id: int,
-    status: StatusEnum,
-    db: Session = Depends(get_db),
-    current_employee: Employee = Depends(require_hr_or_admin)
-):
-    employee = db.query(Employee).filter(Employee.id == employee_id).first()
-    if not employee:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Employee not found"
-        )
-    
-    employee.status = status
-    db.commit()
-    
-    return {"message": f"Employee status updated to {status.value}"}
-
-@router.delete("/{employee_id}")
-def delete_employee(
-    employee_id: int,
-    db: Session = Depends(get_db),
-    current_employee: Employee = Depends(require_super_admin)
-):
-    employee = db.query(Employee).filter(Employee.id == employee_id).first()
-    if not employee:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Employee not found"
-        )
-    
-    # Soft delete by setting status to inactive
-    employee.status = StatusEnum.INACTIVE
-    db.commit()
-    
-    return {"message": "Employee deactivated successfully"}
-
-@router.get("/departments/list")
-def get_departments(
-    db: Session = Depends(get_db),
-    current_employee: Employee = Depends(get_current_employee)
-):
-    departments = db.query(Employee.department).distinct().all()
-    return [dept[0] for dept in departments]
-
-@router.get("/hierarchy/{employee_id}")
-def get_employee_hierarchy(
-    employee_id: int,
-    db: Session = Depends(get_db),
-    current_employee: Employee = Depends(get_current_employee)
-):
-    employee = db.query(Employee).filter(Employee.id == employee_id).first()
-    if not employee:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Employee not found"
-        )
-    
-    hierarchy = {
-        "employee": employee,
-        "manager": employee.manager,
-        "team_leader": employee.team_leader,
-        "subordinates": db.query(Employee).filter(
-            (Employee.manager_id == employee_id) | 
-            (Employee.team_leader_id == employee_id)
-        ).all()
-    }
-    
+from fastapi import APIRouter, Depends, Header, HTTPException, Response, status, Query
+from sqlalchemy.orm import Session, joinedload
+from typing import List, Optional
+from app.database.database import get_db
+from app.schemas.employee import (
+    EmployeeCreate, EmployeeUpdate, EmployeeResponse, EmployeeSuggestion,
+    EmployeeBulkUpdate, EmployeeFilterUpdate, EmployeeBulkResult
+)
+from app.models.employee import Employee, RoleEnum, StatusEnum
+from app.api.deps import get_current_employee, require_hr_or_admin, require_super_admin
+from app.core.security import get_password_hash, generate_password, generate_employee_id
+from app.services.notification_service import send_welcome_email
+from app.services.employee_typeahead import suggest
+from app.services.archive import find_archived_employee
+from app.services.employee_writes import (
+    UPDATED, VersionConflict, bulk_update_employees, update_employee_row, update_employees_where
+)
+from app.services.invalidation_bus import invalidation_bus
+from app.services.response_cache import EMPLOYEES_TAG, employee_tag, response_cache, shared_scope
+
+router = APIRouter()
+
+# Per-worker LRU entries also have to go when another worker changes an employee
+invalidation_bus.subscribe(
+    "employee",
+    lambda employee_pks: response_cache.invalidate(EMPLOYEES_TAG, *(employee_tag(pk) for pk in employee_pks))
+)
+
+@router.post("/", response_model=EmployeeResponse)
+async def create_employee(
+    employee_data: EmployeeCreate,
+    db: Session = Depends(get_db),
+    current_employee: Employee = Depends(require_hr_or_admin)
+):
+    # Check if email already exists
+    if db.query(Employee).filter(Employee.email == employee_data.email).first():
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Email already registered"
+        )
+    
+    # Generate employee ID and password
+    employee_id = generate_employee_id(employee_data.department)
+    password = employee_data.password or generate_password()
+    
+    # Ensure unique employee ID
+    while db.query(Employee).filter(Employee.employee_id == employee_id).first():
+        employee_id = generate_employee_id(employee_data.department)
+    
+    # Create employee
+    db_employee = Employee(
+        employee_id=employee_id,
+        email=employee_data.email,
+        full_name=employee_data.full_name,
+        hashed_password=get_password_hash(password),
+        phone_number=employee_data.phone_number,
+        role=employee_data.role,
+        department=employee_data.department,
+        designation=employee_data.designation,
+        manager_id=employee_data.manager_id,
+        team_leader_id=employee_data.team_leader_id,
+        status=StatusEnum.ACTIVE
+    )
+    
+    db.add(db_employee)
+    db.commit()
+    db.refresh(db_employee)
+    response_cache.invalidate(EMPLOYEES_TAG)
+    
+    # Send welcome email with credentials
+    try:
+        await send_welcome_email(
+            email=employee_data.email,
+            full_name=employee_data.full_name,
+            employee_id=employee_id,
+            password=password
+        )
+    except Exception as e:
+        # Log error but don't fail the creation
+        print(f"Failed to send welcome email: {e}")
+    
+    return db_employee
+
+@router.get("/", response_model=List[EmployeeResponse])
+@response_cache.cached(List[EmployeeResponse], tags=[EMPLOYEES_TAG])
+def get_employees(
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=1000),
+    department: Optional[str] = None,
+    role: Optional[RoleEnum] = None,
+    status: Optional[StatusEnum] = None,
+    db: Session = Depends(get_db),
+    current_employee: Employee = Depends(get_current_employee)
+):
+    query = db.query(Employee)
+    
+    # Apply filters
+    if department:
+        query = query.filter(Employee.department == department)
+    if role:
+        query = query.filter(Employee.role == role)
+    if status:
+        query = query.filter(Employee.status == status)
+    
+    # Role-based access control
+    if current_employee.role not in [RoleEnum.HR, RoleEnum.ADMIN, RoleEnum.SUPER_ADMIN]:
+        # Regular employees can only see their department colleagues
+        query = query.filter(Employee.department == current_employee.department)
+    
+    employees = query.offset(skip).limit(limit).all()
+    return employees
+
+@router.get("/me", response_model=EmployeeResponse)
+def get_current_employee_info(
+    current_employee: Employee = Depends(get_current_employee)
+):
+    return current_employee
+
+@router.get("/suggest", response_model=List[EmployeeSuggestion])
+def suggest_employees(
+    q: str = Query(..., min_length=1, max_length=100),
+    limit: int = Query(10, ge=1, le=50),
+    db: Session = Depends(get_db),
+    current_employee: Employee = Depends(get_current_employee)
+):
+    # Served from the in-memory prefix index, same visibility as the list endpoint
+    department = None
+    if current_employee.role not in [RoleEnum.HR, RoleEnum.ADMIN, RoleEnum.SUPER_ADMIN]:
+        department = current_employee.department
+    
+    return [suggestion._asdict() for suggestion in suggest(db, q, limit, department)]
+
+def _bulk_result(results: List[dict]) -> dict:
+    updated = [result["id"] for result in results if result["outcome"] == UPDATED]
+    if updated:
+        response_cache.invalidate(EMPLOYEES_TAG, *(employee_tag(employee_pk) for employee_pk in updated))
+    return {"updated": len(updated), "results": results}
+
+@router.patch("/bulk", response_model=EmployeeBulkResult)
+def bulk_update(
+    bulk_update: EmployeeBulkUpdate,
+    db: Session = Depends(get_db),
+    current_employee: Employee = Depends(require_hr_or_admin)
+):
+    # One transaction with set-based UPDATEs; entries that can't apply are reported per id
+    updates = [update_data.dict(exclude_unset=True) for update_data in bulk_update.updates]
+    return _bulk_result(bulk_update_employees(db, updates))
+
+@router.patch("/bulk/filter", response_model=EmployeeBulkResult)
+def bulk_update_by_filter(
+    filter_update: EmployeeFilterUpdate,
+    db: Session = Depends(get_db),
+    current_employee: Employee = Depends(require_hr_or_admin)
+):
+    criteria = filter_update.filter.dict(exclude_unset=True)
+    if criteria.get("ids") is None:
+        criteria.pop("ids", None)
+    if not criteria:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="At least one filter is required"
+        )
+    changes = filter_update.update.dict(exclude_unset=True)
+    if not changes:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="No fields to update"
+        )
+    if "email" in changes:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Email must be unique and can't be set by filter"
+        )
+    
+    try:
+        results = update_employees_where(db, criteria, changes)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    return _bulk_result(results)
+
+@router.get("/{employee_id}", response_model=EmployeeResponse)
+@response_cache.cached(EmployeeResponse, tags=[employee_tag("{employee_id}")])
+def get_employee(
+    employee_id: int,
+    include_archived: bool = False,
+    db: Session = Depends(get_db),
+    current_employee: Employee = Depends(get_current_employee)
+):
+    employee = db.query(Employee).filter(Employee.id == employee_id).first()
+    if not employee and include_archived:
+        employee = find_archived_employee(db, employee_id)
+    if not employee:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Employee not found"
+        )
+    
+    # Check permissions
+    if (current_employee.id != employee_id and 
+        current_employee.role not in [RoleEnum.HR, RoleEnum.ADMIN, RoleEnum.SUPER_ADMIN] and
+        current_employee.department != employee.department):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not authorized to view this employee"
+        )
+    
+    return employee
+
+def employee_etag(version: int) -> str:
+    return f'"{version}"'
+
+def if_match_versions(if_match: Optional[str]) -> Optional[List[int]]:
+    """The versions an If-Match header accepts; None when the write is unconditional.
+
+    Tags are compared strongly, so weak (W/) and malformed tags match nothing.
+    """
+    if if_match is None or if_match.strip() == "*":
+        return None
+    versions = []
+    for tag in if_match.split(","):
+        tag = tag.strip()
+        if len(tag) > 2 and tag[0] == tag[-1] == '"' and tag[1:-1].isdigit():
+            versions.append(int(tag[1:-1]))
+    return versions
+
+def _write_employee(db: Session, employee_id: int, changes: dict, if_match: Optional[str], response: Response):
+    """One conditional UPDATE ... RETURNING; 404 for a missing employee, 412 for a stale If-Match"""
+    try:
+        row = update_employee_row(db, employee_id, changes, if_match_versions(if_match))
+    except LookupError:
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Employee not found"
+        )
+    except VersionConflict as e:
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_412_PRECONDITION_FAILED,
+            detail="Employee was modified by someone else",
+            headers={"ETag": employee_etag(e.current_version)}
+        )
+    db.commit()
+    response_cache.invalidate(EMPLOYEES_TAG, employee_tag(employee_id))
+    response.headers["ETag"] = employee_etag(row.version)
+    return row
+
+@router.put("/{employee_id}", response_model=EmployeeResponse)
+def update_employee(
+    employee_id: int,
+    employee_update: EmployeeUpdate,
+    response: Response,
+    if_match: Optional[str] = Header(None),
+    db: Session = Depends(get_db),
+    current_employee: Employee = Depends(require_hr_or_admin)
+):
+    # The response is the row the UPDATE returned, not a second read
+    return _write_employee(db, employee_id, employee_update.dict(exclude_unset=True), if_match, response)
+
+@router.patch("/{employee_id}/status")
+def update_employee_status(
+    employee_id: int,
+    status: StatusEnum,
+    response: Response,
+    if_match: Optional[str] = Header(None),
+    db: Session = Depends(get_db),
+    current_employee: Employee = Depends(require_hr_or_admin)
+):
+    _write_employee(db, employee_id, {"status": status}, if_match, response)
+    return {"message": f"Employee status updated to {status.value}"}
+
+@router.delete("/{employee_id}")
+def delete_employee(
+    employee_id: int,
+    response: Response,
+    if_match: Optional[str] = Header(None),
+    db: Session = Depends(get_db),
+    current_employee: Employee = Depends(require_super_admin)
+):
+    # Soft delete by setting status to inactive
+    _write_employee(db, employee_id, {"status": StatusEnum.INACTIVE}, if_match, response)
+    return {"message": "Employee deactivated successfully"}
+
+@router.get("/departments/list")
+@response_cache.cached(List[str], tags=[EMPLOYEES_TAG], scope=shared_scope)
+def get_departments(
+    db: Session = Depends(get_db),
+    current_employee: Employee = Depends(get_current_employee)
+):
+    departments = db.query(Employee.department).distinct().all()
+    return [dept[0] for dept in departments]
+
+@router.get("/hierarchy/{employee_id}")
+def get_employee_hierarchy(
+    employee_id: int,
+    db: Session = Depends(get_db),
+    current_employee: Employee = Depends(get_current_employee)
+):
+    employee = db.query(Employee).options(
+        joinedload(Employee.manager),
+        joinedload(Employee.team_leader)
+    ).filter(Employee.id == employee_id).first()
+    if not employee:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Employee not found"
+        )
+    
+    hierarchy = {
+        "employee": employee,
+        "manager": employee.manager,
+        "team_leader": employee.team_leader,
+        "subordinates": db.query(Employee).filter(
+            (Employee.manager_id == employee_id) | 
+            (Employee.team_leader_id == employee_id)
+        ).all()
+    }
+    
     return hierarchy
\ No newline at end of file
@@ -0,0 +1,124 @@
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.orm import Session, joinedload
+from typing import List, Optional
+from datetime import datetime
+from app.database.database import get_db
+from app.schemas.goal import GoalCreate, GoalUpdate, GoalResponse, GoalTreeNode
+from app.models.goal import Goal, GoalStatusEnum, GoalTypeEnum
+from app.models.employee import Employee, RoleEnum
+from app.api.deps import get_current_employee
+from app.services.goal_rollup import leaf_progress, rollup_from, would_create_cycle, load_tree
+
+router = APIRouter()
+
+MANAGEMENT_ROLES = [RoleEnum.HR, RoleEnum.ADMIN, RoleEnum.SUPER_ADMIN]
+
+def goal_query(db: Session):
+    return db.query(Goal).options(
+        joinedload(Goal.assignee).load_only(Employee.full_name),
+        joinedload(Goal.creator).load_only(Employee.full_name)
+    )
+
+def check_parent(db: Session, parent_id: Optional[int], current_employee: Employee):
+    if parent_id is None:
+        return
+    parent = db.query(Goal.assigned_to).filter(Goal.id == parent_id).first()
+    if not parent:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Parent goal not found"
+        )
+
+    # Linking a goal moves the parent's progress, so any goal only takes
+    # children from management or whoever owns it
+    if current_employee.role not in MANAGEMENT_ROLES and parent.assigned_to != current_employee.id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not authorized to link goals under this parent"
+        )
+
+@router.get("/tree", response_model=List[GoalTreeNode])
+def get_goal_tree(
+    root_id: Optional[int] = None,
+    db: Session = Depends(get_db),
+    current_employee: Employee = Depends(get_current_employee)
+):
+    return load_tree(db, root_id)
+
+@router.post("/", response_model=GoalResponse)
+def create_goal(
+    goal_data: GoalCreate,
+    db: Session = Depends(get_db),
+    current_employee: Employee = Depends(get_current_employee)
+):
+    # Only management sets goals above the individual level or for other people
+    if current_employee.role not in MANAGEMENT_ROLES and (
+        goal_data.goal_type != GoalTypeEnum.INDIVIDUAL or goal_data.assigned_to != current_employee.id
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not authorized to create this goal"
+        )
+    check_parent(db, goal_data.parent_id, current_employee)
+
+    db_goal = Goal(**goal_data.dict(), created_by=current_employee.id)
+    db_goal.progress_percentage = leaf_progress(db_goal)
+    db.add(db_goal)
+    db.flush()
+    goal_id = db_goal.id
+
+    rollup_from(db, goal_data.parent_id)
+    db.commit()
+
+    return goal_query(db).filter(Goal.id == goal_id).one()
+
+@router.patch("/{goal_id}", response_model=GoalResponse)
+def update_goal(
+    goal_id: int,
+    goal_update: GoalUpdate,
+    db: Session = Depends(get_db),
+    current_employee: Employee = Depends(get_current_employee)
+):
+    goal = db.query(Goal).filter(Goal.id == goal_id).first()
+    if not goal:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Goal not found"
+        )
+
+    if (current_employee.role not in MANAGEMENT_ROLES and
+        current_employee.id not in (goal.assigned_to, goal.created_by)):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not authorized to update this goal"
+        )
+
+    update_data = goal_update.dict(exclude_unset=True)
+    old_parent_id = goal.parent_id
+    new_parent_id = update_data.get("parent_id", old_parent_id)
+    if new_parent_id != old_parent_id and new_parent_id is not None:
+        check_parent(db, new_parent_id, current_employee)
+        if would_create_cycle(db, goal_id, new_parent_id):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="A goal cannot be moved under its own subtree"
+            )
+
+    # Update fields
+    for field, value in update_data.items():
+        setattr(goal, field, value)
+
+    # Progress of goals with children is derived, measured values only drive leaves
+    if not goal.children and {"current_value", "target_value"} & update_data.keys():
+        goal.progress_percentage = leaf_progress(goal)
+    if goal.status == GoalStatusEnum.COMPLETED and not goal.completed_date:
+        goal.completed_date = datetime.utcnow()
+    db.flush()
+
+    # Only the changed goal's ancestors are recomputed
+    rollup_from(db, new_parent_id)
+    if old_parent_id != new_parent_id:
+        rollup_from(db, old_parent_id)
+    db.commit()
+
+    return goal_query(db).filter(Goal.id == goal_id).one()
\ No newline at end of file
@@ -0,0 +1,65 @@
+import asyncio
+from fastapi import APIRouter, HTTPException, Query, WebSocket, WebSocketDisconnect, status
+from fastapi.concurrency import run_in_threadpool
+from typing import Optional, Tuple
+from app.database.database import SessionLocal
+from app.core.security import verify_token
+from app.models.employee import Employee, StatusEnum
+from app.services.push_hub import PushConnection, push_hub
+import logging
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter()
+
+def authenticate(token: str) -> Optional[Tuple[int, str, str]]:
+    """Resolve a JWT to (id, department, role) once, when the socket opens"""
+    try:
+        employee_id = verify_token(token)
+    except HTTPException:
+        return None
+    db = SessionLocal()
+    try:
+        return db.query(Employee.id, Employee.department, Employee.role).filter(
+            Employee.employee_id == employee_id,
+            Employee.status == StatusEnum.ACTIVE
+        ).first()
+    finally:
+        db.close()
+
+async def wait_for_disconnect(websocket: WebSocket):
+    # Nothing is expected from the client; reading only notices the disconnect
+    try:
+        while True:
+            await websocket.receive_text()
+    except WebSocketDisconnect:
+        pass
+
+@router.websocket("/ws")
+async def push_socket(websocket: WebSocket, token: str = Query(...)):
+    # Browsers can't set headers on a WebSocket, so the token comes as a query parameter
+    employee = await run_in_threadpool(authenticate, token)
+    if employee is None:
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
+        return
+    
+    await websocket.accept()
+    employee_pk, department, role = employee
+    connection = PushConnection(websocket, employee_pk, department, role.value)
+    push_hub.subscribe(connection)
+    receiver = asyncio.create_task(wait_for_disconnect(websocket))
+    sender = asyncio.create_task(connection.send_forever())
+    try:
+        # Whichever ends first, the client left or a send failed, ends the subscription
+        await asyncio.wait({receiver, sender}, return_when=asyncio.FIRST_COMPLETED)
+    finally:
+        push_hub.unsubscribe(connection)
+        receiver.cancel()
+        sender.cancel()
+    
+    if sender.done() and not sender.cancelled() and sender.exception() is not None:
+        logger.warning(f"Push send to employee {employee_pk} failed: {sender.exception()}")
+        try:
+            await websocket.close()
+        except Exception:
+            pass
\ No newline at end of file
@@ -0,0 +1,41 @@
+from fastapi import APIRouter, Depends, HTTPException, status, Query
+from sqlalchemy.orm import Session
+from typing import List, Optional
+from app.database.database import get_db
+from app.schemas.search import SearchHit, SearchResponse, SearchReindexResponse
+from app.models.employee import Employee
+from app.api.deps import get_current_employee, require_super_admin
+from app.services.search import rebuild_index, search
+
+router = APIRouter()
+
+@router.get("/", response_model=SearchResponse)
+def search_documents(
+    q: str = Query(..., min_length=1, max_length=200),
+    types: Optional[List[str]] = Query(None),
+    limit: int = Query(20, ge=1, le=100),
+    db: Session = Depends(get_db),
+    current_employee: Employee = Depends(get_current_employee)
+):
+    try:
+        hits = search(db, current_employee, q, types, limit)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    
+    return SearchResponse(
+        query=q,
+        results=[
+            SearchHit(doc_type=doc_type, doc_id=doc_id, title=title, snippet=snippet, score=score)
+            for doc_type, doc_id, title, snippet, score in hits
+        ]
+    )
+
+@router.post("/reindex", response_model=SearchReindexResponse)
+def reindex(
+    db: Session = Depends(get_db),
+    current_employee: Employee = Depends(require_super_admin)
+):
+    return SearchReindexResponse(documents_indexed=rebuild_index(db))
\ No newline at end of file
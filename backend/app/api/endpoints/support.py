@@ -0,0 +1,103 @@
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.orm import Session
+from typing import List, Optional
+from datetime import datetime
+from app.database.database import get_db
+from app.schemas.support_ticket import SupportTicketCreate, SupportTicketResolve, SupportTicketResponse
+from app.models.support_ticket import SupportTicket, TicketCategoryEnum, TicketStatusEnum
+from app.models.employee import Employee, RoleEnum
+from app.api.deps import get_current_employee, require_hr_or_admin, require_roles
+from app.services.archive import find_archived_tickets
+from app.services.ticket_queue import claim_next_ticket, next_ticket_number
+from app.services.push_hub import push_hub
+
+router = APIRouter()
+
+require_support_agent = require_roles([
+    RoleEnum.HR, RoleEnum.TECH, RoleEnum.FINANCE, RoleEnum.ADMIN, RoleEnum.SUPER_ADMIN
+])
+
+def ticket_response(ticket: SupportTicket, viewer: Employee) -> SupportTicketResponse:
+    response = SupportTicketResponse.model_validate(ticket)
+    # Anonymous tickets never reveal their author to anyone else
+    if ticket.is_anonymous and ticket.created_by != viewer.id:
+        response.created_by = None
+    return response
+
+def publish_ticket(ticket: SupportTicket):
+    # Only the people on the ticket hear about it; the payload never names the creator
+    push_hub.publish(
+        "ticket.updated",
+        {"id": ticket.id, "ticket_number": ticket.ticket_number, "status": ticket.status.value},
+        employees=[ticket.created_by, ticket.assigned_to]
+    )
+
+@router.post("/", response_model=SupportTicketResponse)
+def create_ticket(
+    ticket_data: SupportTicketCreate,
+    db: Session = Depends(get_db),
+    current_employee: Employee = Depends(get_current_employee)
+):
+    db_ticket = SupportTicket(
+        **ticket_data.dict(),
+        ticket_number=next_ticket_number(db),
+        created_by=current_employee.id
+    )
+    db.add(db_ticket)
+    db.commit()
+    db.refresh(db_ticket)
+    
+    return ticket_response(db_ticket, current_employee)
+
+@router.post("/claim", response_model=Optional[SupportTicketResponse])
+def claim_ticket(
+    category: Optional[TicketCategoryEnum] = None,
+    db: Session = Depends(get_db),
+    current_employee: Employee = Depends(require_support_agent)
+):
+    ticket_id = claim_next_ticket(db, current_employee.id, category)
+    if ticket_id is None:
+        return None
+    
+    ticket = db.query(SupportTicket).filter(SupportTicket.id == ticket_id).one()
+    publish_ticket(ticket)
+    return ticket_response(ticket, current_employee)
+
+@router.post("/{ticket_id}/resolve", response_model=SupportTicketResponse)
+def resolve_ticket(
+    ticket_id: int,
+    resolution: SupportTicketResolve,
+    db: Session = Depends(get_db),
+    current_employee: Employee = Depends(require_support_agent)
+):
+    ticket = db.query(SupportTicket).filter(SupportTicket.id == ticket_id).first()
+    if not ticket:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Ticket not found"
+        )
+    
+    if (ticket.assigned_to != current_employee.id and
+        current_employee.role not in [RoleEnum.ADMIN, RoleEnum.SUPER_ADMIN]):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Only the assigned agent can resolve this ticket"
+        )
+    
+    ticket.status = TicketStatusEnum.RESOLVED
+    ticket.resolved_at = datetime.utcnow()
+    ticket.resolution_notes = resolution.resolution_notes
+    db.commit()
+    db.refresh(ticket)
+    
+    publish_ticket(ticket)
+    return ticket_response(ticket, current_employee)
+
+@router.get("/archived", response_model=List[SupportTicketResponse])
+def get_archived_tickets(
+    created_by: int,
+    db: Session = Depends(get_db),
+    current_employee: Employee = Depends(require_hr_or_admin)
+):
+    # Tickets leave the hot table together with their archived creator
+    return [ticket_response(ticket, current_employee) for ticket in find_archived_tickets(db, created_by)]
\ No newline at end of file
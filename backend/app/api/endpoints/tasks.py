@@ -0,0 +1,187 @@
+from fastapi import APIRouter, Depends, HTTPException, status, Query
+from sqlalchemy.orm import Session, joinedload
+from typing import List, Optional
+from datetime import datetime
+from app.database.database import get_db
+from app.schemas.task import TaskCreate, TaskBulkAssign, TaskUpdate, TaskResponse
+from app.models.task import Task, TaskStatusEnum
+from app.models.employee import Employee, RoleEnum
+from app.api.deps import get_current_employee
+from app.services.push_hub import push_hub
+from app.services.archive import find_archived_task
+
+router = APIRouter()
+
+MANAGEMENT_ROLES = [RoleEnum.HR, RoleEnum.ADMIN, RoleEnum.SUPER_ADMIN]
+
+def task_query(db: Session):
+    """Tasks with assignee and assigner names joined into the same SELECT"""
+    return db.query(Task).options(
+        joinedload(Task.assignee).load_only(Employee.full_name),
+        joinedload(Task.assigner).load_only(Employee.full_name)
+    )
+
+def check_can_assign(current_employee: Employee, assignees: List[Employee]):
+    if current_employee.role in MANAGEMENT_ROLES:
+        return
+    # Everyone else assigns within their own department only
+    if any(assignee.department != current_employee.department for assignee in assignees):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not authorized to assign tasks outside your department"
+        )
+
+def publish_task(event: str, task: Task, *employee_ids: int):
+    push_hub.publish(
+        event,
+        {"id": task.id, "title": task.title, "status": task.status.value, "due_date": task.due_date},
+        employees=employee_ids
+    )
+
+def load_assignees(db: Session, employee_ids: List[int]) -> List[Employee]:
+    assignees = db.query(Employee).filter(Employee.id.in_(employee_ids)).all()
+    missing = set(employee_ids) - {assignee.id for assignee in assignees}
+    if missing:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Employees not found: {', '.join(str(employee_id) for employee_id in sorted(missing))}"
+        )
+    return assignees
+
+@router.get("/", response_model=List[TaskResponse])
+def get_tasks(
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=1000),
+    status: Optional[TaskStatusEnum] = None,
+    assigned_to: Optional[int] = None,
+    db: Session = Depends(get_db),
+    current_employee: Employee = Depends(get_current_employee)
+):
+    query = task_query(db)
+
+    # Apply filters
+    if status:
+        query = query.filter(Task.status == status)
+    if assigned_to:
+        query = query.filter(Task.assigned_to == assigned_to)
+
+    # Role-based access control
+    if current_employee.role not in MANAGEMENT_ROLES:
+        query = query.filter(
+            (Task.assigned_to == current_employee.id) |
+            (Task.assigned_by == current_employee.id)
+        )
+
+    return query.order_by(Task.due_date, Task.id).offset(skip).limit(limit).all()
+
+@router.get("/{task_id}", response_model=TaskResponse)
+def get_task(
+    task_id: int,
+    include_archived: bool = False,
+    db: Session = Depends(get_db),
+    current_employee: Employee = Depends(get_current_employee)
+):
+    task = task_query(db).filter(Task.id == task_id).first()
+    if not task and include_archived:
+        task = find_archived_task(db, task_id)
+    if not task:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Task not found"
+        )
+
+    if (current_employee.role not in MANAGEMENT_ROLES and
+        current_employee.id not in (task.assigned_to, task.assigned_by)):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not authorized to view this task"
+        )
+
+    return task
+
+@router.post("/", response_model=TaskResponse)
+def create_task(
+    task_data: TaskCreate,
+    db: Session = Depends(get_db),
+    current_employee: Employee = Depends(get_current_employee)
+):
+    assignees = load_assignees(db, [task_data.assigned_to])
+    check_can_assign(current_employee, assignees)
+
+    # The reminder job picks up notification_sent=False and emails the assignee
+    db_task = Task(**task_data.dict(), assigned_by=current_employee.id)
+    db.add(db_task)
+    db.flush()
+    task_id = db_task.id
+    db.commit()
+
+    task = task_query(db).filter(Task.id == task_id).one()
+    publish_task("task.assigned", task, task.assigned_to)
+    return task
+
+@router.post("/bulk-assign", response_model=List[TaskResponse])
+def bulk_assign_task(
+    task_data: TaskBulkAssign,
+    db: Session = Depends(get_db),
+    current_employee: Employee = Depends(get_current_employee)
+):
+    assignee_ids = list(dict.fromkeys(task_data.assigned_to))
+    if not assignee_ids:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="At least one assignee is required"
+        )
+
+    assignees = load_assignees(db, assignee_ids)
+    check_can_assign(current_employee, assignees)
+
+    # One transaction: either every assignee gets the task or none does
+    fields = task_data.dict(exclude={"assigned_to"})
+    db_tasks = [
+        Task(**fields, assigned_to=assignee_id, assigned_by=current_employee.id)
+        for assignee_id in assignee_ids
+    ]
+    db.add_all(db_tasks)
+    db.flush()
+    task_ids = [db_task.id for db_task in db_tasks]
+    db.commit()
+
+    tasks = task_query(db).filter(Task.id.in_(task_ids)).order_by(Task.id).all()
+    for task in tasks:
+        publish_task("task.assigned", task, task.assigned_to)
+    return tasks
+
+@router.patch("/{task_id}", response_model=TaskResponse)
+def update_task(
+    task_id: int,
+    task_update: TaskUpdate,
+    db: Session = Depends(get_db),
+    current_employee: Employee = Depends(get_current_employee)
+):
+    task = db.query(Task).filter(Task.id == task_id).first()
+    if not task:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Task not found"
+        )
+
+    if (current_employee.role not in MANAGEMENT_ROLES and
+        current_employee.id not in (task.assigned_to, task.assigned_by)):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not authorized to update this task"
+        )
+
+    # Update fields
+    update_data = task_update.dict(exclude_unset=True)
+    for field, value in update_data.items():
+        setattr(task, field, value)
+
+    if update_data.get("status") == TaskStatusEnum.COMPLETED and not task.completed_date:
+        task.completed_date = datetime.utcnow()
+
+    db.commit()
+
+    task = task_query(db).filter(Task.id == task_id).one()
+    publish_task("task.updated", task, task.assigned_to, task.assigned_by)
+    return task
\ No newline at end of file
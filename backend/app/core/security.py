@@ -1,71 +1,74 @@
-from datetime import datetime, timedelta
-from typing import Optional, Union
-from jose import JWTError, jwt
-from passlib.context import CryptContext
-from fastapi import HTTPException, status
-from app.core.config import settings
-import secrets
-import string
-
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
-
-def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
-    to_encode = data.copy()
-    if expires_delta:
-        expire = datetime.utcnow() + expires_delta
-    else:
-        expire = datetime.utcnow() + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
-    
-    to_encode.update({"exp": expire})
-    encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
-    return encoded_jwt
-
-def verify_token(token: str):
-    try:
-        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
-        employee_id: str = payload.get("sub")
-        if employee_id is None:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Could not validate credentials"
-            )
-        return employee_id
-    except JWTError:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Could not validate credentials"
-        )
-
-def verify_password(plain_password: str, hashed_password: str) -> bool:
-    return pwd_context.verify(plain_password, hashed_password)
-
-def get_password_hash(password: str) -> str:
-    return pwd_context.hash(password)
-
-def generate_password(length: int = 12) -> str:
-    """Generate a secure random password"""
-    alphabet = string.ascii_letters + string.digits + "!@#$%^&*"
-    password = ''.join(secrets.choice(alphabet) for _ in range(length))
-    return password
-
-def generate_employee_id(department: str) -> str:
-    """Generate employee ID based on department"""
-    dept_codes = {
-        "HR": "HR",
-        "Technology": "TEC",
-        "Finance": "FIN",
-        "Sales": "SAL",
-        "Marketing": "MKT",
-        "Operations": "OPS",
-        "Admin": "ADM"
-    }
-    
-    dept_code = dept_codes.get(department, "EMP")
-    timestamp = datetime.now().strftime("%y%m")
-    random_num = secrets.randbelow(9999)
-    
-    return f"{dept_code}{timestamp}{random_num:04d}"
-
-def generate_otp() -> str:
-    """Generate 6-digit OTP"""
+from datetime import datetime, timedelta
+from typing import Optional, Union
+from jose import JWTError, jwt
+from passlib.context import CryptContext
+from fastapi import HTTPException, status
+from app.core.config import settings
+from app.services.tracing import tracer
+import secrets
+import string
+
+pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=settings.BCRYPT_ROUNDS)
+
+def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
+    to_encode = data.copy()
+    if expires_delta:
+        expire = datetime.utcnow() + expires_delta
+    else:
+        expire = datetime.utcnow() + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+    
+    to_encode.update({"exp": expire})
+    encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
+    return encoded_jwt
+
+def verify_token(token: str):
+    try:
+        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+        employee_id: str = payload.get("sub")
+        if employee_id is None:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Could not validate credentials"
+            )
+        return employee_id
+    except JWTError:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Could not validate credentials"
+        )
+
+def verify_password(plain_password: str, hashed_password: str) -> bool:
+    with tracer.span("bcrypt.verify"):
+        return pwd_context.verify(plain_password, hashed_password)
+
+def get_password_hash(password: str) -> str:
+    with tracer.span("bcrypt.hash"):
+        return pwd_context.hash(password)
+
+def generate_password(length: int = 12) -> str:
+    """Generate a secure random password"""
+    alphabet = string.ascii_letters + string.digits + "!@#$%^&*"
+    password = ''.join(secrets.choice(alphabet) for _ in range(length))
+    return password
+
+def generate_employee_id(department: str) -> str:
+    """Generate employee ID based on department"""
+    dept_codes = {
+        "HR": "HR",
+        "Technology": "TEC",
+        "Finance": "FIN",
+        "Sales": "SAL",
+        "Marketing": "MKT",
+        "Operations": "OPS",
+        "Admin": "ADM"
+    }
+    
+    dept_code = dept_codes.get(department, "EMP")
+    timestamp = datetime.now().strftime("%y%m")
+    random_num = secrets.randbelow(9999)
+    
+    return f"{dept_code}{timestamp}{random_num:04d}"
+
+def generate_otp() -> str:
+    """Generate 6-digit OTP"""
     return ''.join(secrets.choice(string.digits) for _ in range(6))
\ No newline at end of file
@@ -0,0 +1,273 @@
+import os
+import random
+import select
+import signal
+import socket
+import time
+from typing import Dict, Optional, Tuple
+import uvicorn
+from uvicorn.importer import import_from_string
+import logging
+
+logger = logging.getLogger(__name__)
+
+# A worker that dies sooner than this after starting is respawned with a delay
+MIN_WORKER_LIFETIME_SECONDS = 1
+
+def pool_sizes(max_connections: int, workers: int) -> Tuple[int, int]:
+    """Split a total connection budget evenly across workers: (pool_size, max_overflow) for each"""
+    return max(1, max_connections // workers), 0
+
+def invalidation_bus_for(bus: str, workers: int) -> str:
+    """Every worker keeps its own caches; with more than one, they need a bus to hear about each other's writes"""
+    if bus == "none" and workers > 1:
+        return "unix"
+    return bus
+
+class _WorkerServer(uvicorn.Server):
+    """Tells the supervisor once the app has started and the socket is being served"""
+
+    def __init__(self, config: uvicorn.Config, ready_fd: int):
+        super().__init__(config)
+        self.ready_fd = ready_fd
+
+    async def startup(self, sockets=None):
+        await super().startup(sockets=sockets)
+        if not self.should_exit:
+            os.write(self.ready_fd, b"1")
+        os.close(self.ready_fd)
+
+class Worker:
+    def __init__(self, pid: int, slot: int, ready_fd: int):
+        self.pid = pid
+        self.slot = slot
+        self.ready_fd = ready_fd
+        self.started_at = time.monotonic()
+
+class Supervisor:
+    """Pre-forks uvicorn workers that share one listening socket and keeps `workers` of them running.
+
+    With `preload` the app is imported once here and inherited by every
+    worker. SIGHUP replaces the workers one at a time: a new worker must be
+    serving before the old one in its slot is asked to drain, so capacity never
+    drops. SIGTERM/SIGINT drain all of them. A worker that exits on its own,
+    e.g. after serving its max requests, is replaced in the same slot.
+    """
+
+    def __init__(
+        self,
+        app: str,
+        host: str,
+        port: int,
+        workers: int,
+        preload: bool = True,
+        max_requests: int = 0,
+        max_requests_jitter: int = 0,
+        graceful_timeout: int = 30,
+        log_level: str = "info"
+    ):
+        self.app_path = app
+        self.host = host
+        self.port = port
+        self.workers = workers
+        self.preload = preload
+        self.max_requests = max_requests
+        self.max_requests_jitter = max_requests_jitter
+        self.graceful_timeout = graceful_timeout
+        self.log_level = log_level
+        self.app = None
+        self.socket: Optional[socket.socket] = None
+        self._workers: Dict[int, Worker] = {}
+        self._wake_r, self._wake_w = -1, -1
+        self._signals = []
+        self._respawn_at = 0.0
+
+    def run(self):
+        self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self.socket.bind((self.host, self.port))
+        self.socket.listen(2048)
+        self.socket.set_inheritable(True)
+        if self.preload:
+            self.app = import_from_string(self.app_path)
+            # Connections opened while importing (create_all) must not be shared with the workers
+            from app.database.database import engine
+            engine.dispose()
+
+        self._wake_r, self._wake_w = os.pipe()
+        os.set_blocking(self._wake_w, False)
+        for sig in (signal.SIGHUP, signal.SIGTERM, signal.SIGINT, signal.SIGCHLD):
+            signal.signal(sig, self._on_signal)
+        logger.info(f"Supervisor {os.getpid()} serving on {self.host}:{self.port} with {self.workers} workers")
+
+        for slot in range(self.workers):
+            self._spawn(slot)
+        try:
+            while True:
+                self._reap()
+                if self._pop_signal((signal.SIGTERM, signal.SIGINT)):
+                    break
+                if self._pop_signal((signal.SIGHUP,)):
+                    self._rolling_restart()
+                    continue
+                self._replace_missing()
+                self._wait(1)
+        finally:
+            self._shutdown()
+
+    def _on_signal(self, sig, frame):
+        self._signals.append(sig)
+        try:
+            os.write(self._wake_w, b"\0")
+        except BlockingIOError:
+            pass
+
+    def _pop_signal(self, wanted) -> bool:
+        found = any(sig in wanted for sig in self._signals)
+        self._signals = [sig for sig in self._signals if sig not in wanted]
+        return found
+
+    def _wait(self, timeout: float):
+        if select.select([self._wake_r], [], [], timeout)[0]:
+            os.read(self._wake_r, 1024)
+
+    def _spawn(self, slot: int) -> Worker:
+        ready_r, ready_w = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            os.close(ready_r)
+            try:
+                self._run_worker(slot, ready_w)
+            except BaseException:
+                logger.exception(f"Worker in slot {slot} crashed")
+                os._exit(1)
+            os._exit(0)
+        os.close(ready_w)
+        worker = Worker(pid, slot, ready_r)
+        self._workers[pid] = worker
+        logger.info(f"Started worker {pid} in slot {slot}")
+        return worker
+
+    def _run_worker(self, slot: int, ready_fd: int):
+        for sig in (signal.SIGHUP, signal.SIGTERM, signal.SIGINT, signal.SIGCHLD):
+            signal.signal(sig, signal.SIG_DFL)
+        os.close(self._wake_r)
+        os.close(self._wake_w)
+        for other in self._workers.values():
+            os.close(other.ready_fd)
+        application = self.app if self.app is not None else import_from_string(self.app_path)
+
+        from app.core.config import settings
+        from app.database.database import engine
+        from app.services.worker_stats import worker_stats
+        engine.dispose(close=False)
+        worker_stats.slot = slot
+        worker_stats.started_at = time.time()
+        worker_stats.requests = 0
+        # Periodic maintenance jobs run once per deployment, not once per worker
+        settings.SCHEDULER_ENABLED = settings.SCHEDULER_ENABLED and slot == 0
+
+        limit = None
+        if self.max_requests > 0:
+            limit = self.max_requests + random.randint(0, self.max_requests_jitter)
+        config = uvicorn.Config(
+            application,
+            log_level=self.log_level,
+            limit_max_requests=limit,
+            timeout_graceful_shutdown=self.graceful_timeout
+        )
+        _WorkerServer(config, ready_fd).run(sockets=[self.socket])
+
+    def _reap(self):
+        while self._workers:
+            try:
+                pid, status = os.waitpid(-1, os.WNOHANG)
+            except ChildProcessError:
+                return
+            if pid == 0:
+                return
+            worker = self._workers.pop(pid, None)
+            if worker is None:
+                continue
+            os.close(worker.ready_fd)
+            self._remove_stats(pid)
+            logger.info(f"Worker {pid} in slot {worker.slot} exited with status {os.waitstatus_to_exitcode(status)}")
+            if time.monotonic() - worker.started_at < MIN_WORKER_LIFETIME_SECONDS:
+                # Most likely failing on startup; don't fork in a tight loop
+                self._respawn_at = time.monotonic() + MIN_WORKER_LIFETIME_SECONDS
+
+    def _remove_stats(self, pid: int):
+        from app.core.config import settings
+        try:
+            os.unlink(os.path.join(settings.WORKER_STATS_DIR, f"{pid}.json"))
+        except FileNotFoundError:
+            pass
+
+    def _replace_missing(self):
+        if time.monotonic() < self._respawn_at:
+            return
+        taken = {worker.slot for worker in self._workers.values()}
+        for slot in range(self.workers):
+            if slot not in taken:
+                self._spawn(slot)
+
+    def _wait_ready(self, worker: Worker) -> bool:
+        deadline = time.monotonic() + self.graceful_timeout
+        while time.monotonic() < deadline and worker.pid in self._workers:
+            readable = select.select([worker.ready_fd, self._wake_r], [], [], deadline - time.monotonic())[0]
+            if worker.ready_fd in readable:
+                return os.read(worker.ready_fd, 1) == b"1"
+            if self._wake_r in readable:
+                os.read(self._wake_r, 1024)
+                self._reap()
+        return False
+
+    def _stop_worker(self, worker: Worker):
+        """SIGTERM, then SIGKILL if the worker has not drained within the graceful timeout"""
+        try:
+            os.kill(worker.pid, signal.SIGTERM)
+        except ProcessLookupError:
+            return
+        deadline = time.monotonic() + self.graceful_timeout + 5
+        while worker.pid in self._workers and time.monotonic() < deadline:
+            self._wait(0.1)
+            self._reap()
+        if worker.pid in self._workers:
+            logger.warning(f"Worker {worker.pid} did not drain in time, killing it")
+            os.kill(worker.pid, signal.SIGKILL)
+            while worker.pid in self._workers:
+                self._wait(0.1)
+                self._reap()
+
+    def _rolling_restart(self):
+        logger.info("Rolling restart of all workers")
+        for old in sorted(self._workers.values(), key=lambda worker: worker.slot):
+            if any(sig in (signal.SIGTERM, signal.SIGINT) for sig in self._signals):
+                return
+            if old.pid not in self._workers:
+                continue
+            replacement = self._spawn(old.slot)
+            if not self._wait_ready(replacement):
+                logger.error(f"Replacement worker {replacement.pid} failed to start, keeping worker {old.pid}")
+                self._stop_worker(replacement)
+                return
+            self._stop_worker(old)
+
+    def _shutdown(self):
+        logger.info(f"Stopping {len(self._workers)} workers")
+        for worker in list(self._workers.values()):
+            try:
+                os.kill(worker.pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+        deadline = time.monotonic() + self.graceful_timeout + 5
+        while self._workers and time.monotonic() < deadline:
+            self._wait(0.1)
+            self._reap()
+        for worker in list(self._workers.values()):
+            logger.warning(f"Worker {worker.pid} did not drain in time, killing it")
+            os.kill(worker.pid, signal.SIGKILL)
+        while self._workers:
+            self._wait(0.1)
+            self._reap()
+        self.socket.close()
\ No newline at end of file
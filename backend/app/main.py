@@ -1,68 +1,158 @@
-from fastapi import FastAPI, HTTPException
-from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
-from app.core.config import settings
-from app.database.database import engine, Base
-from app.api.endpoints import auth, employees
-import logging
-
-# Configure logging
-logging.basicConfig(level=logging.INFO)
-logger = logging.getLogger(__name__)
-
-# Create database tables
-Base.metadata.create_all(bind=engine)
-
-app = FastAPI(
-    title="Employee Dashboard API",
-    description="Comprehensive Employee Management System API",
-    version="1.0.0",
-    docs_url="/docs" if settings.DEBUG else None,
-    redoc_url="/redoc" if settings.DEBUG else None
-)
-
-# CORS middleware
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=settings.ALLOWED_HOSTS,
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
-
-# Exception handler
-@app.exception_handler(Exception)
-async def global_exception_handler(request, exc):
-    logger.error(f"Global exception: {exc}")
-    return JSONResponse(
-        status_code=500,
-        content={"detail": "Internal server error"}
-    )
-
-# Health check
-@app.get("/health")
-async def health_check():
-    return {"status": "healthy", "timestamp": "2024-01-15T10:00:00Z"}
-
-# Include routers
-app.include_router(auth.router, prefix="/api/auth", tags=["Authentication"])
-app.include_router(employees.router, prefix="/api/employees", tags=["Employees"])
-
-# Root endpoint
-@app.get("/")
-async def root():
-    return {
-        "message": "Employee Dashboard API",
-        "version": "1.0.0",
-        "docs": "/docs" if settings.DEBUG else "Documentation disabled in production"
-    }
-
-if __name__ == "__main__":
-    import uvicorn
-    uvicorn.run(
-        "app.main:app",
-        host="0.0.0.0",
-        port=8000,
-        reload=settings.DEBUG,
-        log_level="info"
+from fastapi import FastAPI, Header, HTTPException, Response, status
+from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
+from app.core.config import settings
+from app.database.database import engine, Base
+from app.api.endpoints import auth, employees, analytics, tasks, goals, announcements, support, search, push, dashboard, admin
+from app.services.scheduler import scheduler
+from app.services.push_hub import push_hub
+from app.services.invalidation_bus import invalidation_bus
+from app.services.worker_stats import worker_stats, RequestCounterMiddleware
+from app.services.metrics import CONTENT_TYPE, MetricsMiddleware, install_query_hooks, registry
+from app.services.query_guard import NPlusOneMiddleware, install_n_plus_one_detector
+from app.services.request_profiler import ProfilingMiddleware
+from app.services.tracing import TracingMiddleware, install_query_hooks as install_tracing_hooks, tracer
+from app.services.task_counters import run_task_counter_reconciliation
+from app.services.overdue_sweeper import run_overdue_sweep
+from app.services.archive import run_archival
+from typing import Optional
+import asyncio
+import logging
+import secrets
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Create database tables
+Base.metadata.create_all(bind=engine)
+
+app = FastAPI(
+    title="Employee Dashboard API",
+    description="Comprehensive Employee Management System API",
+    version="1.0.0",
+    docs_url="/docs" if settings.DEBUG else None,
+    redoc_url="/redoc" if settings.DEBUG else None
+)
+
+# CORS middleware
+app.add_middleware(
+    CORSMiddleware,
+    allow_origins=settings.ALLOWED_HOSTS,
+    allow_credentials=True,
+    allow_methods=["*"],
+    allow_headers=["*"],
+)
+app.add_middleware(RequestCounterMiddleware)
+if settings.METRICS_ENABLED:
+    app.add_middleware(MetricsMiddleware)
+    install_query_hooks(engine)
+if settings.N_PLUS_ONE_DETECTION != "off":
+    app.add_middleware(NPlusOneMiddleware)
+    install_n_plus_one_detector()
+if settings.TRACING_EXPORTER != "none":
+    app.add_middleware(TracingMiddleware)
+    install_tracing_hooks(engine)
+# Outermost, so the Super Admin lookup stays out of the request's own metrics and query budget
+if settings.PROFILING_ENABLED:
+    app.add_middleware(ProfilingMiddleware)
+
+# Exception handler
+@app.exception_handler(Exception)
+async def global_exception_handler(request, exc):
+    logger.error(f"Global exception: {exc}")
+    return JSONResponse(
+        status_code=500,
+        content={"detail": "Internal server error"}
+    )
+
+# Background jobs
+scheduler.add_job(run_task_counter_reconciliation, settings.TASK_COUNTER_RECONCILE_INTERVAL_SECONDS)
+scheduler.add_job(run_overdue_sweep, settings.OVERDUE_SWEEP_INTERVAL_SECONDS)
+scheduler.add_job(run_archival, settings.ARCHIVE_INTERVAL_SECONDS)
+
+@app.on_event("startup")
+async def bind_push_hub():
+    # Write paths publish from the threadpool and need the loop the sockets live on
+    push_hub.bind_loop(asyncio.get_running_loop())
+
+@app.on_event("startup")
+async def start_invalidation_bus():
+    invalidation_bus.start()
+
+@app.on_event("shutdown")
+async def stop_invalidation_bus():
+    invalidation_bus.stop()
+
+@app.on_event("startup")
+async def start_worker_stats():
+    worker_stats.start()
+
+@app.on_event("shutdown")
+async def stop_worker_stats():
+    await worker_stats.stop()
+
+@app.on_event("startup")
+async def start_scheduler():
+    if settings.SCHEDULER_ENABLED:
+        scheduler.start()
+
+@app.on_event("shutdown")
+async def stop_scheduler():
+    await scheduler.stop()
+
+# Last, so spans of the jobs stopped above are written too
+@app.on_event("shutdown")
+async def flush_traces():
+    tracer.flush()
+
+# Health check
+@app.get("/health")
+async def health_check():
+    return {"status": "healthy", "timestamp": "2024-01-15T10:00:00Z"}
+
+if settings.METRICS_ENABLED:
+    @app.get("/metrics", include_in_schema=False)
+    def metrics(authorization: Optional[str] = Header(None)):
+        # Route and query statistics are for operators only: without a token, keep /metrics off public networks
+        if settings.METRICS_TOKEN and not secrets.compare_digest(authorization or "", f"Bearer {settings.METRICS_TOKEN}"):
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Invalid metrics token",
+                headers={"WWW-Authenticate": "Bearer"}
+            )
+        # Summed over every live worker, from the snapshots they share for /api/admin/workers
+        dumps = [worker["metrics"] for worker in worker_stats.collect() if worker.get("metrics")]
+        return Response(content=registry.render(dumps), media_type=CONTENT_TYPE)
+
+# Include routers
+app.include_router(auth.router, prefix="/api/auth", tags=["Authentication"])
+app.include_router(employees.router, prefix="/api/employees", tags=["Employees"])
+app.include_router(analytics.router, prefix="/api/analytics", tags=["Analytics"])
+app.include_router(tasks.router, prefix="/api/tasks", tags=["Tasks"])
+app.include_router(goals.router, prefix="/api/goals", tags=["Goals"])
+app.include_router(announcements.router, prefix="/api/announcements", tags=["Announcements"])
+app.include_router(support.router, prefix="/api/support", tags=["Support"])
+app.include_router(search.router, prefix="/api/search", tags=["Search"])
+app.include_router(push.router, prefix="/api/push", tags=["Push"])
+app.include_router(dashboard.router, prefix="/api/dashboard", tags=["Dashboard"])
+app.include_router(admin.router, prefix="/api/admin", tags=["Admin"])
+
+# Root endpoint
+@app.get("/")
+async def root():
+    return {
+        "message": "Employee Dashboard API",
+        "version": "1.0.0",
+        "docs": "/docs" if settings.DEBUG else "Documentation disabled in production"
+    }
+
+if __name__ == "__main__":
+    import uvicorn
+    uvicorn.run(
+        "app.main:app",
+        host="0.0.0.0",
+        port=8000,
+        reload=settings.DEBUG,
+        log_level="info"
     )
\ No newline at end of file
@@ -0,0 +1,29 @@
+from sqlalchemy import Column, DateTime, Index, Table
+from app.database.database import Base
+from app.models.employee import Employee
+from app.models.support_ticket import SupportTicket
+from app.models.task import Task
+
+def cold_table(hot: Table, name: str, *indexes: str) -> Table:
+    """The hot table's columns without its constraints, plus archived_at.
+
+    Rows keep their ids when they move, and references to other employees
+    may point at either table, so there are no foreign keys to enforce.
+    """
+    columns = [
+        Column(column.name, column.type, primary_key=column.primary_key, autoincrement=False, nullable=column.nullable)
+        for column in hot.columns
+    ]
+    table = Table(name, Base.metadata, *columns, Column("archived_at", DateTime, nullable=False))
+    for column in indexes:
+        Index(f"ix_{name}_{column}", table.c[column])
+    return table
+
+class ArchivedEmployee(Base):
+    __table__ = cold_table(Employee.__table__, "employees_archive", "employee_id")
+
+class ArchivedTask(Base):
+    __table__ = cold_table(Task.__table__, "tasks_archive", "assigned_to")
+
+class ArchivedSupportTicket(Base):
+    __table__ = cold_table(SupportTicket.__table__, "support_tickets_archive", "created_by")
\ No newline at end of file
@@ -1,55 +1,89 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, Enum, ForeignKey, Boolean
-from sqlalchemy.orm import relationship
-from sqlalchemy.sql import func
-from app.database.database import Base
-import enum
-
-class TicketStatusEnum(str, enum.Enum):
-    OPEN = "open"
-    IN_PROGRESS = "in_progress"
-    RESOLVED = "resolved"
-    CLOSED = "closed"
-    REOPENED = "reopened"
-
-class TicketPriorityEnum(str, enum.Enum):
-    LOW = "low"
-    MEDIUM = "medium"
-    HIGH = "high"
-    URGENT = "urgent"
-
-class TicketCategoryEnum(str, enum.Enum):
-    TECHNICAL = "technical"
-    HR = "hr"
-    FINANCE = "finance"
-    GENERAL = "general"
-    FEEDBACK = "feedback"
-
-class SupportTicket(Base):
-    __tablename__ = "support_tickets"
-    
-    id = Column(Integer, primary_key=True, index=True)
-    ticket_number = Column(String, unique=True, nullable=False)
-    title = Column(String, nullable=False)
-    description = Column(Text, nullable=False)
-    
-    # Classification
-    category = Column(Enum(TicketCategoryEnum), default=TicketCategoryEnum.GENERAL)
-    priority = Column(Enum(TicketPriorityEnum), default=TicketPriorityEnum.MEDIUM)
-    status = Column(Enum(TicketStatusEnum), default=TicketStatusEnum.OPEN)
-    
-    # Assignment
-    created_by = Column(Integer, ForeignKey("employees.id"), nullable=False)
-    assigned_to = Column(Integer, ForeignKey("employees.id"), nullable=True)
-    
-    # Dates
-    created_at = Column(DateTime, default=func.now())
-    updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
-    resolved_at = Column(DateTime, nullable=True)
-    
-    # Resolution
-    resolution_notes = Column(Text, nullable=True)
-    is_anonymous = Column(Boolean, default=False)
-    
-    # Relationships
-    creator = relationship("Employee", foreign_keys=[created_by])
-    assignee = relationship("Employee", foreign_keys=[assigned_to])
\ No newline at end of file
+from sqlalchemy import Column, Integer, String, Text, DateTime, Enum, ForeignKey, Boolean, Index, Sequence
+from sqlalchemy.orm import relationship, validates
+from sqlalchemy.sql import func
+from app.database.database import Base
+import enum
+
+class TicketStatusEnum(str, enum.Enum):
+    OPEN = "open"
+    IN_PROGRESS = "in_progress"
+    RESOLVED = "resolved"
+    CLOSED = "closed"
+    REOPENED = "reopened"
+
+class TicketPriorityEnum(str, enum.Enum):
+    LOW = "low"
+    MEDIUM = "medium"
+    HIGH = "high"
+    URGENT = "urgent"
+
+class TicketCategoryEnum(str, enum.Enum):
+    TECHNICAL = "technical"
+    HR = "hr"
+    FINANCE = "finance"
+    GENERAL = "general"
+    FEEDBACK = "feedback"
+
+# Higher rank is served first by the claim queue
+PRIORITY_RANKS = {
+    TicketPriorityEnum.LOW: 0,
+    TicketPriorityEnum.MEDIUM: 1,
+    TicketPriorityEnum.HIGH: 2,
+    TicketPriorityEnum.URGENT: 3,
+}
+
+# Ticket numbers come from a database sequence; SQLite has none, so it
+# allocates from an AUTOINCREMENT table that never reuses values instead
+ticket_number_sequence = Sequence("support_ticket_number_seq", metadata=Base.metadata)
+
+class TicketNumberSequence(Base):
+    __tablename__ = "ticket_number_sequence"
+    __table_args__ = {"sqlite_autoincrement": True}
+    
+    id = Column(Integer, primary_key=True)
+
+class SupportTicket(Base):
+    __tablename__ = "support_tickets"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    ticket_number = Column(String, unique=True, nullable=False)
+    title = Column(String, nullable=False)
+    description = Column(Text, nullable=False)
+    
+    # Classification
+    category = Column(Enum(TicketCategoryEnum), default=TicketCategoryEnum.GENERAL)
+    priority = Column(Enum(TicketPriorityEnum), default=TicketPriorityEnum.MEDIUM)
+    priority_rank = Column(Integer, default=PRIORITY_RANKS[TicketPriorityEnum.MEDIUM])
+    status = Column(Enum(TicketStatusEnum), default=TicketStatusEnum.OPEN)
+    
+    # Assignment
+    created_by = Column(Integer, ForeignKey("employees.id"), nullable=False)
+    assigned_to = Column(Integer, ForeignKey("employees.id"), nullable=True)
+    
+    # Dates
+    created_at = Column(DateTime, default=func.now())
+    updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
+    resolved_at = Column(DateTime, nullable=True)
+    
+    # Resolution
+    resolution_notes = Column(Text, nullable=True)
+    is_anonymous = Column(Boolean, default=False)
+    
+    # Relationships
+    creator = relationship("Employee", foreign_keys=[created_by])
+    assignee = relationship("Employee", foreign_keys=[assigned_to])
+    
+    @validates("priority")
+    def _sync_priority_rank(self, key, priority):
+        self.priority_rank = PRIORITY_RANKS[TicketPriorityEnum(priority)]
+        return priority
+    
+    # Partial index matching the claim query: unassigned open tickets per
+    # category, highest priority then oldest first
+    __table_args__ = (
+        Index(
+            "ix_support_tickets_open_queue", category, priority_rank.desc(), created_at,
+            postgresql_where=status.in_([TicketStatusEnum.OPEN, TicketStatusEnum.REOPENED]) & assigned_to.is_(None),
+            sqlite_where=status.in_([TicketStatusEnum.OPEN, TicketStatusEnum.REOPENED]) & assigned_to.is_(None)
+        ),
+    )
\ No newline at end of file
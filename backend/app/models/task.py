@@ -1,51 +1,74 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, Enum, ForeignKey, Boolean
-from sqlalchemy.orm import relationship
-from sqlalchemy.sql import func
-from app.database.database import Base
-import enum
-
-class TaskStatusEnum(str, enum.Enum):
-    ASSIGNED = "assigned"
-    IN_PROGRESS = "in_progress"
-    COMPLETED = "completed"
-    OVERDUE = "overdue"
-    CANCELLED = "cancelled"
-
-class TaskPriorityEnum(str, enum.Enum):
-    LOW = "low"
-    MEDIUM = "medium"
-    HIGH = "high"
-    URGENT = "urgent"
-
-class Task(Base):
-    __tablename__ = "tasks"
-    
-    id = Column(Integer, primary_key=True, index=True)
-    title = Column(String, nullable=False)
-    description = Column(Text, nullable=False)
-    
-    # Status and Priority
-    status = Column(Enum(TaskStatusEnum), default=TaskStatusEnum.ASSIGNED)
-    priority = Column(Enum(TaskPriorityEnum), default=TaskPriorityEnum.MEDIUM)
-    
-    # Assignment
-    assigned_to = Column(Integer, ForeignKey("employees.id"), nullable=False)
-    assigned_by = Column(Integer, ForeignKey("employees.id"), nullable=False)
-    
-    # Dates
-    due_date = Column(DateTime, nullable=False)
-    completed_date = Column(DateTime, nullable=True)
-    created_at = Column(DateTime, default=func.now())
-    updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
-    
-    # Task Details
-    estimated_hours = Column(Integer, nullable=True)
-    actual_hours = Column(Integer, nullable=True)
-    completion_notes = Column(Text, nullable=True)
-    
-    # Notifications
-    notification_sent = Column(Boolean, default=False)
-    
-    # Relationships
-    assignee = relationship("Employee", foreign_keys=[assigned_to])
-    assigner = relationship("Employee", foreign_keys=[assigned_by])
\ No newline at end of file
+from sqlalchemy import Column, Integer, String, Text, DateTime, Enum, ForeignKey, Boolean, Index, false
+from sqlalchemy.orm import relationship
+from sqlalchemy.sql import func
+from app.database.database import Base
+import enum
+
+class TaskStatusEnum(str, enum.Enum):
+    ASSIGNED = "assigned"
+    IN_PROGRESS = "in_progress"
+    COMPLETED = "completed"
+    OVERDUE = "overdue"
+    CANCELLED = "cancelled"
+
+class TaskPriorityEnum(str, enum.Enum):
+    LOW = "low"
+    MEDIUM = "medium"
+    HIGH = "high"
+    URGENT = "urgent"
+
+class Task(Base):
+    __tablename__ = "tasks"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    title = Column(String, nullable=False)
+    description = Column(Text, nullable=False)
+    
+    # Status and Priority
+    status = Column(Enum(TaskStatusEnum), default=TaskStatusEnum.ASSIGNED)
+    priority = Column(Enum(TaskPriorityEnum), default=TaskPriorityEnum.MEDIUM)
+    
+    # Assignment
+    assigned_to = Column(Integer, ForeignKey("employees.id"), nullable=False)
+    assigned_by = Column(Integer, ForeignKey("employees.id"), nullable=False)
+    
+    # Dates
+    due_date = Column(DateTime, nullable=False)
+    completed_date = Column(DateTime, nullable=True)
+    created_at = Column(DateTime, default=func.now())
+    updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
+    
+    # Task Details
+    estimated_hours = Column(Integer, nullable=True)
+    actual_hours = Column(Integer, nullable=True)
+    completion_notes = Column(Text, nullable=True)
+    
+    # Notifications
+    notification_sent = Column(Boolean, default=False)
+    
+    # Relationships
+    assignee = relationship("Employee", foreign_keys=[assigned_to])
+    assigner = relationship("Employee", foreign_keys=[assigned_by])
+    
+    # Names for TaskResponse; eager-load the relationships when listing to avoid N+1
+    @property
+    def assignee_name(self):
+        return self.assignee.full_name if self.assignee else None
+    
+    @property
+    def assigner_name(self):
+        return self.assigner.full_name if self.assigner else None
+    
+    # Partial indexes: the sweeper and reminder jobs only ever scan open or un-notified tasks
+    __table_args__ = (
+        Index(
+            "ix_tasks_open_due_date", due_date,
+            postgresql_where=status.in_([TaskStatusEnum.ASSIGNED, TaskStatusEnum.IN_PROGRESS]),
+            sqlite_where=status.in_([TaskStatusEnum.ASSIGNED, TaskStatusEnum.IN_PROGRESS])
+        ),
+        Index(
+            "ix_tasks_unnotified_assignee", assigned_to,
+            postgresql_where=notification_sent == false(),
+            sqlite_where=notification_sent == false()
+        ),
+    )
\ No newline at end of file
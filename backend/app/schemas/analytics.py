@@ -0,0 +1,31 @@
+from pydantic import BaseModel
+from typing import Dict, List, Optional
+from datetime import date
+
+class TimeSeriesPoint(BaseModel):
+    date: date
+    value: float
+
+class TimeSeriesResponse(BaseModel):
+    bucket: str
+    department: Optional[str] = None
+    start_date: date
+    end_date: date
+    series: Dict[str, List[TimeSeriesPoint]]
+
+class PerformanceScoringRequest(BaseModel):
+    start_date: date
+    end_date: date
+    weights: Optional[Dict[str, float]] = None
+
+class PerformanceScoringResponse(BaseModel):
+    evaluations_scored: int
+
+class PerformanceRanking(BaseModel):
+    employee_id: int
+    full_name: str
+    department: str
+    evaluation_date: date
+    overall_score: float
+    department_percentile: Optional[float] = None
+    performance_rating: Optional[str] = None
\ No newline at end of file
@@ -0,0 +1,34 @@
+from pydantic import BaseModel
+from typing import List, Optional
+from datetime import datetime
+from app.schemas.announcement import AnnouncementResponse
+from app.schemas.employee import EmployeeResponse
+
+class TaskSummary(BaseModel):
+    pending: int
+    completed: int
+    overdue: int
+
+class GoalSummary(BaseModel):
+    total: int
+    completed: int
+    average_progress: float
+
+class TeamSummary(BaseModel):
+    department: str
+    team_size: int
+    direct_reports: int
+
+class CompanySummary(BaseModel):
+    headcount: int
+    open_tickets: int
+    overdue_tasks: int
+
+class DashboardSummary(BaseModel):
+    employee: EmployeeResponse
+    tasks: TaskSummary
+    goals: GoalSummary
+    team: TeamSummary
+    announcements: List[AnnouncementResponse]
+    company: Optional[CompanySummary] = None  # HR and admins only
+    generated_at: datetime
\ No newline at end of file
@@ -1,56 +1,92 @@
-from pydantic import BaseModel, EmailStr
-from typing import Optional, List
-from datetime import datetime
-from app.models.employee import RoleEnum, StatusEnum
-
-class EmployeeBase(BaseModel):
-    email: EmailStr
-    full_name: str
-    phone_number: Optional[str] = None
-    role: RoleEnum
-    department: str
-    designation: str
-    manager_id: Optional[int] = None
-    team_leader_id: Optional[int] = None
-
-class EmployeeCreate(EmployeeBase):
-    password: Optional[str] = None  # Will be auto-generated if not provided
-
-class EmployeeUpdate(BaseModel):
-    email: Optional[EmailStr] = None
-    full_name: Optional[str] = None
-    phone_number: Optional[str] = None
-    role: Optional[RoleEnum] = None
-    department: Optional[str] = None
-    designation: Optional[str] = None
-    manager_id: Optional[int] = None
-    team_leader_id: Optional[int] = None
-    status: Optional[StatusEnum] = None
-
-class EmployeeResponse(EmployeeBase):
-    id: int
-    employee_id: str
-    status: StatusEnum
-    hire_date: datetime
-    created_at: datetime
-    performance_score: float
-    tasks_completed: int
-    tasks_pending: int
-    
-    class Config:
-        from_attributes = True
-
-class EmployeeLogin(BaseModel):
-    employee_id: str
-    password: str
-    otp_code: Optional[str] = None
-
-class EmployeeLoginResponse(BaseModel):
-    access_token: str
-    token_type: str
-    employee: EmployeeResponse
-
-class PasswordReset(BaseModel):
-    employee_id: str
-    new_password: str
+from pydantic import BaseModel, EmailStr, Field
+from typing import Literal, Optional, List
+from datetime import datetime
+from app.models.employee import RoleEnum, StatusEnum
+
+class EmployeeBase(BaseModel):
+    email: EmailStr
+    full_name: str
+    phone_number: Optional[str] = None
+    role: RoleEnum
+    department: str
+    designation: str
+    manager_id: Optional[int] = None
+    team_leader_id: Optional[int] = None
+
+class EmployeeCreate(EmployeeBase):
+    password: Optional[str] = None  # Will be auto-generated if not provided
+
+class EmployeeUpdate(BaseModel):
+    email: Optional[EmailStr] = None
+    full_name: Optional[str] = None
+    phone_number: Optional[str] = None
+    role: Optional[RoleEnum] = None
+    department: Optional[str] = None
+    designation: Optional[str] = None
+    manager_id: Optional[int] = None
+    team_leader_id: Optional[int] = None
+    status: Optional[StatusEnum] = None
+
+class EmployeeBulkUpdateItem(EmployeeUpdate):
+    id: int
+
+class EmployeeBulkUpdate(BaseModel):
+    updates: List[EmployeeBulkUpdateItem] = Field(..., min_length=1, max_length=1000)
+
+class EmployeeFilter(BaseModel):
+    ids: Optional[List[int]] = None
+    department: Optional[str] = None
+    role: Optional[RoleEnum] = None
+    status: Optional[StatusEnum] = None
+    manager_id: Optional[int] = None
+    team_leader_id: Optional[int] = None
+
+class EmployeeFilterUpdate(BaseModel):
+    filter: EmployeeFilter
+    update: EmployeeUpdate
+
+class EmployeeBulkOutcome(BaseModel):
+    id: int
+    outcome: Literal["updated", "unchanged", "not_found", "invalid"]
+    detail: Optional[str] = None
+
+class EmployeeBulkResult(BaseModel):
+    updated: int
+    results: List[EmployeeBulkOutcome]
+
+class EmployeeResponse(EmployeeBase):
+    id: int
+    employee_id: str
+    status: StatusEnum
+    hire_date: datetime
+    created_at: datetime
+    performance_score: float
+    tasks_completed: int
+    tasks_pending: int
+    version: int
+    
+    class Config:
+        from_attributes = True
+
+class EmployeeSuggestion(BaseModel):
+    id: int
+    employee_id: str
+    full_name: str
+    email: str
+    department: str
+    designation: str
+
+class EmployeeLogin(BaseModel):
+    employee_id: str
+    password: str
+    otp_code: Optional[str] = None
+
+class EmployeeLoginResponse(BaseModel):
+    access_token: str
+    token_type: str
+    employee: EmployeeResponse
+
+class PasswordReset(BaseModel):
+    employee_id: str
+    new_password: str
     otp_code: str
\ No newline at end of file
@@ -0,0 +1,16 @@
+from pydantic import BaseModel
+from typing import List
+
+class SearchHit(BaseModel):
+    doc_type: str
+    doc_id: int
+    title: str
+    snippet: str
+    score: float
+
+class SearchResponse(BaseModel):
+    query: str
+    results: List[SearchHit]
+
+class SearchReindexResponse(BaseModel):
+    documents_indexed: int
\ No newline at end of file
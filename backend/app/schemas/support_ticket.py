@@ -0,0 +1,31 @@
+from pydantic import BaseModel
+from typing import Optional
+from datetime import datetime
+from app.models.support_ticket import TicketStatusEnum, TicketPriorityEnum, TicketCategoryEnum
+
+class SupportTicketBase(BaseModel):
+    title: str
+    description: str
+    category: TicketCategoryEnum = TicketCategoryEnum.GENERAL
+    priority: TicketPriorityEnum = TicketPriorityEnum.MEDIUM
+    is_anonymous: bool = False
+
+class SupportTicketCreate(SupportTicketBase):
+    pass
+
+class SupportTicketResolve(BaseModel):
+    resolution_notes: Optional[str] = None
+
+class SupportTicketResponse(SupportTicketBase):
+    id: int
+    ticket_number: str
+    status: TicketStatusEnum
+    created_by: Optional[int] = None
+    assigned_to: Optional[int] = None
+    created_at: datetime
+    updated_at: datetime
+    resolved_at: Optional[datetime] = None
+    resolution_notes: Optional[str] = None
+    
+    class Config:
+        from_attributes = True
\ No newline at end of file
@@ -0,0 +1,154 @@
+import json
+import threading
+import time
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+from sqlalchemy import delete, event, exists, insert, inspect, or_, select
+from sqlalchemy.orm import Session, joinedload
+from app.core.config import settings
+from app.database.database import SessionLocal
+from app.models.announcement import Announcement, AnnouncementAudience
+from app.models.employee import Employee
+from app.schemas.announcement import AnnouncementResponse
+from app.services.invalidation_bus import invalidation_bus
+
+EVERYONE = "*"
+DEPARTMENT = "department"
+ROLE = "role"
+
+Segment = Tuple[str, str]
+
+def parse_targets(raw: Optional[str]) -> List[str]:
+    """Decode a target_departments/target_roles JSON string; empty means everyone"""
+    if not raw:
+        return []
+    values = json.loads(raw)
+    if not isinstance(values, list) or not all(isinstance(value, str) for value in values):
+        raise ValueError("Targets must be a JSON array of strings")
+    return values
+
+def sync_audience(db: Session, announcement: Announcement):
+    """Rewrite the audience rows of an announcement from its JSON target columns"""
+    db.execute(delete(AnnouncementAudience).where(AnnouncementAudience.announcement_id == announcement.id))
+    rows = [
+        {"announcement_id": announcement.id, "dimension": dimension, "value": value}
+        for dimension, raw in ((DEPARTMENT, announcement.target_departments), (ROLE, announcement.target_roles))
+        for value in (parse_targets(raw) or [EVERYONE])
+    ]
+    db.execute(insert(AnnouncementAudience), rows)
+
+# Audience rows follow the JSON columns on every flush, so no write path can
+# leave an announcement without them and invisible in every feed
+@event.listens_for(SessionLocal, "after_flush")
+def _sync_flushed_audiences(session: Session, flush_context):
+    connection = session.connection()
+    for obj in session.new:
+        if isinstance(obj, Announcement):
+            sync_audience(connection, obj)
+    for obj in session.dirty:
+        if isinstance(obj, Announcement):
+            state = inspect(obj)
+            if any(state.attrs[field].history.has_changes() for field in ("target_departments", "target_roles")):
+                sync_audience(connection, obj)
+
+def audience_match(dimension: str, value: str):
+    return exists().where(
+        AnnouncementAudience.announcement_id == Announcement.id,
+        AnnouncementAudience.dimension == dimension,
+        AnnouncementAudience.value.in_([value, EVERYONE])
+    )
+
+def query_feed(db: Session, department: str, role: str, limit: int) -> List[Announcement]:
+    now = datetime.utcnow()
+    return db.scalars(
+        select(Announcement)
+        .options(joinedload(Announcement.author).load_only(Employee.full_name))
+        .where(
+            Announcement.is_active == True,
+            or_(Announcement.expires_at.is_(None), Announcement.expires_at > now),
+            audience_match(DEPARTMENT, department),
+            audience_match(ROLE, role)
+        )
+        .order_by(Announcement.created_at.desc(), Announcement.id.desc())
+        .limit(limit)
+    ).all()
+
+class FeedCache:
+    """Per audience segment feed cache.
+
+    An entry lives for the configured TTL or until the first announcement in
+    it expires, whichever comes first, so expiry needs no explicit eviction.
+    Every segment also has a generation that invalidation bumps; a feed read
+    while its segment was invalidated is not stored, since it may predate
+    the change.
+    """
+
+    def __init__(self):
+        self._entries: Dict[Segment, Tuple[float, List[AnnouncementResponse]]] = {}
+        self._generations: Dict[Segment, int] = {}
+        self._lock = threading.Lock()
+
+    def get(self, segment: Segment) -> Optional[List[AnnouncementResponse]]:
+        with self._lock:
+            entry = self._entries.get(segment)
+            if entry is None:
+                return None
+            if entry[0] <= time.time():
+                del self._entries[segment]
+                return None
+            return entry[1]
+
+    def generation(self, segment: Segment) -> int:
+        """Take before querying a feed and hand to set()"""
+        with self._lock:
+            return self._generations.setdefault(segment, 0)
+
+    def set(self, segment: Segment, items: List[AnnouncementResponse], generation: int):
+        valid_until = time.time() + settings.ANNOUNCEMENT_FEED_CACHE_TTL_SECONDS
+        now = datetime.utcnow()
+        for item in items:
+            if item.expires_at is not None:
+                valid_until = min(valid_until, time.time() + (item.expires_at - now).total_seconds())
+        with self._lock:
+            if self._generations.get(segment) == generation:
+                self._entries[segment] = (valid_until, items)
+
+    def invalidate(self, departments: Optional[Iterable[str]] = None, roles: Optional[Iterable[str]] = None):
+        """Drop segments that can see an announcement targeted at departments/roles; None drops everything"""
+        with self._lock:
+            if departments is None or roles is None:
+                stale = list(self._generations)
+            else:
+                departments, roles = set(departments), set(roles)
+                stale = [
+                    (department, role) for department, role in self._generations
+                    if ((EVERYONE in departments or department in departments) and
+                        (EVERYONE in roles or role in roles))
+                ]
+            for segment in stale:
+                self._generations[segment] += 1
+                self._entries.pop(segment, None)
+
+feed_cache = FeedCache()
+
+# Another worker's message doesn't say who could see the old version, so
+# every segment is dropped; feeds are cheap to rebuild and rarely change
+invalidation_bus.subscribe("announcement", lambda announcement_ids: feed_cache.invalidate())
+
+def audience_of(announcement: Announcement) -> Tuple[List[str], List[str]]:
+    return (
+        parse_targets(announcement.target_departments) or [EVERYONE],
+        parse_targets(announcement.target_roles) or [EVERYONE]
+    )
+
+def get_feed(db: Session, department: str, role: str) -> List[AnnouncementResponse]:
+    segment = (department, role)
+    items = feed_cache.get(segment)
+    if items is None:
+        generation = feed_cache.generation(segment)
+        items = [
+            AnnouncementResponse.model_validate(announcement)
+            for announcement in query_feed(db, department, role, settings.ANNOUNCEMENT_FEED_SIZE)
+        ]
+        feed_cache.set(segment, items, generation)
+    return items
\ No newline at end of file
@@ -0,0 +1,149 @@
+from datetime import datetime, timedelta
+from typing import List, Optional, Set, Tuple
+from sqlalchemy import DateTime, delete, func, insert, literal, select, union
+from sqlalchemy.engine import Row
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.expression import ColumnElement
+from app.core.config import settings
+from app.database.database import SessionLocal
+from app.models.analytics import EmployeePerformance
+from app.models.announcement import Announcement
+from app.models.archive import ArchivedEmployee, ArchivedSupportTicket, ArchivedTask
+from app.models.employee import Employee, StatusEnum
+from app.models.goal import Goal
+from app.models.support_ticket import SupportTicket
+from app.models.task import Task
+from app.services.invalidation_bus import stage
+from app.services.response_cache import EMPLOYEES_TAG, employee_tag, response_cache
+from app.services.search import EMPLOYEE, TICKET, write_documents
+import logging
+
+logger = logging.getLogger(__name__)
+
+employees_table = Employee.__table__
+tasks_table = Task.__table__
+tickets_table = SupportTicket.__table__
+
+def _still_referenced(db: Session, candidates: Set[int]) -> Set[int]:
+    """Candidates that a row staying in the hot tables points at"""
+    pks = list(candidates)
+    staying = union(
+        # Reports and team members not archived along with them
+        select(Employee.manager_id).where(Employee.manager_id.in_(pks), Employee.id.not_in(pks)),
+        select(Employee.team_leader_id).where(Employee.team_leader_id.in_(pks), Employee.id.not_in(pks)),
+        # Tasks and tickets move with their assignee and creator respectively
+        select(Task.assigned_by).where(Task.assigned_by.in_(pks), Task.assigned_to.not_in(pks)),
+        select(SupportTicket.assigned_to).where(SupportTicket.assigned_to.in_(pks), SupportTicket.created_by.not_in(pks)),
+        # Goals, announcements and reviews never move
+        select(Goal.assigned_to).where(Goal.assigned_to.in_(pks)),
+        select(Goal.created_by).where(Goal.created_by.in_(pks)),
+        select(Announcement.created_by).where(Announcement.created_by.in_(pks)),
+        select(EmployeePerformance.employee_id).where(EmployeePerformance.employee_id.in_(pks)),
+    )
+    return set(db.scalars(staying))
+
+def _copy(db: Session, hot, cold, condition, now: datetime):
+    """INSERT INTO cold SELECT ... FROM hot, stamping archived_at"""
+    db.execute(
+        insert(cold).from_select(
+            [column.name for column in hot.columns] + ["archived_at"],
+            select(*hot.columns, literal(now, DateTime)).where(condition)
+        )
+    )
+
+def _archive_batch(db: Session, candidates: Set[int], now: datetime) -> Tuple[List[int], int, int]:
+    """Archived employee ids, task and ticket counts"""
+    # Dropping a candidate can leave a row pointing at another one, so repeat until stable
+    while candidates:
+        referenced = _still_referenced(db, candidates) & candidates
+        if not referenced:
+            break
+        candidates -= referenced
+    if not candidates:
+        return [], 0, 0
+    pks = list(candidates)
+
+    _copy(db, tasks_table, ArchivedTask.__table__, tasks_table.c.assigned_to.in_(pks), now)
+    _copy(db, tickets_table, ArchivedSupportTicket.__table__, tickets_table.c.created_by.in_(pks), now)
+    _copy(db, employees_table, ArchivedEmployee.__table__, employees_table.c.id.in_(pks), now)
+
+    # Delete exactly what was copied: ids are unique across a hot table and its archive
+    archived_tasks = select(ArchivedTask.id).where(ArchivedTask.assigned_to.in_(pks))
+    archived_tickets = select(ArchivedSupportTicket.id).where(ArchivedSupportTicket.created_by.in_(pks))
+    tasks = db.execute(delete(tasks_table).where(tasks_table.c.id.in_(archived_tasks))).rowcount
+    ticket_pks = db.scalars(delete(tickets_table).where(tickets_table.c.id.in_(archived_tickets)).returning(tickets_table.c.id)).all()
+    db.execute(delete(employees_table).where(employees_table.c.id.in_(pks)))
+
+    # Set-based deletes skip the flush hooks that keep search and the caches current
+    write_documents(db.connection(), [], [(EMPLOYEE, pk) for pk in pks] + [(TICKET, pk) for pk in ticket_pks])
+    stage(db, "employee", pks)
+    return pks, tasks, len(ticket_pks)
+
+def archive_inactive_employees(db: Session, now: Optional[datetime] = None, batch_size: Optional[int] = None) -> Tuple[int, int, int]:
+    """Move employees inactive for ARCHIVE_INACTIVE_AFTER_DAYS, with their tasks and tickets, to the archive tables.
+
+    Employees still referenced by rows that stay (their goals, reviews,
+    announcements, active reports, tasks they assigned to others) are kept
+    until those references are gone. Commits once per batch.
+    """
+    now = now or datetime.utcnow()
+    batch_size = batch_size or settings.ARCHIVE_BATCH_SIZE
+    cutoff = now - timedelta(days=settings.ARCHIVE_INACTIVE_AFTER_DAYS)
+    totals = [0, 0, 0]
+    after = 0
+    while True:
+        # Locked so nobody reactivates or edits them while they move
+        batch = db.scalars(
+            select(Employee.id)
+            .where(Employee.status == StatusEnum.INACTIVE, Employee.updated_at < cutoff, Employee.id > after)
+            .order_by(Employee.id)
+            .limit(batch_size)
+            .with_for_update()
+        ).all()
+        if not batch:
+            break
+        after = batch[-1]
+        archived, tasks, tickets = _archive_batch(db, set(batch), now)
+        db.commit()
+        if archived:
+            # Other workers hear about it over the bus, this one never does
+            response_cache.invalidate(EMPLOYEES_TAG, *(employee_tag(pk) for pk in archived))
+        totals = [totals[0] + len(archived), totals[1] + tasks, totals[2] + tickets]
+
+    employees, tasks, tickets = totals
+    if employees:
+        logger.info(f"Archived {employees} employees with {tasks} tasks and {tickets} tickets")
+    return employees, tasks, tickets
+
+def run_archival():
+    """Scheduler entry point"""
+    db = SessionLocal()
+    try:
+        archive_inactive_employees(db)
+    finally:
+        db.close()
+
+def _employee_name(employee_pk: ColumnElement) -> ColumnElement:
+    """Full name of an employee in either table"""
+    return func.coalesce(
+        select(Employee.full_name).where(Employee.id == employee_pk).scalar_subquery(),
+        select(ArchivedEmployee.full_name).where(ArchivedEmployee.id == employee_pk).scalar_subquery()
+    )
+
+def find_archived_employee(db: Session, employee_pk: int) -> Optional[ArchivedEmployee]:
+    return db.get(ArchivedEmployee, employee_pk)
+
+def find_archived_task(db: Session, task_pk: int) -> Optional[Row]:
+    """An archived task with assignee and assigner names, shaped like TaskResponse"""
+    return db.execute(
+        select(
+            ArchivedTask.__table__,
+            _employee_name(ArchivedTask.assigned_to).label("assignee_name"),
+            _employee_name(ArchivedTask.assigned_by).label("assigner_name")
+        ).where(ArchivedTask.id == task_pk)
+    ).first()
+
+def find_archived_tickets(db: Session, employee_pk: int) -> List[ArchivedSupportTicket]:
+    return db.scalars(
+        select(ArchivedSupportTicket).where(ArchivedSupportTicket.created_by == employee_pk).order_by(ArchivedSupportTicket.id)
+    ).all()
\ No newline at end of file
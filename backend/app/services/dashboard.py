@@ -0,0 +1,102 @@
+import threading
+import time
+from datetime import datetime
+from typing import Dict, Tuple
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+from app.core.config import settings
+from app.models.employee import Employee, RoleEnum, StatusEnum
+from app.models.goal import Goal, GoalStatusEnum
+from app.models.support_ticket import SupportTicket, TicketStatusEnum
+from app.models.task import Task, TaskStatusEnum
+from app.schemas.dashboard import CompanySummary, DashboardSummary, GoalSummary, TaskSummary, TeamSummary
+from app.schemas.employee import EmployeeResponse
+from app.services.announcement_feed import get_feed
+
+MANAGEMENT_ROLES = [RoleEnum.HR, RoleEnum.ADMIN, RoleEnum.SUPER_ADMIN]
+
+RECENT_ANNOUNCEMENTS = 5
+
+OPEN_TICKET_STATUSES = (TicketStatusEnum.OPEN, TicketStatusEnum.IN_PROGRESS, TicketStatusEnum.REOPENED)
+
+def _count(*criteria):
+    return select(func.count()).where(*criteria).scalar_subquery()
+
+def summary_statement(employee: Employee, management: bool):
+    """Every dashboard figure as a scalar subquery of a single SELECT"""
+    my_goals = (Goal.assigned_to == employee.id, Goal.status != GoalStatusEnum.CANCELLED)
+    columns = [
+        _count(Task.assigned_to == employee.id, Task.status == TaskStatusEnum.OVERDUE).label("overdue"),
+        _count(*my_goals).label("goals_total"),
+        _count(*my_goals, Goal.status == GoalStatusEnum.COMPLETED).label("goals_completed"),
+        select(func.coalesce(func.avg(Goal.progress_percentage), 0.0)).where(*my_goals)
+        .scalar_subquery().label("goals_progress"),
+        _count(Employee.department == employee.department, Employee.status == StatusEnum.ACTIVE).label("team_size"),
+        _count(Employee.manager_id == employee.id, Employee.status == StatusEnum.ACTIVE).label("direct_reports"),
+    ]
+    if management:
+        columns += [
+            _count(Employee.status == StatusEnum.ACTIVE).label("headcount"),
+            _count(SupportTicket.status.in_(OPEN_TICKET_STATUSES)).label("open_tickets"),
+            _count(Task.status == TaskStatusEnum.OVERDUE).label("overdue_tasks"),
+        ]
+    return select(*columns)
+
+def build_summary(db: Session, employee: Employee) -> DashboardSummary:
+    management = employee.role in MANAGEMENT_ROLES
+    row = db.execute(summary_statement(employee, management)).one()
+    # The feed is shared by everyone in the segment and usually cached
+    announcements = get_feed(db, employee.department, employee.role.value)[:RECENT_ANNOUNCEMENTS]
+    return DashboardSummary(
+        employee=EmployeeResponse.model_validate(employee),
+        tasks=TaskSummary(pending=employee.tasks_pending or 0, completed=employee.tasks_completed or 0, overdue=row.overdue),
+        goals=GoalSummary(
+            total=row.goals_total, completed=row.goals_completed, average_progress=round(row.goals_progress, 2)
+        ),
+        team=TeamSummary(department=employee.department, team_size=row.team_size, direct_reports=row.direct_reports),
+        announcements=announcements,
+        company=CompanySummary(
+            headcount=row.headcount, open_tickets=row.open_tickets, overdue_tasks=row.overdue_tasks
+        ) if management else None,
+        generated_at=datetime.utcnow()
+    )
+
+class SummaryCache:
+    """Short-lived per-user summaries; a role or department change starts a new entry"""
+
+    def __init__(self):
+        self._entries: Dict[Tuple[int, str, str], Tuple[float, DashboardSummary]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: Tuple[int, str, str]):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= time.time():
+                self._entries.pop(key, None)
+                return None
+            return entry[1]
+
+    def set(self, key: Tuple[int, str, str], summary: DashboardSummary):
+        with self._lock:
+            # Drop expired entries now and then so idle users don't accumulate
+            if len(self._entries) >= settings.DASHBOARD_CACHE_MAX_ENTRIES:
+                now = time.time()
+                self._entries = {k: v for k, v in self._entries.items() if v[0] > now}
+                if len(self._entries) >= settings.DASHBOARD_CACHE_MAX_ENTRIES:
+                    self._entries.clear()
+            self._entries[key] = (time.time() + settings.DASHBOARD_CACHE_TTL_SECONDS, summary)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+# Global instance
+summary_cache = SummaryCache()
+
+def get_summary(db: Session, employee: Employee) -> DashboardSummary:
+    key = (employee.id, employee.role.value, employee.department)
+    summary = summary_cache.get(key)
+    if summary is None:
+        summary = build_summary(db, employee)
+        summary_cache.set(key, summary)
+    return summary
\ No newline at end of file
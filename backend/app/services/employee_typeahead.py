@@ -0,0 +1,276 @@
+import heapq
+import sys
+import threading
+from array import array
+from bisect import bisect_left, bisect_right
+from itertools import groupby
+from operator import itemgetter
+from typing import Dict, Iterator, List, NamedTuple, Optional, Tuple
+from sqlalchemy import event, inspect, select
+from sqlalchemy.orm import Session
+from app.database.database import SessionLocal
+from app.models.employee import Employee, StatusEnum
+from app.services.invalidation_bus import invalidation_bus
+import logging
+
+logger = logging.getLogger(__name__)
+
+_PENDING_KEY = "employee_typeahead.pending"
+
+# Columns the suggestions show or match on; a change to any of them re-indexes
+INDEXED_FIELDS = ("employee_id", "email", "full_name", "department", "designation", "status")
+
+class Suggestion(NamedTuple):
+    id: int
+    employee_id: str
+    full_name: str
+    email: str
+    department: str
+    designation: str
+
+def _keys(suggestion: Suggestion) -> List[str]:
+    """Every string a prefix can match: the whole name, each name part, email and employee ID"""
+    name = suggestion.full_name.lower()
+    keys = {name, suggestion.email.lower(), suggestion.employee_id.lower()}
+    keys.update(name.split())
+    return sorted(keys)
+
+def _suggestion_query():
+    return select(
+        Employee.id, Employee.employee_id, Employee.full_name,
+        Employee.email, Employee.department, Employee.designation
+    ).where(Employee.status == StatusEnum.ACTIVE)
+
+class _Shard:
+    """Sorted (key, id) entries of one department in parallel arrays"""
+
+    def __init__(self, keys: Optional[List[str]] = None, ids: Optional[array] = None):
+        self.keys: List[str] = keys if keys is not None else []
+        self.ids = ids if ids is not None else array("q")
+
+    def _position(self, key: str, employee_pk: int) -> int:
+        """Where (key, employee_pk) sits in the arrays; equal keys are ordered by id"""
+        start, end = bisect_left(self.keys, key), bisect_right(self.keys, key)
+        return bisect_left(self.ids, employee_pk, start, end)
+
+    def insert(self, key: str, employee_pk: int):
+        position = self._position(key, employee_pk)
+        self.keys.insert(position, key)
+        self.ids.insert(position, employee_pk)
+
+    def remove(self, key: str, employee_pk: int):
+        position = self._position(key, employee_pk)
+        if position < len(self.ids) and self.keys[position] == key and self.ids[position] == employee_pk:
+            del self.keys[position]
+            del self.ids[position]
+
+    def scan(self, prefix: str) -> Iterator[Tuple[str, int]]:
+        position = bisect_left(self.keys, prefix)
+        while position < len(self.keys) and self.keys[position].startswith(prefix):
+            yield self.keys[position], self.ids[position]
+            position += 1
+
+class PrefixIndex:
+    """Sorted key arrays over active employees, searched with bisect.
+
+    Keys and the ids they point at are kept in parallel arrays rather than a
+    list of tuples, which roughly halves the per-key overhead. There is one
+    shard per department, so a department-scoped lookup never walks other
+    departments' entries; an unscoped lookup merges the shards in key order.
+    Each worker builds its own copy from one query on the first lookup and
+    then applies committed changes from its own sessions. Changes committed
+    while that query runs are buffered and replayed once it finishes.
+    """
+
+    def __init__(self):
+        self._shards: Dict[str, _Shard] = {}
+        self._suggestions: Dict[int, Suggestion] = {}
+        self._lock = threading.Lock()
+        self._load_lock = threading.Lock()
+        self._loaded = False
+        self._buffer: Optional[List[Tuple[List[Suggestion], List[int]]]] = None
+
+    @property
+    def loaded(self) -> bool:
+        return self._loaded
+
+    @property
+    def tracking(self) -> bool:
+        """Loaded or loading, i.e. changes matter to this copy"""
+        return self._loaded or self._buffer is not None
+
+    def load(self, db: Session):
+        """Build the index; concurrent callers wait for one load instead of each running the query"""
+        with self._load_lock:
+            if self._loaded:
+                return
+            with self._lock:
+                self._buffer = []
+            try:
+                shards, suggestions = self._build(db)
+            except Exception:
+                with self._lock:
+                    self._buffer = None
+                raise
+            with self._lock:
+                self._shards, self._suggestions = shards, suggestions
+                for upserts, removals in self._buffer:
+                    self._apply_locked(upserts, removals)
+                self._buffer, self._loaded = None, True
+        logger.info(f"Loaded typeahead index with {len(suggestions)} employees")
+
+    def _build(self, db: Session) -> Tuple[Dict[str, _Shard], Dict[int, Suggestion]]:
+        rows = db.execute(_suggestion_query()).all()
+        suggestions = {row[0]: Suggestion(*row) for row in rows}
+        entries = sorted(
+            (suggestion.department, key, suggestion.id)
+            for suggestion in suggestions.values() for key in _keys(suggestion)
+        )
+        shards: Dict[str, _Shard] = {}
+        for department, group in groupby(entries, key=itemgetter(0)):
+            group = list(group)
+            shards[department] = _Shard(
+                [key for _, key, _ in group],
+                array("q", (employee_pk for _, _, employee_pk in group))
+            )
+        return shards, suggestions
+
+    def reset(self):
+        with self._lock:
+            self._shards, self._suggestions, self._loaded = {}, {}, False
+
+    def _remove_locked(self, employee_pk: int):
+        suggestion = self._suggestions.pop(employee_pk, None)
+        if suggestion is None:
+            return
+        shard = self._shards[suggestion.department]
+        for key in _keys(suggestion):
+            shard.remove(key, employee_pk)
+        if not shard.keys:
+            del self._shards[suggestion.department]
+
+    def _apply_locked(self, upserts: List[Suggestion], removals: List[int]):
+        for employee_pk in removals:
+            self._remove_locked(employee_pk)
+        for suggestion in upserts:
+            self._remove_locked(suggestion.id)
+            self._suggestions[suggestion.id] = suggestion
+            shard = self._shards.setdefault(suggestion.department, _Shard())
+            for key in _keys(suggestion):
+                shard.insert(key, suggestion.id)
+
+    def apply(self, upserts: List[Suggestion], removals: List[int]):
+        """Apply committed changes; buffered during a load and dropped before one starts"""
+        with self._lock:
+            if self._loaded:
+                self._apply_locked(upserts, removals)
+            elif self._buffer is not None:
+                self._buffer.append((upserts, removals))
+
+    def lookup(self, prefix: str, limit: int = 10, department: Optional[str] = None) -> List[Suggestion]:
+        prefix = prefix.strip().lower()
+        if not prefix:
+            return []
+        results: List[Suggestion] = []
+        seen = set()
+        with self._lock:
+            if department is None:
+                entries = heapq.merge(*(shard.scan(prefix) for shard in self._shards.values()))
+            elif department in self._shards:
+                entries = self._shards[department].scan(prefix)
+            else:
+                return []
+            for _, employee_pk in entries:
+                if employee_pk in seen:
+                    continue
+                seen.add(employee_pk)
+                results.append(self._suggestions[employee_pk])
+                if len(results) == limit:
+                    break
+        return results
+
+    def stats(self) -> Dict[str, int]:
+        """Entry counts and an estimate of the bytes held by this worker's copy"""
+        with self._lock:
+            shards = [(list(shard.keys), sys.getsizeof(shard.ids)) for shard in self._shards.values()]
+            suggestions = list(self._suggestions.values())
+        key_bytes = sum(
+            sys.getsizeof(keys) + sum(sys.getsizeof(key) for key in keys) + ids_bytes
+            for keys, ids_bytes in shards
+        )
+        suggestion_bytes = sys.getsizeof(self._suggestions) + sum(
+            sys.getsizeof(suggestion) + sum(sys.getsizeof(value) for value in suggestion)
+            for suggestion in suggestions
+        )
+        return {
+            "employees": len(suggestions),
+            "keys": sum(len(keys) for keys, _ in shards),
+            "departments": len(shards),
+            "approx_bytes": key_bytes + suggestion_bytes,
+        }
+
+# Global instance
+prefix_index = PrefixIndex()
+
+def suggest(db: Session, prefix: str, limit: int = 10, department: Optional[str] = None) -> List[Suggestion]:
+    if not prefix_index.loaded:
+        prefix_index.load(db)
+    return prefix_index.lookup(prefix, limit, department)
+
+def _snapshot(employee: Employee) -> Optional[Suggestion]:
+    if employee.status != StatusEnum.ACTIVE:
+        return None
+    return Suggestion(
+        employee.id, employee.employee_id, employee.full_name,
+        employee.email, employee.department, employee.designation
+    )
+
+# Changes are staged at flush and applied only once the transaction commits,
+# so a rolled back update never reaches the index
+@event.listens_for(SessionLocal, "after_flush")
+def _stage_employee_changes(session: Session, flush_context):
+    pending: Dict[int, Optional[Suggestion]] = session.info.setdefault(_PENDING_KEY, {})
+    for obj in session.new:
+        if isinstance(obj, Employee):
+            pending[obj.id] = _snapshot(obj)
+    for obj in session.dirty:
+        if isinstance(obj, Employee):
+            state = inspect(obj)
+            if any(state.attrs[field].history.has_changes() for field in INDEXED_FIELDS):
+                pending[obj.id] = _snapshot(obj)
+    for obj in session.deleted:
+        if isinstance(obj, Employee):
+            pending[inspect(obj).identity[0]] = None
+
+def stage_employees(session: Session, employees: List[Employee]):
+    """Queue index updates for rows changed by Core UPDATEs, which never pass through a flush.
+
+    Employees or rows of the employees table; only the attributes are read.
+    """
+    pending: Dict[int, Optional[Suggestion]] = session.info.setdefault(_PENDING_KEY, {})
+    for employee in employees:
+        pending[employee.id] = _snapshot(employee)
+
+@event.listens_for(SessionLocal, "after_commit")
+def _apply_employee_changes(session: Session):
+    pending = session.info.pop(_PENDING_KEY, None)
+    if pending:
+        prefix_index.apply(
+            [suggestion for suggestion in pending.values() if suggestion is not None],
+            [employee_pk for employee_pk, suggestion in pending.items() if suggestion is None]
+        )
+
+@event.listens_for(SessionLocal, "after_rollback")
+def _discard_employee_changes(session: Session):
+    session.info.pop(_PENDING_KEY, None)
+
+def refresh_employees(employee_pks: List[int]):
+    """Re-read employees another worker changed and apply them to this worker's copy"""
+    if not prefix_index.tracking:
+        return
+    with SessionLocal() as db:
+        upserts = [Suggestion(*row) for row in db.execute(_suggestion_query().where(Employee.id.in_(employee_pks)))]
+    active = {suggestion.id for suggestion in upserts}
+    prefix_index.apply(upserts, [employee_pk for employee_pk in employee_pks if employee_pk not in active])
+
+invalidation_bus.subscribe("employee", refresh_employees)
\ No newline at end of file
@@ -0,0 +1,194 @@
+from collections import defaultdict
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+from sqlalchemy import bindparam, select, update
+from sqlalchemy.engine import Row
+from sqlalchemy.orm import Session
+from app.models.employee import Employee
+from app.services.employee_typeahead import stage_employees
+from app.services.invalidation_bus import stage
+from app.services.search import INDEXED_FIELDS, employee_document, write_documents
+import logging
+
+logger = logging.getLogger(__name__)
+
+UPDATED = "updated"
+UNCHANGED = "unchanged"
+NOT_FOUND = "not_found"
+INVALID = "invalid"
+
+# Columns the table declares NOT NULL, plus status, which every query filters on
+REQUIRED_FIELDS = ("email", "full_name", "role", "department", "designation", "status")
+REFERENCE_FIELDS = ("manager_id", "team_leader_id")
+
+employees_table = Employee.__table__
+SEARCH_FIELDS = set(INDEXED_FIELDS[Employee][1])
+# Every write through this module bumps the version clients send back in If-Match
+NEXT_VERSION = {"version": employees_table.c.version + 1}
+
+class VersionConflict(Exception):
+    """The row exists but its version is not one the caller expected"""
+
+    def __init__(self, current_version: int):
+        super().__init__(f"Employee is at version {current_version}")
+        self.current_version = current_version
+
+def _outcome(employee_pk: int, outcome: str, detail: Optional[str] = None) -> Dict[str, Any]:
+    return {"id": employee_pk, "outcome": outcome, "detail": detail}
+
+def _invalid_fields(employee_pk: int, changes: Dict[str, Any], existing: Set[int]) -> Optional[str]:
+    for field in REQUIRED_FIELDS:
+        if field in changes and changes[field] is None:
+            return f"{field} cannot be null"
+    for field in REFERENCE_FIELDS:
+        reference = changes.get(field)
+        if reference is None:
+            continue
+        if reference == employee_pk:
+            return f"{field} cannot be the employee itself"
+        if reference not in existing:
+            return f"{field} {reference} does not exist"
+    return None
+
+def _apply(db: Session, changes_by_pk: Dict[int, Dict[str, Any]]):
+    """As few UPDATEs as the changes allow: one per distinct set of values, then one executemany per set of columns"""
+    groups: Dict[Tuple[Tuple[str, Any], ...], List[int]] = defaultdict(list)
+    for employee_pk, changes in changes_by_pk.items():
+        groups[tuple(sorted(changes.items()))].append(employee_pk)
+
+    singles: Dict[Tuple[str, ...], List[Dict[str, Any]]] = defaultdict(list)
+    for changes, employee_pks in groups.items():
+        if len(employee_pks) > 1:
+            db.execute(
+                update(employees_table).where(employees_table.c.id.in_(employee_pks)).values(**dict(changes), **NEXT_VERSION)
+            )
+        else:
+            singles[tuple(field for field, _ in changes)].append({"employee_pk": employee_pks[0], **dict(changes)})
+    for fields, parameters in singles.items():
+        # The rest of the SET clause comes from the parameter keys
+        db.execute(
+            update(employees_table).where(employees_table.c.id == bindparam("employee_pk")).values(NEXT_VERSION),
+            parameters
+        )
+
+def maintain_employees(db: Session, rows: List[Row], fields: Iterable[str]):
+    """What the flush hooks do for ORM writes, which Core UPDATEs never trigger; once per statement or batch.
+
+    `rows` are the changed rows of the employees table, as returned by
+    UPDATE ... RETURNING or re-selected after it.
+    """
+    if not rows:
+        return
+    if SEARCH_FIELDS.intersection(fields):
+        write_documents(db.connection(), [employee_document(row) for row in rows])
+    stage_employees(db, rows)
+    stage(db, "employee", [row.id for row in rows])
+
+def _select_rows(db: Session, employee_pks: List[int]) -> List[Row]:
+    if not employee_pks:
+        return []
+    return db.execute(select(employees_table).where(employees_table.c.id.in_(employee_pks))).all()
+
+def update_employee_row(db: Session, employee_pk: int, changes: Dict[str, Any], versions: Optional[List[int]] = None) -> Row:
+    """One UPDATE ... WHERE id [AND version IN versions] RETURNING the row; the caller commits.
+
+    Nothing is read first, so no row lock is held while the request runs.
+    Only when no row comes back does a second SELECT tell a missing
+    employee (LookupError) from a stale version (VersionConflict).
+    """
+    statement = (
+        update(employees_table)
+        .where(employees_table.c.id == employee_pk)
+        .values(**changes, **NEXT_VERSION)
+        .returning(*employees_table.c)
+    )
+    if versions is not None:
+        statement = statement.where(employees_table.c.version.in_(versions))
+    row = db.execute(statement).first()
+    if row is None:
+        current_version = db.scalar(select(employees_table.c.version).where(employees_table.c.id == employee_pk))
+        if current_version is None:
+            raise LookupError(employee_pk)
+        raise VersionConflict(current_version)
+    maintain_employees(db, [row], changes)
+    return row
+
+def bulk_update_employees(db: Session, updates: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Apply partial updates, each with its "id", in one transaction; invalid entries are reported and skipped"""
+    employee_pks = [update_data["id"] for update_data in updates]
+    references = {
+        update_data[field] for update_data in updates for field in REFERENCE_FIELDS if update_data.get(field) is not None
+    }
+    existing = set(db.scalars(select(Employee.id).where(Employee.id.in_(set(employee_pks) | references))))
+
+    emails = {update_data["email"] for update_data in updates if update_data.get("email")}
+    taken = dict(
+        db.execute(select(Employee.email, Employee.id).where(Employee.email.in_(emails))).all()
+    ) if emails else {}
+
+    results = []
+    seen: Set[int] = set()
+    seen_emails: Dict[str, int] = {}
+    changes_by_pk: Dict[int, Dict[str, Any]] = {}
+    for update_data in updates:
+        employee_pk = update_data["id"]
+        changes = {field: value for field, value in update_data.items() if field != "id"}
+        email = changes.get("email")
+        duplicate = employee_pk in seen
+        seen.add(employee_pk)
+        if employee_pk not in existing:
+            results.append(_outcome(employee_pk, NOT_FOUND))
+        elif duplicate:
+            results.append(_outcome(employee_pk, INVALID, "employee appears more than once"))
+        elif email and (taken.get(email, employee_pk) != employee_pk or seen_emails.get(email, employee_pk) != employee_pk):
+            results.append(_outcome(employee_pk, INVALID, "email already registered"))
+        elif (detail := _invalid_fields(employee_pk, changes, existing)) is not None:
+            results.append(_outcome(employee_pk, INVALID, detail))
+        elif not changes:
+            results.append(_outcome(employee_pk, UNCHANGED))
+        else:
+            if email:
+                seen_emails[email] = employee_pk
+            changes_by_pk[employee_pk] = changes
+            results.append(_outcome(employee_pk, UPDATED))
+
+    _apply(db, changes_by_pk)
+    maintain_employees(
+        db, _select_rows(db, list(changes_by_pk)), {field for changes in changes_by_pk.values() for field in changes}
+    )
+    db.commit()
+    logger.info(f"Bulk employee update: {len(changes_by_pk)} of {len(updates)} applied")
+    return results
+
+def update_employees_where(db: Session, criteria: Dict[str, Any], changes: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """One UPDATE ... RETURNING over every employee matching the criteria; listed ids that matched nothing are not_found"""
+    references = {changes[field] for field in REFERENCE_FIELDS if changes.get(field) is not None}
+    existing = set(db.scalars(select(Employee.id).where(Employee.id.in_(references)))) if references else set()
+    # Id 0 never exists, so only the null and reference checks apply here
+    detail = _invalid_fields(0, changes, existing)
+    if detail is not None:
+        raise ValueError(detail)
+
+    statement = update(employees_table).values(**changes, **NEXT_VERSION).returning(*employees_table.c)
+    requested = criteria.get("ids")
+    if requested is not None:
+        statement = statement.where(employees_table.c.id.in_(requested))
+    for field, value in criteria.items():
+        if field == "ids":
+            continue
+        statement = statement.where(employees_table.c[field] == value)
+    rows = sorted(db.execute(statement).all(), key=lambda row: row.id)
+    updated = [row.id for row in rows]
+
+    # Assigning the matched rows to themselves as manager is only detectable now
+    for field in REFERENCE_FIELDS:
+        if changes.get(field) in updated:
+            db.rollback()
+            raise ValueError(f"{field} cannot be one of the employees being updated")
+
+    maintain_employees(db, rows, changes)
+    db.commit()
+    logger.info(f"Bulk employee update by filter {criteria}: {len(updated)} updated")
+    matched = set(updated)
+    return [_outcome(employee_pk, UPDATED) for employee_pk in updated] + [
+        _outcome(employee_pk, NOT_FOUND) for employee_pk in dict.fromkeys(requested or ()) if employee_pk not in matched
+    ]
\ No newline at end of file
@@ -0,0 +1,91 @@
+from typing import Dict, List, Optional
+from sqlalchemy import func, literal, select, update
+from sqlalchemy.orm import Session, aliased
+from app.models.goal import Goal, GoalTypeEnum
+
+def leaf_progress(goal: Goal) -> float:
+    """Progress of a goal measured against its own target"""
+    if not goal.target_value:
+        return goal.progress_percentage or 0.0
+    return max(0.0, min(100.0, (goal.current_value or 0.0) / goal.target_value * 100.0))
+
+def ancestor_ids(db: Session, goal_id: int) -> List[int]:
+    """The goal itself followed by its ancestors, nearest first, in one recursive query"""
+    chain = (
+        select(Goal.id, Goal.parent_id, literal(0).label("depth"))
+        .where(Goal.id == goal_id)
+        .cte("goal_ancestors", recursive=True)
+    )
+    parent = aliased(Goal)
+    chain = chain.union_all(
+        select(parent.id, parent.parent_id, chain.c.depth + 1)
+        .where(parent.id == chain.c.parent_id)
+    )
+    return list(db.scalars(select(chain.c.id).order_by(chain.c.depth)))
+
+def rollup_from(db: Session, goal_id: Optional[int]):
+    """Recompute progress of goal_id and every ancestor above it, and nothing else.
+
+    Each level becomes the average progress of its direct children, so the
+    cost is one UPDATE per level of the hierarchy rather than a tree rebuild.
+    """
+    if goal_id is None:
+        return
+    child = aliased(Goal)
+    for ancestor_id in ancestor_ids(db, goal_id):
+        children_average = (
+            select(func.avg(child.progress_percentage))
+            .where(child.parent_id == ancestor_id)
+            .scalar_subquery()
+        )
+        db.execute(
+            update(Goal)
+            .where(Goal.id == ancestor_id)
+            .values(progress_percentage=func.coalesce(children_average, Goal.progress_percentage))
+            .execution_options(synchronize_session=False)
+        )
+    db.expire_all()
+
+def would_create_cycle(db: Session, goal_id: int, new_parent_id: int) -> bool:
+    return goal_id in ancestor_ids(db, new_parent_id)
+
+def load_tree(db: Session, root_id: Optional[int] = None) -> List[Dict]:
+    """Company goals (or one subtree) with all descendants, fetched in one recursive query"""
+    roots = select(Goal.id, literal(0).label("depth"))
+    if root_id is not None:
+        roots = roots.where(Goal.id == root_id)
+    else:
+        roots = roots.where(Goal.parent_id.is_(None), Goal.goal_type == GoalTypeEnum.COMPANY)
+    tree = roots.cte("goal_tree", recursive=True)
+    child = aliased(Goal)
+    tree = tree.union_all(
+        select(child.id, tree.c.depth + 1).where(child.parent_id == tree.c.id)
+    )
+
+    goals = db.scalars(
+        select(Goal).join(tree, Goal.id == tree.c.id).order_by(tree.c.depth, Goal.id)
+    ).all()
+
+    nodes: Dict[int, Dict] = {}
+    top_level: List[Dict] = []
+    for goal in goals:
+        node = {
+            "id": goal.id,
+            "title": goal.title,
+            "goal_type": goal.goal_type,
+            "status": goal.status,
+            "progress_percentage": goal.progress_percentage or 0.0,
+            "current_value": goal.current_value,
+            "target_value": goal.target_value,
+            "unit": goal.unit,
+            "assigned_to": goal.assigned_to,
+            "target_date": goal.target_date,
+            "children": []
+        }
+        nodes[goal.id] = node
+        # Parents come first thanks to the depth ordering
+        if goal.parent_id in nodes:
+            nodes[goal.parent_id]["children"].append(node)
+        else:
+            top_level.append(node)
+    return top_level
\ No newline at end of file
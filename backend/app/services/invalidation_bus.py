@@ -0,0 +1,301 @@
+import errno
+import json
+import os
+import select
+import socket
+import threading
+import time
+import uuid
+from collections import defaultdict
+from typing import Callable, Dict, Iterable, List, Optional, Set
+from sqlalchemy import event, inspect, text
+from sqlalchemy.orm import Session
+from app.core.config import settings
+from app.database.database import SessionLocal, engine
+from app.models.announcement import Announcement
+from app.models.employee import Employee
+import logging
+
+logger = logging.getLogger(__name__)
+
+_PENDING_KEY = "invalidation_bus.pending"
+
+# Models whose committed changes are broadcast, and the kind they go out as
+TRACKED_MODELS = {Employee: "employee", Announcement: "announcement"}
+
+# Keeps each message well under the 8000 byte NOTIFY payload limit
+MAX_KEYS_PER_MESSAGE = 500
+
+Handler = Callable[[List], None]
+
+class NullTransport:
+    """Single worker: nobody else to tell"""
+
+    def start(self, deliver: Callable[[bytes], None]):
+        pass
+
+    def send(self, payload: bytes):
+        pass
+
+    def stop(self):
+        pass
+
+class UnixSocketTransport:
+    """Every worker binds a datagram socket in a shared directory and sends to all the others.
+
+    Needs no broker, so tests and single-host deployments can run the bus
+    without Postgres or Redis.
+    """
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        self._socket: Optional[socket.socket] = None
+        self._path: Optional[str] = None
+        self._thread: Optional[threading.Thread] = None
+        self._stopping = threading.Event()
+
+    def start(self, deliver: Callable[[bytes], None]):
+        os.makedirs(self.directory, exist_ok=True)
+        self._path = os.path.join(self.directory, f"{os.getpid()}-{uuid.uuid4().hex[:8]}.sock")
+        self._socket = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        self._socket.bind(self._path)
+        self._socket.settimeout(0.5)
+        self._stopping.clear()
+        self._thread = threading.Thread(target=self._listen, args=(deliver,), name="invalidation-bus", daemon=True)
+        self._thread.start()
+
+    def _listen(self, deliver: Callable[[bytes], None]):
+        while not self._stopping.is_set():
+            try:
+                payload = self._socket.recv(65536)
+            except socket.timeout:
+                continue
+            except OSError:
+                return
+            deliver(payload)
+
+    def send(self, payload: bytes):
+        sender = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        try:
+            for name in os.listdir(self.directory):
+                path = os.path.join(self.directory, name)
+                if not name.endswith(".sock") or path == self._path:
+                    continue
+                try:
+                    sender.sendto(payload, socket.MSG_DONTWAIT, path)
+                except (ConnectionRefusedError, FileNotFoundError):
+                    # The worker that owned it has exited
+                    try:
+                        os.unlink(path)
+                    except FileNotFoundError:
+                        pass
+                except OSError as e:
+                    if e.errno not in (errno.EAGAIN, errno.ENOBUFS):
+                        raise
+                    logger.warning(f"Invalidation bus dropped a message for {name}, its queue is full")
+        finally:
+            sender.close()
+
+    def stop(self):
+        self._stopping.set()
+        if self._thread is not None:
+            self._thread.join(timeout=2)
+        if self._socket is not None:
+            self._socket.close()
+        if self._path is not None and os.path.exists(self._path):
+            os.unlink(self._path)
+
+class RedisTransport:
+    def __init__(self, url: str, channel: str):
+        import redis
+        self._client = redis.Redis.from_url(url)
+        self.channel = channel
+        self._pubsub = None
+        self._thread: Optional[threading.Thread] = None
+        self._stopping = threading.Event()
+
+    def start(self, deliver: Callable[[bytes], None]):
+        self._pubsub = self._client.pubsub(ignore_subscribe_messages=True)
+        self._pubsub.subscribe(self.channel)
+        self._stopping.clear()
+        self._thread = threading.Thread(target=self._listen, args=(deliver,), name="invalidation-bus", daemon=True)
+        self._thread.start()
+
+    def _listen(self, deliver: Callable[[bytes], None]):
+        while not self._stopping.is_set():
+            try:
+                message = self._pubsub.get_message(timeout=0.5)
+            except Exception as e:
+                logger.error(f"Invalidation bus lost its Redis subscription: {e}")
+                time.sleep(1)
+                continue
+            if message is not None:
+                deliver(message["data"])
+
+    def send(self, payload: bytes):
+        self._client.publish(self.channel, payload)
+
+    def stop(self):
+        self._stopping.set()
+        if self._thread is not None:
+            self._thread.join(timeout=2)
+        if self._pubsub is not None:
+            self._pubsub.close()
+
+class PostgresTransport:
+    """LISTEN on a dedicated connection, NOTIFY through the regular pool"""
+
+    def __init__(self, channel: str):
+        self.channel = channel
+        self._connection = None
+        self._thread: Optional[threading.Thread] = None
+        self._stopping = threading.Event()
+
+    def start(self, deliver: Callable[[bytes], None]):
+        # Detached from the pool: a LISTENing connection must never be handed to a request
+        pooled = engine.raw_connection()
+        pooled.detach()
+        self._connection = pooled.driver_connection
+        self._connection.autocommit = True
+        with self._connection.cursor() as cursor:
+            cursor.execute(f'LISTEN "{self.channel}"')
+        self._stopping.clear()
+        self._thread = threading.Thread(target=self._listen, args=(deliver,), name="invalidation-bus", daemon=True)
+        self._thread.start()
+
+    def _listen(self, deliver: Callable[[bytes], None]):
+        while not self._stopping.is_set():
+            if select.select([self._connection], [], [], 0.5) == ([], [], []):
+                continue
+            self._connection.poll()
+            while self._connection.notifies:
+                deliver(self._connection.notifies.pop(0).payload.encode())
+
+    def send(self, payload: bytes):
+        with engine.begin() as connection:
+            connection.execute(text("SELECT pg_notify(:channel, :payload)"), {"channel": self.channel, "payload": payload.decode()})
+
+    def stop(self):
+        self._stopping.set()
+        if self._thread is not None:
+            self._thread.join(timeout=2)
+        if self._connection is not None:
+            self._connection.close()
+
+def create_transport():
+    if settings.INVALIDATION_BUS == "unix":
+        return UnixSocketTransport(settings.INVALIDATION_BUS_SOCKET_DIR)
+    if settings.INVALIDATION_BUS == "redis":
+        return RedisTransport(settings.REDIS_URL, settings.INVALIDATION_BUS_CHANNEL)
+    if settings.INVALIDATION_BUS == "postgres":
+        return PostgresTransport(settings.INVALIDATION_BUS_CHANNEL)
+    return NullTransport()
+
+class InvalidationBus:
+    """Broadcasts the keys of committed changes so other workers can evict their copies.
+
+    Each worker already keeps its own caches current from its own commits,
+    so messages a worker sent itself are ignored. Delivery is best effort;
+    cache TTLs still bound staleness if a message is lost.
+    """
+
+    def __init__(self, transport=None):
+        self._transport = transport
+        self._handlers: Dict[str, List[Handler]] = defaultdict(list)
+        self.worker_id: Optional[str] = None
+        self._lock = threading.Lock()
+        self._stats = {"published": 0, "received": 0, "errors": 0}
+        self._latencies_ms: List[float] = []
+
+    def subscribe(self, kind: str, handler: Handler):
+        self._handlers[kind].append(handler)
+
+    def start(self, transport=None):
+        # Called in each worker after the fork, so the id is per process
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:6]}"
+        self._transport = transport or self._transport or create_transport()
+        self._transport.start(self._deliver)
+
+    def stop(self):
+        if self._transport is not None:
+            self._transport.stop()
+
+    def publish(self, keys: Dict[str, Iterable]):
+        if self._transport is None or self.worker_id is None:
+            return
+        keys = {kind: sorted(set(values)) for kind, values in keys.items() if values}
+        for kind, values in keys.items():
+            for start in range(0, len(values), MAX_KEYS_PER_MESSAGE):
+                payload = json.dumps({
+                    "origin": self.worker_id,
+                    "sent_at": time.time(),
+                    "kind": kind,
+                    "keys": values[start:start + MAX_KEYS_PER_MESSAGE]
+                }).encode()
+                try:
+                    self._transport.send(payload)
+                    self._stats["published"] += 1
+                except Exception as e:
+                    self._stats["errors"] += 1
+                    logger.error(f"Failed to publish {kind} invalidation: {e}")
+
+    def _deliver(self, payload: bytes):
+        try:
+            message = json.loads(payload)
+        except ValueError:
+            self._stats["errors"] += 1
+            return
+        if message.get("origin") == self.worker_id:
+            return
+        with self._lock:
+            self._stats["received"] += 1
+            self._latencies_ms.append((time.time() - message["sent_at"]) * 1000)
+            del self._latencies_ms[:-1000]
+        for handler in self._handlers.get(message["kind"], ()):
+            try:
+                handler(message["keys"])
+            except Exception as e:
+                self._stats["errors"] += 1
+                logger.error(f"Invalidation handler for {message['kind']} failed: {e}")
+
+    def stats(self) -> Dict:
+        """Message counts and propagation latency over the last 1000 received messages"""
+        with self._lock:
+            latencies = sorted(self._latencies_ms)
+        percentile = lambda q: round(latencies[min(len(latencies) - 1, int(len(latencies) * q))], 3) if latencies else None
+        return {
+            **self._stats,
+            "transport": type(self._transport).__name__ if self._transport else None,
+            "latency_ms_p50": percentile(0.5),
+            "latency_ms_p99": percentile(0.99),
+            "latency_ms_max": round(latencies[-1], 3) if latencies else None,
+        }
+
+# Global instance
+invalidation_bus = InvalidationBus()
+
+def stage(session: Session, kind: str, keys: Iterable):
+    """Queue keys to broadcast once the session commits; for writes that bypass the ORM"""
+    pending: Dict[str, Set] = session.info.setdefault(_PENDING_KEY, defaultdict(set))
+    pending[kind].update(keys)
+
+@event.listens_for(SessionLocal, "after_flush")
+def _stage_tracked_changes(session: Session, flush_context):
+    for obj in list(session.new) + list(session.dirty):
+        kind = TRACKED_MODELS.get(type(obj))
+        if kind is not None and (obj in session.new or session.is_modified(obj, include_collections=False)):
+            stage(session, kind, [obj.id])
+    for obj in session.deleted:
+        kind = TRACKED_MODELS.get(type(obj))
+        if kind is not None:
+            stage(session, kind, [inspect(obj).identity[0]])
+
+@event.listens_for(SessionLocal, "after_commit")
+def _publish_committed_changes(session: Session):
+    pending = session.info.pop(_PENDING_KEY, None)
+    if pending:
+        invalidation_bus.publish(pending)
+
+@event.listens_for(SessionLocal, "after_rollback")
+def _discard_staged_changes(session: Session):
+    session.info.pop(_PENDING_KEY, None)
\ No newline at end of file
@@ -0,0 +1,239 @@
+import re
+import threading
+import time
+from bisect import bisect_left
+from contextvars import ContextVar
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from app.core.config import settings
+import logging
+
+logger = logging.getLogger(__name__)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+
+# Label for requests no route matched, so scanners can't blow up the series count
+UNMATCHED_ROUTE = "<unmatched>"
+
+class Counter:
+    type = "counter"
+
+    def __init__(self, name: str, documentation: str, labels: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labels = tuple(labels)
+        self._series: Dict[Tuple[str, ...], List[float]] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, *label_values: str, amount: float = 1):
+        with self._lock:
+            series = self._series.get(label_values)
+            if series is None:
+                series = self._series[label_values] = [0.0]
+            series[0] += amount
+
+    def dump(self) -> Dict[Tuple[str, ...], List[float]]:
+        with self._lock:
+            return {labels: list(values) for labels, values in self._series.items()}
+
+    def render(self, labels: Tuple[str, ...], values: List[float]) -> Iterable[str]:
+        yield f"{self.name}{_labels(self.labels, labels)} {_number(values[0])}"
+
+class Histogram:
+    """Per-bucket counts followed by the overflow count and the sum; rendered cumulatively"""
+
+    type = "histogram"
+
+    def __init__(self, name: str, documentation: str, labels: Sequence[str] = (), buckets: Sequence[float] = LATENCY_BUCKETS):
+        self.name = name
+        self.documentation = documentation
+        self.labels = tuple(labels)
+        self.buckets = tuple(buckets)
+        self._series: Dict[Tuple[str, ...], List[float]] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, *label_values: str):
+        position = bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(label_values)
+            if series is None:
+                series = self._series[label_values] = [0] * (len(self.buckets) + 1) + [0.0]
+            series[position] += 1
+            series[-1] += value
+
+    def dump(self) -> Dict[Tuple[str, ...], List[float]]:
+        with self._lock:
+            return {labels: list(values) for labels, values in self._series.items()}
+
+    def render(self, labels: Tuple[str, ...], values: List[float]) -> Iterable[str]:
+        cumulative = 0
+        for bound, count in zip(self.buckets + (float("inf"),), values[:-1]):
+            cumulative += count
+            le = "+Inf" if bound == float("inf") else _number(bound)
+            yield f"{self.name}_bucket{_labels(self.labels + ('le',), labels + (le,))} {_number(cumulative)}"
+        yield f"{self.name}_sum{_labels(self.labels, labels)} {_number(values[-1])}"
+        yield f"{self.name}_count{_labels(self.labels, labels)} {_number(cumulative)}"
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+def _labels(names: Tuple[str, ...], values: Tuple[str, ...]) -> str:
+    if not names:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(str(value))}"' for name, value in zip(names, values)) + "}"
+
+def _number(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+class Registry:
+    def __init__(self):
+        self.metrics: Dict[str, object] = {}
+
+    def register(self, metric):
+        self.metrics[metric.name] = metric
+        return metric
+
+    def dump(self) -> Dict[str, List]:
+        """JSON-friendly copy of every series, so other workers can merge it"""
+        return {
+            name: [[list(labels), values] for labels, values in metric.dump().items()]
+            for name, metric in self.metrics.items()
+        }
+
+    def render(self, dumps: Iterable[Dict[str, List]]) -> str:
+        """Prometheus text exposition of the element-wise sum of the given dumps"""
+        merged: Dict[str, Dict[Tuple[str, ...], List[float]]] = {name: {} for name in self.metrics}
+        for dump in dumps:
+            for name, series in dump.items():
+                if name not in merged:
+                    continue
+                for labels, values in series:
+                    current = merged[name].setdefault(tuple(labels), [0] * len(values))
+                    for index, value in enumerate(values):
+                        current[index] += value
+        lines = []
+        for name, metric in self.metrics.items():
+            lines.append(f"# HELP {name} {metric.documentation}")
+            lines.append(f"# TYPE {name} {metric.type}")
+            for labels, values in sorted(merged[name].items()):
+                lines.extend(metric.render(labels, values))
+        return "\n".join(lines) + "\n"
+
+# Global instance
+registry = Registry()
+
+REQUESTS = registry.register(Counter(
+    "http_requests_total", "HTTP requests by route template and status code", ("method", "route", "status")
+))
+REQUEST_LATENCY = registry.register(Histogram(
+    "http_request_duration_seconds", "Time from receiving a request to sending its response", ("method", "route")
+))
+REQUEST_QUERIES = registry.register(Histogram(
+    "http_request_db_queries", "SQL statements issued per request", ("method", "route"), QUERY_COUNT_BUCKETS
+))
+REQUEST_DB_TIME = registry.register(Histogram(
+    "http_request_db_seconds", "Time spent executing SQL per request", ("method", "route")
+))
+SLOW_QUERIES = registry.register(Counter(
+    "db_slow_queries_total", "Statements slower than SLOW_QUERY_MS", ("route",)
+))
+
+class RequestMetrics:
+    """SQL issued while serving one request"""
+
+    __slots__ = ("scope", "queries", "db_seconds")
+
+    def __init__(self, scope: dict):
+        self.scope = scope
+        self.queries = 0
+        self.db_seconds = 0.0
+
+    @property
+    def route(self) -> str:
+        route = self.scope.get("route")
+        return route.path if route is not None else UNMATCHED_ROUTE
+
+# Copied into the threadpool with the rest of the context, so sync endpoints and dependencies count too
+_current_request: ContextVar[Optional[RequestMetrics]] = ContextVar("request_metrics", default=None)
+
+def current_request() -> Optional[RequestMetrics]:
+    return _current_request.get()
+
+class MetricsMiddleware:
+    """Records latency, status and SQL totals per route template; plain ASGI to keep the per-request cost low"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        state = RequestMetrics(scope)
+        token = _current_request.set(state)
+        status = 500
+
+        async def send_with_status(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            elapsed = time.perf_counter() - started
+            _current_request.reset(token)
+            route = state.route
+            REQUESTS.inc(scope["method"], route, str(status))
+            REQUEST_LATENCY.observe(elapsed, scope["method"], route)
+            REQUEST_QUERIES.observe(state.queries, scope["method"], route)
+            REQUEST_DB_TIME.observe(state.db_seconds, scope["method"], route)
+
+_WHITESPACE = re.compile(r"\s+")
+_STRING = re.compile(r"'(?:[^']|'')*'")
+_NUMBER = re.compile(r"\b\d+(?:\.\d+)?\b")
+# psycopg2 pyformat, sqlite qmark, named and numeric styles; "::" casts are left alone
+_PARAMETER = re.compile(r"%\(\w+\)s|%s|(?<!:):\w+|\$\d+|\?")
+_VALUE_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+
+@lru_cache(maxsize=1024)
+def normalize_sql(statement: str) -> str:
+    """Collapse literals, parameters and IN lists so one query shape logs the same way every time"""
+    normalized = _STRING.sub("?", statement)
+    normalized = _PARAMETER.sub("?", normalized)
+    normalized = _NUMBER.sub("?", normalized)
+    normalized = _VALUE_LIST.sub("(?, ...)", normalized)
+    return _WHITESPACE.sub(" ", normalized).strip()
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("metrics_query_start", []).append(time.perf_counter())
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    elapsed = time.perf_counter() - conn.info["metrics_query_start"].pop()
+    state = _current_request.get()
+    if state is not None:
+        state.queries += 1
+        state.db_seconds += elapsed
+    if elapsed * 1000 >= settings.SLOW_QUERY_MS:
+        route = state.route if state is not None else "background"
+        SLOW_QUERIES.inc(route)
+        logger.warning(f"Slow query ({elapsed * 1000:.0f} ms) on {route}: {normalize_sql(statement)}")
+
+def _handle_error(context):
+    # A failed statement never reaches after_cursor_execute
+    starts = context.connection.info.get("metrics_query_start") if context.connection is not None else None
+    if starts:
+        starts.pop()
+
+def install_query_hooks(engine: Engine):
+    if not event.contains(engine, "after_cursor_execute", _after_cursor_execute):
+        event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+        event.listen(engine, "handle_error", _handle_error)
\ No newline at end of file
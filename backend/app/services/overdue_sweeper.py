@@ -0,0 +1,115 @@
+import asyncio
+from collections import defaultdict
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+from sqlalchemy import select, update
+from sqlalchemy.orm import Session
+from app.core.config import settings
+from app.database.database import SessionLocal
+from app.models.employee import Employee
+from app.models.goal import Goal, GoalStatusEnum
+from app.models.task import Task, TaskStatusEnum
+from app.services.notification_service import send_task_notification
+from app.services.tracing import in_current_context
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Must match the predicates of the partial indexes on tasks and goals
+OPEN_TASK_STATUSES = (TaskStatusEnum.ASSIGNED, TaskStatusEnum.IN_PROGRESS)
+OPEN_GOAL_STATUSES = (GoalStatusEnum.PENDING, GoalStatusEnum.IN_PROGRESS)
+REMINDER_TASK_STATUSES = OPEN_TASK_STATUSES + (TaskStatusEnum.OVERDUE,)
+
+def sweep_overdue(db: Session, now: Optional[datetime] = None) -> Tuple[int, int]:
+    """Flip every open task and goal past its due date to OVERDUE with one UPDATE each"""
+    now = now or datetime.utcnow()
+
+    # ASSIGNED/IN_PROGRESS -> OVERDUE keeps a task pending, so the employee
+    # task counters are unaffected by bypassing the ORM flush here
+    tasks = db.execute(
+        update(Task)
+        .where(Task.status.in_(OPEN_TASK_STATUSES), Task.due_date < now)
+        .values(status=TaskStatusEnum.OVERDUE, updated_at=now)
+        .execution_options(synchronize_session=False)
+    ).rowcount
+    goals = db.execute(
+        update(Goal)
+        .where(Goal.status.in_(OPEN_GOAL_STATUSES), Goal.target_date < now)
+        .values(status=GoalStatusEnum.OVERDUE, updated_at=now)
+        .execution_options(synchronize_session=False)
+    ).rowcount
+    db.commit()
+
+    if tasks or goals:
+        logger.info(f"Marked {tasks} tasks and {goals} goals overdue")
+    return tasks, goals
+
+def collect_pending_reminders(db: Session) -> Dict[int, Dict]:
+    """Open tasks nobody has been notified about, grouped per assignee"""
+    rows = db.execute(
+        select(Task.id, Task.title, Task.due_date, Employee.id, Employee.email, Employee.full_name)
+        .join(Employee, Employee.id == Task.assigned_to)
+        .where(Task.notification_sent == False, Task.status.in_(REMINDER_TASK_STATUSES))
+        .order_by(Employee.id, Task.due_date)
+    ).all()
+
+    digests: Dict[int, Dict] = defaultdict(lambda: {"tasks": []})
+    for task_id, title, due_date, employee_id, email, full_name in rows:
+        digest = digests[employee_id]
+        digest["email"] = email
+        digest["full_name"] = full_name
+        digest["tasks"].append((task_id, title, due_date))
+    return digests
+
+async def send_reminder_digests(digests: Dict[int, Dict]) -> List[int]:
+    """Send one email per assignee; returns the ids of tasks that were delivered"""
+    semaphore = asyncio.Semaphore(settings.NOTIFICATION_CONCURRENCY)
+
+    async def send(digest: Dict) -> List[int]:
+        (_, first_title, first_due), *others = digest["tasks"]
+        async with semaphore:
+            try:
+                await send_task_notification(
+                    email=digest["email"],
+                    full_name=digest["full_name"],
+                    task_title=first_title,
+                    due_date=first_due.strftime("%Y-%m-%d"),
+                    other_tasks=[(title, due.strftime("%Y-%m-%d")) for _, title, due in others]
+                )
+            except Exception as e:
+                logger.error(f"Failed to send task reminder to {digest['email']}: {e}")
+                return []
+        return [task_id for task_id, _, _ in digest["tasks"]]
+
+    results = await asyncio.gather(*(send(digest) for digest in digests.values()))
+    return [task_id for delivered in results for task_id in delivered]
+
+def mark_notified(db: Session, task_ids: List[int]):
+    if not task_ids:
+        return
+    db.execute(
+        update(Task)
+        .where(Task.id.in_(task_ids))
+        .values(notification_sent=True)
+        .execution_options(synchronize_session=False)
+    )
+    db.commit()
+
+def _with_session(func, *args):
+    db = SessionLocal()
+    try:
+        return func(db, *args)
+    finally:
+        db.close()
+
+async def run_overdue_sweep():
+    """Scheduler entry point: sweep statuses, then send and record reminder digests"""
+    loop = asyncio.get_running_loop()
+    await loop.run_in_executor(None, in_current_context(_with_session, sweep_overdue))
+
+    digests = await loop.run_in_executor(None, in_current_context(_with_session, collect_pending_reminders))
+    if not digests:
+        return
+    delivered = await send_reminder_digests(digests)
+    await loop.run_in_executor(None, in_current_context(_with_session, mark_notified, delivered))
+    logger.info(f"Task reminders for {len(digests)} assignees, {len(delivered)} tasks delivered")
\ No newline at end of file
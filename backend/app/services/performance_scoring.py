@@ -0,0 +1,114 @@
+from datetime import date
+from typing import Dict, Optional
+import numpy as np
+from sqlalchemy import select, update
+from sqlalchemy.orm import Session
+from app.models.analytics import EmployeePerformance
+from app.models.employee import Employee
+import logging
+
+logger = logging.getLogger(__name__)
+
+SUB_SCORES = ("technical_skills", "communication", "teamwork", "leadership", "problem_solving")
+
+DEFAULT_WEIGHTS = {
+    "technical_skills": 0.3,
+    "communication": 0.2,
+    "teamwork": 0.2,
+    "leadership": 0.15,
+    "problem_solving": 0.15,
+}
+
+# Lower bound of each rating on the 0-10 scale, best first
+RATING_BANDS = (
+    (9, "Excellent"),
+    (7, "Good"),
+    (5, "Average"),
+    (3, "Below Average"),
+)
+LOWEST_RATING = "Poor"
+
+MAX_SCORE = 10.0
+
+def rating_for(score: float) -> str:
+    for threshold, rating in RATING_BANDS:
+        if score >= threshold:
+            return rating
+    return LOWEST_RATING
+
+def normalize_weights(weights: Optional[Dict[str, float]] = None) -> np.ndarray:
+    """Weight vector in SUB_SCORES order, scaled to sum to 1"""
+    merged = {**DEFAULT_WEIGHTS, **(weights or {})}
+    unknown = set(merged) - set(SUB_SCORES)
+    if unknown:
+        raise ValueError(f"Unknown score components: {', '.join(sorted(unknown))}")
+    vector = np.array([merged[name] for name in SUB_SCORES], dtype=float)
+    if (vector < 0).any() or vector.sum() == 0:
+        raise ValueError("Weights must be non-negative and not all zero")
+    return vector / vector.sum()
+
+def compute_scores(sub_scores: np.ndarray, departments: np.ndarray, weights: np.ndarray):
+    """Overall score, per-department percentile and rating for every evaluation.
+
+    The percentile is the share of evaluations in the same department that
+    scored at or below this one.
+    """
+    overall = np.clip(np.nan_to_num(sub_scores) @ weights, 0.0, MAX_SCORE)
+
+    # Sort on a composite (department, score) key so every department is one
+    # contiguous run and ranks fall out of searchsorted
+    _, codes = np.unique(departments, return_inverse=True)
+    span = MAX_SCORE + 1
+    keys = codes * span + overall
+    sorted_keys = np.sort(keys)
+    group_start = np.searchsorted(sorted_keys, codes * span, side="left")
+    group_end = np.searchsorted(sorted_keys, (codes + 1) * span, side="left")
+    at_or_below = np.searchsorted(sorted_keys, keys, side="right") - group_start
+    percentiles = at_or_below / (group_end - group_start) * 100.0
+
+    thresholds = [threshold for threshold, _ in RATING_BANDS]
+    labels = [rating for _, rating in RATING_BANDS]
+    ratings = np.select([overall >= threshold for threshold in thresholds], labels, default=LOWEST_RATING)
+
+    return overall, percentiles, ratings
+
+def score_period(
+    db: Session,
+    start_date: date,
+    end_date: date,
+    weights: Optional[Dict[str, float]] = None
+) -> int:
+    """Recompute and store scores for every evaluation in the period"""
+    weight_vector = normalize_weights(weights)
+
+    columns = [getattr(EmployeePerformance, name) for name in SUB_SCORES]
+    rows = db.execute(
+        select(EmployeePerformance.id, Employee.department, *columns)
+        .join(Employee, Employee.id == EmployeePerformance.employee_id)
+        .where(EmployeePerformance.evaluation_date.between(start_date, end_date))
+    ).all()
+    if not rows:
+        return 0
+
+    ids = [row[0] for row in rows]
+    departments = np.array([row[1] for row in rows], dtype=object)
+    sub_scores = np.array([row[2:] for row in rows], dtype=float)
+
+    overall, percentiles, ratings = compute_scores(sub_scores, departments, weight_vector)
+
+    db.execute(
+        update(EmployeePerformance),
+        [
+            {
+                "id": evaluation_id,
+                "overall_score": round(float(score), 2),
+                "department_percentile": round(float(percentile), 2),
+                "performance_rating": str(rating)
+            }
+            for evaluation_id, score, percentile, rating in zip(ids, overall, percentiles, ratings)
+        ]
+    )
+    db.commit()
+
+    logger.info(f"Scored {len(ids)} evaluations between {start_date} and {end_date}")
+    return len(ids)
\ No newline at end of file
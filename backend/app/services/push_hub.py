@@ -0,0 +1,184 @@
+import asyncio
+import json
+from collections import defaultdict
+from typing import Any, Dict, Iterable, List, Optional, Set
+from fastapi import WebSocket
+from app.core.config import settings
+from app.services.announcement_feed import EVERYONE
+from app.services.invalidation_bus import invalidation_bus
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Close code sent to connections that fall too far behind
+SLOW_CONSUMER_CLOSE_CODE = 4008
+
+# Invalidation bus kind carrying events to the other workers
+PUSH_KIND = "push"
+
+def department_channel(department: str) -> str:
+    return f"department:{department}"
+
+def role_channel(role: str) -> str:
+    return f"role:{role}"
+
+def employee_channel(employee_pk: int) -> str:
+    return f"employee:{employee_pk}"
+
+class PushConnection:
+    """One subscriber: a bounded queue of encoded events drained by its own sender task"""
+
+    def __init__(self, websocket: WebSocket, employee_pk: int, department: str, role: str):
+        self.websocket = websocket
+        self.employee_pk = employee_pk
+        self.department = department
+        self.role = role
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=settings.PUSH_QUEUE_SIZE)
+        self.channels = (department_channel(department), role_channel(role), employee_channel(employee_pk))
+
+    async def send_forever(self):
+        while True:
+            message = await self.queue.get()
+            await self.websocket.send_text(message)
+
+class PushHub:
+    """Per-worker fan-out of events to subscribed WebSocket connections.
+
+    Publishing never waits on a client: each event is encoded once and
+    dropped into every recipient's queue. A connection whose queue is full
+    is evicted instead of letting it hold events back for everyone else.
+    Events also go out over the invalidation bus, so every other worker
+    fans them out to its own connections.
+    """
+
+    def __init__(self):
+        self._channels: Dict[str, Set[PushConnection]] = defaultdict(set)
+        self._connections: Set[PushConnection] = set()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._evicted = 0
+
+    def bind_loop(self, loop: asyncio.AbstractEventLoop):
+        self._loop = loop
+
+    def subscribe(self, connection: PushConnection):
+        self._connections.add(connection)
+        for channel in connection.channels:
+            self._channels[channel].add(connection)
+
+    def unsubscribe(self, connection: PushConnection):
+        self._connections.discard(connection)
+        for channel in connection.channels:
+            subscribers = self._channels.get(channel)
+            if subscribers is not None:
+                subscribers.discard(connection)
+                if not subscribers:
+                    del self._channels[channel]
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "connections": len(self._connections),
+            "channels": len(self._channels),
+            "evicted": self._evicted,
+        }
+
+    def publish(
+        self,
+        event: str,
+        data: Dict[str, Any],
+        departments: Optional[Iterable[str]] = None,
+        roles: Optional[Iterable[str]] = None,
+        employees: Optional[Iterable[int]] = None
+    ):
+        """Queue an event for everyone in the audience; safe to call from any thread.
+
+        Connections receive the event once if they are one of `employees`, or
+        if they match both `departments` and `roles` (EVERYONE or None for
+        either dimension matches all).
+        """
+        message = json.dumps({"event": event, "data": data}, default=str)
+        departments = None if departments is None else sorted(set(departments))
+        roles = None if roles is None else sorted(set(roles))
+        employees = sorted({employee_pk for employee_pk in employees or () if employee_pk is not None})
+        invalidation_bus.publish({PUSH_KIND: [json.dumps({
+            "message": message, "departments": departments, "roles": roles, "employees": employees
+        })]})
+        self._dispatch(message, departments, roles, employees)
+
+    def receive(self, events: List[str]):
+        """Bus handler: fan out events published by another worker"""
+        for event in events:
+            try:
+                decoded = json.loads(event)
+            except ValueError:
+                logger.warning("Dropping undecodable push event from the bus")
+                continue
+            self._dispatch(decoded["message"], decoded["departments"], decoded["roles"], decoded["employees"])
+
+    def _dispatch(
+        self,
+        message: str,
+        departments: Optional[Iterable[str]],
+        roles: Optional[Iterable[str]],
+        employees: Iterable[int]
+    ):
+        if self._loop is None:
+            return
+        audience = (
+            None if departments is None else set(departments),
+            None if roles is None else set(roles),
+            set(employees)
+        )
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is self._loop:
+            self._fan_out(message, *audience)
+        elif not self._loop.is_closed():
+            # Write paths and the bus listener run in other threads; hand the event to the loop
+            self._loop.call_soon_threadsafe(self._fan_out, message, *audience)
+
+    def _recipients(self, departments: Optional[Set[str]], roles: Optional[Set[str]], employees: Set[int]):
+        recipients: Set[PushConnection] = set()
+        for employee_pk in employees:
+            recipients |= self._channels.get(employee_channel(employee_pk), set())
+        if departments is None and roles is None:
+            return recipients
+        departments = None if departments is None or EVERYONE in departments else departments
+        roles = None if roles is None or EVERYONE in roles else roles
+
+        # Start from the targeted channels of one dimension, then filter on the other
+        if departments is not None:
+            candidates = set().union(*(self._channels.get(department_channel(d), set()) for d in departments))
+        elif roles is not None:
+            candidates = set().union(*(self._channels.get(role_channel(r), set()) for r in roles))
+        else:
+            candidates = self._connections
+        return recipients | {
+            connection for connection in candidates
+            if (departments is None or connection.department in departments) and
+               (roles is None or connection.role in roles)
+        }
+
+    def _fan_out(self, message: str, departments, roles, employees):
+        for connection in list(self._recipients(departments, roles, employees)):
+            try:
+                connection.queue.put_nowait(message)
+            except asyncio.QueueFull:
+                self._evict(connection)
+
+    def _evict(self, connection: PushConnection):
+        self._evicted += 1
+        self.unsubscribe(connection)
+        logger.warning(f"Evicting slow push consumer for employee {connection.employee_pk}")
+        asyncio.ensure_future(self._close(connection))
+
+    async def _close(self, connection: PushConnection):
+        try:
+            await connection.websocket.close(code=SLOW_CONSUMER_CLOSE_CODE)
+        except Exception:
+            pass
+
+# Global instance
+push_hub = PushHub()
+invalidation_bus.subscribe(PUSH_KIND, push_hub.receive)
\ No newline at end of file
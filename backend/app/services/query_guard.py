@@ -0,0 +1,81 @@
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, List, Optional
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import ORMExecuteState
+from app.core.config import settings
+from app.database.database import SessionLocal, engine
+import logging
+
+logger = logging.getLogger(__name__)
+
+class NPlusOneError(RuntimeError):
+    pass
+
+class QueryBudgetExceeded(AssertionError):
+    pass
+
+# Lazy loads per relationship within the current request; None outside a request
+_lazy_loads: ContextVar[Optional[Counter]] = ContextVar("lazy_loads", default=None)
+
+def _record_lazy_load(orm_execute_state: ORMExecuteState):
+    loads = _lazy_loads.get()
+    if loads is None or not orm_execute_state.is_relationship_load or orm_execute_state.lazy_loaded_from is None:
+        return
+    # The path ends in the relationship being loaded, e.g. Employee.manager
+    loads[str(orm_execute_state.loader_strategy_path[-1])] += 1
+
+class NPlusOneMiddleware:
+    """Flags a request that lazy-loads the same relationship N_PLUS_ONE_THRESHOLD or more times.
+
+    Each of those loads is one SELECT per parent row, the N in N+1; the fix
+    is an eager load (selectinload/joinedload) on the query that fetched the
+    parents. Meant for development and tests: "log" warns, "raise" fails the
+    request with NPlusOneError.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        loads = Counter()
+        token = _lazy_loads.set(loads)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            _lazy_loads.reset(token)
+        repeated = {key: count for key, count in loads.items() if count >= settings.N_PLUS_ONE_THRESHOLD}
+        if not repeated:
+            return
+        route = scope.get("route")
+        summary = ", ".join(f"{key} x{count}" for key, count in sorted(repeated.items()))
+        message = f"N+1 lazy loads on {scope['method']} {route.path if route else scope['path']}: {summary}"
+        if settings.N_PLUS_ONE_DETECTION == "raise":
+            raise NPlusOneError(message)
+        logger.warning(message)
+
+def install_n_plus_one_detector():
+    if not event.contains(SessionLocal, "do_orm_execute", _record_lazy_load):
+        event.listen(SessionLocal, "do_orm_execute", _record_lazy_load)
+
+@contextmanager
+def query_budget(limit: int, bind: Engine = engine) -> Iterator[List[str]]:
+    """Fail with QueryBudgetExceeded if the block sends more than `limit` SQL statements"""
+    statements: List[str] = []
+
+    def count(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(bind, "before_cursor_execute", count)
+    try:
+        yield statements
+    finally:
+        event.remove(bind, "before_cursor_execute", count)
+    if len(statements) > limit:
+        listing = "\n".join(f"  {index}. {statement}" for index, statement in enumerate(statements, 1))
+        raise QueryBudgetExceeded(f"Expected at most {limit} statements, got {len(statements)}:\n{listing}")
\ No newline at end of file
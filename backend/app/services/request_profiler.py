@@ -0,0 +1,283 @@
+import asyncio
+import os
+import queue
+import random
+import re
+import sys
+import threading
+import time
+from collections import Counter
+from contextvars import ContextVar
+from datetime import datetime
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+from fastapi import HTTPException
+from fastapi.security import HTTPAuthorizationCredentials
+from starlette.concurrency import run_in_threadpool
+from app.api.deps import get_current_employee, require_super_admin
+from app.core.config import settings
+from app.database.database import SessionLocal
+import logging
+
+logger = logging.getLogger(__name__)
+
+try:
+    from anyio._backends._asyncio import WorkerThread
+    _WORKER_RUN = WorkerThread.run.__code__
+except (ImportError, AttributeError):  # pragma: no cover - other anyio versions only lose threadpool samples
+    _WORKER_RUN = None
+
+PROFILE_HEADER = b"x-profile"
+EXTENSION = ".collapsed"
+# Root frames of samples taken in the threadpool and of ticks where the request ran nowhere
+THREADPOOL = "[threadpool]"
+WAITING = "[waiting]"
+
+_NAME = re.compile(
+    r"^(?P<stamp>\d{8}T\d{12})-(?P<pid>\d+)-(?P<method>[A-Z]+)-(?P<route>\w*)"
+    r"-(?P<status>\d{3})-(?P<duration_ms>\d+)ms" + re.escape(EXTENSION) + "$"
+)
+_SLUG = re.compile(r"\W+")
+
+class RequestProfile:
+    """Stack samples of one request, from the event loop while its task runs and from the worker threads running its sync code"""
+
+    __slots__ = ("loop", "loop_thread", "task", "samples")
+
+    def __init__(self):
+        self.loop = asyncio.get_running_loop()
+        self.loop_thread = threading.get_ident()
+        self.task = asyncio.current_task()
+        self.samples: Counter = Counter()
+
+# Copied into the threadpool, which is how a worker thread's stack is tied to the request
+_current_profile: ContextVar[Optional[RequestProfile]] = ContextVar("request_profile", default=None)
+
+@lru_cache(maxsize=8192)
+def _label(code) -> str:
+    filename = code.co_filename
+    for root in _import_roots():
+        if filename.startswith(root):
+            filename = filename[len(root):]
+            break
+    return f"{getattr(code, 'co_qualname', code.co_name)} ({filename}:{code.co_firstlineno})"
+
+@lru_cache(maxsize=1)
+def _import_roots() -> Tuple[str, ...]:
+    # Longest first, so site-packages wins over the prefix it lives under
+    roots = {os.path.join(os.path.abspath(path), "") for path in sys.path if path}
+    return tuple(sorted(roots, key=len, reverse=True))
+
+def _loop_stack(frame) -> Tuple[str, ...]:
+    """The loop thread's stack above the profiling middleware, root first"""
+    labels = []
+    while frame is not None and frame.f_code is not _MIDDLEWARE_CALL:
+        labels.append(_label(frame.f_code))
+        frame = frame.f_back
+    labels.reverse()
+    return tuple(labels)
+
+def _worker_stack(frame) -> Tuple[Optional[object], Tuple[str, ...]]:
+    """The context an anyio worker thread is running and its stack above the worker loop.
+
+    The worker keeps the context of its current call in a local of its run
+    loop; while it waits on its queue for the next call that local still
+    holds the previous one, so an idle worker counts for nobody.
+    """
+    labels = []
+    child = None
+    while frame is not None:
+        if frame.f_code is _WORKER_RUN:
+            if child is None or child.f_code.co_filename == queue.__file__:
+                return None, ()
+            labels.reverse()
+            return frame.f_locals.get("context"), (THREADPOOL, *labels)
+        labels.append(_label(frame.f_code))
+        child = frame
+        frame = frame.f_back
+    return None, ()
+
+class Sampler:
+    """One thread sampling every profiled request in this worker every PROFILE_INTERVAL_MS; runs only while one is in flight"""
+
+    def __init__(self):
+        self._profiles: List[RequestProfile] = []
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+    def add(self, profile: RequestProfile):
+        with self._lock:
+            self._profiles.append(profile)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="request-profiler", daemon=True)
+                self._thread.start()
+
+    def remove(self, profile: RequestProfile):
+        with self._lock:
+            self._profiles.remove(profile)
+
+    def _run(self):
+        while True:
+            with self._lock:
+                profiles = list(self._profiles)
+                if not profiles:
+                    self._thread = None
+                    return
+            self.sample(profiles)
+            time.sleep(settings.PROFILE_INTERVAL_MS / 1000)
+
+    def sample(self, profiles: List[RequestProfile]):
+        own_thread = threading.get_ident()
+        loops = {profile.loop_thread: profile.loop for profile in profiles}
+        by_task = {profile.task: profile for profile in profiles}
+        active = set(profiles)
+        sampled = set()
+        for thread_id, frame in sys._current_frames().items():
+            if thread_id == own_thread:
+                continue
+            if thread_id in loops:
+                profile = by_task.get(asyncio.current_task(loops[thread_id]))
+                stack = _loop_stack(frame) if profile is not None else ()
+            else:
+                context, stack = _worker_stack(frame)
+                profile = context.get(_current_profile) if context is not None else None
+            if profile not in active:
+                continue
+            profile.samples[stack] += 1
+            sampled.add(profile)
+        for profile in profiles:
+            if profile not in sampled:
+                profile.samples[(WAITING,)] += 1
+
+sampler = Sampler()
+
+def render_collapsed(samples: Counter) -> str:
+    """Brendan Gregg's collapsed stacks: one "root;...;leaf count" line per stack, read by flamegraph.pl and speedscope"""
+    return "".join(f"{';'.join(stack)} {count}\n" for stack, count in sorted(samples.items()) if stack)
+
+def save_profile(profile: RequestProfile, method: str, route: str, status: int, duration_ms: int) -> str:
+    os.makedirs(settings.PROFILE_DIR, exist_ok=True)
+    now = datetime.now()
+    slug = _SLUG.sub("_", route).strip("_")[:80]
+    name = f"{now:%Y%m%dT%H%M%S%f}-{os.getpid()}-{method}-{slug}-{status}-{duration_ms}ms{EXTENSION}"
+    path = os.path.join(settings.PROFILE_DIR, name)
+    temporary = f"{path}.tmp"
+    with open(temporary, "w") as f:
+        f.write(render_collapsed(profile.samples))
+    os.replace(temporary, path)
+    prune_profiles()
+    return name
+
+def list_profiles() -> List[Dict]:
+    """Stored profiles, newest first"""
+    try:
+        names = os.listdir(settings.PROFILE_DIR)
+    except FileNotFoundError:
+        return []
+    profiles = []
+    for name in names:
+        match = _NAME.match(name)
+        if match is None:
+            continue
+        try:
+            size = os.path.getsize(os.path.join(settings.PROFILE_DIR, name))
+        except FileNotFoundError:
+            continue
+        profiles.append({
+            "name": name,
+            "created_at": datetime.strptime(match["stamp"], "%Y%m%dT%H%M%S%f").isoformat(),
+            "pid": int(match["pid"]),
+            "method": match["method"],
+            "route": match["route"],
+            "status": int(match["status"]),
+            "duration_ms": int(match["duration_ms"]),
+            "bytes": size,
+        })
+    profiles.sort(key=lambda profile: profile["name"], reverse=True)
+    return profiles
+
+def profile_path(name: str) -> Optional[str]:
+    """Path of a stored profile; None for anything that is not one, including names that would leave PROFILE_DIR"""
+    if _NAME.match(name) is None:
+        return None
+    path = os.path.join(settings.PROFILE_DIR, name)
+    return path if os.path.isfile(path) else None
+
+def prune_profiles():
+    """Delete the oldest profiles beyond PROFILE_MAX_FILES or PROFILE_MAX_MB; every worker shares the directory"""
+    profiles = list_profiles()
+    budget = settings.PROFILE_MAX_MB * 1024 * 1024
+    kept_bytes = 0
+    for position, profile in enumerate(profiles):
+        kept_bytes += profile["bytes"]
+        if position < settings.PROFILE_MAX_FILES and kept_bytes <= budget:
+            continue
+        try:
+            os.remove(os.path.join(settings.PROFILE_DIR, profile["name"]))
+        except FileNotFoundError:
+            pass
+
+def _is_super_admin(token: str) -> bool:
+    db = SessionLocal()
+    try:
+        credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+        require_super_admin(get_current_employee(credentials, db))
+        return True
+    except HTTPException:
+        return False
+    finally:
+        db.close()
+
+class ProfilingMiddleware:
+    """Samples the stacks of one request and stores them under PROFILE_DIR.
+
+    A request is profiled when a Super Admin sends "X-Profile: true" with it,
+    or for a PROFILE_SAMPLE_RATE fraction of all requests. Everything else
+    pays for one header lookup.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not await self._wanted(scope):
+            await self.app(scope, receive, send)
+            return
+        profile = RequestProfile()
+        token = _current_profile.set(profile)
+        status = 500
+
+        async def send_with_status(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        started = time.perf_counter()
+        sampler.add(profile)
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            sampler.remove(profile)
+            duration_ms = round((time.perf_counter() - started) * 1000)
+            _current_profile.reset(token)
+            route = scope.get("route")
+            try:
+                await run_in_threadpool(
+                    save_profile, profile, scope["method"], route.path if route else scope["path"], status, duration_ms
+                )
+            except OSError as e:
+                logger.error(f"Could not store request profile: {e}")
+
+    async def _wanted(self, scope) -> bool:
+        if settings.PROFILE_SAMPLE_RATE > 0 and random.random() < settings.PROFILE_SAMPLE_RATE:
+            return True
+        headers = dict(scope["headers"])
+        if headers.get(PROFILE_HEADER, b"").lower() not in (b"1", b"true"):
+            return False
+        scheme, _, token = headers.get(b"authorization", b"").decode("latin-1").partition(" ")
+        if scheme.lower() != "bearer" or not token:
+            return False
+        return await run_in_threadpool(_is_super_admin, token)
+
+_MIDDLEWARE_CALL = ProfilingMiddleware.__call__.__code__
\ No newline at end of file
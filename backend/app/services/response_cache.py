@@ -0,0 +1,203 @@
+import functools
+import hashlib
+import inspect
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+from fastapi import Request, Response
+from pydantic import TypeAdapter
+from app.core.config import settings
+from app.models.employee import Employee, RoleEnum
+import logging
+
+logger = logging.getLogger(__name__)
+
+MANAGEMENT_ROLES = [RoleEnum.HR, RoleEnum.ADMIN, RoleEnum.SUPER_ADMIN]
+
+def visibility_scope(employee: Employee) -> str:
+    """What an employee may read: management sees everyone, others their own department"""
+    if employee.role in MANAGEMENT_ROLES:
+        return "all"
+    return f"department:{employee.department}"
+
+def shared_scope(employee: Employee) -> str:
+    return "everyone"
+
+# Cached employee reads are tagged; writes invalidate the list tag and the employee's own tag
+EMPLOYEES_TAG = "employees"
+
+def employee_tag(employee_pk) -> str:
+    return f"employee:{employee_pk}"
+
+class MemoryBackend:
+    """In-process LRU; each worker holds its own entries and tag versions"""
+
+    def __init__(self, max_entries: int = 10000):
+        self._max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[float, bytes]]" = OrderedDict()
+        self._versions: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] <= time.time():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def set(self, key: str, value: bytes, ttl: int):
+        with self._lock:
+            self._entries[key] = (time.time() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def versions(self, tags: List[str]) -> List[int]:
+        with self._lock:
+            return [self._versions.get(tag, 0) for tag in tags]
+
+    def bump(self, tags: Iterable[str]):
+        with self._lock:
+            for tag in tags:
+                self._versions[tag] = self._versions.get(tag, 0) + 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._versions.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+class RedisBackend:
+    """Shared across workers; uses only GET/SET/MGET/INCR so any Redis-compatible server works"""
+
+    def __init__(self, client, prefix: str = "response-cache:"):
+        self._client = client
+        self._prefix = prefix
+
+    def get(self, key: str) -> Optional[bytes]:
+        return self._client.get(f"{self._prefix}entry:{key}")
+
+    def set(self, key: str, value: bytes, ttl: int):
+        self._client.set(f"{self._prefix}entry:{key}", value, ex=ttl)
+
+    def versions(self, tags: List[str]) -> List[int]:
+        if not tags:
+            return []
+        values = self._client.mget([f"{self._prefix}tag:{tag}" for tag in tags])
+        return [int(value) if value is not None else 0 for value in values]
+
+    def bump(self, tags: Iterable[str]):
+        for tag in tags:
+            self._client.incr(f"{self._prefix}tag:{tag}")
+
+    def clear(self):
+        pass
+
+def create_backend():
+    if settings.RESPONSE_CACHE_BACKEND == "redis":
+        import redis
+        return RedisBackend(redis.Redis.from_url(settings.REDIS_URL))
+    return MemoryBackend(settings.RESPONSE_CACHE_MAX_ENTRIES)
+
+class ResponseCache:
+    """Caches serialized GET responses keyed on route, parameters and the caller's RBAC scope.
+
+    Every entry is tagged, and its key embeds the current version of each
+    tag. Invalidating a tag bumps its version, so older entries can no longer
+    be found and simply age out; a response computed while a write was
+    committing is stored under the old version and never served after it.
+    """
+
+    def __init__(self, backend=None):
+        self._backend = backend
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def backend(self):
+        if self._backend is None:
+            with self._lock:
+                if self._backend is None:
+                    self._backend = create_backend()
+        return self._backend
+
+    def configure(self, backend):
+        self._backend = backend
+
+    def clear(self):
+        self.backend.clear()
+        self.hits = self.misses = 0
+
+    def invalidate(self, *tags: str):
+        try:
+            self.backend.bump(tags)
+        except Exception as e:
+            logger.error(f"Failed to invalidate cached responses for {', '.join(tags)}: {e}")
+
+    def cached(
+        self,
+        model: Any,
+        tags: Iterable[str],
+        scope: Callable[[Employee], str] = visibility_scope,
+        ttl: Optional[int] = None
+    ):
+        """Decorate a sync GET endpoint that takes `current_employee`.
+
+        `model` serializes the endpoint's return value, and `tags` may
+        reference path parameters, e.g. "employee:{employee_id}".
+        """
+        adapter = TypeAdapter(model)
+        tags = list(tags)
+
+        def decorator(endpoint):
+            signature = inspect.signature(endpoint)
+            parameters = list(signature.parameters.values())
+            inject_request = "request" not in signature.parameters
+            if inject_request:
+                parameters.append(inspect.Parameter("request", inspect.Parameter.KEYWORD_ONLY, annotation=Request))
+            name = f"{endpoint.__module__}.{endpoint.__qualname__}"
+
+            @functools.wraps(endpoint)
+            def wrapper(*args, **kwargs):
+                request: Request = kwargs.pop("request") if inject_request else kwargs["request"]
+                if not settings.RESPONSE_CACHE_ENABLED:
+                    return endpoint(*args, **kwargs)
+                entry_tags = [tag.format(**kwargs) for tag in tags]
+                query = "&".join(f"{k}={v}" for k, v in sorted(request.query_params.multi_items()))
+                key = None
+                try:
+                    versions = self.backend.versions(entry_tags)
+                    base = f"{name}|{scope(kwargs['current_employee'])}|{request.url.path}?{query}|{versions}"
+                    key = hashlib.sha1(base.encode()).hexdigest()
+                    body = self.backend.get(key)
+                except Exception as e:
+                    logger.warning(f"Response cache unavailable, serving {name} uncached: {e}")
+                    body = None
+                if body is not None:
+                    self.hits += 1
+                    return Response(content=body, media_type="application/json", headers={"X-Cache": "HIT"})
+
+                self.misses += 1
+                body = adapter.dump_json(endpoint(*args, **kwargs))
+                if key is not None:
+                    try:
+                        self.backend.set(key, body, ttl or settings.RESPONSE_CACHE_TTL_SECONDS)
+                    except Exception as e:
+                        logger.warning(f"Failed to cache response of {name}: {e}")
+                return Response(content=body, media_type="application/json", headers={"X-Cache": "MISS"})
+
+            wrapper.__signature__ = signature.replace(parameters=parameters)
+            return wrapper
+
+        return decorator
+
+# Global instance
+response_cache = ResponseCache()
\ No newline at end of file
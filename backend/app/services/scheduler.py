@@ -0,0 +1,59 @@
+import asyncio
+from typing import Callable, List, Optional
+from app.services.tracing import in_current_context, tracer
+import logging
+
+logger = logging.getLogger(__name__)
+
+class PeriodicJob:
+    def __init__(self, func: Callable[[], object], interval_seconds: int, name: Optional[str] = None):
+        self.func = func
+        self.interval_seconds = interval_seconds
+        self.name = name or func.__name__
+
+    async def run_forever(self):
+        while True:
+            await asyncio.sleep(self.interval_seconds)
+            await self.run_once()
+
+    async def run_once(self):
+        """Run the job body; blocking jobs are pushed to the default executor"""
+        try:
+            with tracer.span(f"job {self.name}"):
+                if asyncio.iscoroutinefunction(self.func):
+                    await self.func()
+                else:
+                    loop = asyncio.get_running_loop()
+                    await loop.run_in_executor(None, in_current_context(self.func))
+        except Exception as e:
+            logger.error(f"Scheduled job {self.name} failed: {e}")
+
+class Scheduler:
+    """Minimal in-process scheduler for periodic maintenance jobs"""
+
+    def __init__(self):
+        self.jobs: List[PeriodicJob] = []
+        self._tasks: List[asyncio.Task] = []
+
+    def add_job(self, func: Callable[[], object], interval_seconds: int, name: Optional[str] = None) -> PeriodicJob:
+        job = PeriodicJob(func, interval_seconds, name)
+        self.jobs.append(job)
+        return job
+
+    def start(self):
+        if self._tasks:
+            return
+        for job in self.jobs:
+            if job.interval_seconds <= 0:
+                continue
+            self._tasks.append(asyncio.create_task(job.run_forever(), name=job.name))
+            logger.info(f"Scheduled job {job.name} every {job.interval_seconds}s")
+
+    async def stop(self):
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+# Global instance
+scheduler = Scheduler()
\ No newline at end of file
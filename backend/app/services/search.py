@@ -0,0 +1,364 @@
+import html
+import re
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+from sqlalchemy import column, event, exists, func, inspect, literal_column, or_, select, table, text
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session
+from app.database.database import Base, SessionLocal
+from app.models.announcement import Announcement
+from app.models.employee import Employee, RoleEnum, StatusEnum
+from app.models.support_ticket import SupportTicket
+from app.services.announcement_feed import DEPARTMENT, ROLE, audience_match
+import logging
+
+logger = logging.getLogger(__name__)
+
+EMPLOYEE = "employee"
+ANNOUNCEMENT = "announcement"
+TICKET = "ticket"
+DOC_TYPES = (EMPLOYEE, ANNOUNCEMENT, TICKET)
+
+MANAGEMENT_ROLES = [RoleEnum.HR, RoleEnum.ADMIN, RoleEnum.SUPER_ADMIN]
+
+HIGHLIGHT_START = "<mark>"
+HIGHLIGHT_END = "</mark>"
+SNIPPET_WORDS = 16
+
+# The database marks matches with private-use characters that never occur in
+# indexed text; only after the text is HTML-escaped do they become <mark>
+# tags, so markup stored in a document never reaches a client unescaped
+_MATCH_START = "\ue000"
+_MATCH_END = "\ue001"
+_STRIP_MARKERS = {ord(_MATCH_START): None, ord(_MATCH_END): None}
+
+# FTS5 has no composite key, so each document gets a fixed rowid derived from
+# its type and id; replacing or deleting a document is then a rowid lookup
+_TYPE_CODES = {EMPLOYEE: 1, ANNOUNCEMENT: 2, TICKET: 3}
+_TYPE_SLOTS = 4
+
+search_documents = table(
+    "search_documents",
+    column("rowid"),
+    column("doc_type"),
+    column("doc_id"),
+    column("title"),
+    column("body"),
+    column("tsv"),
+)
+
+_POSTGRES_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS search_documents (
+        doc_type VARCHAR NOT NULL,
+        doc_id INTEGER NOT NULL,
+        title TEXT NOT NULL,
+        body TEXT NOT NULL,
+        tsv TSVECTOR GENERATED ALWAYS AS (
+            setweight(to_tsvector('english', title), 'A') ||
+            setweight(to_tsvector('english', body), 'B')
+        ) STORED,
+        PRIMARY KEY (doc_type, doc_id)
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS ix_search_documents_tsv ON search_documents USING GIN (tsv)",
+)
+
+_SQLITE_SCHEMA = (
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS search_documents USING fts5(
+        title, body, doc_type UNINDEXED, doc_id UNINDEXED,
+        tokenize = 'porter unicode61'
+    )
+    """,
+    # Titles weigh ten times the body in the bm25 rank
+    "INSERT INTO search_documents (search_documents, rank) VALUES ('rank', 'bm25(10.0, 1.0)')",
+)
+
+Document = Tuple[str, int, str, str]
+
+# Model -> (document type, columns whose change requires re-indexing)
+INDEXED_FIELDS = {
+    Employee: (EMPLOYEE, ("full_name", "employee_id", "email", "designation", "department")),
+    Announcement: (ANNOUNCEMENT, ("title", "content", "is_active")),
+    SupportTicket: (TICKET, ("ticket_number", "title", "description")),
+}
+
+# The index is not an ORM table, so it follows the models' create_all/drop_all
+@event.listens_for(Base.metadata, "after_create")
+def create_search_schema(target, connection: Connection, **kw):
+    statements = _POSTGRES_SCHEMA if connection.dialect.name == "postgresql" else _SQLITE_SCHEMA
+    for statement in statements:
+        connection.execute(text(statement))
+
+@event.listens_for(Base.metadata, "before_drop")
+def drop_search_schema(target, connection: Connection, **kw):
+    connection.execute(text("DROP TABLE IF EXISTS search_documents"))
+
+def _rowid(doc_type: str, doc_id: int) -> int:
+    return doc_id * _TYPE_SLOTS + _TYPE_CODES[doc_type]
+
+def employee_document(employee) -> Document:
+    """An Employee, or a row of the employees table as returned by a Core UPDATE ... RETURNING"""
+    body = " ".join(filter(None, (employee.employee_id, employee.email, employee.designation, employee.department)))
+    return EMPLOYEE, employee.id, _plain(employee.full_name), _plain(body)
+
+def document_for(obj) -> Optional[Document]:
+    """The indexed text of a model instance, or None if it should not be searchable"""
+    if isinstance(obj, Employee):
+        return employee_document(obj)
+    if isinstance(obj, Announcement):
+        if obj.is_active is False:
+            return None
+        return ANNOUNCEMENT, obj.id, _plain(obj.title), _plain(obj.content)
+    if isinstance(obj, SupportTicket):
+        return TICKET, obj.id, _plain(f"{obj.ticket_number} {obj.title}"), _plain(obj.description)
+    return None
+
+def _plain(value: Optional[str]) -> Optional[str]:
+    return None if value is None else value.translate(_STRIP_MARKERS)
+
+def render_highlight(value: Optional[str]) -> str:
+    """HTML-escape highlighted text, then turn the match markers into <mark> tags"""
+    escaped = html.escape(value or "")
+    return escaped.replace(_MATCH_START, HIGHLIGHT_START).replace(_MATCH_END, HIGHLIGHT_END)
+
+def write_documents(connection: Connection, upserts: List[Document], deletes: List[Tuple[str, int]] = ()):
+    """Replace and remove index entries, batched into one statement per kind"""
+    if connection.dialect.name == "postgresql":
+        if deletes:
+            connection.execute(
+                text("DELETE FROM search_documents WHERE doc_type = :doc_type AND doc_id = :doc_id"),
+                [{"doc_type": doc_type, "doc_id": doc_id} for doc_type, doc_id in deletes]
+            )
+        if upserts:
+            connection.execute(
+                text(
+                    "INSERT INTO search_documents (doc_type, doc_id, title, body) "
+                    "VALUES (:doc_type, :doc_id, :title, :body) "
+                    "ON CONFLICT (doc_type, doc_id) DO UPDATE SET title = EXCLUDED.title, body = EXCLUDED.body"
+                ),
+                [
+                    {"doc_type": doc_type, "doc_id": doc_id, "title": title, "body": body}
+                    for doc_type, doc_id, title, body in upserts
+                ]
+            )
+        return
+
+    # FTS5 has no upsert: drop every touched rowid, then insert the new text
+    stale = [_rowid(doc_type, doc_id) for doc_type, doc_id in deletes]
+    stale += [_rowid(doc_type, doc_id) for doc_type, doc_id, _, _ in upserts]
+    if stale:
+        connection.execute(
+            text("DELETE FROM search_documents WHERE rowid = :rowid"),
+            [{"rowid": rowid} for rowid in stale]
+        )
+    if upserts:
+        connection.execute(
+            text(
+                "INSERT INTO search_documents (rowid, doc_type, doc_id, title, body) "
+                "VALUES (:rowid, :doc_type, :doc_id, :title, :body)"
+            ),
+            [
+                {"rowid": _rowid(doc_type, doc_id), "doc_type": doc_type, "doc_id": doc_id, "title": title, "body": body}
+                for doc_type, doc_id, title, body in upserts
+            ]
+        )
+
+def append_documents(connection: Connection, documents: List[Document]):
+    """Index documents that are known not to be indexed yet, as in a bulk load; write_documents replaces instead"""
+    if not documents:
+        return
+    if connection.dialect.name == "postgresql":
+        connection.exec_driver_sql(
+            "INSERT INTO search_documents (doc_type, doc_id, title, body) VALUES (%s, %s, %s, %s)",
+            documents
+        )
+        return
+    connection.exec_driver_sql(
+        "INSERT INTO search_documents (rowid, doc_type, doc_id, title, body) VALUES (?, ?, ?, ?, ?)",
+        [(_rowid(doc_type, doc_id), doc_type, doc_id, title, body) for doc_type, doc_id, title, body in documents]
+    )
+
+def _document_key(obj) -> Optional[Tuple[str, int]]:
+    identity = inspect(obj).identity
+    if identity is None:
+        return None
+    return INDEXED_FIELDS[type(obj)][0], identity[0]
+
+@event.listens_for(SessionLocal, "after_flush")
+def _index_flushed_changes(session: Session, flush_context):
+    upserts: Dict[Tuple[str, int], Document] = {}
+    deletes: Dict[Tuple[str, int], Tuple[str, int]] = {}
+
+    def stage(obj, document: Optional[Document]):
+        key = document[:2] if document else _document_key(obj)
+        if key is None:
+            return
+        if document is None:
+            deletes[key] = key
+            upserts.pop(key, None)
+        else:
+            upserts[key] = document
+            deletes.pop(key, None)
+
+    for obj in session.new:
+        if type(obj) in INDEXED_FIELDS:
+            stage(obj, document_for(obj))
+    for obj in session.dirty:
+        if type(obj) not in INDEXED_FIELDS:
+            continue
+        # Logins and counter updates touch employees constantly; skip those
+        state = inspect(obj)
+        if any(state.attrs[field].history.has_changes() for field in INDEXED_FIELDS[type(obj)][1]):
+            stage(obj, document_for(obj))
+    for obj in session.deleted:
+        if type(obj) in INDEXED_FIELDS:
+            stage(obj, None)
+
+    if upserts or deletes:
+        write_documents(session.connection(), list(upserts.values()), list(deletes.values()))
+
+def rebuild_index(db: Session, batch_size: int = 5000) -> int:
+    """Re-index every employee, announcement and ticket, e.g. after a bulk import"""
+    connection = db.connection()
+    connection.execute(text("DELETE FROM search_documents"))
+    total = 0
+    for model in (Employee, Announcement, SupportTicket):
+        batch: List[Document] = []
+        for obj in db.execute(select(model).execution_options(yield_per=batch_size)).scalars():
+            document = document_for(obj)
+            if document is not None:
+                batch.append(document)
+            if len(batch) >= batch_size:
+                write_documents(connection, batch)
+                total += len(batch)
+                batch = []
+        if batch:
+            write_documents(connection, batch)
+            total += len(batch)
+        db.expunge_all()
+    db.commit()
+    logger.info(f"Rebuilt search index with {total} documents")
+    return total
+
+_TERM = re.compile(r"\w+", re.UNICODE)
+
+def query_terms(query: str) -> List[str]:
+    return _TERM.findall(query.lower())
+
+def visibility_clause(viewer: Employee, now: datetime):
+    """Which documents the viewer may see, evaluated against the live rows"""
+    doc_type, doc_id = search_documents.c.doc_type, search_documents.c.doc_id
+    management = viewer.role in MANAGEMENT_ROLES
+
+    employee_rule = exists().where(Employee.id == doc_id)
+    if not management:
+        # Everyone else looks up active colleagues in their own department
+        employee_rule = exists().where(
+            Employee.id == doc_id,
+            Employee.department == viewer.department,
+            Employee.status == StatusEnum.ACTIVE
+        )
+
+    announcement_conditions = [
+        Announcement.id == doc_id,
+        Announcement.is_active == True,
+        or_(Announcement.expires_at.is_(None), Announcement.expires_at > now),
+    ]
+    if not management:
+        announcement_conditions += [
+            audience_match(DEPARTMENT, viewer.department),
+            audience_match(ROLE, viewer.role.value)
+        ]
+    announcement_rule = exists().where(*announcement_conditions)
+
+    ticket_rule = exists().where(SupportTicket.id == doc_id)
+    if not management:
+        ticket_rule = exists().where(
+            SupportTicket.id == doc_id,
+            or_(SupportTicket.created_by == viewer.id, SupportTicket.assigned_to == viewer.id)
+        )
+
+    return or_(
+        (doc_type == EMPLOYEE) & employee_rule,
+        (doc_type == ANNOUNCEMENT) & announcement_rule,
+        (doc_type == TICKET) & ticket_rule,
+    )
+
+def _sqlite_search(db: Session, terms: List[str], visible, doc_types, limit: int):
+    # Every term must match; the last one is a prefix so results follow typing
+    match = " ".join(f'"{term}"' for term in terms[:-1]) + f' "{terms[-1]}"*'
+    fts = literal_column("search_documents")
+    # FTS5 serves ORDER BY rank itself, best first, so the visibility checks
+    # and highlighting only run until the limit is filled
+    rank = literal_column("rank")
+    rows = db.execute(
+        select(
+            search_documents.c.doc_type,
+            search_documents.c.doc_id,
+            func.highlight(fts, 0, _MATCH_START, _MATCH_END),
+            func.snippet(fts, 1, _MATCH_START, _MATCH_END, "…", SNIPPET_WORDS),
+            rank
+        )
+        .where(fts.op("MATCH")(match), search_documents.c.doc_type.in_(doc_types), visible)
+        .order_by(rank)
+        .limit(limit)
+    ).all()
+    # bm25() is lower-is-better; flip it so callers always sort by descending score
+    return [
+        (doc_type, int(doc_id), render_highlight(title), render_highlight(snippet), -rank)
+        for doc_type, doc_id, title, snippet, rank in rows
+    ]
+
+def _postgres_search(db: Session, terms: List[str], visible, doc_types, limit: int):
+    tsquery = func.to_tsquery("english", " & ".join(f"{term}:*" for term in terms))
+    rank = func.ts_rank(search_documents.c.tsv, tsquery)
+    hits = (
+        select(search_documents.c.doc_type, search_documents.c.doc_id, search_documents.c.title,
+               search_documents.c.body, rank.label("rank"))
+        .where(
+            search_documents.c.tsv.op("@@")(tsquery),
+            search_documents.c.doc_type.in_(doc_types),
+            visible
+        )
+        .order_by(rank.desc())
+        .limit(limit)
+        .subquery()
+    )
+    # Headlines are expensive, so they are only built for the rows returned
+    options = f'StartSel="{_MATCH_START}", StopSel="{_MATCH_END}"'
+    rows = db.execute(
+        select(
+            hits.c.doc_type,
+            hits.c.doc_id,
+            func.ts_headline("english", hits.c.title, tsquery, f"{options}, HighlightAll=true"),
+            func.ts_headline("english", hits.c.body, tsquery, f"{options}, MaxWords={SNIPPET_WORDS}, MinWords=5"),
+            hits.c.rank
+        ).order_by(hits.c.rank.desc())
+    ).all()
+    return [
+        (doc_type, doc_id, render_highlight(title), render_highlight(snippet), rank)
+        for doc_type, doc_id, title, snippet, rank in rows
+    ]
+
+def search(
+    db: Session,
+    viewer: Employee,
+    query: str,
+    doc_types: Optional[Iterable[str]] = None,
+    limit: int = 20
+) -> List[Tuple[str, int, str, str, float]]:
+    """Ranked (doc_type, doc_id, highlighted title, snippet, score) hits visible to the viewer"""
+    doc_types = list(doc_types or DOC_TYPES)
+    unknown = set(doc_types) - set(DOC_TYPES)
+    if unknown:
+        raise ValueError(f"Unknown document types: {', '.join(sorted(unknown))}")
+    terms = query_terms(query)
+    if not terms:
+        return []
+
+    visible = visibility_clause(viewer, datetime.utcnow())
+    if db.get_bind().dialect.name == "postgresql":
+        return _postgres_search(db, terms, visible, doc_types, limit)
+    return _sqlite_search(db, terms, visible, doc_types, limit)
\ No newline at end of file
@@ -0,0 +1,756 @@
+import csv
+import io
+import json
+import time
+from collections import defaultdict
+from datetime import date, timedelta
+from itertools import chain
+from typing import Dict, Iterator, List, NamedTuple, Sequence, Tuple
+import numpy as np
+from sqlalchemy import Numeric, Table, cast, func, select, text, update
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.orm import Session, aliased
+from app.core.security import get_password_hash
+from app.database.database import Base
+from app.models.analytics import CompanyMetrics, DepartmentMetrics, EmployeePerformance
+from app.models.announcement import Announcement, AnnouncementAudience, PriorityEnum
+from app.models.employee import Employee, RoleEnum, StatusEnum
+from app.models.goal import Goal, GoalStatusEnum, GoalTypeEnum
+from app.models.support_ticket import (
+    PRIORITY_RANKS, SupportTicket, TicketCategoryEnum, TicketNumberSequence, TicketPriorityEnum, TicketStatusEnum
+)
+from app.models.task import Task, TaskPriorityEnum, TaskStatusEnum
+from app.services.announcement_feed import DEPARTMENT, EVERYONE, ROLE
+from app.services.performance_scoring import score_period
+from app.services.search import ANNOUNCEMENT, EMPLOYEE, TICKET, append_documents
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Employees are generated this many at a time, together with their tasks and goals
+CHUNK_SIZE = 10000
+
+# Department name and the role of the people in it
+DEPARTMENTS = (
+    ("Technology", RoleEnum.TECH),
+    ("Finance", RoleEnum.FINANCE),
+    ("Human Resources", RoleEnum.HR),
+    ("Sales", RoleEnum.FINANCE),
+    ("Marketing", RoleEnum.TECH),
+    ("Operations", RoleEnum.TECH),
+    ("Support", RoleEnum.TECH),
+    ("Legal", RoleEnum.HR),
+)
+EXECUTIVE_DEPARTMENT = "Executive"
+
+# Department whose people work each ticket category
+TICKET_DEPARTMENTS = {
+    TicketCategoryEnum.TECHNICAL: "Technology",
+    TicketCategoryEnum.HR: "Human Resources",
+    TicketCategoryEnum.FINANCE: "Finance",
+    TicketCategoryEnum.GENERAL: "Support",
+    TicketCategoryEnum.FEEDBACK: "Support",
+}
+
+FIRST_NAMES = (
+    "Aarav", "Aisha", "Ben", "Carmen", "Daniel", "Elena", "Farah", "Gabriel", "Hana", "Ivan",
+    "Jia", "Kofi", "Lena", "Mateo", "Nadia", "Omar", "Priya", "Quinn", "Rosa", "Samuel",
+    "Tara", "Umar", "Vera", "Wei", "Ximena", "Yusuf", "Zoe",
+)
+LAST_NAMES = (
+    "Anderson", "Bose", "Chen", "Diaz", "Evans", "Fischer", "Garcia", "Hughes", "Iyer", "Jensen",
+    "Kim", "Lopez", "Mehta", "Nowak", "Okafor", "Patel", "Quintero", "Reddy", "Silva", "Tanaka",
+    "Usman", "Varga", "Walsh", "Xu", "Yamada", "Zhang",
+)
+DESIGNATIONS = ("Associate", "Senior Associate", "Specialist", "Senior Specialist", "Analyst")
+TASK_TITLES = (
+    "Prepare weekly report", "Review pull request", "Update documentation", "Customer follow-up",
+    "Plan sprint", "Audit expenses", "Onboard new hire", "Fix production issue", "Draft proposal",
+    "Prepare presentation", "Reconcile accounts", "Update forecast",
+)
+TICKET_TITLES = (
+    "Cannot log in", "Laptop running slow", "Payslip question", "Leave balance incorrect",
+    "VPN disconnects", "Expense claim rejected", "Request new monitor", "Office access card",
+    "Suggestion for the cafeteria", "Benefits enrolment",
+)
+ANNOUNCEMENT_TITLES = (
+    "Quarterly all-hands", "Office closure", "New benefits provider", "Security training due",
+    "Welcome our new hires", "Holiday schedule", "System maintenance window", "Team offsite",
+)
+
+GOAL_UNIT = "points"
+HIRE_WINDOW_DAYS = 8 * 365
+# Due dates and expiries run this far past the as-of date
+FUTURE_DAYS = 120
+WORKDAY_SECONDS = (8 * 3600, 18 * 3600)
+
+class OrgShape(NamedTuple):
+    """Size and history of a generated organisation"""
+    employees: int = 10000
+    departments: int = 8
+    # Direct reports per manager
+    span: int = 8
+    months: int = 12
+    # Per employee
+    tasks_per_month: float = 2.0
+    goals_per_quarter: int = 1
+    tickets_per_month: float = 0.1
+    announcements_per_month: int = 20
+
+class Org:
+    """The manager tree as arrays indexed by employee id; index 0 is unused.
+
+    Id 1 runs the company and ids 2..departments+1 head one department each.
+    Everyone after that is dealt round-robin into the departments, and
+    within a department member k reports to member (k - 1) // span, so every
+    manager has a lower id than the people reporting to them.
+    """
+
+    def __init__(self, shape: OrgShape):
+        n, d = shape.employees, shape.departments
+        if not 1 <= d <= n - 1:
+            raise ValueError("Need at least one department and more employees than departments")
+        if shape.span < 1:
+            raise ValueError("Span must be at least 1")
+        self.names = [
+            DEPARTMENTS[index][0] if index < len(DEPARTMENTS) else f"Department {index + 1}"
+            for index in range(d)
+        ]
+        self.roles = [DEPARTMENTS[index][1] if index < len(DEPARTMENTS) else RoleEnum.TECH for index in range(d)]
+        self.ids = np.arange(n + 1)
+
+        rest = self.ids[d + 2:]
+        # -1 is the executive department of employee 1
+        self.department = np.full(n + 1, -1)
+        self.department[2:d + 2] = np.arange(d)
+        self.department[d + 2:] = (rest - d - 2) % d
+        self.position = np.zeros(n + 1, dtype=np.int64)
+        self.position[d + 2:] = (rest - d - 2) // d + 1
+
+        boss = (self.position - 1) // shape.span
+        self.manager = np.where(boss == 0, self.department + 2, d + 2 + (boss - 1) * d + self.department)
+        self.manager[2:d + 2] = 1
+        self.manager[:2] = 0
+
+        sizes = np.bincount(self.department[2:], minlength=d)
+        self.has_reports = self.position * shape.span + 1 < sizes[self.department]
+        self.has_reports[:2] = [False, n > 1]
+
+    def members(self, department_name: str) -> np.ndarray:
+        if department_name not in self.names:
+            return self.ids[2:]
+        return self.ids[self.department == self.names.index(department_name)]
+
+class Calendar:
+    """Day numbers counted from the earliest hire, and their SQL timestamp strings.
+
+    Formatting a datetime costs about a microsecond; joining a cached date
+    and a cached time of day is several times cheaper, and every generated
+    timestamp goes through here.
+    """
+
+    def __init__(self, as_of: date, months: int):
+        self.origin = as_of - timedelta(days=round(months * 365.25 / 12) + HIRE_WINDOW_DAYS)
+        self.today = self.day(as_of)
+        self.start = self.today - round(months * 365.25 / 12)
+        self.dates = [(self.origin + timedelta(days=offset)).isoformat() for offset in range(self.today + FUTURE_DAYS + 1)]
+        self.times = [f" {second // 3600:02d}:{second // 60 % 60:02d}:{second % 60:02d}.000000" for second in range(86400)]
+
+    def day(self, value: date) -> int:
+        return (value - self.origin).days
+
+    def date_of(self, day: int) -> date:
+        return self.origin + timedelta(days=int(day))
+
+    def stamps(self, days: np.ndarray, seconds: np.ndarray) -> List[str]:
+        dates, times = self.dates, self.times
+        return [dates[day] + times[second] for day, second in zip(days.tolist(), seconds.tolist())]
+
+    def quarters(self) -> List[Tuple[int, int]]:
+        """(first day, last day) of every calendar quarter overlapping the history"""
+        first = self.date_of(self.start)
+        current = date(first.year, (first.month - 1) // 3 * 3 + 1, 1)
+        quarters = []
+        while self.day(current) <= self.today:
+            following = date(current.year + current.month // 10, (current.month + 2) % 12 + 1, 1)
+            quarters.append((self.day(current), self.day(following) - 1))
+            current = following
+        return quarters
+
+class BulkWriter:
+    """Writes row tuples with one executemany on SQLite and COPY on PostgreSQL.
+
+    Rows skip the ORM and SQLAlchemy's type processing entirely, so they
+    must already hold what the database stores: enum names, timestamp
+    strings, and None for NULL.
+    """
+
+    def __init__(self, connection: Connection):
+        self.connection = connection
+        self.postgres = connection.dialect.name == "postgresql"
+        self.rows: Dict[str, int] = defaultdict(int)
+        self.max_ids: Dict[str, int] = {}
+
+    def write(self, table: Table, columns: Sequence[str], rows: List[tuple]):
+        if not rows:
+            return
+        cursor = self.connection.connection.cursor()
+        try:
+            if self.postgres:
+                buffer = io.StringIO()
+                csv.writer(buffer).writerows(rows)
+                buffer.seek(0)
+                cursor.copy_expert(f"COPY {table.name} ({', '.join(columns)}) FROM STDIN WITH (FORMAT csv)", buffer)
+            else:
+                # Many rows per statement run close to twice as fast as one; 999 is
+                # SQLite's smallest compiled-in limit on bound parameters
+                per_statement = max(1, 999 // len(columns))
+                full = len(rows) - len(rows) % per_statement
+                if full:
+                    cursor.executemany(
+                        self._sqlite_insert(table, columns, per_statement),
+                        (tuple(chain.from_iterable(rows[start:start + per_statement])) for start in range(0, full, per_statement))
+                    )
+                if full < len(rows):
+                    cursor.execute(self._sqlite_insert(table, columns, len(rows) - full), tuple(chain.from_iterable(rows[full:])))
+        finally:
+            cursor.close()
+        self.rows[table.name] += len(rows)
+        if columns[0] == "id":
+            self.max_ids[table.name] = max(self.max_ids.get(table.name, 0), rows[-1][0])
+
+    @staticmethod
+    def _sqlite_insert(table: Table, columns: Sequence[str], count: int) -> str:
+        row = f"({', '.join('?' * len(columns))})"
+        return f"INSERT INTO {table.name} ({', '.join(columns)}) VALUES {', '.join([row] * count)}"
+
+def _names(members, codes: np.ndarray) -> List[str]:
+    names = [member.name for member in members]
+    return [names[code] for code in codes.tolist()]
+
+def _pick(rng: np.random.Generator, values: Sequence, count: int) -> List:
+    return [values[index] for index in rng.integers(0, len(values), count).tolist()]
+
+def _rounded(values: np.ndarray, digits: int = 2) -> List[float]:
+    return np.round(values, digits).tolist()
+
+EMPLOYEE_COLUMNS = (
+    "id", "employee_id", "email", "full_name", "hashed_password", "role", "department", "designation",
+    "manager_id", "team_leader_id", "status", "hire_date", "created_at", "updated_at",
+    "performance_score", "tasks_completed", "tasks_pending",
+)
+TASK_COLUMNS = (
+    "id", "title", "description", "status", "priority", "assigned_to", "assigned_by", "due_date",
+    "completed_date", "created_at", "updated_at", "estimated_hours", "actual_hours", "notification_sent",
+)
+GOAL_COLUMNS = (
+    "id", "title", "description", "goal_type", "progress_percentage", "status", "start_date", "target_date",
+    "completed_date", "created_at", "updated_at", "assigned_to", "created_by", "parent_id",
+    "target_value", "current_value", "unit",
+)
+TICKET_COLUMNS = (
+    "id", "ticket_number", "title", "description", "category", "priority", "priority_rank", "status",
+    "created_by", "assigned_to", "created_at", "updated_at", "resolved_at", "resolution_notes", "is_anonymous",
+)
+ANNOUNCEMENT_COLUMNS = (
+    "id", "title", "content", "priority", "created_by", "created_at", "updated_at",
+    "is_active", "expires_at", "target_departments", "target_roles",
+)
+COMPANY_METRICS_COLUMNS = (
+    "id", "date", "revenue", "profit", "expenses", "total_employees", "active_employees", "new_hires",
+    "productivity_score", "customer_satisfaction", "created_at",
+)
+DEPARTMENT_METRICS_COLUMNS = (
+    "id", "department", "date", "revenue_contribution", "employee_count", "productivity_score",
+    "target_achievement", "projects_completed", "projects_ongoing", "created_at",
+)
+PERFORMANCE_COLUMNS = (
+    "id", "employee_id", "evaluation_date", "technical_skills", "communication", "teamwork", "leadership",
+    "problem_solving", "overall_score", "goals_achieved", "goals_total", "created_at",
+)
+
+TASK_STATUS = list(TaskStatusEnum)
+TICKET_STATUS = list(TicketStatusEnum)
+TICKET_PRIORITY = list(TicketPriorityEnum)
+TICKET_CATEGORY = list(TicketCategoryEnum)
+
+class Generator:
+    """Deterministic rows for every model from one seed.
+
+    Each table draws from its own stream of the seed, so changing how many
+    rows one table gets leaves every other table's rows unchanged.
+    """
+
+    def __init__(self, shape: OrgShape, seed: int, as_of: date, hashed_password: str):
+        self.shape = shape
+        self.seed = seed
+        self.org = Org(shape)
+        self.calendar = Calendar(as_of, shape.months)
+        self.hashed_password = hashed_password
+        self.writer = None
+        self.hire_day = np.zeros(shape.employees + 1, dtype=np.int64)
+        self.abilities = np.zeros(shape.employees + 1)
+
+    def rng(self, stream: int) -> np.random.Generator:
+        return np.random.default_rng([self.seed, stream])
+
+    def seconds(self, rng: np.random.Generator, count: int) -> np.ndarray:
+        return rng.integers(*WORKDAY_SECONDS, count)
+
+    def run(self, writer: BulkWriter):
+        self.writer = writer
+        self.employees_and_tasks()
+        self.goals()
+        self.tickets()
+        self.announcements()
+        self.company_metrics()
+        self.department_metrics()
+        self.performance()
+
+    def chunks(self) -> Iterator[np.ndarray]:
+        for first in range(1, self.shape.employees + 1, CHUNK_SIZE):
+            yield self.org.ids[first:min(first + CHUNK_SIZE, self.shape.employees + 1)]
+
+    def employees_and_tasks(self):
+        """Tasks go first in memory so each employee row carries its real task counters"""
+        org, calendar, writer = self.org, self.calendar, self.writer
+        people, work = self.rng(1), self.rng(2)
+        next_task_id = 1
+        for ids in self.chunks():
+            count = len(ids)
+            # Executives were hired at the start of the window, everyone else any time before last week
+            hired = people.integers(0, calendar.today - 7, count)
+            hired[ids <= self.shape.departments + 1] = 0
+            self.hire_day[ids] = hired
+            self.abilities[ids] = people.normal(6.5, 1.2, count)
+
+            tasks = work.poisson(self.shape.tasks_per_month * self.shape.months, count)
+            total = int(tasks.sum())
+            assignee = np.repeat(ids, tasks)
+            first_day = np.maximum(self.hire_day[assignee], calendar.start)
+            created = first_day + (work.random(total) * (calendar.today - first_day + 1)).astype(np.int64)
+            due = created + work.integers(1, 31, total)
+            past_due = due < calendar.today
+            roll = work.random(total)
+            status = np.where(
+                past_due,
+                np.select([roll < 0.85, roll < 0.95], [2, 3], 4),  # completed, overdue, cancelled
+                np.select([roll < 0.05, roll < 0.5], [2, 1], 0)    # completed, in progress, assigned
+            )
+            done = status == 2
+            finished = created + (work.random(total) * (np.minimum(due, calendar.today) - created + 1)).astype(np.int64)
+            created_at = calendar.stamps(created, self.seconds(work, total))
+            completed_at = calendar.stamps(finished, self.seconds(work, total))
+            due_at = calendar.stamps(due, np.full(total, 17 * 3600))
+            estimated = work.integers(1, 41, total)
+            actual = np.maximum(1, np.round(estimated * work.uniform(0.6, 1.6, total))).astype(np.int64)
+            task_ids = np.arange(next_task_id, next_task_id + total)
+            next_task_id += total
+
+            completed_counts = np.bincount(assignee[done] - ids[0], minlength=count)
+            # Assigned, in progress and overdue, see task_counters.PENDING_STATUSES
+            pending_counts = np.bincount(assignee[(status <= 3) & ~done] - ids[0], minlength=count)
+            counted = completed_counts + pending_counts
+            # Same rate as task_counters.performance_score
+            scores = _rounded(np.where(counted > 0, completed_counts * 10.0 / np.maximum(counted, 1), 0.0))
+            completed_counts, pending_counts = completed_counts.tolist(), pending_counts.tolist()
+
+            first = people.integers(0, len(FIRST_NAMES), count).tolist()
+            last = people.integers(0, len(LAST_NAMES), count).tolist()
+            designation = people.integers(0, len(DESIGNATIONS), count).tolist()
+            intern = (people.random(count) < 0.05).tolist()
+            status_roll = people.random(count).tolist()
+            hire_stamps = calendar.stamps(hired, self.seconds(people, count))
+            managers = org.manager[ids].tolist()
+            rows = []
+            documents = []
+            for index, (pk, department, position, has_reports, manager) in enumerate(zip(
+                ids.tolist(), org.department[ids].tolist(), org.position[ids].tolist(),
+                org.has_reports[ids].tolist(), managers
+            )):
+                first_name, last_name = FIRST_NAMES[first[index]], LAST_NAMES[last[index]]
+                full_name = f"{first_name} {last_name}"
+                email = f"{first_name}.{last_name}.{pk}@example.com".lower()
+                employee_id = f"EMP{pk:07d}"
+                if pk == 1:
+                    role, department_name, title = RoleEnum.SUPER_ADMIN, EXECUTIVE_DEPARTMENT, "Chief Executive Officer"
+                elif position == 0:
+                    role, department_name, title = RoleEnum.ADMIN, org.names[department], f"Head of {org.names[department]}"
+                else:
+                    department_name = org.names[department]
+                    role = RoleEnum.INTERN if intern[index] else org.roles[department]
+                    title = "Manager" if has_reports else ("Intern" if intern[index] else DESIGNATIONS[designation[index]])
+                if position == 0 or status_roll[index] < 0.95:
+                    state = StatusEnum.ACTIVE
+                else:
+                    state = StatusEnum.INACTIVE if status_roll[index] < 0.98 else StatusEnum.SUSPENDED
+                hired_at = hire_stamps[index]
+                rows.append((
+                    pk, employee_id, email, full_name, self.hashed_password, role.name, department_name, title,
+                    manager or None, manager or None, state.name, hired_at, hired_at, hired_at,
+                    scores[index], completed_counts[index], pending_counts[index]
+                ))
+                documents.append((EMPLOYEE, pk, full_name, f"{employee_id} {email} {title} {department_name}"))
+            writer.write(Employee.__table__, EMPLOYEE_COLUMNS, rows)
+            append_documents(writer.connection, documents)
+
+            assigner = org.manager[assignee]
+            assigner[assigner == 0] = 1
+            writer.write(Task.__table__, TASK_COLUMNS, list(zip(
+                task_ids.tolist(),
+                _pick(work, TASK_TITLES, total),
+                [f"Synthetic task {pk}" for pk in task_ids.tolist()],
+                _names(TASK_STATUS, status),
+                _names(list(TaskPriorityEnum), work.choice(4, total, p=[0.3, 0.4, 0.2, 0.1])),
+                assignee.tolist(),
+                assigner.tolist(),
+                due_at,
+                [stamp if is_done else None for stamp, is_done in zip(completed_at, done.tolist())],
+                created_at,
+                [stamp if is_done else created for stamp, created, is_done in zip(completed_at, created_at, done.tolist())],
+                estimated.tolist(),
+                [hours if is_done else None for hours, is_done in zip(actual.tolist(), done.tolist())],
+                # Historical tasks were announced long ago, so the reminder job has nothing to send
+                [True] * total,
+            )))
+
+    def goals(self):
+        """Each quarter: a company goal, one per department, one per manager's team and some per employee.
+
+        Parents are written with no progress of their own; seed_database() rolls the
+        individual goals up through the hierarchy once everything is loaded.
+        """
+        org, calendar, writer = self.org, self.calendar, self.writer
+        rng = self.rng(3)
+        departments = self.shape.departments
+        managers = org.ids[org.has_reports & (org.ids >= 2)]
+        team_goal = np.zeros(self.shape.employees + 1, dtype=np.int64)
+        next_id = 1
+        for quarter, (first_day, last_day) in enumerate(calendar.quarters(), 1):
+            label = f"Q{(calendar.date_of(first_day).month + 2) // 3} {calendar.date_of(first_day).year}"
+            start_at = calendar.dates[first_day] + calendar.times[WORKDAY_SECONDS[0]]
+            target_at = calendar.dates[last_day] + calendar.times[WORKDAY_SECONDS[1]]
+            closed = last_day < calendar.today
+            parent_status = GoalStatusEnum.COMPLETED.name if closed else GoalStatusEnum.IN_PROGRESS.name
+            parent_completed = target_at if closed else None
+
+            def parent(pk, goal_type, title, assignee, creator, parent_id):
+                return (
+                    pk, title, f"{title} for {label}", goal_type.name, 0.0, parent_status, start_at, target_at,
+                    parent_completed, start_at, start_at, assignee, creator, parent_id, None, 0.0, None
+                )
+
+            company_id = next_id
+            department_ids = company_id + 1 + np.arange(departments)
+            team_goal[managers] = department_ids[-1] + 1 + np.arange(len(managers))
+            next_id = company_id + 1 + departments + len(managers)
+            rows = [parent(company_id, GoalTypeEnum.COMPANY, "Company objectives", 1, 1, None)]
+            rows += [
+                parent(int(department_ids[index]), GoalTypeEnum.DEPARTMENT, f"{name} objectives", index + 2, 1, company_id)
+                for index, name in enumerate(org.names)
+            ]
+            rows += [
+                parent(
+                    int(team_goal[pk]), GoalTypeEnum.TEAM, "Team objectives", pk, int(org.manager[pk]),
+                    int(department_ids[org.department[pk]])
+                )
+                for pk in managers.tolist()
+            ]
+            writer.write(Goal.__table__, GOAL_COLUMNS, rows)
+
+            for ids in self.chunks():
+                ids = ids[(ids >= 2) & (self.hire_day[ids] <= last_day)]
+                assignee = np.repeat(ids, self.shape.goals_per_quarter)
+                total = len(assignee)
+                if not total:
+                    continue
+                manager = org.manager[assignee]
+                # Department heads report to the company, their goals sit under their department's
+                parent_ids = np.where(manager == 1, department_ids[org.department[assignee]], team_goal[manager])
+                elapsed = 1.0 if closed else (calendar.today - first_day + 1) / (last_day - first_day + 1)
+                target = rng.integers(10, 101, total).astype(float)
+                progress = np.clip(rng.uniform(0.4, 1.3, total) * elapsed, 0.0, 1.0)
+                current = np.round(progress * target, 2)
+                percentage = np.round(current / target * 100.0, 2)
+                status = np.where(
+                    percentage >= 100.0, GoalStatusEnum.COMPLETED.name,
+                    np.where(closed, GoalStatusEnum.OVERDUE.name, np.where(
+                        percentage > 0, GoalStatusEnum.IN_PROGRESS.name, GoalStatusEnum.PENDING.name
+                    ))
+                ).tolist()
+                finished = first_day + (rng.random(total) * (min(last_day, calendar.today) - first_day + 1)).astype(np.int64)
+                completed_at = calendar.stamps(finished, self.seconds(rng, total))
+                goal_ids = np.arange(next_id, next_id + total)
+                next_id += total
+                writer.write(Goal.__table__, GOAL_COLUMNS, list(zip(
+                    goal_ids.tolist(),
+                    _pick(rng, TASK_TITLES, total),
+                    [f"Individual goal for {label}"] * total,
+                    [GoalTypeEnum.INDIVIDUAL.name] * total,
+                    percentage.tolist(),
+                    status,
+                    [start_at] * total,
+                    [target_at] * total,
+                    [stamp if state == GoalStatusEnum.COMPLETED.name else None for stamp, state in zip(completed_at, status)],
+                    [start_at] * total,
+                    [stamp if state == GoalStatusEnum.COMPLETED.name else start_at for stamp, state in zip(completed_at, status)],
+                    assignee.tolist(),
+                    manager.tolist(),
+                    parent_ids.tolist(),
+                    target.tolist(),
+                    current.tolist(),
+                    [GOAL_UNIT] * total,
+                )))
+
+    def tickets(self):
+        """Tickets raised over the history; old ones mostly resolved, open ones unassigned for the claim queue"""
+        org, calendar, writer = self.org, self.calendar, self.writer
+        rng = self.rng(4)
+        pools = [org.members(TICKET_DEPARTMENTS[category]) for category in TICKET_CATEGORY]
+        remaining = int(rng.poisson(self.shape.employees * self.shape.tickets_per_month * self.shape.months))
+        ranks = [PRIORITY_RANKS[priority] for priority in TICKET_PRIORITY]
+        next_id = 1
+        while remaining:
+            total = min(remaining, CHUNK_SIZE)
+            remaining -= total
+            created = rng.integers(calendar.start, calendar.today + 1, total)
+            age = calendar.today - created
+            category = rng.integers(0, len(TICKET_CATEGORY), total)
+            priority = rng.choice(len(TICKET_PRIORITY), total, p=[0.3, 0.4, 0.2, 0.1])
+            roll = rng.random(total)
+            # open, in progress, resolved, closed, reopened
+            status = np.where(
+                age > 14,
+                np.select([roll < 0.6, roll < 0.95], [2, 3], 4),
+                np.select([roll < 0.4, roll < 0.7], [0, 1], 2)
+            )
+            agent = np.zeros(total, dtype=np.int64)
+            for code, pool in enumerate(pools):
+                matches = category == code
+                agent[matches] = pool[rng.integers(0, len(pool), int(matches.sum()))]
+            unassigned = status == 0
+            resolved = (status == 2) | (status == 3)
+            resolved_day = created + (rng.random(total) * (np.minimum(age, 7) + 1)).astype(np.int64)
+            created_at = calendar.stamps(created, self.seconds(rng, total))
+            resolved_at = calendar.stamps(resolved_day, self.seconds(rng, total))
+            ticket_ids = np.arange(next_id, next_id + total)
+            next_id += total
+            numbers = [f"TKT{pk:06d}" for pk in ticket_ids.tolist()]
+            titles = _pick(rng, TICKET_TITLES, total)
+            descriptions = [f"{title} (synthetic ticket {pk})" for title, pk in zip(titles, ticket_ids.tolist())]
+            writer.write(SupportTicket.__table__, TICKET_COLUMNS, list(zip(
+                ticket_ids.tolist(),
+                numbers,
+                titles,
+                descriptions,
+                _names(TICKET_CATEGORY, category),
+                _names(TICKET_PRIORITY, priority),
+                [ranks[code] for code in priority.tolist()],
+                _names(TICKET_STATUS, status),
+                rng.integers(1, self.shape.employees + 1, total).tolist(),
+                [None if is_open else pk for pk, is_open in zip(agent.tolist(), unassigned.tolist())],
+                created_at,
+                [stamp if done else created for stamp, created, done in zip(resolved_at, created_at, resolved.tolist())],
+                [stamp if done else None for stamp, done in zip(resolved_at, resolved.tolist())],
+                ["Resolved by the support team" if done else None for done in resolved.tolist()],
+                (rng.random(total) < 0.03).tolist(),
+            )))
+            append_documents(writer.connection, [
+                (TICKET, pk, f"{number} {title}", description)
+                for pk, number, title, description in zip(ticket_ids.tolist(), numbers, titles, descriptions)
+            ])
+
+    def announcements(self):
+        """Mostly company-wide, some for one department or a couple of roles; only recent ones still active"""
+        org, calendar, writer = self.org, self.calendar, self.writer
+        rng = self.rng(5)
+        total = self.shape.announcements_per_month * self.shape.months
+        if not total:
+            return
+        created = np.sort(rng.integers(calendar.start, calendar.today + 1, total))
+        created_at = calendar.stamps(created, self.seconds(rng, total))
+        expires_at = calendar.stamps(created + 30, np.full(total, WORKDAY_SECONDS[1]))
+        authors = rng.integers(1, self.shape.departments + 2, total).tolist()
+        titles = _pick(rng, ANNOUNCEMENT_TITLES, total)
+        priorities = _names(list(PriorityEnum), rng.choice(4, total, p=[0.2, 0.5, 0.2, 0.1]))
+        active = ((calendar.today - created <= 90) | (rng.random(total) < 0.3)).tolist()
+        expiring = (rng.random(total) < 0.2).tolist()
+        reach = rng.random(total).tolist()
+        department_pick = rng.integers(0, len(org.names), total).tolist()
+        role_picks = rng.integers(0, len(RoleEnum), (total, 2)).tolist()
+        roles = [role.value for role in RoleEnum]
+
+        rows, audience, documents = [], [], []
+        for index, pk in enumerate(range(1, total + 1)):
+            target_departments = target_roles = None
+            if 0.6 <= reach[index] < 0.9:
+                target_departments = [org.names[department_pick[index]]]
+            elif reach[index] >= 0.9:
+                target_roles = sorted({roles[pick] for pick in role_picks[index]})
+            content = f"{titles[index]}: details for everyone concerned (synthetic announcement {pk})"
+            rows.append((
+                pk, titles[index], content, priorities[index], authors[index], created_at[index], created_at[index],
+                active[index], expires_at[index] if expiring[index] else None,
+                json.dumps(target_departments) if target_departments else None,
+                json.dumps(target_roles) if target_roles else None
+            ))
+            # Same rows announcement_feed.sync_audience writes
+            audience += [(pk, DEPARTMENT, value) for value in target_departments or [EVERYONE]]
+            audience += [(pk, ROLE, value) for value in target_roles or [EVERYONE]]
+            if active[index]:
+                documents.append((ANNOUNCEMENT, pk, titles[index], content))
+        writer.write(Announcement.__table__, ANNOUNCEMENT_COLUMNS, rows)
+        writer.write(AnnouncementAudience.__table__, ("announcement_id", "dimension", "value"), audience)
+        append_documents(writer.connection, documents)
+
+    def company_metrics(self):
+        """One row per day, headcount following the generated hire dates"""
+        calendar = self.calendar
+        rng = self.rng(6)
+        days = np.arange(calendar.start, calendar.today + 1)
+        total = len(days)
+        hires = np.sort(self.hire_day[1:])
+        headcount = np.searchsorted(hires, days, side="right")
+        new_hires = headcount - np.searchsorted(hires, days, side="left")
+        revenue = headcount * rng.normal(400.0, 40.0, total)
+        expenses = revenue * rng.uniform(0.7, 0.95, total)
+        stamps = calendar.stamps(days, np.full(total, 23 * 3600))
+        self.writer.write(CompanyMetrics.__table__, COMPANY_METRICS_COLUMNS, list(zip(
+            range(1, total + 1),
+            [calendar.dates[day] for day in days.tolist()],
+            _rounded(revenue),
+            _rounded(revenue - expenses),
+            _rounded(expenses),
+            headcount.tolist(),
+            np.round(headcount * 0.95).astype(np.int64).tolist(),
+            new_hires.tolist(),
+            _rounded(rng.uniform(6.0, 9.0, total)),
+            _rounded(rng.uniform(3.5, 5.0, total)),
+            stamps,
+        )))
+
+    def department_metrics(self):
+        """One row per department per day"""
+        org, calendar = self.org, self.calendar
+        rng = self.rng(7)
+        days = np.arange(calendar.start, calendar.today + 1)
+        per_department = len(days)
+        rows = []
+        for index, name in enumerate(org.names):
+            members = np.sort(self.hire_day[org.department == index])
+            headcount = np.searchsorted(members, days, side="right")
+            ongoing = rng.integers(1, 20, per_department)
+            first_id = index * per_department + 1
+            rows += zip(
+                range(first_id, first_id + per_department),
+                [name] * per_department,
+                [calendar.dates[day] for day in days.tolist()],
+                _rounded(headcount * rng.normal(400.0, 60.0, per_department)),
+                headcount.tolist(),
+                _rounded(rng.uniform(5.0, 9.5, per_department)),
+                _rounded(rng.uniform(60.0, 110.0, per_department)),
+                rng.poisson(0.5, per_department).tolist(),
+                ongoing.tolist(),
+                calendar.stamps(days, np.full(per_department, 23 * 3600)),
+            )
+        self.writer.write(DepartmentMetrics.__table__, DEPARTMENT_METRICS_COLUMNS, rows)
+
+    def performance(self):
+        """A review at the end of every finished quarter for everyone hired by then; seed_database() scores them"""
+        calendar, writer = self.calendar, self.writer
+        rng = self.rng(8)
+        next_id = 1
+        for first_day, last_day in calendar.quarters():
+            if last_day >= calendar.today:
+                continue
+            evaluation_date = calendar.dates[last_day]
+            reviewed_at = evaluation_date + calendar.times[WORKDAY_SECONDS[1]]
+            for ids in self.chunks():
+                ids = ids[self.hire_day[ids] <= last_day]
+                total = len(ids)
+                if not total:
+                    continue
+                scores = np.clip(self.abilities[ids, None] + rng.normal(0.0, 1.0, (total, 5)), 1.0, 10.0).round(1)
+                goals_total = np.full(total, self.shape.goals_per_quarter)
+                writer.write(EmployeePerformance.__table__, PERFORMANCE_COLUMNS, list(zip(
+                    range(next_id, next_id + total),
+                    ids.tolist(),
+                    [evaluation_date] * total,
+                    *(scores[:, column].tolist() for column in range(5)),
+                    [0.0] * total,
+                    rng.binomial(goals_total, 0.7).tolist(),
+                    goals_total.tolist(),
+                    [reviewed_at] * total,
+                )))
+                next_id += total
+
+def _roll_up_goals(db: Session):
+    """Team, then department, then company progress as the average of their children, one UPDATE per level"""
+    child = aliased(Goal)
+    for goal_type in (GoalTypeEnum.TEAM, GoalTypeEnum.DEPARTMENT, GoalTypeEnum.COMPANY):
+        children_average = (
+            select(func.avg(child.progress_percentage))
+            .where(child.parent_id == Goal.id)
+            .scalar_subquery()
+        )
+        db.execute(
+            update(Goal)
+            .where(Goal.goal_type == goal_type)
+            # Keep the generated updated_at rather than the onupdate default, so reruns match
+            .values(progress_percentage=func.round(cast(func.coalesce(children_average, 0.0), Numeric), 2), updated_at=Goal.updated_at)
+            .execution_options(synchronize_session=False)
+        )
+
+def _advance_sequences(db: Session, writer: BulkWriter):
+    """Point id sequences and the ticket number counter past the rows written with explicit ids"""
+    tickets = writer.rows[SupportTicket.__tablename__]
+    if writer.postgres:
+        for table, max_id in writer.max_ids.items():
+            db.execute(text(f"SELECT setval(pg_get_serial_sequence('{table}', 'id'), {max_id})"))
+        if tickets:
+            db.execute(text(f"SELECT setval('support_ticket_number_seq', {tickets})"))
+    elif tickets:
+        # AUTOINCREMENT never hands out a value at or below one it has already seen
+        db.execute(text(f"INSERT INTO {TicketNumberSequence.__tablename__} (id) VALUES ({tickets})"))
+
+def seed_database(
+    engine: Engine,
+    shape: OrgShape,
+    seed: int,
+    as_of: date,
+    password: str,
+    reset: bool = False
+) -> Dict[str, float]:
+    """Fill an empty database with a generated organisation and return rows written per table.
+
+    The same shape, seed and as-of date always produce the same rows, except
+    for the bcrypt salt of the one password hash every employee shares.
+    """
+    # Hashing once keeps seeding fast; at the default bcrypt cost a hash takes far longer than inserting a row
+    generator = Generator(shape, seed, as_of, get_password_hash(password))
+    if reset:
+        Base.metadata.drop_all(bind=engine)
+        Base.metadata.create_all(bind=engine)
+    with Session(engine) as db:
+        if db.scalar(select(func.count()).select_from(Employee)):
+            raise ValueError("Database already has employees; reset it to generate synthetic data")
+
+    started = time.perf_counter()
+    with engine.begin() as connection:
+        writer = BulkWriter(connection)
+        generator.run(writer)
+    loaded = time.perf_counter() - started
+    rows = sum(writer.rows.values())
+    logger.info(f"Wrote {rows} rows in {loaded:.1f}s ({rows / loaded:,.0f} rows/s)")
+
+    with Session(engine) as db:
+        _advance_sequences(db, writer)
+        _roll_up_goals(db)
+        db.commit()
+        evaluation_dates = db.scalars(select(EmployeePerformance.evaluation_date).distinct()).all()
+        for evaluation_date in evaluation_dates:
+            score_period(db, evaluation_date, evaluation_date)
+        db.execute(text("ANALYZE"))
+        db.commit()
+
+    return {**writer.rows, "rows": rows, "seconds": round(loaded, 3), "rows_per_second": round(rows / loaded)}
\ No newline at end of file
@@ -0,0 +1,179 @@
+from collections import defaultdict
+from typing import Dict, List, Optional, Tuple
+from sqlalchemy import bindparam, case, event, func, inspect, or_, select
+from sqlalchemy.orm import Session
+from app.database.database import SessionLocal
+from app.models.employee import Employee
+from app.models.task import Task, TaskStatusEnum
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Statuses counted in Employee.tasks_pending; CANCELLED counts towards neither counter
+PENDING_STATUSES = (TaskStatusEnum.ASSIGNED, TaskStatusEnum.IN_PROGRESS, TaskStatusEnum.OVERDUE)
+
+_DELETED_TASKS_KEY = "task_counters.deleted"
+
+employees_table = Employee.__table__
+
+def _bucket(status: Optional[TaskStatusEnum]) -> Optional[int]:
+    """Map a task status to its counter slot: 0 = completed, 1 = pending"""
+    if status is None:
+        # Not flushed yet, the column default applies
+        status = TaskStatusEnum.ASSIGNED
+    if status == TaskStatusEnum.COMPLETED:
+        return 0
+    if status in PENDING_STATUSES:
+        return 1
+    return None
+
+def _previous(task: Task, attr: str):
+    history = inspect(task).attrs[attr].history
+    if history.deleted:
+        return history.deleted[0]
+    if history.added:
+        # Attribute was set on a fresh instance, there is no previous value
+        return None
+    return getattr(task, attr)
+
+def performance_score(completed: int, pending: int) -> float:
+    """Task completion rate on the same 0-10 scale as performance evaluations"""
+    total = completed + pending
+    return completed * 10.0 / total if total else 0.0
+
+def _performance_score_expr(completed, pending):
+    return case(
+        (completed + pending > 0, completed * 10.0 / (completed + pending)),
+        else_=0.0
+    )
+
+# Load the old value when a status or assignee is set on an expired instance so
+# the flush-time history always carries what we have to decrement.
+def _keep_previous_value(target, value, oldvalue, initiator):
+    pass
+
+event.listen(Task.status, "set", _keep_previous_value, active_history=True)
+event.listen(Task.assigned_to, "set", _keep_previous_value, active_history=True)
+
+@event.listens_for(SessionLocal, "before_flush")
+def _capture_deleted_tasks(session: Session, flush_context, instances):
+    # Deleted rows can't be loaded after the flush, read them while they still exist
+    deleted: List[Tuple[int, TaskStatusEnum]] = session.info.setdefault(_DELETED_TASKS_KEY, [])
+    for obj in session.deleted:
+        if isinstance(obj, Task):
+            deleted.append((_previous(obj, "assigned_to"), _previous(obj, "status")))
+
+@event.listens_for(SessionLocal, "after_flush")
+def _apply_task_counter_deltas(session: Session, flush_context):
+    deltas: Dict[int, List[int]] = defaultdict(lambda: [0, 0])
+
+    def add(employee_id: Optional[int], status: Optional[TaskStatusEnum], sign: int):
+        slot = _bucket(status)
+        if employee_id is not None and slot is not None:
+            deltas[employee_id][slot] += sign
+
+    for obj in session.new:
+        if isinstance(obj, Task):
+            add(obj.assigned_to, obj.status, 1)
+
+    for obj in session.dirty:
+        if not isinstance(obj, Task) or not session.is_modified(obj):
+            continue
+        old_assignee = _previous(obj, "assigned_to")
+        old_status = _previous(obj, "status")
+        if old_assignee == obj.assigned_to and old_status == obj.status:
+            continue
+        add(old_assignee, old_status, -1)
+        add(obj.assigned_to, obj.status, 1)
+
+    for assignee, status in session.info.pop(_DELETED_TASKS_KEY, []):
+        add(assignee, status, -1)
+
+    params = [
+        {"target_id": employee_id, "completed_delta": completed, "pending_delta": pending}
+        for employee_id, (completed, pending) in deltas.items()
+        if completed or pending
+    ]
+    if not params:
+        return
+
+    # Same connection, same transaction: the counters commit or roll back with the tasks
+    completed = func.coalesce(employees_table.c.tasks_completed, 0) + bindparam("completed_delta")
+    pending = func.coalesce(employees_table.c.tasks_pending, 0) + bindparam("pending_delta")
+    stmt = (
+        employees_table.update()
+        .where(employees_table.c.id == bindparam("target_id"))
+        .values(
+            tasks_completed=completed,
+            tasks_pending=pending,
+            performance_score=_performance_score_expr(completed, pending)
+        )
+    )
+    session.connection().execute(stmt, params)
+
+    # Loaded employees now hold stale counters
+    for employee_id in deltas:
+        employee = session.identity_map.get(session.identity_key(Employee, employee_id))
+        if employee is not None:
+            session.expire(employee, ["tasks_completed", "tasks_pending", "performance_score"])
+
+@event.listens_for(SessionLocal, "after_rollback")
+def _discard_deleted_tasks(session: Session):
+    # A failed flush never reaches after_flush; its captured deletes must not
+    # be applied by the next one
+    session.info.pop(_DELETED_TASKS_KEY, None)
+
+def reconcile_task_counters(db: Session) -> int:
+    """Recount every employee's task counters in one grouped query and fix any drift"""
+    counts = (
+        select(
+            Task.assigned_to.label("employee_id"),
+            func.sum(case((Task.status == TaskStatusEnum.COMPLETED, 1), else_=0)).label("completed"),
+            func.sum(case((Task.status.in_(PENDING_STATUSES), 1), else_=0)).label("pending")
+        )
+        .group_by(Task.assigned_to)
+        .subquery()
+    )
+    completed = func.coalesce(counts.c.completed, 0)
+    pending = func.coalesce(counts.c.pending, 0)
+
+    drifted = db.execute(
+        select(Employee.id, completed, pending)
+        .outerjoin(counts, counts.c.employee_id == Employee.id)
+        .where(or_(
+            func.coalesce(Employee.tasks_completed, 0) != completed,
+            func.coalesce(Employee.tasks_pending, 0) != pending
+        ))
+    ).all()
+
+    if drifted:
+        db.connection().execute(
+            employees_table.update()
+            .where(employees_table.c.id == bindparam("target_id"))
+            .values(
+                tasks_completed=bindparam("completed"),
+                tasks_pending=bindparam("pending"),
+                performance_score=bindparam("score")
+            ),
+            [
+                {
+                    "target_id": employee_id,
+                    "completed": completed_count,
+                    "pending": pending_count,
+                    "score": performance_score(completed_count, pending_count)
+                }
+                for employee_id, completed_count, pending_count in drifted
+            ]
+        )
+        logger.warning(f"Task counters drifted for {len(drifted)} employees, corrected")
+
+    db.commit()
+    return len(drifted)
+
+def run_task_counter_reconciliation():
+    """Scheduler entry point"""
+    db = SessionLocal()
+    try:
+        reconcile_task_counters(db)
+    finally:
+        db.close()
\ No newline at end of file
@@ -0,0 +1,53 @@
+from datetime import datetime
+from typing import Optional
+from sqlalchemy import insert, select, update
+from sqlalchemy.orm import Session
+from app.models.support_ticket import (
+    SupportTicket, TicketCategoryEnum, TicketNumberSequence, TicketStatusEnum, ticket_number_sequence
+)
+
+# Must match the predicate of ix_support_tickets_open_queue
+CLAIMABLE_STATUSES = (TicketStatusEnum.OPEN, TicketStatusEnum.REOPENED)
+
+def next_ticket_number(db: Session) -> str:
+    if db.get_bind().dialect.name == "postgresql":
+        number = db.scalar(ticket_number_sequence.next_value())
+    else:
+        number = db.execute(insert(TicketNumberSequence)).inserted_primary_key[0]
+    return f"TKT{number:06d}"
+
+def claim_statement(agent_id: int, category: Optional[TicketCategoryEnum] = None):
+    """UPDATE ... WHERE id = (SELECT ... FOR UPDATE SKIP LOCKED) RETURNING id.
+
+    On Postgres the candidate row is picked with SKIP LOCKED, so concurrent
+    agents step over each other's rows instead of queueing on them. SQLite
+    ignores the locking clause; it serializes writers, which makes the same
+    single statement just as safe there.
+    """
+    candidate = select(SupportTicket.id).where(
+        SupportTicket.status.in_(CLAIMABLE_STATUSES),
+        SupportTicket.assigned_to.is_(None)
+    )
+    if category is not None:
+        candidate = candidate.where(SupportTicket.category == category)
+    candidate = (
+        candidate
+        .order_by(SupportTicket.priority_rank.desc(), SupportTicket.created_at, SupportTicket.id)
+        .limit(1)
+        .with_for_update(skip_locked=True)
+        .scalar_subquery()
+    )
+
+    return (
+        update(SupportTicket)
+        .where(SupportTicket.id == candidate, SupportTicket.assigned_to.is_(None))
+        .values(assigned_to=agent_id, status=TicketStatusEnum.IN_PROGRESS, updated_at=datetime.utcnow())
+        .returning(SupportTicket.id)
+        .execution_options(synchronize_session=False)
+    )
+
+def claim_next_ticket(db: Session, agent_id: int, category: Optional[TicketCategoryEnum] = None) -> Optional[int]:
+    """Atomically assign the highest-priority, oldest open ticket to agent_id"""
+    ticket_id = db.execute(claim_statement(agent_id, category)).scalar()
+    db.commit()
+    return ticket_id
\ No newline at end of file
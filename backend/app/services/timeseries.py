@@ -0,0 +1,119 @@
+from datetime import date
+from typing import Dict, List, Optional, Sequence, Tuple
+from sqlalchemy import Date, Integer, cast, func, select, type_coerce
+from sqlalchemy.orm import Session
+from app.models.analytics import CompanyMetrics, DepartmentMetrics
+
+BUCKETS = ("day", "week", "month", "quarter")
+
+# Flow metrics add up across a bucket, level metrics are averaged
+COMPANY_METRICS = {
+    "revenue": (CompanyMetrics.revenue, func.sum),
+    "profit": (CompanyMetrics.profit, func.sum),
+    "expenses": (CompanyMetrics.expenses, func.sum),
+    "new_hires": (CompanyMetrics.new_hires, func.sum),
+    "total_employees": (CompanyMetrics.total_employees, func.avg),
+    "active_employees": (CompanyMetrics.active_employees, func.avg),
+    "productivity_score": (CompanyMetrics.productivity_score, func.avg),
+    "customer_satisfaction": (CompanyMetrics.customer_satisfaction, func.avg),
+}
+
+DEPARTMENT_METRICS = {
+    "revenue_contribution": (DepartmentMetrics.revenue_contribution, func.sum),
+    "projects_completed": (DepartmentMetrics.projects_completed, func.sum),
+    "employee_count": (DepartmentMetrics.employee_count, func.avg),
+    "productivity_score": (DepartmentMetrics.productivity_score, func.avg),
+    "target_achievement": (DepartmentMetrics.target_achievement, func.avg),
+    "projects_ongoing": (DepartmentMetrics.projects_ongoing, func.avg),
+}
+
+Point = Tuple[date, float]
+
+def bucket_expression(column, bucket: str, dialect: str):
+    """SQL expression truncating a date column to the start of its bucket"""
+    if bucket == "day":
+        return column
+    if dialect == "postgresql":
+        return cast(func.date_trunc(bucket, column), Date)
+    if dialect == "sqlite":
+        if bucket == "week":
+            # ISO weeks start on Monday
+            truncated = func.date(column, "-6 days", "weekday 1")
+        elif bucket == "month":
+            truncated = func.strftime("%Y-%m-01", column)
+        else:
+            month = cast(func.strftime("%m", column), Integer)
+            truncated = func.printf(
+                "%s-%02d-01", func.strftime("%Y", column), (month - 1) // 3 * 3 + 1
+            )
+        return type_coerce(truncated, Date)
+    raise ValueError(f"Bucketing is not supported on {dialect}")
+
+def query_timeseries(
+    db: Session,
+    metrics: Sequence[str],
+    start_date: date,
+    end_date: date,
+    bucket: str = "day",
+    department: Optional[str] = None
+) -> Dict[str, List[Point]]:
+    """Aggregate the requested metrics per bucket in a single range scan"""
+    registry = DEPARTMENT_METRICS if department else COMPANY_METRICS
+    model = DepartmentMetrics if department else CompanyMetrics
+    unknown = [metric for metric in metrics if metric not in registry]
+    if unknown:
+        raise ValueError(f"Unknown metrics: {', '.join(unknown)}")
+    if bucket not in BUCKETS:
+        raise ValueError(f"Unknown bucket: {bucket}")
+
+    period = bucket_expression(model.date, bucket, db.get_bind().dialect.name).label("period")
+    columns = [registry[metric][1](registry[metric][0]).label(metric) for metric in metrics]
+
+    query = select(period, *columns).where(model.date.between(start_date, end_date))
+    if department:
+        query = query.where(DepartmentMetrics.department == department)
+    query = query.group_by(period).order_by(period)
+
+    series: Dict[str, List[Point]] = {metric: [] for metric in metrics}
+    for row in db.execute(query):
+        for metric in metrics:
+            value = row._mapping[metric]
+            series[metric].append((row.period, float(value) if value is not None else 0.0))
+    return series
+
+def lttb(points: Sequence[Point], threshold: int) -> List[Point]:
+    """Largest-Triangle-Three-Buckets downsampling, keeps first and last points"""
+    length = len(points)
+    if threshold >= length or threshold < 3:
+        return list(points)
+
+    xs = [point[0].toordinal() for point in points]
+    ys = [point[1] for point in points]
+    sampled = [points[0]]
+    every = (length - 2) / (threshold - 2)
+    a = 0
+
+    for i in range(threshold - 2):
+        # Average of the next bucket is the third triangle vertex
+        next_start = int((i + 1) * every) + 1
+        next_end = min(int((i + 2) * every) + 1, length)
+        span = next_end - next_start
+        avg_x = sum(xs[next_start:next_end]) / span
+        avg_y = sum(ys[next_start:next_end]) / span
+
+        start = int(i * every) + 1
+        end = int((i + 1) * every) + 1
+        best_area = -1.0
+        best = start
+        for j in range(start, end):
+            area = abs(
+                (xs[a] - avg_x) * (ys[j] - ys[a]) - (xs[a] - xs[j]) * (avg_y - ys[a])
+            )
+            if area > best_area:
+                best_area = area
+                best = j
+        sampled.append(points[best])
+        a = best
+
+    sampled.append(points[-1])
+    return sampled
\ No newline at end of file
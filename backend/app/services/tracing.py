@@ -0,0 +1,289 @@
+import asyncio
+import functools
+import json
+import os
+import queue
+import random
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar, copy_context
+from typing import Any, Callable, Dict, List, Optional
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from app.core.config import settings
+from app.services.metrics import normalize_sql
+import logging
+
+logger = logging.getLogger(__name__)
+
+EXPORTERS = ("none", "jsonl", "otlp")
+SERVICE_NAME = "employee-dashboard-api"
+
+class Span:
+    __slots__ = ("name", "trace_id", "span_id", "parent_id", "start_ns", "end_ns", "attributes", "error")
+
+    def __init__(self, name: str, parent: Optional["Span"] = None, attributes: Optional[Dict[str, Any]] = None):
+        self.name = name
+        self.trace_id = parent.trace_id if parent is not None else f"{random.getrandbits(128):032x}"
+        self.span_id = f"{random.getrandbits(64):016x}"
+        self.parent_id = parent.span_id if parent is not None else None
+        self.start_ns = time.time_ns()
+        self.end_ns = 0
+        self.attributes = attributes or {}
+        self.error: Optional[str] = None
+
+    def set_attribute(self, key: str, value: Any):
+        self.attributes[key] = value
+
+    @property
+    def duration_ms(self) -> float:
+        return (self.end_ns - self.start_ns) / 1e6
+
+class _UnsampledSpan:
+    """Stands in for every span of a trace the sampler dropped, so its children are dropped too"""
+
+    def set_attribute(self, key: str, value: Any):
+        pass
+
+UNSAMPLED = _UnsampledSpan()
+
+# Inherited by asyncio tasks and anyio's threadpool; loop.run_in_executor needs in_current_context
+_current_span: ContextVar[Optional[Span]] = ContextVar("current_span", default=None)
+
+def current_span() -> Optional[Span]:
+    span = _current_span.get()
+    return span if span is not UNSAMPLED else None
+
+def in_current_context(func: Callable, *args) -> Callable:
+    """func bound to a copy of the caller's context, for executors that do not carry it over"""
+    return functools.partial(copy_context().run, func, *args)
+
+def _otlp_value(value: Any) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+def _otlp_span(span: Span) -> Dict[str, Any]:
+    record = {
+        "traceId": span.trace_id,
+        "spanId": span.span_id,
+        "name": span.name,
+        "kind": 1,
+        "startTimeUnixNano": str(span.start_ns),
+        "endTimeUnixNano": str(span.end_ns),
+        "attributes": [{"key": key, "value": _otlp_value(value)} for key, value in span.attributes.items()],
+        "status": {"code": 2, "message": span.error} if span.error else {},
+    }
+    if span.parent_id:
+        record["parentSpanId"] = span.parent_id
+    return record
+
+def _jsonl_span(span: Span) -> Dict[str, Any]:
+    return {
+        "trace_id": span.trace_id,
+        "span_id": span.span_id,
+        "parent_id": span.parent_id,
+        "name": span.name,
+        "start_unix_nano": span.start_ns,
+        "duration_ms": round(span.duration_ms, 3),
+        "attributes": span.attributes,
+        "error": span.error,
+    }
+
+class FileExporter:
+    """Appends finished spans to a file from a background thread, so ending a span never waits on disk.
+
+    "jsonl" writes one span per line; "otlp" writes one OTLP/JSON
+    ExportTraceServiceRequest per batch, the OpenTelemetry file exporter
+    format that the collector's otlpjsonfile receiver reads.
+    """
+
+    def __init__(self, path: str, format: str):
+        self.path = path
+        self.format = format
+        self._queue: "queue.Queue[Span]" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._pid = 0
+
+    def export(self, span: Span):
+        # A worker forked from a preloaded app does not inherit the thread
+        if self._pid != os.getpid():
+            self._pid = os.getpid()
+            self._thread = threading.Thread(target=self._write_forever, name="trace-exporter", daemon=True)
+            self._thread.start()
+        self._queue.put(span)
+
+    def flush(self):
+        """Wait until every span exported so far is on disk"""
+        if self._thread is not None and self._pid == os.getpid():
+            self._queue.join()
+
+    def _write_forever(self):
+        path = self.path.format(pid=os.getpid())
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        while True:
+            batch = [self._queue.get()]
+            while True:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                with open(path, "a") as f:
+                    f.write(self._render(batch))
+            except OSError as e:
+                logger.error(f"Could not write {len(batch)} spans to {path}: {e}")
+            for _ in batch:
+                self._queue.task_done()
+
+    def _render(self, batch: List[Span]) -> str:
+        if self.format == "jsonl":
+            return "".join(json.dumps(_jsonl_span(span), default=str) + "\n" for span in batch)
+        request = {"resourceSpans": [{
+            "resource": {"attributes": [
+                {"key": "service.name", "value": {"stringValue": SERVICE_NAME}},
+                {"key": "process.pid", "value": {"intValue": str(os.getpid())}},
+            ]},
+            "scopeSpans": [{"scope": {"name": __name__}, "spans": [_otlp_span(span) for span in batch]}],
+        }]}
+        return json.dumps(request, default=str) + "\n"
+
+class Tracer:
+    """Spans for where a request's time goes; with TRACING_EXPORTER=none every span is a no-op"""
+
+    def __init__(self):
+        self.exporter: Optional[FileExporter] = None
+        self.sample_rate = 1.0
+        self.configure(settings.TRACING_EXPORTER, settings.TRACE_FILE, settings.TRACE_SAMPLE_RATE)
+
+    def configure(self, exporter: str, path: str, sample_rate: float = 1.0):
+        if exporter not in EXPORTERS:
+            raise ValueError(f"Unknown TRACING_EXPORTER {exporter!r}, expected one of {', '.join(EXPORTERS)}")
+        if self.exporter is not None:
+            self.exporter.flush()
+        self.exporter = FileExporter(path, exporter) if exporter != "none" else None
+        self.sample_rate = sample_rate
+
+    @property
+    def enabled(self) -> bool:
+        return self.exporter is not None
+
+    def start_span(self, name: str, **attributes) -> Optional[Span]:
+        """A child of the current span that does not become current itself, for leaves timed by callbacks"""
+        parent = _current_span.get()
+        if self.exporter is None or parent is None or parent is UNSAMPLED:
+            return None
+        return Span(name, parent, attributes)
+
+    def end_span(self, span: Optional[Span], error: Optional[BaseException] = None):
+        if span is None or self.exporter is None:
+            return
+        span.end_ns = time.time_ns()
+        if error is not None:
+            span.error = f"{type(error).__name__}: {error}"
+        self.exporter.export(span)
+
+    @contextmanager
+    def span(self, name: str, **attributes):
+        """Time the block as a child of the current span, or as a new trace outside of one"""
+        parent = _current_span.get()
+        if self.exporter is None or parent is UNSAMPLED:
+            yield UNSAMPLED
+            return
+        if parent is None and random.random() >= self.sample_rate:
+            token = _current_span.set(UNSAMPLED)
+            try:
+                yield UNSAMPLED
+            finally:
+                _current_span.reset(token)
+            return
+        span = Span(name, parent, attributes)
+        token = _current_span.set(span)
+        error = None
+        try:
+            yield span
+        except BaseException as e:
+            error = e
+            raise
+        finally:
+            _current_span.reset(token)
+            self.end_span(span, error)
+
+    def traced(self, name: Optional[str] = None):
+        """Decorator running each call of a sync or async function in a span named after it"""
+        def decorator(func):
+            span_name = name or f"{func.__module__.rsplit('.', 1)[-1]}.{func.__qualname__}"
+            if asyncio.iscoroutinefunction(func):
+                @functools.wraps(func)
+                async def async_wrapper(*args, **kwargs):
+                    with self.span(span_name):
+                        return await func(*args, **kwargs)
+                return async_wrapper
+
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                with self.span(span_name):
+                    return func(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    def flush(self):
+        if self.exporter is not None:
+            self.exporter.flush()
+
+# Global instance
+tracer = Tracer()
+traced = tracer.traced
+
+class TracingMiddleware:
+    """Opens the root span of each request; named after the route template once routing has matched"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        with tracer.span(f"{scope['method']} {scope['path']}", **{"http.method": scope["method"]}) as span:
+            async def send_with_status(message):
+                if message["type"] == "http.response.start":
+                    span.set_attribute("http.status_code", message["status"])
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_with_status)
+            finally:
+                route = scope.get("route")
+                if route is not None and isinstance(span, Span):
+                    span.name = f"{scope['method']} {route.path}"
+                    span.set_attribute("http.route", route.path)
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    span = tracer.start_span("db.query")
+    if span is not None:
+        span.set_attribute("db.statement", normalize_sql(statement))
+    conn.info.setdefault("trace_spans", []).append(span)
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    tracer.end_span(conn.info["trace_spans"].pop())
+
+def _handle_error(context):
+    # A failed statement never reaches after_cursor_execute
+    spans = context.connection.info.get("trace_spans") if context.connection is not None else None
+    if spans:
+        tracer.end_span(spans.pop(), context.original_exception)
+
+def install_query_hooks(engine: Engine):
+    """One db.query span per statement sent by a session from get_db (or any other) while a span is current"""
+    if not event.contains(engine, "after_cursor_execute", _after_cursor_execute):
+        event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+        event.listen(engine, "handle_error", _handle_error)
\ No newline at end of file
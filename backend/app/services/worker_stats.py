@@ -0,0 +1,145 @@
+import asyncio
+import json
+import os
+import resource
+import time
+from typing import Dict, List, Optional
+from app.core.config import settings
+from app.database.database import engine
+from app.services.employee_typeahead import prefix_index
+from app.services.invalidation_bus import invalidation_bus
+from app.services.metrics import registry
+from app.services.push_hub import push_hub
+from app.services.response_cache import response_cache
+import logging
+
+logger = logging.getLogger(__name__)
+
+class RequestCounterMiddleware:
+    """Counts HTTP requests served by this worker; plain ASGI so it adds no task per request"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http":
+            worker_stats.requests += 1
+        await self.app(scope, receive, send)
+
+def pool_stats(pool) -> Dict:
+    if not hasattr(pool, "checkedout"):
+        return {"class": type(pool).__name__}
+    return {
+        "class": type(pool).__name__,
+        "size": pool.size(),
+        "checked_out": pool.checkedout(),
+        "overflow": pool.overflow(),
+    }
+
+def _alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass
+    return True
+
+class WorkerStats:
+    """Per-worker counters shared through one JSON file per process in WORKER_STATS_DIR.
+
+    Every worker rewrites its own file every few seconds, so whichever worker
+    answers the admin request can report on all of them. Files left behind by
+    processes that are gone are skipped and removed.
+    """
+
+    def __init__(self):
+        self.slot: Optional[int] = None
+        self.requests = 0
+        self.started_at = time.time()
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def path(self) -> str:
+        return os.path.join(settings.WORKER_STATS_DIR, f"{os.getpid()}.json")
+
+    def snapshot(self) -> Dict:
+        usage = resource.getrusage(resource.RUSAGE_SELF)
+        return {
+            "pid": os.getpid(),
+            "slot": self.slot,
+            "supervisor_pid": os.getppid() if self.slot is not None else None,
+            "started_at": self.started_at,
+            "uptime_seconds": round(time.time() - self.started_at, 1),
+            "updated_at": time.time(),
+            "requests": self.requests,
+            "max_rss_kb": usage.ru_maxrss,
+            "cpu_seconds": round(usage.ru_utime + usage.ru_stime, 3),
+            "db_pool": pool_stats(engine.pool),
+            "response_cache": {"hits": response_cache.hits, "misses": response_cache.misses},
+            "invalidation_bus": invalidation_bus.stats(),
+            "push": push_hub.stats(),
+            # Each worker holds its own copy of the index
+            "typeahead": {"loaded": prefix_index.loaded, **prefix_index.stats()},
+            # Raw series so /metrics on any worker can report the sum over all of them
+            "metrics": registry.dump() if settings.METRICS_ENABLED else {},
+        }
+
+    def write(self):
+        os.makedirs(settings.WORKER_STATS_DIR, exist_ok=True)
+        temporary = f"{self.path}.tmp"
+        with open(temporary, "w") as f:
+            json.dump(self.snapshot(), f)
+        os.replace(temporary, self.path)
+
+    def collect(self) -> List[Dict]:
+        """Latest snapshot of every live worker, this one taken fresh"""
+        workers = {os.getpid(): self.snapshot()}
+        if os.path.isdir(settings.WORKER_STATS_DIR):
+            for name in os.listdir(settings.WORKER_STATS_DIR):
+                if not name.endswith(".json"):
+                    continue
+                path = os.path.join(settings.WORKER_STATS_DIR, name)
+                try:
+                    with open(path) as f:
+                        snapshot = json.load(f)
+                except (OSError, ValueError):
+                    continue
+                if snapshot["pid"] in workers:
+                    continue
+                if not _alive(snapshot["pid"]):
+                    try:
+                        os.unlink(path)
+                    except FileNotFoundError:
+                        pass
+                    continue
+                workers[snapshot["pid"]] = snapshot
+        return sorted(workers.values(), key=lambda w: (w["slot"] is None, w["slot"] or 0, w["pid"]))
+
+    async def _write_forever(self):
+        while True:
+            await asyncio.sleep(settings.WORKER_STATS_INTERVAL_SECONDS)
+            try:
+                self.write()
+            except OSError as e:
+                logger.warning(f"Failed to write worker stats: {e}")
+
+    def start(self):
+        try:
+            self.write()
+        except OSError as e:
+            logger.warning(f"Failed to write worker stats: {e}")
+        self._task = asyncio.create_task(self._write_forever(), name="worker-stats")
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        try:
+            os.unlink(self.path)
+        except FileNotFoundError:
+            pass
+
+# Global instance
+worker_stats = WorkerStats()
\ No newline at end of file
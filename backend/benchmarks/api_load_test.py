@@ -0,0 +1,226 @@
+"""API load test: mixed workload against the in-process app with p50/p95/p99 per endpoint.
+
+    python -m benchmarks.api_load_test --sizes 1000 10000 100000 --output results.json
+    python -m benchmarks.api_load_test --baseline benchmarks/baselines/api_load_test.json
+
+For each size the schema is recreated and seeded with that many employees
+in a manager tree, then --requests requests drawn from a seeded weighted mix
+(login, list, hierarchy, me, departments) are sent by --concurrency clients
+through httpx's ASGI transport. Results are printed as JSON. With --baseline,
+every endpoint's p50/p95/p99 is compared with the stored run and the exit
+status is 1 if any is more than --threshold slower; --save-baseline writes
+this run there instead.
+"""
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import sys
+import tempfile
+import time
+from collections import defaultdict
+from datetime import datetime, timedelta
+from typing import Dict, List
+
+_db_dir = tempfile.mkdtemp(prefix="api-load-test-")
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(_db_dir, 'benchmark.db')}"
+os.environ.setdefault("MAIL_FROM", "noreply@example.com")
+os.environ["SCHEDULER_ENABLED"] = "false"
+os.environ["N_PLUS_ONE_DETECTION"] = "off"
+os.environ.setdefault("WORKER_STATS_DIR", os.path.join(_db_dir, "workers"))
+
+import httpx
+from sqlalchemy import insert
+from app.main import app
+from app.core.security import create_access_token, get_password_hash
+from app.database.database import Base, engine
+from app.models.employee import Employee, RoleEnum
+from app.services.dashboard import summary_cache
+from app.services.employee_typeahead import prefix_index
+from app.services.response_cache import response_cache
+
+PASSWORD = "loadtest123"
+DEPARTMENTS = ["Technology", "Finance", "Human Resources", "Sales", "Marketing", "Operations", "Support", "Legal"]
+
+# Relative frequency of each endpoint in the mix
+WORKLOAD = {"login": 2, "list": 30, "hierarchy": 20, "me": 33, "departments": 15}
+
+PERCENTILES = ("p50_ms", "p95_ms", "p99_ms")
+
+def seed(size: int, rng: random.Random):
+    """Employees in a tree with up to 8 reports per manager; one bcrypt hash shared by all"""
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    hashed_password = get_password_hash(PASSWORD)
+    hired = datetime(2020, 1, 1)
+    rows = []
+    for pk in range(1, size + 1):
+        manager = (pk - 2) // 8 + 1 if pk > 1 else None
+        rows.append({
+            "id": pk,
+            "employee_id": f"LT{pk:06d}",
+            "email": f"employee{pk}@example.com",
+            "full_name": f"Load Test {pk}",
+            "hashed_password": hashed_password,
+            "role": RoleEnum.HR if pk % 50 == 0 else RoleEnum.TECH,
+            "department": DEPARTMENTS[pk % len(DEPARTMENTS)] if pk > 1 else "Executive",
+            "designation": "Manager" if pk <= size // 8 else "Engineer",
+            "manager_id": manager,
+            "team_leader_id": manager,
+            "hire_date": hired + timedelta(days=rng.randint(0, 1500)),
+        })
+    with engine.begin() as connection:
+        for start in range(0, size, 10000):
+            connection.execute(insert(Employee), rows[start:start + 10000])
+    response_cache.clear()
+    prefix_index.reset()
+    summary_cache.clear()
+
+def plan(size: int, requests: int, rng: random.Random) -> List[tuple]:
+    """The whole request sequence up front, so every run of a seed sends the same requests"""
+    names = list(WORKLOAD)
+    weights = list(WORKLOAD.values())
+    tokens: Dict[int, str] = {}
+    planned = []
+    for _ in range(requests):
+        endpoint = rng.choices(names, weights)[0]
+        pk = rng.randint(1, size)
+        if endpoint == "login":
+            planned.append((endpoint, "POST", "/api/auth/login", {"json": {"employee_id": f"LT{pk:06d}", "password": PASSWORD}}))
+            continue
+        if pk not in tokens:
+            tokens[pk] = create_access_token(data={"sub": f"LT{pk:06d}"}, expires_delta=timedelta(hours=2))
+        headers = {"Authorization": f"Bearer {tokens[pk]}"}
+        if endpoint == "list":
+            request = ("GET", "/api/employees/", {"params": {"skip": rng.randint(0, 9) * 50, "limit": 50}})
+        elif endpoint == "hierarchy":
+            request = ("GET", f"/api/employees/hierarchy/{rng.randint(1, size)}", {})
+        elif endpoint == "me":
+            request = ("GET", "/api/employees/me", {})
+        else:
+            request = ("GET", "/api/employees/departments/list", {})
+        method, path, kwargs = request
+        planned.append((endpoint, method, path, dict(kwargs, headers=headers)))
+    return planned
+
+def percentile(ordered: List[float], q: float) -> float:
+    return ordered[min(len(ordered) - 1, int(len(ordered) * q))]
+
+async def drive(planned: List[tuple], concurrency: int) -> dict:
+    latencies: Dict[str, List[float]] = defaultdict(list)
+    errors: Dict[str, int] = defaultdict(int)
+    queue = iter(planned)
+
+    async def client_loop(client: httpx.AsyncClient):
+        for endpoint, method, path, kwargs in queue:
+            started = time.perf_counter()
+            response = await client.request(method, path, **kwargs)
+            latencies[endpoint].append((time.perf_counter() - started) * 1000)
+            if response.status_code != 200:
+                errors[endpoint] += 1
+
+    await app.router.startup()
+    try:
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://loadtest") as client:
+            started = time.perf_counter()
+            await asyncio.gather(*(client_loop(client) for _ in range(concurrency)))
+            elapsed = time.perf_counter() - started
+    finally:
+        await app.router.shutdown()
+
+    endpoints = {}
+    for endpoint in WORKLOAD:
+        ordered = sorted(latencies[endpoint])
+        if not ordered:
+            continue
+        endpoints[endpoint] = {
+            "requests": len(ordered),
+            "errors": errors[endpoint],
+            "throughput_rps": round(len(ordered) / elapsed, 1),
+            "p50_ms": round(percentile(ordered, 0.50), 3),
+            "p95_ms": round(percentile(ordered, 0.95), 3),
+            "p99_ms": round(percentile(ordered, 0.99), 3),
+        }
+    return {
+        "requests": len(planned),
+        "elapsed_seconds": round(elapsed, 3),
+        "throughput_rps": round(len(planned) / elapsed, 1),
+        "endpoints": endpoints,
+    }
+
+def compare(results: dict, baseline: dict, threshold: float) -> List[str]:
+    """One line per endpoint percentile more than `threshold` slower than the baseline"""
+    regressions = []
+    for size, run in results["sizes"].items():
+        previous = baseline.get("sizes", {}).get(size)
+        if previous is None:
+            continue
+        for endpoint, stats in run["endpoints"].items():
+            before = previous["endpoints"].get(endpoint)
+            if before is None:
+                continue
+            for key in PERCENTILES:
+                if before[key] > 0 and stats[key] > before[key] * (1 + threshold):
+                    regressions.append(
+                        f"{size} employees, {endpoint} {key}: {stats[key]:.2f} ms vs {before[key]:.2f} ms baseline "
+                        f"(+{(stats[key] / before[key] - 1) * 100:.0f}%)"
+                    )
+    return regressions
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000])
+    parser.add_argument("--requests", type=int, default=2000, help="Requests per size")
+    # Above the pool size (5 + 10 overflow) the async login endpoint, which waits for a
+    # connection on the event loop, can stall every other request until the pool times out
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", help="Also write the results to this file")
+    parser.add_argument("--baseline", help="Stored results to compare against")
+    parser.add_argument("--threshold", type=float, default=0.25, help="Allowed slowdown per percentile, 0.25 = 25%%")
+    parser.add_argument("--save-baseline", action="store_true", help="Write this run to --baseline instead of comparing")
+    args = parser.parse_args()
+
+    results = {
+        "meta": {
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "cpus": os.cpu_count(),
+            "concurrency": args.concurrency,
+            "seed": args.seed,
+            "workload": WORKLOAD,
+        },
+        "sizes": {},
+    }
+    for size in args.sizes:
+        rng = random.Random(args.seed)
+        started = time.perf_counter()
+        seed(size, rng)
+        print(f"Seeded {size} employees in {time.perf_counter() - started:.1f}s", file=sys.stderr)
+        results["sizes"][str(size)] = asyncio.run(drive(plan(size, args.requests, rng), args.concurrency))
+
+    report = json.dumps(results, indent=2)
+    print(report)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(report + "\n")
+    if not args.baseline:
+        return
+    if args.save_baseline:
+        with open(args.baseline, "w") as f:
+            f.write(report + "\n")
+        print(f"Saved baseline to {args.baseline}", file=sys.stderr)
+        return
+    with open(args.baseline) as f:
+        regressions = compare(results, json.load(f), args.threshold)
+    for regression in regressions:
+        print(f"REGRESSION {regression}", file=sys.stderr)
+    if regressions:
+        sys.exit(1)
+    print(f"No endpoint more than {args.threshold:.0%} slower than {args.baseline}", file=sys.stderr)
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,89 @@
+"""Invalidation bus benchmark: propagation latency from one worker to the others.
+
+    python -m benchmarks.invalidation_bus_benchmark --workers 4 --messages 2000
+    python -m benchmarks.invalidation_bus_benchmark --transport redis
+"""
+import argparse
+import multiprocessing
+import os
+import statistics
+import tempfile
+import time
+
+_db_dir = tempfile.mkdtemp(prefix="invalidation-bus-benchmark-")
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(_db_dir, 'benchmark.db')}"
+os.environ.setdefault("MAIL_FROM", "noreply@example.com")
+os.environ["SCHEDULER_ENABLED"] = "false"
+
+from app.core.config import settings
+from app.services.invalidation_bus import InvalidationBus, RedisTransport, UnixSocketTransport
+
+def transport_for(name: str, socket_dir: str):
+    if name == "redis":
+        return RedisTransport(settings.REDIS_URL, "invalidation_bus_benchmark")
+    return UnixSocketTransport(socket_dir)
+
+def listen(name: str, socket_dir: str, expected: int, ready, results):
+    bus = InvalidationBus(transport_for(name, socket_dir))
+    done = multiprocessing.Event()
+    count = [0]
+
+    def handler(keys):
+        count[0] += 1
+        if count[0] == expected:
+            done.set()
+
+    bus.subscribe("employee", handler)
+    bus.start()
+    ready.release()
+    done.wait(timeout=60)
+    bus.stop()
+    results.put((count[0], bus.stats()))
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--transport", choices=["unix", "redis"], default="unix")
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--messages", type=int, default=2000)
+    parser.add_argument("--keys", type=int, default=10, help="employee ids per message")
+    args = parser.parse_args()
+
+    socket_dir = tempfile.mkdtemp(prefix="bus-")
+    context = multiprocessing.get_context("fork")
+    ready = context.Semaphore(0)
+    results = context.Queue()
+    listeners = [
+        context.Process(target=listen, args=(args.transport, socket_dir, args.messages, ready, results))
+        for _ in range(args.workers)
+    ]
+    for process in listeners:
+        process.start()
+    for _ in listeners:
+        ready.acquire()
+
+    publisher = InvalidationBus(transport_for(args.transport, socket_dir))
+    publisher.start()
+    start = time.perf_counter()
+    for i in range(args.messages):
+        publisher.publish({"employee": range(i, i + args.keys)})
+        # Paced, so the numbers show propagation rather than queueing behind a burst
+        time.sleep(0.0005)
+    elapsed = time.perf_counter() - start
+
+    worker_stats = [results.get(timeout=120) for _ in listeners]
+    for process in listeners:
+        process.join()
+    publisher.stop()
+
+    delivered = sum(count for count, _ in worker_stats)
+    print(f"{args.transport}: {args.messages} messages to {args.workers} workers in {elapsed:.2f}s, "
+          f"{delivered}/{args.messages * args.workers} delivered")
+    # Latency percentiles cover each worker's last 1000 messages
+    print(
+        f"Propagation: p50 {statistics.median(s['latency_ms_p50'] for _, s in worker_stats):.3f}ms, "
+        f"p99 {max(s['latency_ms_p99'] for _, s in worker_stats):.3f}ms, "
+        f"max {max(s['latency_ms_max'] for _, s in worker_stats):.3f}ms"
+    )
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
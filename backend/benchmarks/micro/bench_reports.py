@@ -0,0 +1,56 @@
+import pytest
+from app.services.report_service import report_service
+from conftest import SIZES
+
+def _evaluations(count: int):
+    return [
+        {"overall_score": 5 + index % 5, "technical_skills": 6 + index % 4, "communication": 4 + index % 6}
+        for index in range(count)
+    ]
+
+def _department_metrics(count: int):
+    return [
+        {
+            "metric": f"Metric {index}",
+            "current_value": 1000 + index,
+            "previous_value": 950 + index,
+            "change_percent": 5.2,
+            "target": 1100,
+            "achievement_percent": 91.0,
+        }
+        for index in range(count)
+    ]
+
+def _company_analytics(count: int):
+    return {
+        "total_revenue": 12500000.0,
+        "net_profit": 2300000.0,
+        "total_employees": 1250,
+        "active_projects": 42,
+        "customer_satisfaction": 87.5,
+        "department_performance": [
+            {"department": f"Department {index}", "revenue_contribution": 150000.0 + index,
+             "employee_count": 40, "productivity_score": 81.5}
+            for index in range(count)
+        ],
+    }
+
+EMPLOYEE = {"full_name": "Jane Doe", "employee_id": "EMP0000001", "department": "Technology", "designation": "Engineer"}
+
+@pytest.mark.parametrize("size", SIZES)
+def test_employee_performance_pdf(benchmark, size):
+    evaluations = _evaluations(SIZES[size])
+    pdf = benchmark(report_service.generate_employee_performance_pdf, EMPLOYEE, evaluations)
+    assert pdf.startswith(b"%PDF")
+
+@pytest.mark.parametrize("size", SIZES)
+def test_department_report_excel(benchmark, size):
+    metrics = _department_metrics(SIZES[size])
+    workbook = benchmark(report_service.generate_department_report_excel, "Technology", metrics)
+    assert workbook.startswith(b"PK")
+
+@pytest.mark.parametrize("size", SIZES)
+def test_company_analytics_pdf(benchmark, size):
+    analytics = _company_analytics(SIZES[size])
+    pdf = benchmark(report_service.generate_company_analytics_pdf, analytics)
+    assert pdf.startswith(b"%PDF")
\ No newline at end of file
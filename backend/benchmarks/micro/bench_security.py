@@ -0,0 +1,38 @@
+import pytest
+from datetime import timedelta
+from fastapi import HTTPException
+from app.core.config import settings
+from app.core.security import create_access_token, get_password_hash, verify_password, verify_token
+
+PASSWORD = "correct horse battery staple"
+
+@pytest.fixture(scope="module")
+def hashed_password():
+    return get_password_hash(PASSWORD)
+
+def test_create_access_token(benchmark):
+    token = benchmark(create_access_token, {"sub": "EMP0000001"})
+    assert verify_token(token) == "EMP0000001"
+
+def test_verify_token(benchmark):
+    token = create_access_token({"sub": "EMP0000001"}, expires_delta=timedelta(hours=1))
+    assert benchmark(verify_token, token) == "EMP0000001"
+
+def test_verify_token_rejects_tampered(benchmark):
+    token = create_access_token({"sub": "EMP0000001"})
+    tampered = token[:-2] + ("AA" if not token.endswith("AA") else "BB")
+
+    def rejected():
+        with pytest.raises(HTTPException):
+            verify_token(tampered)
+
+    benchmark(rejected)
+
+def test_verify_password(benchmark, hashed_password):
+    # One verification costs 2**BCRYPT_ROUNDS rounds, so a handful of samples is enough
+    benchmark.extra_info["bcrypt_rounds"] = settings.BCRYPT_ROUNDS
+    assert benchmark.pedantic(verify_password, (PASSWORD, hashed_password), rounds=5, warmup_rounds=1)
+
+def test_verify_password_wrong(benchmark, hashed_password):
+    benchmark.extra_info["bcrypt_rounds"] = settings.BCRYPT_ROUNDS
+    assert not benchmark.pedantic(verify_password, ("wrong password", hashed_password), rounds=5, warmup_rounds=1)
\ No newline at end of file
@@ -0,0 +1,43 @@
+import pytest
+from datetime import datetime, timedelta
+from app.models.employee import Employee, RoleEnum, StatusEnum
+from app.schemas.employee import EmployeeResponse
+from conftest import SIZES
+
+def _employees(count: int):
+    """Loaded-looking ORM rows, built without a database"""
+    hired = datetime(2022, 1, 1)
+    return [
+        Employee(
+            id=pk,
+            employee_id=f"EMP{pk:07d}",
+            email=f"employee{pk}@example.com",
+            full_name=f"Employee {pk}",
+            hashed_password="not-a-real-hash",
+            phone_number="+10000000000",
+            role=RoleEnum.TECH,
+            department="Technology",
+            designation="Engineer",
+            manager_id=1,
+            team_leader_id=1,
+            status=StatusEnum.ACTIVE,
+            hire_date=hired + timedelta(days=pk),
+            created_at=hired,
+            updated_at=hired,
+            performance_score=7.5,
+            tasks_completed=12,
+            tasks_pending=3,
+        )
+        for pk in range(1, count + 1)
+    ]
+
+@pytest.mark.parametrize("size", SIZES)
+def test_employee_response_from_orm(benchmark, size):
+    rows = _employees(SIZES[size])
+    responses = benchmark(lambda: [EmployeeResponse.model_validate(row) for row in rows])
+    assert len(responses) == SIZES[size]
+
+@pytest.mark.parametrize("size", SIZES)
+def test_employee_response_to_json(benchmark, size):
+    responses = [EmployeeResponse.model_validate(row) for row in _employees(SIZES[size])]
+    assert benchmark(lambda: [response.model_dump_json() for response in responses])
\ No newline at end of file
@@ -0,0 +1,11 @@
+import os
+import tempfile
+
+# Nothing here touches the database, but importing the app modules needs settings
+_db_dir = tempfile.mkdtemp(prefix="micro-benchmarks-")
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(_db_dir, 'benchmark.db')}"
+os.environ.setdefault("MAIL_FROM", "noreply@example.com")
+os.environ["SCHEDULER_ENABLED"] = "false"
+
+# Input sizes every sized benchmark runs at
+SIZES = {"small": 10, "medium": 100, "large": 1000}
\ No newline at end of file
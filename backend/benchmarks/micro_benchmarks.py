@@ -0,0 +1,99 @@
+"""Micro-benchmarks of the security, serialization and report hot paths against a stored baseline.
+
+    python -m benchmarks.micro_benchmarks
+    python -m benchmarks.micro_benchmarks --baseline benchmarks/baselines/micro_benchmarks.json
+    python -m benchmarks.micro_benchmarks --baseline benchmarks/baselines/micro_benchmarks.json --save-baseline
+    python -m benchmarks.micro_benchmarks -k report
+
+Runs the pytest-benchmark suite in benchmarks/micro (token creation and
+verification, bcrypt at BCRYPT_ROUNDS, EmployeeResponse validation of ORM
+rows, every ReportService generator at small/medium/large inputs) and
+prints each benchmark's timings as JSON. With --baseline, each --stat is
+compared with the stored run and the exit status is 1 if any benchmark is
+more than --threshold slower; --save-baseline writes this run there
+instead. Arguments after the options are passed to pytest.
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+from typing import List
+import pytest
+
+SUITE = os.path.join(os.path.dirname(__file__), "micro")
+STATS = ("min", "median", "mean")
+
+def run_suite(pytest_args: List[str]) -> dict:
+    with tempfile.TemporaryDirectory(prefix="micro-benchmarks-") as directory:
+        path = os.path.join(directory, "results.json")
+        status = pytest.main([SUITE, "-q", f"--benchmark-json={path}", *pytest_args])
+        if status != 0:
+            sys.exit(status)
+        with open(path) as f:
+            raw = json.load(f)
+    return {
+        benchmark["name"]: {
+            **{f"{stat}_ms": round(benchmark["stats"][stat] * 1000, 4) for stat in STATS},
+            "rounds": benchmark["stats"]["rounds"],
+            **benchmark["extra_info"],
+        }
+        for benchmark in raw["benchmarks"]
+    }
+
+def compare(results: dict, baseline: dict, threshold: float, stat: str) -> List[str]:
+    """One line per benchmark more than `threshold` slower than the baseline"""
+    key = f"{stat}_ms"
+    regressions = []
+    for name, stats in sorted(results["benchmarks"].items()):
+        before = baseline.get("benchmarks", {}).get(name)
+        if before is None or before[key] <= 0:
+            continue
+        if stats[key] > before[key] * (1 + threshold):
+            regressions.append(
+                f"{name} {stat}: {stats[key]:.4f} ms vs {before[key]:.4f} ms baseline "
+                f"(+{(stats[key] / before[key] - 1) * 100:.0f}%)"
+            )
+    return regressions
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--output", help="Also write the results to this file")
+    parser.add_argument("--baseline", help="Stored results to compare against")
+    parser.add_argument("--threshold", type=float, default=0.25, help="Allowed slowdown, 0.25 = 25%%")
+    # The fastest round is the one least disturbed by the rest of the machine
+    parser.add_argument("--stat", choices=STATS, default="min", help="Statistic compared with the baseline")
+    parser.add_argument("--save-baseline", action="store_true", help="Write this run to --baseline instead of comparing")
+    args, pytest_args = parser.parse_known_args()
+
+    results = {
+        "meta": {
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "cpus": os.cpu_count(),
+        },
+        "benchmarks": run_suite(pytest_args),
+    }
+    report = json.dumps(results, indent=2)
+    print(report)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(report + "\n")
+    if not args.baseline:
+        return
+    if args.save_baseline:
+        with open(args.baseline, "w") as f:
+            f.write(report + "\n")
+        print(f"Saved baseline to {args.baseline}", file=sys.stderr)
+        return
+    with open(args.baseline) as f:
+        regressions = compare(results, json.load(f), args.threshold, args.stat)
+    for regression in regressions:
+        print(f"REGRESSION {regression}", file=sys.stderr)
+    if regressions:
+        sys.exit(1)
+    print(f"No benchmark more than {args.threshold:.0%} slower than {args.baseline}", file=sys.stderr)
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
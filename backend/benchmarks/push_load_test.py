@@ -0,0 +1,138 @@
+"""Push hub load test: idle WebSocket connections held by one worker.
+
+    python -m benchmarks.push_load_test --connections 10000
+
+Starts a single uvicorn worker on a throwaway SQLite database, opens the
+connections from this process, reports the worker's memory per connection,
+then publishes one announcement and times its delivery to every socket.
+"""
+import argparse
+import asyncio
+import os
+import resource
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+
+import httpx
+import websockets
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def free_port() -> int:
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        return probe.getsockname()[1]
+
+def rss_mib(pid: int) -> float:
+    with open(f"/proc/{pid}/status") as status:
+        for line in status:
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1]) / 1024
+    return 0.0
+
+def raise_fd_limit():
+    _, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    resource.setrlimit(resource.RLIMIT_NOFILE, (hard, hard))
+    return hard
+
+def seed(env: dict) -> str:
+    """Create the schema and one HR employee; returns a token for it"""
+    script = (
+        "from app.main import app\n"
+        "from app.database.database import SessionLocal\n"
+        "from app.models.employee import Employee, RoleEnum\n"
+        "from app.core.security import create_access_token\n"
+        "db = SessionLocal()\n"
+        "db.add(Employee(employee_id='HR0001', email='hr@example.com', full_name='Load Test',"
+        " hashed_password='x', role=RoleEnum.HR, department='People', designation='HR'))\n"
+        "db.commit()\n"
+        "print(create_access_token(data={'sub': 'HR0001'}, expires_delta=__import__('datetime').timedelta(hours=2)))\n"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", script], cwd=BACKEND_DIR, env=env, check=True, capture_output=True, text=True
+    )
+    return output.stdout.strip().splitlines()[-1]
+
+async def wait_until_up(base_url: str):
+    async with httpx.AsyncClient() as client:
+        for _ in range(100):
+            try:
+                await client.get(f"{base_url}/health")
+                return
+            except httpx.TransportError:
+                await asyncio.sleep(0.1)
+    raise RuntimeError("Server did not start")
+
+async def run(args):
+    port = free_port()
+    base_url = f"http://127.0.0.1:{port}"
+    db_dir = tempfile.mkdtemp(prefix="push-load-")
+    env = {
+        **os.environ,
+        "DATABASE_URL": f"sqlite:///{os.path.join(db_dir, 'load.db')}",
+        "MAIL_FROM": "noreply@example.com",
+        "SCHEDULER_ENABLED": "false",
+        "DEBUG": "false",
+    }
+    token = seed(env)
+    server = subprocess.Popen(
+        [
+            sys.executable, "-c",
+            "import resource; h = resource.getrlimit(resource.RLIMIT_NOFILE)[1];"
+            "resource.setrlimit(resource.RLIMIT_NOFILE, (h, h));"
+            f"import uvicorn; uvicorn.run('app.main:app', port={port}, log_level='warning', backlog=4096)"
+        ],
+        cwd=BACKEND_DIR, env=env
+    )
+    sockets = []
+    try:
+        await wait_until_up(base_url)
+        baseline = rss_mib(server.pid)
+
+        url = f"ws://127.0.0.1:{port}/api/push/ws?token={token}"
+        start = time.perf_counter()
+        for offset in range(0, args.connections, args.batch):
+            batch = min(args.batch, args.connections - offset)
+            sockets += await asyncio.gather(*(websockets.connect(url, ping_interval=None) for _ in range(batch)))
+        connect_seconds = time.perf_counter() - start
+
+        await asyncio.sleep(args.idle)
+        loaded = rss_mib(server.pid)
+        print(f"{len(sockets)} connections open in {connect_seconds:.1f}s, idle for {args.idle}s")
+        print(
+            f"Worker RSS {baseline:.0f} MiB -> {loaded:.0f} MiB "
+            f"({(loaded - baseline) * 1024 / len(sockets):.1f} KiB per connection)"
+        )
+
+        async with httpx.AsyncClient() as client:
+            start = time.perf_counter()
+            response = await client.post(
+                f"{base_url}/api/announcements/",
+                json={"title": "Load test", "content": "Fan-out"},
+                headers={"Authorization": f"Bearer {token}"}
+            )
+            response.raise_for_status()
+            await asyncio.gather(*(connection.recv() for connection in sockets))
+            print(f"Announcement delivered to all {len(sockets)} connections in {time.perf_counter() - start:.2f}s")
+    finally:
+        await asyncio.gather(*(connection.close() for connection in sockets), return_exceptions=True)
+        server.terminate()
+        server.wait()
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--connections", type=int, default=10000)
+    parser.add_argument("--batch", type=int, default=500)
+    parser.add_argument("--idle", type=float, default=10.0)
+    args = parser.parse_args()
+
+    limit = raise_fd_limit()
+    if limit < args.connections + 100:
+        sys.exit(f"Open file limit {limit} is too low for {args.connections} connections")
+    asyncio.run(run(args))
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,120 @@
+"""Full-text search benchmark on a synthetic corpus.
+
+    python -m benchmarks.search_benchmark --documents 100000
+
+Seeds a throwaway SQLite database with employees, announcements and tickets,
+rebuilds the search index and reports query latency for a management and a
+department-scoped caller.
+"""
+import argparse
+import os
+import random
+import statistics
+import tempfile
+import time
+
+_db_dir = tempfile.mkdtemp(prefix="search-benchmark-")
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(_db_dir, 'benchmark.db')}"
+os.environ.setdefault("MAIL_FROM", "noreply@example.com")
+os.environ["SCHEDULER_ENABLED"] = "false"
+
+from sqlalchemy import insert
+from app.database.database import Base, SessionLocal, engine
+from app.models.announcement import Announcement, AnnouncementAudience
+from app.models.employee import Employee, RoleEnum
+from app.models.support_ticket import SupportTicket
+from app.services.announcement_feed import DEPARTMENT, EVERYONE, ROLE
+from app.services.search import rebuild_index, search
+
+WORDS = (
+    "payroll laptop onboarding benefits travel expense policy deadline review budget office "
+    "security password network printer vacation holiday training workshop release sprint "
+    "customer invoice contract hiring referral wellness parking badge migration outage"
+).split()
+FIRST_NAMES = "Ada Grace Alan Linus Barbara Edsger Donald Margaret Ken Dennis Frances John".split()
+LAST_NAMES = "Lovelace Hopper Turing Torvalds Liskov Dijkstra Knuth Hamilton Thompson Ritchie Allen Backus".split()
+DEPARTMENTS = [f"Department {i}" for i in range(20)]
+QUERIES = ["payroll", "laptop security", "grace", "hop", "budget review deadline", "outage", "turing"]
+
+# Filler vocabulary so the topic words above occur at a realistic rate
+SYLLABLES = "ka lo mi ne ru sa te vo zi pa".split()
+FILLER = [a + b + c for a in SYLLABLES for b in SYLLABLES for c in SYLLABLES]
+
+def sentence(rng: random.Random, length: int) -> str:
+    return " ".join(rng.choice(WORDS) if rng.random() < 0.05 else rng.choice(FILLER) for _ in range(length))
+
+def seed(documents: int, rng: random.Random):
+    employees = documents * 6 // 10
+    announcements = tickets = (documents - employees) // 2
+    with engine.begin() as connection:
+        connection.execute(insert(Employee), [
+            {
+                "employee_id": f"EMP{i:06d}",
+                "email": f"employee{i}@example.com",
+                "full_name": f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}",
+                "hashed_password": "x",
+                "role": rng.choice(list(RoleEnum)),
+                "department": rng.choice(DEPARTMENTS),
+                "designation": rng.choice(WORDS + FILLER).title() + " Specialist",
+            }
+            for i in range(1, employees + 1)
+        ])
+        connection.execute(insert(Announcement), [
+            {"title": sentence(rng, 4).capitalize(), "content": sentence(rng, 40), "created_by": 1}
+            for _ in range(announcements)
+        ])
+        connection.execute(insert(AnnouncementAudience), [
+            {"announcement_id": i, "dimension": dimension, "value": value}
+            for i in range(1, announcements + 1)
+            for dimension, value in ((DEPARTMENT, rng.choice(DEPARTMENTS + [EVERYONE])), (ROLE, EVERYONE))
+        ])
+        connection.execute(insert(SupportTicket), [
+            {
+                "ticket_number": f"TKT{i:06d}",
+                "title": sentence(rng, 5).capitalize(),
+                "description": sentence(rng, 25),
+                "created_by": rng.randint(1, employees),
+            }
+            for i in range(1, tickets + 1)
+        ])
+
+def measure(db, viewer, repeats: int):
+    timings = []
+    for _ in range(repeats):
+        for query in QUERIES:
+            start = time.perf_counter()
+            search(db, viewer, query)
+            timings.append((time.perf_counter() - start) * 1000)
+    timings.sort()
+    return {
+        "p50_ms": round(statistics.median(timings), 2),
+        "p95_ms": round(timings[int(len(timings) * 0.95) - 1], 2),
+        "max_ms": round(timings[-1], 2),
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--documents", type=int, default=100000)
+    parser.add_argument("--repeats", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    Base.metadata.create_all(bind=engine)
+    seed(args.documents, random.Random(args.seed))
+
+    db = SessionLocal()
+    try:
+        start = time.perf_counter()
+        indexed = rebuild_index(db)
+        elapsed = time.perf_counter() - start
+        print(f"Indexed {indexed} documents in {elapsed:.1f}s ({indexed / elapsed:,.0f} docs/s)")
+
+        admin = db.query(Employee).filter(Employee.role == RoleEnum.ADMIN).first()
+        intern = db.query(Employee).filter(Employee.role == RoleEnum.INTERN).first()
+        for label, viewer in (("admin", admin), ("intern", intern)):
+            print(f"{label:>6}: {measure(db, viewer, args.repeats)}")
+    finally:
+        db.close()
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,82 @@
+"""Support queue benchmark: claim throughput with concurrent agents.
+
+    python -m benchmarks.ticket_claim_benchmark --agents 8 --tickets 2000
+"""
+import argparse
+import os
+import tempfile
+import threading
+import time
+from datetime import datetime, timedelta
+
+_db_dir = tempfile.mkdtemp(prefix="ticket-claim-benchmark-")
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(_db_dir, 'benchmark.db')}"
+os.environ.setdefault("MAIL_FROM", "noreply@example.com")
+os.environ["SCHEDULER_ENABLED"] = "false"
+
+from sqlalchemy import insert
+from app.database.database import Base, SessionLocal, engine
+from app.models.employee import Employee, RoleEnum
+from app.models.support_ticket import PRIORITY_RANKS, SupportTicket, TicketCategoryEnum, TicketPriorityEnum
+from app.services.ticket_queue import claim_next_ticket
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--agents", type=int, default=8)
+    parser.add_argument("--tickets", type=int, default=2000)
+    args = parser.parse_args()
+
+    Base.metadata.create_all(bind=engine)
+    priorities = list(TicketPriorityEnum)
+    start = datetime.utcnow() - timedelta(days=1)
+    with engine.begin() as connection:
+        connection.execute(insert(Employee), [
+            {
+                "employee_id": f"AGENT{i:03d}",
+                "email": f"agent{i}@example.com",
+                "full_name": f"Agent {i}",
+                "hashed_password": "x",
+                "role": RoleEnum.TECH,
+                "department": "Support",
+                "designation": "Agent",
+            }
+            for i in range(1, args.agents + 1)
+        ])
+        connection.execute(insert(SupportTicket), [
+            {
+                "ticket_number": f"TKT{i:06d}",
+                "title": f"Ticket {i}",
+                "description": "Something is broken",
+                "category": TicketCategoryEnum.TECHNICAL,
+                "priority": priorities[i % len(priorities)],
+                "priority_rank": PRIORITY_RANKS[priorities[i % len(priorities)]],
+                "created_by": 1,
+                "created_at": start + timedelta(seconds=i),
+            }
+            for i in range(1, args.tickets + 1)
+        ])
+
+    claims = {agent_id: 0 for agent_id in range(1, args.agents + 1)}
+
+    def work(agent_id):
+        session = SessionLocal()
+        try:
+            while claim_next_ticket(session, agent_id, TicketCategoryEnum.TECHNICAL) is not None:
+                claims[agent_id] += 1
+        finally:
+            session.close()
+
+    threads = [threading.Thread(target=work, args=(agent_id,)) for agent_id in claims]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+
+    claimed = sum(claims.values())
+    print(f"{args.agents} agents claimed {claimed} of {args.tickets} tickets in {elapsed:.2f}s ({claimed / elapsed:.0f} claims/s)")
+    print(f"Claims per agent: min {min(claims.values())}, max {max(claims.values())}")
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,87 @@
+"""Employee typeahead benchmark: build time, lookup latency and memory.
+
+    python -m benchmarks.typeahead_benchmark --employees 100000
+"""
+import argparse
+import os
+import random
+import statistics
+import tempfile
+import time
+import tracemalloc
+
+_db_dir = tempfile.mkdtemp(prefix="typeahead-benchmark-")
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(_db_dir, 'benchmark.db')}"
+os.environ.setdefault("MAIL_FROM", "noreply@example.com")
+os.environ["SCHEDULER_ENABLED"] = "false"
+
+from sqlalchemy import insert
+from app.database.database import Base, SessionLocal, engine
+from app.models.employee import Employee, RoleEnum
+from app.services.employee_typeahead import Suggestion, prefix_index
+
+SYLLABLES = "ka lo mi ne ru sa te vo zi pa an el".split()
+
+def name(rng: random.Random) -> str:
+    part = lambda: "".join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 4))).title()
+    return f"{part()} {part()}"
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--employees", type=int, default=100000)
+    parser.add_argument("--lookups", type=int, default=20000)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+    rng = random.Random(args.seed)
+
+    Base.metadata.create_all(bind=engine)
+    names = [name(rng) for _ in range(args.employees)]
+    with engine.begin() as connection:
+        connection.execute(insert(Employee), [
+            {
+                "employee_id": f"EMP{i:06d}",
+                "email": f"{full_name.replace(' ', '.').lower()}{i}@example.com",
+                "full_name": full_name,
+                "hashed_password": "x",
+                "role": RoleEnum.TECH,
+                "department": f"Department {i % 20}",
+                "designation": "Engineer",
+            }
+            for i, full_name in enumerate(names, start=1)
+        ])
+
+    db = SessionLocal()
+    try:
+        tracemalloc.start()
+        start = time.perf_counter()
+        prefix_index.load(db)
+        build_seconds = time.perf_counter() - start
+        traced_bytes, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    finally:
+        db.close()
+
+    prefixes = [rng.choice(names).lower()[:rng.randint(1, 6)] for _ in range(args.lookups)]
+    timings = []
+    for prefix in prefixes:
+        start = time.perf_counter()
+        prefix_index.lookup(prefix, 10, rng.choice([None, "Department 3"]))
+        timings.append((time.perf_counter() - start) * 1e6)
+    timings.sort()
+
+    update = Suggestion(1, "EMP000001", "Renamed Person", "renamed@example.com", "Department 1", "Engineer")
+    start = time.perf_counter()
+    prefix_index.apply([update], [])
+    update_us = (time.perf_counter() - start) * 1e6
+
+    stats = prefix_index.stats()
+    print(f"Built index over {stats['employees']} employees ({stats['keys']} keys) in {build_seconds:.2f}s")
+    print(f"Memory: {traced_bytes / 2**20:.1f} MiB traced during build, {stats['approx_bytes'] / 2**20:.1f} MiB estimated by stats()")
+    print(
+        f"Lookup: p50 {statistics.median(timings):.1f}us, "
+        f"p99 {timings[int(len(timings) * 0.99) - 1]:.1f}us, max {timings[-1]:.1f}us"
+    )
+    print(f"Incremental update: {update_us:.1f}us")
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
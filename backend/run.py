@@ -1,12 +1,90 @@
-import uvicorn
-from app.main import app
-from app.core.config import settings
-
-if __name__ == "__main__":
-    uvicorn.run(
-        "app.main:app",
-        host="0.0.0.0",
-        port=8000,
-        reload=settings.DEBUG,
-        log_level="info"
-    )
\ No newline at end of file
+"""Start the API: `python run.py` for development, `python run.py serve` for production"""
+import argparse
+import logging
+from datetime import date
+import uvicorn
+from app.core.config import settings
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=8000)
+    commands = parser.add_subparsers(dest="command")
+    serve = commands.add_parser("serve", help="Pre-forked workers; SIGHUP restarts them one at a time")
+    # SUPPRESS keeps these from overwriting values given before `serve`
+    serve.add_argument("--host", default=argparse.SUPPRESS)
+    serve.add_argument("--port", type=int, default=argparse.SUPPRESS)
+    serve.add_argument("--workers", type=int, default=settings.WEB_CONCURRENCY)
+    serve.add_argument("--preload", action=argparse.BooleanOptionalAction, default=settings.PRELOAD_APP,
+                       help="Import the app once before forking the workers")
+    serve.add_argument("--max-requests", type=int, default=settings.MAX_REQUESTS,
+                       help="Replace a worker after it has served this many requests (0 never)")
+    serve.add_argument("--max-requests-jitter", type=int, default=settings.MAX_REQUESTS_JITTER,
+                       help="Add up to this many requests per worker so they don't all restart together")
+    serve.add_argument("--graceful-timeout", type=int, default=settings.GRACEFUL_TIMEOUT_SECONDS,
+                       help="Seconds a stopping worker gets to finish in-flight requests")
+    serve.add_argument("--db-connections", type=int, default=settings.DB_MAX_CONNECTIONS,
+                       help="Total database connections, split evenly across the workers (0 uses DB_POOL_SIZE per worker)")
+    seed = commands.add_parser("seed", help="Fill an empty database with deterministic synthetic data")
+    seed.add_argument("--employees", type=int, default=10000)
+    seed.add_argument("--departments", type=int, default=8)
+    seed.add_argument("--span", type=int, default=8, help="Direct reports per manager")
+    seed.add_argument("--months", type=int, default=12, help="History length")
+    seed.add_argument("--tasks-per-month", type=float, default=2.0, help="Per employee")
+    seed.add_argument("--goals-per-quarter", type=int, default=1, help="Per employee")
+    seed.add_argument("--tickets-per-month", type=float, default=0.1, help="Per employee")
+    seed.add_argument("--announcements-per-month", type=int, default=20)
+    seed.add_argument("--seed", type=int, default=42)
+    seed.add_argument("--as-of", type=date.fromisoformat, default=date.today(),
+                      help="Last day of the history (YYYY-MM-DD); fix it to get the same rows on another day")
+    seed.add_argument("--password", default="password123", help="Password of every generated employee")
+    seed.add_argument("--reset", action="store_true", help="Drop and recreate every table first")
+    args = parser.parse_args()
+
+    if args.command == "seed":
+        from app.database.database import engine
+        from app.services.synthetic_data import OrgShape, seed_database
+        logging.basicConfig(level=logging.INFO)
+        shape = OrgShape(*(getattr(args, field) for field in OrgShape._fields))
+        try:
+            written = seed_database(engine, shape, args.seed, args.as_of, args.password, reset=args.reset)
+        except ValueError as error:
+            parser.error(str(error))
+        for table, rows in written.items():
+            print(f"{table:>24} {rows:>12,}")
+        return
+
+    if args.command != "serve":
+        uvicorn.run(
+            "app.main:app",
+            host=args.host,
+            port=args.port,
+            reload=settings.DEBUG,
+            log_level="info"
+        )
+        return
+
+    from app.core.supervisor import Supervisor, invalidation_bus_for, pool_sizes
+    logging.basicConfig(level=logging.INFO)
+    if args.db_connections > 0:
+        # The engine reads these when the app is imported, which happens after this
+        settings.DB_POOL_SIZE, settings.DB_MAX_OVERFLOW = pool_sizes(args.db_connections, args.workers)
+    bus = invalidation_bus_for(settings.INVALIDATION_BUS, args.workers)
+    if bus != settings.INVALIDATION_BUS:
+        logging.getLogger(__name__).info(
+            f"INVALIDATION_BUS=none with {args.workers} workers, using the unix socket bus in {settings.INVALIDATION_BUS_SOCKET_DIR}"
+        )
+        settings.INVALIDATION_BUS = bus
+    Supervisor(
+        "app.main:app",
+        host=args.host,
+        port=args.port,
+        workers=args.workers,
+        preload=args.preload,
+        max_requests=args.max_requests,
+        max_requests_jitter=args.max_requests_jitter,
+        graceful_timeout=args.graceful_timeout
+    ).run()
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
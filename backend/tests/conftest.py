@@ -0,0 +1,85 @@
+import os
+import tempfile
+
+# Point the app at a throwaway SQLite database before anything imports settings
+_db_dir = tempfile.mkdtemp(prefix="employee-dashboard-tests-")
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(_db_dir, 'test.db')}"
+os.environ.setdefault("MAIL_FROM", "noreply@example.com")
+os.environ["SCHEDULER_ENABLED"] = "false"
+os.environ["N_PLUS_ONE_DETECTION"] = "raise"
+os.environ["METRICS_ENABLED"] = "true"
+os.environ["PROFILING_ENABLED"] = "true"
+os.environ["WORKER_STATS_DIR"] = os.path.join(_db_dir, "workers")
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+from app.main import app
+from app.database.database import Base, SessionLocal, engine
+from app.core.security import create_access_token
+from app.models.employee import Employee, RoleEnum
+from app.services.response_cache import response_cache
+
+@pytest.fixture(autouse=True)
+def reset_database():
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    response_cache.clear()
+    yield
+
+@pytest.fixture
+def db():
+    session = SessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
+
+@pytest.fixture
+def client():
+    with TestClient(app) as test_client:
+        yield test_client
+
+@pytest.fixture
+def make_employee(db):
+    counter = {"value": 0}
+
+    def factory(role: RoleEnum = RoleEnum.TECH, department: str = "Technology", **fields) -> Employee:
+        counter["value"] += 1
+        number = counter["value"]
+        employee = Employee(
+            employee_id=fields.pop("employee_id", f"EMP{number:04d}"),
+            email=fields.pop("email", f"employee{number}@example.com"),
+            full_name=fields.pop("full_name", f"Employee {number}"),
+            hashed_password=fields.pop("hashed_password", "not-a-real-hash"),
+            role=role,
+            department=department,
+            designation=fields.pop("designation", "Engineer"),
+            **fields
+        )
+        db.add(employee)
+        db.commit()
+        db.refresh(employee)
+        return employee
+
+    return factory
+
+@pytest.fixture
+def auth_headers():
+    def headers_for(employee: Employee) -> dict:
+        token = create_access_token(data={"sub": employee.employee_id})
+        return {"Authorization": f"Bearer {token}"}
+
+    return headers_for
+
+@pytest.fixture
+def count_queries():
+    """Collects every SQL statement sent to the engine while the fixture is active"""
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    yield statements
+    event.remove(engine, "before_cursor_execute", before_cursor_execute)
\ No newline at end of file
@@ -0,0 +1,94 @@
+import time
+from datetime import datetime, timedelta
+import pytest
+from app.models.announcement import Announcement
+from app.models.employee import RoleEnum
+from app.services.announcement_feed import feed_cache
+
+@pytest.fixture(autouse=True)
+def empty_feed_cache():
+    feed_cache.invalidate()
+    yield
+    feed_cache.invalidate()
+
+def feed_titles(client, headers):
+    response = client.get("/api/announcements/feed", headers=headers)
+    assert response.status_code == 200
+    return [item["title"] for item in response.json()]
+
+def test_created_announcements_invalidate_cached_feeds(client, make_employee, auth_headers):
+    hr = make_employee(role=RoleEnum.HR, department="People")
+    engineer = make_employee(department="Technology")
+    headers = auth_headers(engineer)
+    assert feed_titles(client, headers) == []
+
+    for title, targets in (("People only", '["People"]'), ("Technology only", '["Technology"]')):
+        response = client.post(
+            "/api/announcements/",
+            json={"title": title, "content": "...", "target_departments": targets},
+            headers=auth_headers(hr)
+        )
+        assert response.status_code == 200
+
+    assert feed_titles(client, headers) == ["Technology only"]
+
+def test_edits_invalidate_old_and_new_audiences(client, make_employee, auth_headers):
+    hr = make_employee(role=RoleEnum.HR, department="People")
+    finance = auth_headers(make_employee(department="Finance"))
+    engineer = auth_headers(make_employee(department="Technology"))
+    created = client.post(
+        "/api/announcements/",
+        json={"title": "Budget", "content": "...", "target_departments": '["Finance"]'},
+        headers=auth_headers(hr)
+    ).json()
+    assert (feed_titles(client, finance), feed_titles(client, engineer)) == (["Budget"], [])
+
+    response = client.put(
+        f"/api/announcements/{created['id']}",
+        json={"title": "Roadmap", "target_departments": '["Technology"]'},
+        headers=auth_headers(hr)
+    )
+    assert response.status_code == 200
+    assert (feed_titles(client, finance), feed_titles(client, engineer)) == ([], ["Roadmap"])
+
+    assert client.delete(f"/api/announcements/{created['id']}", headers=auth_headers(hr)).status_code == 200
+    assert feed_titles(client, engineer) == []
+
+def test_expired_announcements_leave_the_cached_feed(client, db, make_employee, auth_headers):
+    hr = make_employee(role=RoleEnum.HR)
+    headers = auth_headers(make_employee())
+    db.add_all([
+        Announcement(title="Flash", content="...", created_by=hr.id, expires_at=datetime.utcnow() + timedelta(seconds=1)),
+        Announcement(title="Standing", content="...", created_by=hr.id),
+    ])
+    db.commit()
+    feed_cache.invalidate()
+    assert sorted(feed_titles(client, headers)) == ["Flash", "Standing"]
+
+    time.sleep(1.1)
+
+    assert feed_titles(client, headers) == ["Standing"]
+
+def test_announcements_written_outside_the_api_get_audience_rows(client, db, make_employee, auth_headers):
+    hr = make_employee(role=RoleEnum.HR)
+    headers = auth_headers(make_employee(department="Technology"))
+    announcement = Announcement(title="Direct", content="...", created_by=hr.id, target_roles='["hr"]')
+    db.add(announcement)
+    db.commit()
+    assert feed_titles(client, headers) == []
+
+    announcement.target_roles = None
+    db.commit()
+    feed_cache.invalidate()
+    assert feed_titles(client, headers) == ["Direct"]
+
+def test_feeds_read_before_an_invalidation_are_not_cached():
+    segment = ("Technology", "tech")
+    generation = feed_cache.generation(segment)
+
+    feed_cache.invalidate(["Technology"], ["*"])
+    feed_cache.set(segment, [], generation)
+    assert feed_cache.get(segment) is None
+
+    feed_cache.set(segment, [], feed_cache.generation(segment))
+    assert feed_cache.get(segment) == []
\ No newline at end of file
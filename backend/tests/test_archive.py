@@ -0,0 +1,88 @@
+from datetime import datetime, timedelta
+from sqlalchemy import func, select, text, update
+from app.core.config import settings
+from app.models.archive import ArchivedEmployee, ArchivedSupportTicket, ArchivedTask
+from app.models.employee import Employee, RoleEnum, StatusEnum
+from app.models.goal import Goal
+from app.models.support_ticket import SupportTicket
+from app.models.task import Task
+from app.services.archive import archive_inactive_employees
+
+LATER = datetime.utcnow() + timedelta(days=settings.ARCHIVE_INACTIVE_AFTER_DAYS + 30)
+
+def _task(assignee, assigner, title="Handover"):
+    return Task(title=title, description="...", assigned_to=assignee.id, assigned_by=assigner.id, due_date=datetime.utcnow())
+
+def test_long_inactive_employees_move_with_their_tasks_and_tickets(client, db, make_employee, auth_headers):
+    hr = make_employee(RoleEnum.HR, department="HR")
+    leavers_manager = make_employee(status=StatusEnum.INACTIVE)
+    leaver = make_employee(full_name="Long Gone", status=StatusEnum.INACTIVE, manager_id=leavers_manager.id)
+    # An inactive manager goes together with their inactive report
+    old_manager = make_employee(status=StatusEnum.INACTIVE)
+    old_report = make_employee(status=StatusEnum.INACTIVE, manager_id=old_manager.id)
+    recent = make_employee(status=StatusEnum.INACTIVE)
+    with_goal = make_employee(status=StatusEnum.INACTIVE)
+    manages_active = make_employee(status=StatusEnum.INACTIVE)
+    make_employee(manager_id=manages_active.id)
+    db.add_all([
+        _task(leaver, hr),
+        _task(hr, leaver, "Assigned by the leaver"),
+        SupportTicket(ticket_number="TKT000001", title="Laptop return", description="...", created_by=leaver.id),
+        Goal(title="Grow", description="...", assigned_to=with_goal.id, created_by=hr.id, target_date=datetime.utcnow()),
+    ])
+    db.commit()
+    # Deactivated a day before the run, so not due yet
+    db.execute(update(Employee).where(Employee.id == recent.id).values(updated_at=LATER - timedelta(days=1)))
+    db.commit()
+    hr_id, leaver_id, leavers_manager_id, old_pair = hr.id, leaver.id, leavers_manager.id, {old_manager.id, old_report.id}
+    headers = auth_headers(hr)
+    assert client.get("/api/search/", params={"q": "laptop"}, headers=headers).json()["results"]
+
+    # HR keeps the task the leaver assigned, so the leaver stays, and so does
+    # the leaver's manager; of the rest only the old pair is unreferenced
+    assert archive_inactive_employees(db, now=LATER) == (2, 0, 0)
+    assert set(db.scalars(select(ArchivedEmployee.id))) == old_pair
+    assert set(db.scalars(select(Employee.id).where(Employee.status == StatusEnum.INACTIVE))) == {
+        leavers_manager_id, leaver_id, recent.id, with_goal.id, manages_active.id
+    }
+
+    db.execute(Task.__table__.delete().where(Task.assigned_to == hr_id))
+    db.commit()
+    # One at a time the manager is still referenced by the leaver in the next batch; the run after takes them too
+    assert archive_inactive_employees(db, now=LATER, batch_size=1) == (1, 1, 1)
+    assert archive_inactive_employees(db, now=LATER, batch_size=1) == (1, 0, 0)
+    assert db.scalar(select(Employee.id).where(Employee.id.in_([leaver_id, leavers_manager_id]))) is None
+    assert db.scalar(select(ArchivedTask.title)) == "Handover"
+    assert db.scalar(select(ArchivedSupportTicket.title)) == "Laptop return"
+    assert db.scalar(select(func.count()).select_from(Task)) == 0
+    assert client.get("/api/search/", params={"q": "laptop"}, headers=headers).json()["results"] == []
+
+def test_archived_records_are_read_only_when_asked_for(client, db, make_employee, auth_headers):
+    hr = make_employee(RoleEnum.HR, department="HR")
+    leaver = make_employee(full_name="Long Gone", status=StatusEnum.INACTIVE)
+    task = _task(leaver, hr)
+    ticket = SupportTicket(ticket_number="TKT000001", title="Secret", description="...", created_by=leaver.id, is_anonymous=True)
+    db.add_all([task, ticket])
+    db.commit()
+    headers = auth_headers(hr)
+    leaver_id, task_id, hr_name = leaver.id, task.id, hr.full_name
+    assert client.get(f"/api/employees/{leaver_id}", headers=headers).status_code == 200
+
+    assert archive_inactive_employees(db, now=LATER) == (1, 1, 1)
+    # The cached hot read was invalidated by the move
+    assert client.get(f"/api/employees/{leaver_id}", headers=headers).status_code == 404
+    assert client.get(f"/api/tasks/{task_id}", headers=headers).status_code == 404
+
+    employee = client.get(f"/api/employees/{leaver_id}", params={"include_archived": True}, headers=headers).json()
+    assert (employee["full_name"], employee["status"]) == ("Long Gone", "inactive")
+    archived_task = client.get(f"/api/tasks/{task_id}", params={"include_archived": True}, headers=headers).json()
+    assert (archived_task["assignee_name"], archived_task["assigner_name"]) == ("Long Gone", hr_name)
+    [archived_ticket] = client.get("/api/support/archived", params={"created_by": leaver_id}, headers=headers).json()
+    assert (archived_ticket["title"], archived_ticket["created_by"]) == ("Secret", None)
+    assert client.get("/api/support/archived", params={"created_by": leaver_id}, headers=auth_headers(make_employee())).status_code == 403
+
+def test_hot_filters_use_the_active_partial_index(db):
+    plan = " ".join(row[-1] for row in db.execute(text(
+        "EXPLAIN QUERY PLAN SELECT count(*) FROM employees WHERE department = 'Sales' AND status = 'ACTIVE'"
+    )))
+    assert "ix_employees_active_department_role" in plan
\ No newline at end of file
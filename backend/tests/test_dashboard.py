@@ -0,0 +1,77 @@
+from datetime import datetime, timedelta
+import pytest
+from app.models.announcement import Announcement
+from app.models.employee import RoleEnum
+from app.models.goal import Goal, GoalStatusEnum
+from app.models.task import Task, TaskStatusEnum
+from app.services.announcement_feed import feed_cache
+from app.services.dashboard import summary_cache
+
+@pytest.fixture(autouse=True)
+def empty_caches():
+    summary_cache.clear()
+    feed_cache.invalidate()
+    yield
+    summary_cache.clear()
+    feed_cache.invalidate()
+
+def seed_dashboard(db, employee, manager):
+    due = datetime.utcnow() + timedelta(days=3)
+    db.add_all([
+        Task(title="Open", description="...", assigned_to=employee.id, assigned_by=manager.id, due_date=due),
+        Task(title="Late", description="...", assigned_to=employee.id, assigned_by=manager.id, due_date=due,
+             status=TaskStatusEnum.OVERDUE),
+        Task(title="Done", description="...", assigned_to=employee.id, assigned_by=manager.id, due_date=due,
+             status=TaskStatusEnum.COMPLETED),
+        Goal(title="Ship", description="...", assigned_to=employee.id, created_by=manager.id, target_date=due,
+             progress_percentage=100.0, status=GoalStatusEnum.COMPLETED),
+        Goal(title="Learn", description="...", assigned_to=employee.id, created_by=manager.id, target_date=due,
+             progress_percentage=50.0),
+        Announcement(title="Welcome", content="...", created_by=manager.id),
+    ])
+    db.commit()
+
+def test_summary_gathers_everything_in_one_request(client, db, make_employee, auth_headers, count_queries):
+    manager = make_employee(role=RoleEnum.ADMIN, department="Technology")
+    engineer = make_employee(department="Technology", manager_id=manager.id)
+    make_employee(department="Finance")
+    seed_dashboard(db, engineer, manager)
+    headers = auth_headers(engineer)
+
+    count_queries.clear()
+    response = client.get("/api/dashboard/summary", headers=headers)
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["employee"]["id"] == engineer.id
+    assert body["tasks"] == {"pending": 2, "completed": 1, "overdue": 1}
+    assert body["goals"] == {"total": 2, "completed": 1, "average_progress": 75.0}
+    assert body["team"] == {"department": "Technology", "team_size": 2, "direct_reports": 0}
+    assert [item["title"] for item in body["announcements"]] == ["Welcome"]
+    assert body["company"] is None
+    assert response.headers["cache-control"].startswith("private")
+    # Auth lookup, the combined summary SELECT and the (uncached) feed
+    assert len(count_queries) == 3
+
+def test_management_also_gets_company_figures(client, db, make_employee, auth_headers):
+    manager = make_employee(role=RoleEnum.HR, department="People")
+    engineer = make_employee(manager_id=manager.id)
+    seed_dashboard(db, engineer, manager)
+
+    body = client.get("/api/dashboard/summary", headers=auth_headers(manager)).json()
+
+    assert body["team"]["direct_reports"] == 1
+    assert body["company"] == {"headcount": 2, "open_tickets": 0, "overdue_tasks": 1}
+
+def test_summary_is_cached_per_user(client, db, make_employee, auth_headers, count_queries):
+    first = make_employee()
+    second = make_employee()
+    headers = auth_headers(first)
+    client.get("/api/dashboard/summary", headers=headers)
+
+    count_queries.clear()
+    cached = client.get("/api/dashboard/summary", headers=headers).json()
+    assert len(count_queries) == 1    # only the auth lookup
+    assert cached["employee"]["id"] == first.id
+
+    assert client.get("/api/dashboard/summary", headers=auth_headers(second)).json()["employee"]["id"] == second.id
\ No newline at end of file
@@ -0,0 +1,111 @@
+import threading
+import time
+import pytest
+from app.database.database import SessionLocal
+from app.models.employee import RoleEnum, StatusEnum
+from app.services import employee_typeahead
+from app.services.employee_typeahead import PrefixIndex, prefix_index
+
+@pytest.fixture(autouse=True)
+def fresh_index():
+    prefix_index.reset()
+    yield
+    prefix_index.reset()
+
+def suggest(client, headers, q):
+    response = client.get("/api/employees/suggest", params={"q": q}, headers=headers)
+    assert response.status_code == 200
+    return [suggestion["full_name"] for suggestion in response.json()]
+
+def test_matches_name_parts_email_and_employee_id(client, make_employee, auth_headers):
+    admin = make_employee(role=RoleEnum.ADMIN, full_name="Admin User")
+    make_employee(full_name="Grace Hopper", email="ghopper@example.com", employee_id="TEC0042")
+    headers = auth_headers(admin)
+
+    assert suggest(client, headers, "gra") == ["Grace Hopper"]
+    assert suggest(client, headers, "HOP") == ["Grace Hopper"]
+    assert suggest(client, headers, "ghop") == ["Grace Hopper"]
+    assert suggest(client, headers, "tec00") == ["Grace Hopper"]
+
+def test_follows_committed_changes(client, db, make_employee, auth_headers):
+    admin = make_employee(role=RoleEnum.ADMIN, full_name="Admin User")
+    grace = make_employee(full_name="Grace Hopper")
+    headers = auth_headers(admin)
+    assert suggest(client, headers, "grace") == ["Grace Hopper"]
+
+    make_employee(full_name="Grace Brewster")
+    grace.full_name = "Amazing Grace"
+    db.commit()
+    assert suggest(client, headers, "grace") == ["Amazing Grace", "Grace Brewster"]
+    assert suggest(client, headers, "hopper") == []
+
+    grace.status = StatusEnum.INACTIVE
+    db.commit()
+    assert suggest(client, headers, "grace") == ["Grace Brewster"]
+
+    grace.full_name = "Rolled Back"
+    db.flush()
+    db.rollback()
+    assert suggest(client, headers, "rolled") == []
+
+def test_non_management_only_see_their_department(client, make_employee, auth_headers):
+    intern = make_employee(role=RoleEnum.INTERN, department="Technology", full_name="Ian Intern")
+    make_employee(department="Technology", full_name="Tina Tech")
+    make_employee(department="Finance", full_name="Tom Finance")
+
+    assert suggest(client, auth_headers(intern), "t") == ["Tina Tech"]
+
+def test_changes_committed_during_the_load_are_replayed(db, make_employee, monkeypatch):
+    grace = make_employee(full_name="Grace Hopper")
+    build = PrefixIndex._build
+
+    def build_then_commit(self, session):
+        result = build(self, session)
+        # Lands after the load query read its rows but before the index is live
+        grace.full_name = "Grace Brewster"
+        db.commit()
+        return result
+
+    monkeypatch.setattr(PrefixIndex, "_build", build_then_commit)
+    with SessionLocal() as session:
+        prefix_index.load(session)
+
+    assert [s.full_name for s in prefix_index.lookup("grace")] == ["Grace Brewster"]
+    assert prefix_index.lookup("hopper") == []
+
+def test_concurrent_first_lookups_share_one_load(make_employee, monkeypatch):
+    make_employee(full_name="Grace Hopper")
+    build = PrefixIndex._build
+    builds = []
+
+    def slow_build(self, session):
+        builds.append(threading.get_ident())
+        time.sleep(0.2)
+        return build(self, session)
+
+    monkeypatch.setattr(PrefixIndex, "_build", slow_build)
+    results = []
+
+    def lookup():
+        with SessionLocal() as session:
+            results.append([s.full_name for s in employee_typeahead.suggest(session, "gra")])
+
+    threads = [threading.Thread(target=lookup) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(builds) == 1
+    assert results == [["Grace Hopper"]] * 4
+
+def test_department_shards_and_merged_lookup(db, make_employee):
+    make_employee(department="Finance", full_name="Anna Finance")
+    make_employee(department="Technology", full_name="Ann Tech")
+    make_employee(department="Technology", full_name="Andy Tech")
+    prefix_index.load(db)
+
+    assert [s.full_name for s in prefix_index.lookup("an")] == ["Andy Tech", "Ann Tech", "Anna Finance"]
+    assert [s.full_name for s in prefix_index.lookup("an", department="Finance")] == ["Anna Finance"]
+    assert prefix_index.lookup("an", department="Legal") == []
+    assert prefix_index.stats()["departments"] == 2
\ No newline at end of file
@@ -0,0 +1,162 @@
+import pytest
+from app.models.employee import Employee, RoleEnum, StatusEnum
+from app.services.employee_typeahead import prefix_index
+from app.services.invalidation_bus import invalidation_bus
+
+@pytest.fixture(autouse=True)
+def fresh_index():
+    prefix_index.reset()
+    yield
+    prefix_index.reset()
+
+@pytest.fixture
+def published(monkeypatch):
+    messages = []
+    monkeypatch.setattr(invalidation_bus, "publish", messages.append)
+    return messages
+
+def _names(client, headers, path, **params):
+    response = client.get(path, params=params, headers=headers)
+    assert response.status_code == 200
+    body = response.json()
+    hits = body["results"] if isinstance(body, dict) else body
+    return sorted(hit.get("full_name") or hit.get("title") for hit in hits)
+
+def test_bulk_update_reports_each_id_and_maintains_caches(client, db, make_employee, auth_headers, published):
+    hr = make_employee(RoleEnum.HR, department="HR")
+    director = make_employee(RoleEnum.ADMIN, department="Operations")
+    movers = [make_employee(full_name=f"Mover {number}") for number in range(3)]
+    taken = make_employee(email="taken@example.com")
+    headers = auth_headers(hr)
+    # Warm the response cache, typeahead and search index before the batch
+    assert client.get(f"/api/employees/{movers[0].id}", headers=headers).json()["department"] == "Technology"
+    assert _names(client, headers, "/api/employees/suggest", q="mover") == ["Mover 0", "Mover 1", "Mover 2"]
+
+    published.clear()
+    response = client.patch("/api/employees/bulk", headers=headers, json={"updates": [
+        *({"id": mover.id, "department": "Operations", "manager_id": director.id} for mover in movers),
+        {"id": taken.id, "designation": "Principal Engineer"},
+        {"id": hr.id, "email": "taken@example.com"},
+        {"id": taken.id, "full_name": "Twice"},
+        {"id": director.id, "manager_id": 9999},
+        {"id": director.id},
+        {"id": 9999, "full_name": "Nobody"},
+        {"id": hr.id, "full_name": None},
+    ]})
+    assert response.status_code == 200, response.text
+    body = response.json()
+    assert body["updated"] == 4
+    assert [(result["id"], result["outcome"], result["detail"]) for result in body["results"]] == [
+        (movers[0].id, "updated", None),
+        (movers[1].id, "updated", None),
+        (movers[2].id, "updated", None),
+        (taken.id, "updated", None),
+        (hr.id, "invalid", "email already registered"),
+        (taken.id, "invalid", "employee appears more than once"),
+        (director.id, "invalid", "manager_id 9999 does not exist"),
+        (director.id, "invalid", "employee appears more than once"),
+        (9999, "not_found", None),
+        (hr.id, "invalid", "employee appears more than once"),
+    ]
+
+    db.expire_all()
+    assert {(mover.department, mover.manager_id) for mover in movers} == {("Operations", director.id)}
+    assert db.get(Employee, taken.id).designation == "Principal Engineer"
+    assert db.get(Employee, hr.id).email != "taken@example.com"
+    assert published == [{"employee": {mover.id for mover in movers} | {taken.id}}]
+    assert client.get(f"/api/employees/{movers[0].id}", headers=headers).json()["department"] == "Operations"
+    assert _names(client, headers, "/api/search/", q="principal") == [taken.full_name]
+
+def test_update_by_filter_suspends_a_team_in_one_statement(client, db, make_employee, auth_headers, published, count_queries):
+    admin = make_employee(RoleEnum.ADMIN)
+    manager = make_employee(RoleEnum.ADMIN)
+    team = [make_employee(full_name=f"Teammate {number}", manager_id=manager.id) for number in range(4)]
+    bystander = make_employee(full_name="Teammate Elsewhere")
+    headers = auth_headers(admin)
+    assert len(_names(client, headers, "/api/employees/suggest", q="teammate")) == 5
+
+    count_queries.clear()
+    published.clear()
+    response = client.patch("/api/employees/bulk/filter", headers=headers, json={
+        "filter": {"manager_id": manager.id, "ids": [team[0].id, team[1].id, bystander.id, 9999]},
+        "update": {"status": "suspended"},
+    })
+    assert response.status_code == 200, response.text
+    assert response.json() == {"updated": 2, "results": [
+        {"id": team[0].id, "outcome": "updated", "detail": None},
+        {"id": team[1].id, "outcome": "updated", "detail": None},
+        {"id": bystander.id, "outcome": "not_found", "detail": None},
+        {"id": 9999, "outcome": "not_found", "detail": None},
+    ]}
+    assert [statement.split()[0] for statement in count_queries if "employees" in statement].count("UPDATE") == 1
+    assert published == [{"employee": {team[0].id, team[1].id}}]
+    assert _names(client, headers, "/api/employees/suggest", q="teammate") == ["Teammate 2", "Teammate 3", "Teammate Elsewhere"]
+    db.expire_all()
+    assert [db.get(Employee, member.id).status for member in team] == [
+        StatusEnum.SUSPENDED, StatusEnum.SUSPENDED, StatusEnum.ACTIVE, StatusEnum.ACTIVE
+    ]
+
+@pytest.mark.parametrize("payload, detail", [
+    ({"filter": {}, "update": {"status": "inactive"}}, "At least one filter is required"),
+    ({"filter": {"department": "Technology"}, "update": {}}, "No fields to update"),
+    ({"filter": {"department": "Technology"}, "update": {"email": "same@example.com"}}, "Email must be unique and can't be set by filter"),
+    ({"filter": {"department": "Technology"}, "update": {"designation": None}}, "designation cannot be null"),
+])
+def test_update_by_filter_rejects_unsafe_requests(client, make_employee, auth_headers, payload, detail):
+    make_employee()
+    response = client.patch("/api/employees/bulk/filter", headers=auth_headers(make_employee(RoleEnum.HR)), json=payload)
+    assert response.status_code == 400
+    assert response.json()["detail"] == detail
+
+def test_update_by_filter_cannot_make_a_matched_employee_their_own_manager(client, db, make_employee, auth_headers):
+    lead = make_employee(department="Sales")
+    make_employee(department="Sales")
+    response = client.patch("/api/employees/bulk/filter", headers=auth_headers(make_employee(RoleEnum.HR)), json={
+        "filter": {"department": "Sales"}, "update": {"manager_id": lead.id},
+    })
+    assert response.status_code == 400
+    db.expire_all()
+    assert db.query(Employee).filter(Employee.manager_id == lead.id).count() == 0
+
+def test_bulk_endpoints_require_hr_or_admin(client, make_employee, auth_headers):
+    headers = auth_headers(make_employee())
+    assert client.patch("/api/employees/bulk", headers=headers, json={"updates": [{"id": 1}]}).status_code == 403
+def test_conditional_writes_fail_fast_on_a_stale_version(client, db, make_employee, auth_headers, published):
+    hr = make_employee(RoleEnum.HR, department="HR")
+    employee = make_employee(full_name="Versioned Person")
+    headers = auth_headers(hr)
+    assert client.get(f"/api/employees/{employee.id}", headers=headers).json()["version"] == 1
+
+    published.clear()
+    response = client.put(f"/api/employees/{employee.id}", headers={**headers, "If-Match": '"1"'}, json={"designation": "Staff Engineer"})
+    assert response.status_code == 200, response.text
+    assert response.headers["ETag"] == '"2"'
+    assert (response.json()["designation"], response.json()["version"]) == ("Staff Engineer", 2)
+    assert published == [{"employee": {employee.id}}]
+    assert _names(client, headers, "/api/search/", q="staff") == ["Versioned Person"]
+
+    # A second editor still holding version 1 is turned away without writing
+    response = client.put(f"/api/employees/{employee.id}", headers={**headers, "If-Match": '"1"'}, json={"designation": "Intern"})
+    assert response.status_code == 412
+    assert response.headers["ETag"] == '"2"'
+    for if_match in ('W/"2"', "2", '"1", "3"'):
+        response = client.patch(f"/api/employees/{employee.id}/status", headers={**headers, "If-Match": if_match}, params={"status": "suspended"})
+        assert response.status_code == 412, if_match
+
+    response = client.patch(f"/api/employees/{employee.id}/status", headers={**headers, "If-Match": '"1", "2"'}, params={"status": "suspended"})
+    assert (response.status_code, response.headers["ETag"]) == (200, '"3"')
+    response = client.delete(f"/api/employees/{employee.id}", headers={**auth_headers(make_employee(RoleEnum.SUPER_ADMIN)), "If-Match": "*"})
+    assert (response.status_code, response.headers["ETag"]) == (200, '"4"')
+    db.expire_all()
+    assert (db.get(Employee, employee.id).designation, db.get(Employee, employee.id).status) == ("Staff Engineer", StatusEnum.INACTIVE)
+    assert client.get(f"/api/employees/{employee.id}", headers=headers).json()["version"] == 4
+
+def test_writes_without_if_match_still_bump_the_version(client, db, make_employee, auth_headers):
+    headers = auth_headers(make_employee(RoleEnum.HR))
+    employee = make_employee()
+    assert client.put(f"/api/employees/{employee.id}", headers=headers, json={"full_name": "Renamed"}).json()["version"] == 2
+    response = client.patch("/api/employees/bulk", headers=headers, json={"updates": [{"id": employee.id, "designation": "Lead"}]})
+    assert response.status_code == 200
+    db.expire_all()
+    assert db.get(Employee, employee.id).version == 3
+    assert client.put("/api/employees/9999", headers={**headers, "If-Match": '"1"'}, json={"full_name": "Nobody"}).status_code == 404
\ No newline at end of file
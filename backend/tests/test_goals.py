@@ -0,0 +1,97 @@
+from datetime import datetime, timedelta
+from app.models.employee import RoleEnum
+from app.models.goal import Goal, GoalTypeEnum
+
+TARGET_DATE = (datetime.utcnow() + timedelta(days=30)).isoformat()
+
+def create_goal(client, headers, assigned_to, **fields):
+    response = client.post("/api/goals/", headers=headers, json={
+        "title": fields.pop("title", "Goal"), "description": "Details", "target_date": TARGET_DATE,
+        "assigned_to": assigned_to, **fields
+    })
+    assert response.status_code == 200, response.text
+    return response.json()
+
+def progress(db, *goal_ids):
+    db.expire_all()
+    return [db.get(Goal, goal_id).progress_percentage for goal_id in goal_ids]
+
+def test_progress_rolls_up_along_the_ancestor_path(client, db, make_employee, auth_headers):
+    admin = make_employee(role=RoleEnum.ADMIN)
+    headers = auth_headers(admin)
+    company = create_goal(client, headers, admin.id, goal_type="company")
+    team = create_goal(client, headers, admin.id, goal_type="team", parent_id=company["id"])
+    other_team = create_goal(client, headers, admin.id, goal_type="team", parent_id=company["id"])
+    first = create_goal(client, headers, admin.id, parent_id=team["id"], target_value=10)
+    second = create_goal(client, headers, admin.id, parent_id=team["id"], target_value=10)
+
+    response = client.patch(f"/api/goals/{first['id']}", headers=headers, json={"current_value": 5})
+
+    assert response.status_code == 200
+    assert progress(db, first["id"], second["id"], team["id"], other_team["id"], company["id"]) == [50.0, 0.0, 25.0, 0.0, 12.5]
+
+def test_reparenting_recomputes_old_and_new_parents(client, db, make_employee, auth_headers):
+    admin = make_employee(role=RoleEnum.ADMIN)
+    headers = auth_headers(admin)
+    old_parent = create_goal(client, headers, admin.id, goal_type="team")
+    new_parent = create_goal(client, headers, admin.id, goal_type="team")
+    stays = create_goal(client, headers, admin.id, parent_id=old_parent["id"], target_value=10)
+    moves = create_goal(client, headers, admin.id, parent_id=old_parent["id"], target_value=10)
+    client.patch(f"/api/goals/{moves['id']}", headers=headers, json={"current_value": 8})
+    assert progress(db, old_parent["id"]) == [40.0]
+
+    response = client.patch(f"/api/goals/{moves['id']}", headers=headers, json={"parent_id": new_parent["id"]})
+
+    assert response.status_code == 200
+    assert progress(db, old_parent["id"], new_parent["id"], stays["id"]) == [0.0, 80.0, 0.0]
+
+def test_moving_a_goal_under_its_own_subtree_is_rejected(client, make_employee, auth_headers):
+    admin = make_employee(role=RoleEnum.ADMIN)
+    headers = auth_headers(admin)
+    root = create_goal(client, headers, admin.id, goal_type="department")
+    child = create_goal(client, headers, admin.id, goal_type="team", parent_id=root["id"])
+    grandchild = create_goal(client, headers, admin.id, parent_id=child["id"])
+
+    for parent_id in (grandchild["id"], root["id"]):
+        response = client.patch(f"/api/goals/{root['id']}", headers=headers, json={"parent_id": parent_id})
+        assert response.status_code == 400
+
+def test_only_management_or_the_owner_can_link_under_a_goal(client, make_employee, auth_headers):
+    admin = make_employee(role=RoleEnum.ADMIN)
+    owner = make_employee()
+    outsider = make_employee()
+    company = create_goal(client, auth_headers(admin), admin.id, goal_type="company")
+    team = create_goal(client, auth_headers(admin), owner.id, goal_type="team")
+    own_goal = create_goal(client, auth_headers(outsider), outsider.id)
+
+    def link(employee, parent_id):
+        return client.post("/api/goals/", headers=auth_headers(employee), json={
+            "title": "Mine", "description": "Details", "target_date": TARGET_DATE,
+            "assigned_to": employee.id, "parent_id": parent_id
+        })
+
+    assert link(outsider, company["id"]).status_code == 403
+    assert link(outsider, team["id"]).status_code == 403
+    assert link(owner, team["id"]).status_code == 200
+    moved = client.patch(f"/api/goals/{own_goal['id']}", headers=auth_headers(outsider), json={"parent_id": team["id"]})
+    assert moved.status_code == 403
+
+def test_employees_cannot_link_under_each_others_individual_goals(client, db, make_employee, auth_headers):
+    owner = make_employee()
+    other = make_employee()
+    hr = make_employee(role=RoleEnum.HR, department="HR")
+    personal = create_goal(client, auth_headers(owner), owner.id, target_value=10)
+    other_goal = create_goal(client, auth_headers(other), other.id, target_value=10)
+
+    response = client.post("/api/goals/", headers=auth_headers(other), json={
+        "title": "Mine", "description": "Details", "target_date": TARGET_DATE,
+        "assigned_to": other.id, "parent_id": personal["id"]
+    })
+    assert response.status_code == 403
+    moved = client.patch(f"/api/goals/{other_goal['id']}", headers=auth_headers(other), json={"parent_id": personal["id"]})
+    assert moved.status_code == 403
+    assert progress(db, personal["id"]) == [0.0]
+
+    # The owner and management still can
+    create_goal(client, auth_headers(owner), owner.id, parent_id=personal["id"])
+    create_goal(client, auth_headers(hr), other.id, parent_id=personal["id"])
\ No newline at end of file
@@ -0,0 +1,83 @@
+import json
+import threading
+import pytest
+from sqlalchemy import text
+from app.models.employee import StatusEnum
+from app.services.employee_typeahead import prefix_index, refresh_employees
+from app.services.invalidation_bus import InvalidationBus, NullTransport, UnixSocketTransport, invalidation_bus
+
+class RecordingTransport(NullTransport):
+    def __init__(self):
+        self.sent = []
+
+    def send(self, payload):
+        message = json.loads(payload)
+        self.sent.append((message["kind"], message["keys"]))
+
+@pytest.fixture
+def recorded():
+    transport = RecordingTransport()
+    invalidation_bus.start(transport)
+    yield transport.sent
+    invalidation_bus.start(NullTransport())
+
+def test_unix_socket_transport_reaches_other_workers_only(tmp_path):
+    workers = [InvalidationBus(UnixSocketTransport(str(tmp_path))) for _ in range(3)]
+    received = {index: [] for index in range(3)}
+    delivered = threading.Event()
+    for index, bus in enumerate(workers):
+        def handler(keys, index=index):
+            received[index].append(keys)
+            if len(received[1]) and len(received[2]):
+                delivered.set()
+        bus.subscribe("employee", handler)
+        bus.start()
+    try:
+        workers[0].publish({"employee": [3, 1, 3]})
+        assert delivered.wait(timeout=5)
+    finally:
+        for bus in workers:
+            bus.stop()
+
+    assert received == {0: [], 1: [[1, 3]], 2: [[1, 3]]}
+    stats = workers[1].stats()
+    assert stats["received"] == 1 and stats["latency_ms_p50"] is not None
+    assert workers[0].stats()["published"] == 1
+
+def test_committed_changes_are_published_once(db, make_employee, recorded):
+    employee = make_employee()
+    recorded.clear()
+
+    employee.full_name = "Renamed"
+    db.commit()
+    employee.full_name = "Rolled back"
+    db.flush()
+    db.rollback()
+    db.commit()
+
+    assert recorded == [("employee", [employee.id])]
+
+def test_large_changes_are_split_across_messages(recorded):
+    invalidation_bus.publish({"employee": range(1200), "announcement": []})
+
+    assert [(kind, len(keys)) for kind, keys in recorded] == [("employee", 500), ("employee", 500), ("employee", 200)]
+
+def test_typeahead_applies_changes_made_by_another_worker(db, make_employee):
+    grace = make_employee(full_name="Grace Hopper")
+    prefix_index.reset()
+    prefix_index.load(db)
+    try:
+        # Written without this process's ORM hooks, as another worker would
+        db.execute(text("UPDATE employees SET full_name = 'Grace Brewster' WHERE id = :id"), {"id": grace.id})
+        db.commit()
+        assert [s.full_name for s in prefix_index.lookup("grace")] == ["Grace Hopper"]
+
+        refresh_employees([grace.id])
+        assert [s.full_name for s in prefix_index.lookup("grace")] == ["Grace Brewster"]
+
+        db.execute(text("UPDATE employees SET status = :status WHERE id = :id"), {"status": StatusEnum.INACTIVE.name, "id": grace.id})
+        db.commit()
+        refresh_employees([grace.id])
+        assert prefix_index.lookup("grace") == []
+    finally:
+        prefix_index.reset()
\ No newline at end of file
@@ -0,0 +1,84 @@
+import logging
+from app.core.config import settings
+from app.models.employee import RoleEnum
+from app.services.metrics import Counter, Histogram, Registry, normalize_sql
+
+def _sample(text: str, series: str) -> float:
+    for line in text.splitlines():
+        if line.startswith(series + " "):
+            return float(line.rsplit(" ", 1)[1])
+    return 0.0
+
+def test_normalize_sql_collapses_literals_and_parameters():
+    statement = """SELECT employees.id FROM employees
+        WHERE employees.department = %(department_1)s AND employees.id IN (?, ?, ?)
+        AND employees.full_name = 'O''Brien' AND employees.salary > 1000.5 LIMIT ? OFFSET 20"""
+    assert normalize_sql(statement) == (
+        "SELECT employees.id FROM employees WHERE employees.department = ? AND employees.id IN (?, ...) "
+        "AND employees.full_name = ? AND employees.salary > ? LIMIT ? OFFSET ?"
+    )
+    assert normalize_sql("SELECT CAST(:value AS TEXT)::text") == "SELECT CAST(? AS TEXT)::text"
+
+def test_registry_sums_series_across_workers():
+    registry = Registry()
+    requests = registry.register(Counter("requests_total", "Requests", ("route",)))
+    latency = registry.register(Histogram("latency_seconds", "Latency", ("route",), buckets=(0.1, 1)))
+    requests.inc("/a")
+    latency.observe(0.05, "/a")
+    latency.observe(5, "/a")
+    text = registry.render([registry.dump(), registry.dump()])
+
+    assert _sample(text, 'requests_total{route="/a"}') == 2
+    assert _sample(text, 'latency_seconds_bucket{route="/a",le="0.1"}') == 2
+    assert _sample(text, 'latency_seconds_bucket{route="/a",le="1"}') == 2
+    assert _sample(text, 'latency_seconds_bucket{route="/a",le="+Inf"}') == 4
+    assert _sample(text, 'latency_seconds_count{route="/a"}') == 4
+    assert _sample(text, 'latency_seconds_sum{route="/a"}') == 10.1
+    assert "# TYPE latency_seconds histogram" in text
+
+def test_metrics_record_route_template_status_and_queries(client, make_employee, auth_headers):
+    employee = make_employee(RoleEnum.HR)
+    headers = auth_headers(employee)
+    route = 'method="GET",route="/api/employees/{employee_id}"'
+    before = client.get("/metrics").text
+
+    assert client.get(f"/api/employees/{employee.id}", headers=headers).status_code == 200
+    assert client.get("/api/employees/999999", headers=headers).status_code == 404
+    assert client.get("/no/such/path").status_code == 404
+    after = client.get("/metrics")
+
+    assert after.headers["content-type"].startswith("text/plain; version=0.0.4")
+    text = after.text
+    for status in ("200", "404"):
+        series = f'http_requests_total{{{route},status="{status}"}}'
+        assert _sample(text, series) - _sample(before, series) == 1
+    unmatched = 'http_requests_total{method="GET",route="<unmatched>",status="404"}'
+    assert _sample(text, unmatched) - _sample(before, unmatched) == 1
+    latency = f"http_request_duration_seconds_count{{{route}}}"
+    assert _sample(text, latency) - _sample(before, latency) == 2
+    # Every request here at least loads the caller
+    queries = f"http_request_db_queries_sum{{{route}}}"
+    assert _sample(text, queries) - _sample(before, queries) >= 2
+    assert _sample(text, f'http_request_db_queries_bucket{{{route},le="0"}}') == _sample(before, f'http_request_db_queries_bucket{{{route},le="0"}}')
+
+def test_slow_queries_are_logged_normalized(client, make_employee, auth_headers, caplog, monkeypatch):
+    employee = make_employee(RoleEnum.HR)
+    headers = auth_headers(employee)
+    monkeypatch.setattr(settings, "SLOW_QUERY_MS", 0)
+
+    with caplog.at_level(logging.WARNING, logger="app.services.metrics"):
+        assert client.get("/api/employees/me", headers=headers).status_code == 200
+
+    messages = [record.getMessage() for record in caplog.records if record.name == "app.services.metrics"]
+    assert messages
+    assert all(message.startswith("Slow query (") for message in messages)
+    assert any("on /api/employees/me: SELECT" in message and "= ?" in message for message in messages)
+    assert not any(employee.employee_id in message for message in messages)
+    assert _sample(client.get("/metrics").text, 'db_slow_queries_total{route="/api/employees/me"}') >= 1
+
+def test_metrics_token_is_required_once_set(client, monkeypatch):
+    monkeypatch.setattr(settings, "METRICS_TOKEN", "scrape-secret")
+
+    assert client.get("/metrics").status_code == 401
+    assert client.get("/metrics", headers={"Authorization": "Bearer wrong"}).status_code == 401
+    assert client.get("/metrics", headers={"Authorization": "Bearer scrape-secret"}).status_code == 200
\ No newline at end of file
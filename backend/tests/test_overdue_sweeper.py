@@ -0,0 +1,85 @@
+import asyncio
+from datetime import datetime, timedelta
+from app.models.employee import RoleEnum
+from app.models.goal import Goal, GoalStatusEnum
+from app.models.task import Task, TaskStatusEnum
+from app.services import overdue_sweeper
+from app.services.overdue_sweeper import collect_pending_reminders, mark_notified, send_reminder_digests, sweep_overdue
+
+NOW = datetime(2024, 6, 1, 12, 0)
+
+def add_task(db, assignee, assigner, due_date, status=TaskStatusEnum.ASSIGNED, **fields):
+    task = Task(
+        title=fields.pop("title", "Task"), description="Details", assigned_to=assignee.id,
+        assigned_by=assigner.id, due_date=due_date, status=status, **fields
+    )
+    db.add(task)
+    db.commit()
+    return task
+
+def test_sweep_flips_only_open_items_past_due(db, make_employee):
+    manager = make_employee(role=RoleEnum.ADMIN)
+    worker = make_employee()
+    late = add_task(db, worker, manager, NOW - timedelta(days=1))
+    started = add_task(db, worker, manager, NOW - timedelta(hours=1), TaskStatusEnum.IN_PROGRESS)
+    done = add_task(db, worker, manager, NOW - timedelta(days=1), TaskStatusEnum.COMPLETED)
+    upcoming = add_task(db, worker, manager, NOW + timedelta(days=1))
+    goals = [
+        Goal(title="Late", description="Details", assigned_to=worker.id, created_by=manager.id,
+             target_date=NOW - timedelta(days=1)),
+        Goal(title="Cancelled", description="Details", assigned_to=worker.id, created_by=manager.id,
+             target_date=NOW - timedelta(days=1), status=GoalStatusEnum.CANCELLED),
+    ]
+    db.add_all(goals)
+    db.commit()
+
+    assert sweep_overdue(db, NOW) == (2, 1)
+    assert sweep_overdue(db, NOW) == (0, 0)
+
+    db.expire_all()
+    assert [task.status for task in (late, started, done, upcoming)] == [
+        TaskStatusEnum.OVERDUE, TaskStatusEnum.OVERDUE, TaskStatusEnum.COMPLETED, TaskStatusEnum.ASSIGNED
+    ]
+    assert [goal.status for goal in goals] == [GoalStatusEnum.OVERDUE, GoalStatusEnum.CANCELLED]
+
+def test_reminders_are_grouped_per_assignee_in_due_order(db, make_employee):
+    manager = make_employee(role=RoleEnum.ADMIN)
+    alice = make_employee(full_name="Alice")
+    bob = make_employee(full_name="Bob")
+    second = add_task(db, alice, manager, NOW + timedelta(days=2), title="Second")
+    first = add_task(db, alice, manager, NOW + timedelta(days=1), TaskStatusEnum.OVERDUE, title="First")
+    add_task(db, alice, manager, NOW, TaskStatusEnum.COMPLETED, title="Done")
+    add_task(db, alice, manager, NOW, notification_sent=True, title="Already sent")
+    only = add_task(db, bob, manager, NOW, title="Only")
+
+    digests = collect_pending_reminders(db)
+
+    assert set(digests) == {alice.id, bob.id}
+    assert digests[alice.id]["full_name"] == "Alice"
+    assert [task[:2] for task in digests[alice.id]["tasks"]] == [(first.id, "First"), (second.id, "Second")]
+    assert [task[:2] for task in digests[bob.id]["tasks"]] == [(only.id, "Only")]
+
+def test_failed_sends_are_not_marked_notified(db, make_employee, monkeypatch):
+    manager = make_employee(role=RoleEnum.ADMIN)
+    alice = make_employee(email="alice@example.com")
+    bob = make_employee(email="bob@example.com")
+    alice_tasks = [add_task(db, alice, manager, NOW + timedelta(days=day)) for day in (1, 2)]
+    bob_task = add_task(db, bob, manager, NOW)
+    sent = []
+
+    async def fake_send(email, full_name, task_title, due_date, other_tasks):
+        if email == "bob@example.com":
+            raise RuntimeError("SMTP unavailable")
+        sent.append((email, task_title, other_tasks))
+
+    monkeypatch.setattr(overdue_sweeper, "send_task_notification", fake_send)
+
+    delivered = asyncio.run(send_reminder_digests(collect_pending_reminders(db)))
+    mark_notified(db, delivered)
+
+    assert sent == [("alice@example.com", "Task", [("Task", alice_tasks[1].due_date.strftime("%Y-%m-%d"))])]
+    assert sorted(delivered) == sorted(task.id for task in alice_tasks)
+    db.expire_all()
+    assert [task.notification_sent for task in alice_tasks] == [True, True]
+    assert bob_task.notification_sent is False
+    assert set(collect_pending_reminders(db)) == {bob.id}
\ No newline at end of file
@@ -0,0 +1,73 @@
+from datetime import date
+import numpy as np
+import pytest
+from app.models.analytics import EmployeePerformance
+from app.services.performance_scoring import SUB_SCORES, compute_scores, normalize_weights, score_period
+
+def uniform(*scores):
+    """Sub-score rows whose weighted overall is exactly each given score"""
+    return np.array([[score] * len(SUB_SCORES) for score in scores], dtype=float)
+
+def test_percentiles_are_share_at_or_below_within_department():
+    departments = np.array(["Sales", "Sales", "Sales", "Sales", "Support"], dtype=object)
+
+    overall, percentiles, _ = compute_scores(uniform(2, 4, 6, 8, 1), departments, normalize_weights())
+
+    assert overall.tolist() == pytest.approx([2, 4, 6, 8, 1])
+    assert percentiles.tolist() == pytest.approx([25.0, 50.0, 75.0, 100.0, 100.0])
+
+def test_tied_scores_share_the_higher_percentile():
+    departments = np.array(["Sales"] * 4, dtype=object)
+
+    _, percentiles, _ = compute_scores(uniform(5, 7, 7, 9), departments, normalize_weights())
+
+    assert percentiles.tolist() == pytest.approx([25.0, 75.0, 75.0, 100.0])
+
+def test_ratings_bands_clipping_and_missing_scores():
+    sub_scores = uniform(9, 8.99, 7, 5, 3, 2.99, 14)
+    sub_scores[0, 0] = np.nan    # a missing component counts as zero
+    departments = np.array(["Sales"] * len(sub_scores), dtype=object)
+
+    overall, _, ratings = compute_scores(sub_scores, departments, normalize_weights())
+
+    assert overall[0] == pytest.approx(9 * 0.7)
+    assert overall[-1] == 10.0
+    assert ratings.tolist() == ["Average", "Good", "Good", "Average", "Below Average", "Poor", "Excellent"]
+
+def test_normalize_weights_rejects_unknown_and_zero_weights():
+    assert normalize_weights({"technical_skills": 3.0}).sum() == pytest.approx(1.0)
+    with pytest.raises(ValueError):
+        normalize_weights({"charisma": 1.0})
+    with pytest.raises(ValueError):
+        normalize_weights({name: 0.0 for name in SUB_SCORES})
+
+def test_score_period_stores_scores_for_evaluations_in_range(db, make_employee):
+    sales = [make_employee(department="Sales") for _ in range(2)]
+    support = make_employee(department="Support")
+    evaluations = [
+        EmployeePerformance(employee_id=employee.id, evaluation_date=day, **dict.fromkeys(SUB_SCORES, score))
+        for employee, day, score in [
+            (sales[0], date(2024, 3, 1), 6.0),
+            (sales[1], date(2024, 3, 2), 9.0),
+            (support, date(2024, 3, 3), 4.0),
+            (support, date(2024, 6, 1), 8.0),
+        ]
+    ]
+    db.add_all(evaluations)
+    db.commit()
+
+    assert score_period(db, date(2024, 3, 1), date(2024, 3, 31)) == 3
+
+    stored = {}
+    for evaluation in evaluations:
+        db.refresh(evaluation)
+        stored[evaluation.evaluation_date] = (
+            evaluation.overall_score, evaluation.department_percentile, evaluation.performance_rating
+        )
+    assert stored == {
+        date(2024, 3, 1): (6.0, 50.0, "Average"),
+        date(2024, 3, 2): (9.0, 100.0, "Excellent"),
+        date(2024, 3, 3): (4.0, 100.0, "Below Average"),
+        date(2024, 6, 1): (0.0, None, None),
+    }
+    assert score_period(db, date(2023, 1, 1), date(2023, 12, 31)) == 0
\ No newline at end of file
@@ -0,0 +1,89 @@
+import threading
+import time
+import anyio
+import pytest
+from app.core.config import settings
+from app.models.employee import RoleEnum
+from app.services.request_profiler import WAITING, ProfilingMiddleware, list_profiles
+
+@pytest.fixture(autouse=True)
+def profile_dir(monkeypatch, tmp_path):
+    monkeypatch.setattr(settings, "PROFILE_DIR", str(tmp_path))
+    monkeypatch.setattr(settings, "PROFILE_INTERVAL_MS", 1)
+    return tmp_path
+
+def _spin(seconds: float):
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        pass
+
+def _unrelated_spin(stop: threading.Event):
+    while not stop.is_set():
+        _spin(0.001)
+
+def test_samples_only_the_profiled_requests_threads(monkeypatch, profile_dir):
+    monkeypatch.setattr(settings, "PROFILE_SAMPLE_RATE", 1.0)
+
+    async def app(scope, receive, send):
+        await anyio.to_thread.run_sync(_spin, 0.2)
+        await anyio.sleep(0.05)
+        await send({"type": "http.response.start", "status": 204, "headers": []})
+        await send({"type": "http.response.body", "body": b""})
+
+    async def receive():
+        return {"type": "http.request"}
+
+    async def send(message):
+        pass
+
+    stop = threading.Event()
+    other = threading.Thread(target=_unrelated_spin, args=(stop,))
+    other.start()
+    try:
+        scope = {"type": "http", "method": "GET", "path": "/slow", "headers": []}
+        anyio.run(ProfilingMiddleware(app), scope, receive, send)
+    finally:
+        stop.set()
+        other.join()
+
+    [profile] = list_profiles()
+    assert profile["route"] == "slow" and profile["status"] == 204 and profile["duration_ms"] >= 250
+    stacks = {}
+    for line in (profile_dir / profile["name"]).read_text().splitlines():
+        stack, count = line.rsplit(" ", 1)
+        stacks[stack] = int(count)
+    assert any(stack.startswith("[threadpool];_spin ") for stack in stacks)
+    assert stacks[WAITING] > 0
+    assert not any("_unrelated_spin" in stack for stack in stacks)
+
+def test_only_super_admins_opt_in_and_download(client, make_employee, auth_headers):
+    super_admin = make_employee(RoleEnum.SUPER_ADMIN)
+    admin = make_employee(RoleEnum.ADMIN)
+    headers = auth_headers(super_admin)
+
+    assert client.get("/api/employees/", headers=headers).status_code == 200
+    assert client.get("/api/employees/", headers={**auth_headers(admin), "X-Profile": "true"}).status_code == 200
+    assert client.get("/api/admin/profiles", headers=headers).json() == {"profiles": []}
+
+    assert client.get("/api/employees/", headers={**headers, "X-Profile": "true"}).status_code == 200
+    [profile] = client.get("/api/admin/profiles", headers=headers).json()["profiles"]
+    assert profile["method"] == "GET" and profile["route"] == "api_employees" and profile["status"] == 200
+
+    response = client.get(f"/api/admin/profiles/{profile['name']}", headers=headers)
+    assert response.status_code == 200
+    assert all(line.rsplit(" ", 1)[1].isdigit() for line in response.text.splitlines())
+    assert client.get("/api/admin/profiles/..%2Ftest.db", headers=headers).status_code == 404
+    # Profiles carry stacks and arguments from other people's requests
+    assert client.get("/api/admin/profiles", headers=auth_headers(admin)).status_code == 403
+    assert client.get(f"/api/admin/profiles/{profile['name']}", headers=auth_headers(admin)).status_code == 403
+    assert client.get("/api/admin/profiles", headers=auth_headers(make_employee(RoleEnum.HR))).status_code == 403
+
+def test_oldest_profiles_are_pruned(client, monkeypatch):
+    monkeypatch.setattr(settings, "PROFILE_SAMPLE_RATE", 1.0)
+    monkeypatch.setattr(settings, "PROFILE_MAX_FILES", 2)
+    for _ in range(4):
+        client.get("/health")
+
+    profiles = list_profiles()
+    assert len(profiles) == 2
+    assert all(profile["route"] == "health" for profile in profiles)
\ No newline at end of file
@@ -0,0 +1,97 @@
+import asyncio
+import json
+from concurrent.futures import ThreadPoolExecutor
+import pytest
+from starlette.websockets import WebSocketDisconnect
+from app.core.security import create_access_token
+from app.models.employee import RoleEnum
+from app.services.push_hub import PUSH_KIND, PushConnection, PushHub, SLOW_CONSUMER_CLOSE_CODE
+
+def connect(client, employee):
+    token = create_access_token(data={"sub": employee.employee_id})
+    return client.websocket_connect(f"/api/push/ws?token={token}")
+
+def receive(socket, timeout=5):
+    # The test session blocks forever on an empty socket; fail instead of hanging
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(socket.receive_json).result(timeout=timeout)
+
+def test_events_reach_their_audience(client, make_employee, auth_headers):
+    hr = make_employee(role=RoleEnum.HR, department="People")
+    engineer = make_employee(role=RoleEnum.TECH, department="Technology")
+
+    with connect(client, engineer) as socket:
+        responses = [
+            client.post(
+                "/api/announcements/",
+                json={"title": "People only", "content": "...", "target_departments": '["People"]'},
+                headers=auth_headers(hr)
+            ),
+            client.post("/api/announcements/", json={"title": "Everyone", "content": "..."}, headers=auth_headers(hr)),
+            client.post(
+                "/api/tasks/",
+                json={
+                    "title": "Write docs", "description": "...",
+                    "assigned_to": engineer.id, "due_date": "2030-01-01T00:00:00"
+                },
+                headers=auth_headers(hr)
+            ),
+        ]
+        assert [response.status_code for response in responses] == [200, 200, 200]
+
+        # The announcement targeted at another department is never delivered
+        first, second = receive(socket), receive(socket)
+        assert (first["event"], first["data"]["title"]) == ("announcement.created", "Everyone")
+        assert (second["event"], second["data"]["title"]) == ("task.assigned", "Write docs")
+
+def test_rejects_invalid_token(client):
+    with pytest.raises(WebSocketDisconnect):
+        with client.websocket_connect("/api/push/ws?token=not-a-token") as socket:
+            socket.receive_json()
+
+class StubSocket:
+    def __init__(self):
+        self.closed_with = None
+
+    async def close(self, code):
+        self.closed_with = code
+
+def test_slow_consumer_is_evicted(monkeypatch):
+    async def scenario():
+        hub = PushHub()
+        hub.bind_loop(asyncio.get_running_loop())
+        monkeypatch.setattr("app.services.push_hub.settings.PUSH_QUEUE_SIZE", 2)
+        slow_socket = StubSocket()
+        slow = PushConnection(slow_socket, 1, "Technology", "tech")
+        hub.subscribe(slow)
+
+        for number in range(3):
+            hub.publish("announcement.created", {"id": number}, ["*"], ["*"])
+        await asyncio.sleep(0)
+
+        assert hub.stats() == {"connections": 0, "channels": 0, "evicted": 1}
+        assert slow_socket.closed_with == SLOW_CONSUMER_CLOSE_CODE
+
+    asyncio.run(scenario())
+
+def test_events_published_by_another_worker_reach_local_sockets(monkeypatch):
+    async def scenario():
+        sent = []
+        monkeypatch.setattr("app.services.push_hub.invalidation_bus.publish", sent.append)
+        # Two workers, each with its own hub; the bus carries what one publishes to the other
+        publisher, receiver = PushHub(), PushHub()
+        receiver.bind_loop(asyncio.get_running_loop())
+        engineer = PushConnection(StubSocket(), 1, "Technology", "tech")
+        receiver.subscribe(engineer)
+
+        publisher.publish("announcement.created", {"title": "People only"}, ["People"], ["*"])
+        publisher.publish("task.assigned", {"title": "Write docs"}, employees=[1])
+        assert [list(keys) for keys in sent] == [[PUSH_KIND], [PUSH_KIND]]
+        # Delivered from the bus listener thread, as another worker's message would be
+        await asyncio.to_thread(receiver.receive, [event for keys in sent for event in keys[PUSH_KIND]])
+        await asyncio.sleep(0)
+
+        assert engineer.queue.qsize() == 1
+        assert json.loads(engineer.queue.get_nowait()) == {"event": "task.assigned", "data": {"title": "Write docs"}}
+
+    asyncio.run(scenario())
\ No newline at end of file
@@ -0,0 +1,102 @@
+import pytest
+from fastapi import Depends, FastAPI
+from fastapi.routing import APIRoute
+from fastapi.testclient import TestClient
+from datetime import datetime, timedelta
+from sqlalchemy.orm import Session, selectinload
+from app.api.endpoints import auth, employees
+from app.core.security import get_password_hash
+from app.database.database import get_db
+from app.models.employee import Employee, RoleEnum
+from app.services.query_guard import NPlusOneError, NPlusOneMiddleware, QueryBudgetExceeded, query_budget
+
+async def _no_email(*args, **kwargs):
+    pass
+
+@pytest.fixture
+def setup(make_employee, auth_headers, monkeypatch):
+    monkeypatch.setattr(employees, "send_welcome_email", _no_email)
+    monkeypatch.setattr(auth, "send_otp_email", _no_email)
+    manager = make_employee(RoleEnum.ADMIN)
+    admin = make_employee(RoleEnum.SUPER_ADMIN, otp_code="123456", otp_expires_at=datetime.utcnow() + timedelta(minutes=5))
+    # Not a role that needs an OTP, so login completes
+    engineer = make_employee(hashed_password=get_password_hash("secret123"))
+    team_leader = make_employee()
+    reports = [make_employee(manager_id=manager.id, team_leader_id=team_leader.id) for _ in range(5)]
+    return {
+        "manager": manager, "admin": admin, "engineer": engineer, "report": reports[0], "reports": reports,
+        "headers": auth_headers(admin)
+    }
+
+# Statement budget per route, auth lookup included: (method, path template) -> (budget, request)
+CASES = {
+    ("POST", "/api/employees/"): (7, lambda s: ("POST", "/api/employees/", {"json": {
+        "email": "new.hire@example.com", "full_name": "New Hire", "role": "tech",
+        "department": "Technology", "designation": "Engineer", "password": "secret123"
+    }})),
+    ("GET", "/api/employees/"): (2, lambda s: ("GET", "/api/employees/", {})),
+    ("GET", "/api/employees/me"): (1, lambda s: ("GET", "/api/employees/me", {})),
+    ("GET", "/api/employees/suggest"): (2, lambda s: ("GET", "/api/employees/suggest", {"params": {"q": "emp"}})),
+    ("GET", "/api/employees/{employee_id}"): (2, lambda s: ("GET", f"/api/employees/{s['manager'].id}", {})),
+    ("PUT", "/api/employees/{employee_id}"): (4, lambda s: ("PUT", f"/api/employees/{s['manager'].id}", {"json": {"designation": "Director"}})),
+    ("PATCH", "/api/employees/{employee_id}/status"): (2, lambda s: ("PATCH", f"/api/employees/{s['manager'].id}/status", {"params": {"status": "suspended"}})),
+    ("DELETE", "/api/employees/{employee_id}"): (2, lambda s: ("DELETE", f"/api/employees/{s['manager'].id}", {})),
+    ("PATCH", "/api/employees/bulk"): (7, lambda s: ("PATCH", "/api/employees/bulk", {"json": {"updates": [
+        *({"id": report.id, "department": "Operations"} for report in s["reports"]),
+        {"id": s["engineer"].id, "designation": "Staff Engineer"}, {"id": s["manager"].id, "designation": "Director"}
+    ]}})),
+    ("PATCH", "/api/employees/bulk/filter"): (3, lambda s: ("PATCH", "/api/employees/bulk/filter", {"json": {
+        "filter": {"manager_id": s["manager"].id}, "update": {"status": "suspended"}
+    }})),
+    ("GET", "/api/employees/departments/list"): (2, lambda s: ("GET", "/api/employees/departments/list", {})),
+    ("GET", "/api/employees/hierarchy/{employee_id}"): (3, lambda s: ("GET", f"/api/employees/hierarchy/{s['report'].id}", {})),
+    ("POST", "/api/auth/login"): (1, lambda s: ("POST", "/api/auth/login", {"json": {"employee_id": s["engineer"].employee_id, "password": "secret123"}})),
+    ("POST", "/api/auth/request-otp"): (3, lambda s: ("POST", "/api/auth/request-otp", {"params": {"employee_id": s["admin"].employee_id}})),
+    ("POST", "/api/auth/reset-password"): (2, lambda s: ("POST", "/api/auth/reset-password", {"json": {
+        "employee_id": s["admin"].employee_id, "otp_code": "123456", "new_password": "secret456"
+    }})),
+}
+
+def test_every_employee_and_auth_route_has_a_budget():
+    routes = {
+        (method, prefix + route.path)
+        for router, prefix in ((employees.router, "/api/employees"), (auth.router, "/api/auth"))
+        for route in router.routes if isinstance(route, APIRoute)
+        for method in route.methods
+    }
+    assert routes == set(CASES)
+
+@pytest.mark.parametrize("route", sorted(CASES), ids=lambda route: f"{route[0]} {route[1]}")
+def test_route_stays_within_query_budget(route, client, setup):
+    budget, build = CASES[route]
+    method, path, kwargs = build(setup)
+    with query_budget(budget) as statements:
+        response = client.request(method, path, headers=setup["headers"], **kwargs)
+    assert response.status_code == 200, response.text
+
+def test_query_budget_reports_the_statements(db, make_employee):
+    make_employee()
+    with pytest.raises(QueryBudgetExceeded, match=r"at most 1 statements, got 2:\n  1\. SELECT"):
+        with query_budget(1):
+            db.query(Employee).all()
+            db.query(Employee).count()
+
+def test_repeated_lazy_loads_in_one_request_are_flagged(make_employee):
+    managers = [make_employee(RoleEnum.ADMIN) for _ in range(3)]
+    for manager in managers:
+        make_employee(manager_id=manager.id)
+
+    app = FastAPI()
+    app.add_middleware(NPlusOneMiddleware)
+
+    @app.get("/managers")
+    def manager_names(eager: bool = False, db: Session = Depends(get_db)):
+        query = db.query(Employee).filter(Employee.manager_id.isnot(None))
+        if eager:
+            query = query.options(selectinload(Employee.manager))
+        return [employee.manager.full_name for employee in query.all()]
+
+    with TestClient(app) as test_client:
+        assert len(test_client.get("/managers", params={"eager": True}).json()) == 3
+        with pytest.raises(NPlusOneError, match=r"GET /managers: Employee.manager x3"):
+            test_client.get("/managers")
\ No newline at end of file
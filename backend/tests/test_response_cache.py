@@ -0,0 +1,110 @@
+import time
+import pytest
+from app.models.employee import RoleEnum
+from app.services.response_cache import MemoryBackend, RedisBackend, response_cache
+
+class FakeRedis:
+    """The handful of Redis commands RedisBackend uses, kept in a dict"""
+
+    def __init__(self):
+        self.data = {}
+
+    def get(self, name):
+        value, expires = self.data.get(name, (None, None))
+        if expires is not None and expires <= time.time():
+            del self.data[name]
+            return None
+        return value
+
+    def set(self, name, value, ex=None):
+        self.data[name] = (value, time.time() + ex if ex else None)
+
+    def mget(self, names):
+        return [self.get(name) for name in names]
+
+    def incr(self, name):
+        value = int(self.get(name) or 0) + 1
+        self.data[name] = (str(value).encode(), None)
+        return value
+
+@pytest.fixture(params=["memory", "redis"])
+def backend(request):
+    previous = response_cache.backend
+    response_cache.configure(MemoryBackend() if request.param == "memory" else RedisBackend(FakeRedis()))
+    yield request.param
+    response_cache.configure(previous)
+
+def get(client, url, headers, **params):
+    response = client.get(url, headers=headers, params=params)
+    assert response.status_code == 200
+    return response.headers["x-cache"], response.json()
+
+def test_repeated_reads_are_served_from_cache(backend, client, make_employee, auth_headers, count_queries):
+    admin = make_employee(role=RoleEnum.ADMIN)
+    headers = auth_headers(admin)
+    assert get(client, "/api/employees/", headers)[0] == "MISS"
+
+    count_queries.clear()
+    state, body = get(client, "/api/employees/", headers)
+
+    assert state == "HIT"
+    assert [employee["id"] for employee in body] == [admin.id]
+    assert len(count_queries) == 1    # only the auth lookup
+    assert get(client, "/api/employees/", headers, limit=5)[0] == "MISS"
+
+def test_entries_are_scoped_to_what_the_caller_may_see(backend, client, make_employee, auth_headers):
+    hr = make_employee(role=RoleEnum.HR, department="People")
+    tech = make_employee(department="Technology")
+    finance = make_employee(department="Finance")
+
+    for viewer, expected in ((tech, [tech.id]), (finance, [finance.id]), (hr, [hr.id, tech.id, finance.id])):
+        _, body = get(client, "/api/employees/", auth_headers(viewer))
+        assert [employee["id"] for employee in body] == expected
+
+    colleague = make_employee(department="Technology", role=RoleEnum.INTERN)
+    # Shares the Technology scope with `tech`, so it gets the same entry
+    assert get(client, f"/api/employees/{tech.id}", auth_headers(tech))[0] == "MISS"
+    assert get(client, f"/api/employees/{tech.id}", auth_headers(colleague))[0] == "HIT"
+    assert client.get(f"/api/employees/{tech.id}", headers=auth_headers(finance)).status_code == 403
+
+def test_writes_invalidate_tagged_entries(backend, client, make_employee, auth_headers):
+    admin = make_employee(role=RoleEnum.ADMIN)
+    other = make_employee(full_name="Other")
+    target = make_employee(full_name="Before")
+    headers = auth_headers(admin)
+    get(client, "/api/employees/", headers)
+    get(client, f"/api/employees/{target.id}", headers)
+    get(client, f"/api/employees/{other.id}", headers)
+
+    response = client.put(f"/api/employees/{target.id}", headers=headers, json={"full_name": "After"})
+    assert response.status_code == 200
+
+    assert get(client, f"/api/employees/{target.id}", headers) == ("MISS", response.json())
+    assert get(client, f"/api/employees/{other.id}", headers)[0] == "HIT"
+    state, body = get(client, "/api/employees/", headers)
+    assert state == "MISS" and "After" in [employee["full_name"] for employee in body]
+
+    assert client.patch(f"/api/employees/{target.id}/status", headers=headers, params={"status": "suspended"}).status_code == 200
+    assert get(client, f"/api/employees/{target.id}", headers)[1]["status"] == "suspended"
+
+def test_lru_evicts_least_recently_used():
+    backend = MemoryBackend(max_entries=2)
+    backend.set("a", b"1", 60)
+    backend.set("b", b"2", 60)
+    backend.get("a")
+    backend.set("c", b"3", 60)
+
+    assert (backend.get("a"), backend.get("b"), backend.get("c")) == (b"1", None, b"3")
+
+def test_unavailable_backend_serves_uncached(client, make_employee, auth_headers):
+    class BrokenBackend(MemoryBackend):
+        def versions(self, tags):
+            raise ConnectionError("redis is down")
+
+    previous = response_cache.backend
+    response_cache.configure(BrokenBackend())
+    try:
+        admin = make_employee(role=RoleEnum.ADMIN)
+        assert get(client, "/api/employees/", auth_headers(admin))[0] == "MISS"
+    finally:
+        response_cache.configure(previous)
\ No newline at end of file
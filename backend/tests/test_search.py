@@ -0,0 +1,73 @@
+from app.models.announcement import Announcement
+from app.models.employee import RoleEnum, StatusEnum
+from app.models.support_ticket import SupportTicket
+
+def search(client, headers, q, **params):
+    response = client.get("/api/search/", params={"q": q, **params}, headers=headers)
+    assert response.status_code == 200
+    return [(hit["doc_type"], hit["doc_id"]) for hit in response.json()["results"]]
+
+def test_index_follows_writes(client, db, make_employee, auth_headers):
+    admin = make_employee(role=RoleEnum.ADMIN)
+    ada = make_employee(full_name="Ada Lovelace", designation="Analyst")
+    headers = auth_headers(admin)
+
+    assert search(client, headers, "lovel") == [("employee", ada.id)]
+
+    ada.full_name = "Ada King"
+    db.commit()
+    assert search(client, headers, "lovelace") == []
+    assert search(client, headers, "king") == [("employee", ada.id)]
+
+    db.delete(ada)
+    db.commit()
+    assert search(client, headers, "king") == []
+
+def test_results_are_ranked_and_highlighted(client, db, make_employee, auth_headers):
+    admin = make_employee(role=RoleEnum.ADMIN)
+    db.add_all([
+        Announcement(title="Office move", content="The payroll team moves upstairs", created_by=admin.id),
+        Announcement(title="Payroll deadline", content="Submit payroll changes by Friday", created_by=admin.id),
+    ])
+    db.commit()
+
+    hits = client.get("/api/search/", params={"q": "payroll"}, headers=auth_headers(admin)).json()["results"]
+
+    assert [hit["title"] for hit in hits] == ["<mark>Payroll</mark> deadline", "Office move"]
+    assert "<mark>payroll</mark>" in hits[1]["snippet"]
+
+def test_results_respect_visibility(client, db, make_employee, auth_headers):
+    admin = make_employee(role=RoleEnum.ADMIN)
+    intern = make_employee(role=RoleEnum.INTERN, department="Technology")
+    make_employee(full_name="Grace Hopper", department="Technology")
+    make_employee(full_name="Grace Finance", department="Finance")
+    make_employee(full_name="Grace Gone", department="Technology", status=StatusEnum.INACTIVE)
+    announcements = [
+        Announcement(title="Grace period", content="For everyone", created_by=admin.id),
+        Announcement(title="Grace bonus", content="Finance only", target_departments='["Finance"]', created_by=admin.id),
+    ]
+    db.add_all(announcements)
+    db.add_all([
+        SupportTicket(ticket_number="TKT000001", title="Grace laptop", description="Mine", created_by=intern.id),
+        SupportTicket(ticket_number="TKT000002", title="Grace payroll", description="Not mine", created_by=admin.id),
+    ])
+    db.commit()
+
+    visible = search(client, auth_headers(intern), "grace")
+    assert sorted(doc_type for doc_type, _ in visible) == ["announcement", "employee", "ticket"]
+    assert len(search(client, auth_headers(admin), "grace")) == 7
+    assert [hit for hit in visible if hit[0] == "ticket"] == search(client, auth_headers(intern), "grace", types="ticket")
+
+def test_stored_markup_is_escaped_around_highlights(client, db, make_employee, auth_headers):
+    admin = make_employee(role=RoleEnum.ADMIN)
+    db.add(Announcement(
+        title='<img src=x onerror="alert(1)"> payroll',
+        content="<script>steal()</script> payroll details",
+        created_by=admin.id
+    ))
+    db.commit()
+
+    hit = client.get("/api/search/", params={"q": "payroll"}, headers=auth_headers(admin)).json()["results"][0]
+
+    assert hit["title"] == "&lt;img src=x onerror=&quot;alert(1)&quot;&gt; <mark>payroll</mark>"
+    assert hit["snippet"] == "&lt;script&gt;steal()&lt;/script&gt; <mark>payroll</mark> details"
\ No newline at end of file
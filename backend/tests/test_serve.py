@@ -0,0 +1,114 @@
+import json
+import os
+import signal
+import socket
+import subprocess
+import sys
+import time
+import httpx
+from app.core.config import settings
+from app.core.supervisor import invalidation_bus_for, pool_sizes
+from app.models.employee import RoleEnum
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def test_connection_budget_is_split_across_workers():
+    assert pool_sizes(40, 4) == (10, 0)
+    assert pool_sizes(10, 3) == (3, 0)
+    assert pool_sizes(2, 8) == (1, 0)
+
+def test_several_workers_always_get_a_bus():
+    assert invalidation_bus_for("none", 4) == "unix"
+    assert invalidation_bus_for("none", 1) == "none"
+    assert invalidation_bus_for("redis", 4) == "redis"
+
+def test_worker_stats_aggregate_live_workers_only(client, make_employee, auth_headers):
+    admin = make_employee(RoleEnum.ADMIN)
+    headers = auth_headers(admin)
+    os.makedirs(settings.WORKER_STATS_DIR, exist_ok=True)
+
+    # A sibling worker that is alive (our parent stands in for it) and one that has exited
+    sibling = client.get("/api/admin/workers", headers=headers).json()["workers"][0]
+    sibling.update(pid=os.getppid(), slot=1, requests=7)
+    with open(os.path.join(settings.WORKER_STATS_DIR, f"{os.getppid()}.json"), "w") as f:
+        json.dump(sibling, f)
+    dead = subprocess.run([sys.executable, "-c", "import os; print(os.getpid())"], capture_output=True, text=True)
+    dead_pid = int(dead.stdout)
+    dead_path = os.path.join(settings.WORKER_STATS_DIR, f"{dead_pid}.json")
+    with open(dead_path, "w") as f:
+        json.dump(dict(sibling, pid=dead_pid), f)
+
+    try:
+        response = client.get("/api/admin/workers", headers=headers)
+        assert response.status_code == 200
+        body = response.json()
+        pids = [worker["pid"] for worker in body["workers"]]
+        assert sorted(pids) == sorted([os.getpid(), os.getppid()])
+        assert body["totals"]["workers"] == 2
+        this_worker = next(worker for worker in body["workers"] if worker["pid"] == os.getpid())
+        assert body["totals"]["requests"] == this_worker["requests"] + 7
+        assert body["totals"]["typeahead_approx_bytes"] == 2 * this_worker["typeahead"]["approx_bytes"]
+        assert this_worker["typeahead"].keys() >= {"loaded", "employees", "keys", "approx_bytes"}
+        assert not os.path.exists(dead_path)
+    finally:
+        os.unlink(os.path.join(settings.WORKER_STATS_DIR, f"{os.getppid()}.json"))
+
+def test_worker_stats_require_admin(client, make_employee, auth_headers):
+    employee = make_employee(RoleEnum.HR)
+    assert client.get("/api/admin/workers", headers=auth_headers(employee)).status_code == 403
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+def _worker_pids(directory: str) -> set:
+    if not os.path.isdir(directory):
+        return set()
+    return {int(name[:-5]) for name in os.listdir(directory) if name.endswith(".json")}
+
+def _wait_for(condition, timeout: float = 30):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        result = condition()
+        if result:
+            return result
+        time.sleep(0.2)
+    raise AssertionError("Timed out waiting for the workers")
+
+def test_serve_recycles_and_rolls_workers(tmp_path):
+    port = _free_port()
+    stats_dir = str(tmp_path / "workers")
+    env = dict(
+        os.environ,
+        DATABASE_URL=f"sqlite:///{tmp_path / 'serve.db'}",
+        WORKER_STATS_DIR=stats_dir,
+        INVALIDATION_BUS="none"
+    )
+    supervisor = subprocess.Popen(
+        [sys.executable, "run.py", "serve", "--host", "127.0.0.1", "--port", str(port),
+         "--workers", "2", "--max-requests", "5", "--graceful-timeout", "5"],
+        cwd=BACKEND_DIR, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    try:
+        first = _wait_for(lambda: len(_worker_pids(stats_dir)) == 2 and _worker_pids(stats_dir))
+
+        # Some worker reaches its max requests and is replaced in its slot
+        for _ in range(12):
+            assert httpx.get(f"http://127.0.0.1:{port}/health").status_code == 200
+        recycled = _wait_for(lambda: (pids := _worker_pids(stats_dir)) != first and len(pids) == 2 and pids)
+
+        # SIGHUP replaces every worker while the socket keeps answering
+        supervisor.send_signal(signal.SIGHUP)
+        deadline = time.monotonic() + 30
+        while _worker_pids(stats_dir) & recycled and time.monotonic() < deadline:
+            assert httpx.get(f"http://127.0.0.1:{port}/health").status_code == 200
+            time.sleep(0.1)
+        _wait_for(lambda: len(_worker_pids(stats_dir) - recycled) == 2)
+
+        supervisor.send_signal(signal.SIGTERM)
+        assert supervisor.wait(timeout=20) == 0
+        assert _worker_pids(stats_dir) == set()
+    finally:
+        if supervisor.poll() is None:
+            supervisor.kill()
\ No newline at end of file
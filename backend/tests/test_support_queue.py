@@ -0,0 +1,89 @@
+import threading
+from datetime import datetime, timedelta
+from app.database.database import SessionLocal
+from app.models.employee import RoleEnum
+from app.models.support_ticket import (
+    SupportTicket, TicketCategoryEnum, TicketPriorityEnum, TicketStatusEnum
+)
+from app.services.ticket_queue import claim_next_ticket
+
+def seed_tickets(db, creator, count, **fields):
+    start = datetime.utcnow() - timedelta(hours=1)
+    tickets = [
+        SupportTicket(
+            ticket_number=f"SEED-{fields.get('category')}-{fields.get('priority')}-{i}",
+            title=f"Ticket {i}",
+            description="Something is broken",
+            created_by=creator.id,
+            created_at=start + timedelta(seconds=i),
+            **fields
+        )
+        for i in range(count)
+    ]
+    db.add_all(tickets)
+    db.commit()
+    return [ticket.id for ticket in tickets]
+
+def test_claim_serves_highest_priority_then_oldest(client, db, make_employee, auth_headers):
+    agent = make_employee(role=RoleEnum.TECH)
+    low = seed_tickets(db, agent, 1, priority=TicketPriorityEnum.LOW, category=TicketCategoryEnum.TECHNICAL)
+    urgent = seed_tickets(db, agent, 2, priority=TicketPriorityEnum.URGENT, category=TicketCategoryEnum.HR)
+
+    claimed = [client.post("/api/support/claim", headers=auth_headers(agent)).json()["id"] for _ in range(3)]
+
+    assert claimed == urgent + low
+    assert client.post("/api/support/claim", headers=auth_headers(agent)).json() is None
+
+def test_claim_filters_by_category(client, db, make_employee, auth_headers):
+    agent = make_employee(role=RoleEnum.FINANCE)
+    seed_tickets(db, agent, 1, category=TicketCategoryEnum.TECHNICAL)
+    finance = seed_tickets(db, agent, 1, category=TicketCategoryEnum.FINANCE)
+
+    response = client.post("/api/support/claim", params={"category": "finance"}, headers=auth_headers(agent))
+
+    assert response.json()["id"] == finance[0]
+    assert response.json()["status"] == TicketStatusEnum.IN_PROGRESS.value
+    assert response.json()["assigned_to"] == agent.id
+
+def test_ticket_numbers_come_from_the_sequence(client, make_employee, auth_headers):
+    employee = make_employee()
+    numbers = [
+        client.post(
+            "/api/support/",
+            headers=auth_headers(employee),
+            json={"title": "Laptop", "description": "Will not boot", "priority": "high"}
+        ).json()["ticket_number"]
+        for _ in range(3)
+    ]
+
+    assert numbers == sorted(set(numbers))
+
+def test_concurrent_agents_never_claim_the_same_ticket(db, make_employee):
+    agents = [make_employee(role=RoleEnum.TECH) for _ in range(8)]
+    for priority in TicketPriorityEnum:
+        seed_tickets(db, agents[0], 50, priority=priority, category=TicketCategoryEnum.TECHNICAL)
+    claims = {agent.id: [] for agent in agents}
+
+    def work(agent_id):
+        session = SessionLocal()
+        try:
+            while True:
+                ticket_id = claim_next_ticket(session, agent_id, TicketCategoryEnum.TECHNICAL)
+                if ticket_id is None:
+                    return
+                claims[agent_id].append(ticket_id)
+        finally:
+            session.close()
+
+    threads = [threading.Thread(target=work, args=(agent.id,)) for agent in agents]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    claimed = [ticket_id for agent_claims in claims.values() for ticket_id in agent_claims]
+    assert len(claimed) == len(set(claimed)) == 200
+    owners = dict(
+        db.query(SupportTicket.id, SupportTicket.assigned_to).all()
+    )
+    assert all(owners[ticket_id] == agent_id for agent_id, ids in claims.items() for ticket_id in ids)
\ No newline at end of file
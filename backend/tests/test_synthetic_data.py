@@ -0,0 +1,61 @@
+from collections import Counter
+from datetime import date
+import numpy as np
+from sqlalchemy import func, select, text
+from app.database.database import Base, engine
+from app.models.employee import Employee, RoleEnum
+from app.models.goal import Goal, GoalTypeEnum
+from app.services.synthetic_data import Org, OrgShape, seed_database
+from app.services.task_counters import reconcile_task_counters
+from app.services.ticket_queue import next_ticket_number
+
+SHAPE = OrgShape(employees=120, departments=3, span=4, months=7, announcements_per_month=3)
+AS_OF = date(2026, 5, 20)
+
+def _dump() -> dict:
+    tables = [table for table in Base.metadata.sorted_tables if table.name != "ticket_number_sequence"]
+    with engine.connect() as connection:
+        dump = {
+            table.name: connection.execute(select(table).order_by(*table.primary_key.columns)).all()
+            for table in tables
+        }
+        dump["search_documents"] = connection.execute(
+            text("SELECT doc_type, doc_id, title, body FROM search_documents ORDER BY doc_type, doc_id")
+        ).all()
+    # Every employee shares one hash, but its salt differs per run
+    password = Employee.__table__.c.keys().index("hashed_password")
+    dump["employees"] = [row[:password] + row[password + 1:] for row in dump["employees"]]
+    return dump
+
+def test_org_is_a_manager_tree_within_departments():
+    org = Org(OrgShape(employees=500, departments=4, span=3))
+    reports = Counter(org.manager[2:].tolist())
+
+    assert org.manager[1] == 0
+    assert (org.manager[2:] < org.ids[2:]).all()
+    heads = org.manager[2:] == 1
+    assert heads.sum() == 4
+    assert (org.department[2:][~heads] == org.department[org.manager[2:][~heads]]).all()
+    assert max(count for manager, count in reports.items() if manager != 1) == 3
+    assert set(np.flatnonzero(org.has_reports)) == set(reports)
+
+def test_seeding_is_deterministic_and_consistent(db, client):
+    first = seed_database(engine, SHAPE, 7, AS_OF, "secret123")
+    rows = _dump()
+    seed_database(engine, SHAPE, 7, AS_OF, "secret123", reset=True)
+    assert _dump() == rows
+    assert rows["employees"] and rows["tasks"] and rows["goals"] and rows["support_tickets"]
+    assert rows["company_metrics"] and rows["department_metrics"] and rows["employee_performance"]
+    assert first["employees"] == SHAPE.employees
+
+    # Derived state matches what the application itself would have written
+    assert reconcile_task_counters(db) == 0
+    assert next_ticket_number(db) == f"TKT{first['support_tickets'] + 1:06d}"
+    company = db.scalars(select(Goal).where(Goal.goal_type == GoalTypeEnum.COMPANY)).first()
+    departments_average = db.scalar(select(func.avg(Goal.progress_percentage)).where(Goal.parent_id == company.id))
+    assert company.progress_percentage == round(departments_average, 2)
+    assert db.scalar(select(func.count()).select_from(text("announcement_audiences"))) >= 2 * first["announcements"]
+
+    engineer = db.scalars(select(Employee).where(Employee.role == RoleEnum.TECH)).first()
+    response = client.post("/api/auth/login", json={"employee_id": engineer.employee_id, "password": "secret123"})
+    assert response.status_code == 200, response.text
\ No newline at end of file
@@ -0,0 +1,69 @@
+from datetime import datetime, timedelta
+import pytest
+from sqlalchemy import update
+from sqlalchemy.exc import IntegrityError
+from app.models.employee import Employee
+from app.models.task import Task, TaskStatusEnum
+from app.services.task_counters import reconcile_task_counters
+
+def make_task(db, assignee, assigner, **fields):
+    task = Task(
+        title="Task", description="Details", assigned_to=assignee.id, assigned_by=assigner.id,
+        due_date=datetime.utcnow() + timedelta(days=7), **fields
+    )
+    db.add(task)
+    db.commit()
+    return task
+
+def counters(db, employee):
+    db.refresh(employee)
+    return employee.tasks_completed, employee.tasks_pending, employee.performance_score
+
+def test_counters_follow_task_writes(db, make_employee):
+    manager, alice, bob = make_employee(), make_employee(), make_employee()
+
+    first = make_task(db, alice, manager)
+    make_task(db, alice, manager)
+    assert counters(db, alice) == (0, 2, 0.0)
+
+    first.status = TaskStatusEnum.COMPLETED
+    db.commit()
+    assert counters(db, alice) == (1, 1, 5.0)
+
+    first.assigned_to = bob.id
+    db.commit()
+    assert counters(db, alice) == (0, 1, 0.0)
+    assert counters(db, bob) == (1, 0, 10.0)
+
+    db.delete(first)
+    db.commit()
+    assert counters(db, bob) == (0, 0, 0.0)
+
+def test_failed_flush_does_not_leak_deletes(db, make_employee):
+    manager, alice = make_employee(), make_employee()
+    task = make_task(db, alice, manager)
+
+    db.delete(task)
+    db.add(Employee(
+        employee_id=alice.employee_id, email="duplicate@example.com", full_name="Duplicate",
+        hashed_password="x", role=alice.role, department="Technology", designation="Engineer"
+    ))
+    with pytest.raises(IntegrityError):
+        db.commit()
+    db.rollback()
+
+    # The next successful flush must not replay the rolled back delete
+    task.title = "Renamed"
+    db.commit()
+    assert counters(db, alice) == (0, 1, 0.0)
+
+def test_reconcile_fixes_drift(db, make_employee):
+    manager, alice = make_employee(), make_employee()
+    make_task(db, alice, manager, status=TaskStatusEnum.COMPLETED)
+    make_task(db, alice, manager)
+    db.execute(update(Employee).where(Employee.id == alice.id).values(tasks_completed=7, tasks_pending=0))
+    db.commit()
+
+    assert reconcile_task_counters(db) == 1
+    assert counters(db, alice) == (1, 1, 5.0)
+    assert reconcile_task_counters(db) == 0
\ No newline at end of file
@@ -0,0 +1,82 @@
+from datetime import datetime, timedelta
+from app.models.employee import Employee, RoleEnum
+from app.models.task import Task
+
+def add_tasks(db, assignee, assigner, count):
+    due = datetime.utcnow() + timedelta(days=7)
+    db.add_all([
+        Task(title=f"Task {i}", description="Details", assigned_to=assignee.id, assigned_by=assigner.id, due_date=due)
+        for i in range(count)
+    ])
+    db.commit()
+
+def test_list_tasks_resolves_names(client, db, make_employee, auth_headers):
+    manager = make_employee(role=RoleEnum.ADMIN, full_name="Alice Admin")
+    worker = make_employee(full_name="Bob Builder")
+    add_tasks(db, worker, manager, 2)
+
+    response = client.get("/api/tasks/", headers=auth_headers(worker))
+
+    assert response.status_code == 200
+    tasks = response.json()
+    assert len(tasks) == 2
+    assert {(task["assignee_name"], task["assigner_name"]) for task in tasks} == {("Bob Builder", "Alice Admin")}
+
+def test_list_tasks_query_count_is_constant(client, db, make_employee, auth_headers, count_queries):
+    manager = make_employee(role=RoleEnum.ADMIN)
+    headers = auth_headers(manager)
+    workers = [make_employee() for _ in range(5)]
+    add_tasks(db, workers[0], manager, 1)
+
+    count_queries.clear()
+    client.get("/api/tasks/", headers=headers)
+    small_page = len(count_queries)
+
+    for worker in workers:
+        add_tasks(db, worker, manager, 10)
+    count_queries.clear()
+
+    response = client.get("/api/tasks/", headers=headers)
+
+    assert len(response.json()) == 51
+    # One auth lookup plus one joined SELECT, however many tasks and assignees
+    assert len(count_queries) == small_page == 2
+
+def test_bulk_assign_creates_one_task_per_assignee(client, db, make_employee, auth_headers):
+    manager = make_employee(role=RoleEnum.HR)
+    workers = [make_employee() for _ in range(3)]
+
+    response = client.post(
+        "/api/tasks/bulk-assign",
+        headers=auth_headers(manager),
+        json={
+            "title": "Quarterly training",
+            "description": "Complete the security course",
+            "due_date": (datetime.utcnow() + timedelta(days=14)).isoformat(),
+            "assigned_to": [worker.id for worker in workers]
+        }
+    )
+
+    assert response.status_code == 200
+    assert sorted(task["assigned_to"] for task in response.json()) == sorted(worker.id for worker in workers)
+    db.expire_all()
+    pending = {employee.id: employee.tasks_pending for employee in db.query(Employee).all()}
+    assert all(pending[worker.id] == 1 for worker in workers)
+
+def test_bulk_assign_is_all_or_nothing(client, db, make_employee, auth_headers):
+    manager = make_employee(role=RoleEnum.HR)
+    worker = make_employee()
+
+    response = client.post(
+        "/api/tasks/bulk-assign",
+        headers=auth_headers(manager),
+        json={
+            "title": "Quarterly training",
+            "description": "Complete the security course",
+            "due_date": (datetime.utcnow() + timedelta(days=14)).isoformat(),
+            "assigned_to": [worker.id, 9999]
+        }
+    )
+
+    assert response.status_code == 404
+    assert db.query(Task).count() == 0
\ No newline at end of file
@@ -0,0 +1,65 @@
+from datetime import date, timedelta
+import pytest
+from app.models.analytics import CompanyMetrics, DepartmentMetrics
+from app.services.timeseries import lttb, query_timeseries
+
+def add_company_metrics(db, rows):
+    db.add_all([CompanyMetrics(date=day, revenue=revenue, productivity_score=score) for day, revenue, score in rows])
+    db.commit()
+
+@pytest.mark.parametrize("bucket, expected", [
+    ("week", [(date(2024, 1, 1), 3.0), (date(2024, 1, 8), 4.0)]),
+    ("month", [(date(2024, 1, 1), 7.0), (date(2024, 5, 1), 8.0), (date(2024, 12, 1), 16.0)]),
+    ("quarter", [(date(2024, 1, 1), 7.0), (date(2024, 4, 1), 8.0), (date(2024, 10, 1), 16.0)]),
+])
+def test_buckets_start_on_monday_month_and_quarter(db, bucket, expected):
+    add_company_metrics(db, [
+        (date(2024, 1, 1), 1.0, 0.0),    # Monday
+        (date(2024, 1, 7), 2.0, 0.0),    # Sunday, same ISO week
+        (date(2024, 1, 8), 4.0, 0.0),    # next Monday
+        (date(2024, 5, 15), 8.0, 0.0),
+        (date(2024, 12, 31), 16.0, 0.0),
+    ])
+    end = date(2024, 1, 8) if bucket == "week" else date(2024, 12, 31)
+
+    series = query_timeseries(db, ["revenue"], date(2024, 1, 1), end, bucket)
+
+    assert series["revenue"] == expected
+
+def test_flow_metrics_sum_and_level_metrics_average(db):
+    add_company_metrics(db, [(date(2024, 3, 1), 10.0, 6.0), (date(2024, 3, 2), 20.0, 8.0)])
+
+    series = query_timeseries(db, ["revenue", "productivity_score"], date(2024, 3, 1), date(2024, 3, 31), "month")
+
+    assert series == {"revenue": [(date(2024, 3, 1), 30.0)], "productivity_score": [(date(2024, 3, 1), 7.0)]}
+
+def test_department_series_and_unknown_metrics(db):
+    db.add_all([
+        DepartmentMetrics(department="Sales", date=date(2024, 2, 1), revenue_contribution=5.0),
+        DepartmentMetrics(department="Support", date=date(2024, 2, 1), revenue_contribution=50.0),
+    ])
+    db.commit()
+
+    series = query_timeseries(db, ["revenue_contribution"], date(2024, 1, 1), date(2024, 12, 31), "day", "Sales")
+
+    assert series["revenue_contribution"] == [(date(2024, 2, 1), 5.0)]
+    with pytest.raises(ValueError):
+        query_timeseries(db, ["revenue"], date(2024, 1, 1), date(2024, 12, 31), "day", "Sales")
+
+def test_lttb_keeps_endpoints_and_peaks():
+    start = date(2024, 1, 1)
+    points = [(start + timedelta(days=i), 100.0 if i == 37 else float(i % 5)) for i in range(100)]
+
+    sampled = lttb(points, 10)
+
+    assert len(sampled) == 10
+    assert sampled[0] == points[0] and sampled[-1] == points[-1]
+    assert points[37] in sampled
+    assert [day for day, _ in sampled] == sorted(day for day, _ in sampled)
+
+def test_lttb_returns_input_below_threshold():
+    points = [(date(2024, 1, day), float(day)) for day in range(1, 6)]
+
+    assert lttb(points, 5) == points
+    assert lttb(points, 50) == points
+    assert lttb(points, 2) == points
\ No newline at end of file
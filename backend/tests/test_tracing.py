@@ -0,0 +1,86 @@
+import asyncio
+import json
+import pytest
+from fastapi.testclient import TestClient
+from app.core.config import settings
+from app.core.security import get_password_hash
+from app.database.database import engine
+from app.main import app
+from app.models.employee import RoleEnum
+from app.services.report_service import report_service
+from app.services.tracing import TracingMiddleware, in_current_context, install_query_hooks, tracer
+
+@pytest.fixture
+def spans_file(tmp_path):
+    path = tmp_path / "spans.jsonl"
+    tracer.configure("jsonl", str(path))
+    yield path
+    tracer.configure(settings.TRACING_EXPORTER, settings.TRACE_FILE, settings.TRACE_SAMPLE_RATE)
+
+def _spans(path) -> list:
+    tracer.flush()
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+def test_login_spans_nest_under_the_request(spans_file, make_employee):
+    employee = make_employee(RoleEnum.TECH, hashed_password=get_password_hash("secret123"))
+    install_query_hooks(engine)
+    _spans(spans_file)
+    spans_file.write_text("")
+
+    with TestClient(TracingMiddleware(app)) as client:
+        response = client.post("/api/auth/login", json={"employee_id": employee.employee_id, "password": "secret123"})
+    assert response.status_code == 200
+
+    spans = _spans(spans_file)
+    [root] = [span for span in spans if span["parent_id"] is None]
+    assert root["name"] == "POST /api/auth/login"
+    assert root["attributes"] == {"http.method": "POST", "http.status_code": 200, "http.route": "/api/auth/login"}
+    assert {span["trace_id"] for span in spans} == {root["trace_id"]}
+    children = {span["name"] for span in spans if span["parent_id"] == root["span_id"]}
+    assert {"bcrypt.verify", "db.query"} <= children
+    query = next(span for span in spans if span["name"] == "db.query")
+    assert "FROM employees WHERE employees.employee_id = ?" in query["attributes"]["db.statement"]
+
+def test_context_follows_tasks_and_executor_hops(spans_file):
+    def blocking():
+        with tracer.span("in executor"):
+            pass
+
+    async def child():
+        with tracer.span("in task"):
+            await asyncio.get_running_loop().run_in_executor(None, in_current_context(blocking))
+
+    async def main():
+        with tracer.span("outer"):
+            await asyncio.gather(child(), child())
+
+    asyncio.run(main())
+    spans = {span["span_id"]: span for span in _spans(spans_file)}
+    by_name = lambda name: [span for span in spans.values() if span["name"] == name]
+    [outer] = by_name("outer")
+    assert [span["parent_id"] for span in by_name("in task")] == [outer["span_id"]] * 2
+    assert sorted(spans[span["parent_id"]]["name"] for span in by_name("in executor")) == ["in task", "in task"]
+
+def test_otlp_export_records_errors(tmp_path):
+    path = tmp_path / "spans.otlp.jsonl"
+    tracer.configure("otlp", str(path))
+    try:
+        with pytest.raises(AttributeError):
+            with tracer.span("report", rows=3):
+                report_service.generate_company_analytics_pdf(None)
+        tracer.flush()
+    finally:
+        tracer.configure(settings.TRACING_EXPORTER, settings.TRACE_FILE, settings.TRACE_SAMPLE_RATE)
+
+    spans = [
+        span
+        for line in path.read_text().splitlines()
+        for resource in json.loads(line)["resourceSpans"]
+        for scope in resource["scopeSpans"]
+        for span in scope["spans"]
+    ]
+    report, root = spans
+    assert report["name"] == "report_service.ReportService.generate_company_analytics_pdf"
+    assert report["parentSpanId"] == root["spanId"] and report["traceId"] == root["traceId"]
+    assert report["status"]["code"] == 2 and report["status"]["message"].startswith("AttributeError")
+    assert root["attributes"] == [{"key": "rows", "value": {"intValue": "3"}}]
\ No newline at end of file